@@ -6,8 +6,23 @@ from box_sdk_gen.networking import *
 
 from box_sdk_gen.serialization import *
 
-from box_sdk_gen.schemas import *
+from box_sdk_gen.internal.lazy_imports import lazy_package as _lazy_package
 
-from box_sdk_gen.managers import *
+from box_sdk_gen import schemas as _schemas, managers as _managers
 
-from box_sdk_gen.client import *
+# Schemas, managers, clients and the async fetch are imported on first access of a name they define,
+# as importing all of them takes most of the import time of the package.
+_exports = {
+    'networking': ('create_async_http_client', 'fetch_async', 'HttpxTransport'),
+    'schemas': tuple(_schemas.__all__),
+    'managers': tuple(_managers.__all__),
+    'raw_client': ('RawManager', 'RawBoxClient'),
+    'client': ('BoxClient',),
+    'async_client': ('AsyncManager', 'AsyncBoxClient'),
+}
+
+__all__ = [name for name in globals() if not name.startswith('_')] + [
+    name for names in _exports.values() for name in names
+]
+
+__getattr__, __dir__ = _lazy_package(__name__, _exports, globals())
@@ -0,0 +1,185 @@
+import functools
+from typing import Any, Callable, Dict
+
+from box_sdk_gen.client import BoxClient
+
+from box_sdk_gen.internal.endpoints import get_endpoint, is_manager, list_endpoints
+
+from box_sdk_gen.internal.utils import ByteStream
+
+from box_sdk_gen.networking.auth import Authentication
+
+from box_sdk_gen.networking.network import NetworkSession
+
+from box_sdk_gen.networking.base_urls import BaseUrls
+
+from box_sdk_gen.networking.retries import RetryPolicy
+
+from box_sdk_gen.networking.async_fetch import fetch_async
+
+from box_sdk_gen.serialization.json.serializer import deserialize
+
+
+class AsyncManager:
+    """
+    Asynchronous view of a manager of BoxClient. Every endpoint method of the manager is available
+    as a coroutine function with the same parameters, returning the same schemas, or the parsed JSON
+    of the responses, when raw responses are requested.
+    """
+
+    def __init__(self, manager: Any, *, raw_responses: bool = False):
+        self._manager = manager
+        self._raw_responses = raw_responses
+
+    def __getattr__(self, name: str) -> Callable:
+        endpoint = get_endpoint(self._manager, name)
+        manager = self._manager
+        raw_responses = self._raw_responses
+
+        @functools.wraps(getattr(type(manager), name))
+        async def async_method(*args, **kwargs):
+            url, options = endpoint.build_request(manager, *args, **kwargs)
+            response = await fetch_async(url, options)
+            if endpoint.returns_nothing:
+                return None
+            if endpoint.return_type is ByteStream:
+                return response.content
+            if raw_responses:
+                return response.data
+            return deserialize(
+                response.data,
+                endpoint.return_type,
+                lazy=manager.network_session.lazy_deserialization,
+            )
+
+        setattr(self, name, async_method)
+        return async_method
+
+    def __dir__(self):
+        return list_endpoints(self._manager)
+
+
+class AsyncBoxClient:
+    """
+    Asynchronous counterpart of BoxClient. It has the same managers, e.g. `client.files`,
+    whose endpoint methods are coroutine functions, and sends requests over a non-blocking connection pool.
+    """
+
+    def __init__(
+        self,
+        auth: Authentication,
+        *,
+        network_session: NetworkSession = None,
+        raw_responses: bool = False,
+    ):
+        """
+        :param auth: Auth object used for API calls
+        :param network_session: An object to keep network session state, defaults to None
+        :param raw_responses: If True, endpoint methods return the parsed JSON of responses as dicts and lists
+            instead of schema objects, defaults to False
+        """
+        self._client = BoxClient(auth=auth, network_session=network_session)
+        self.auth = self._client.auth
+        self.network_session = self._client.network_session
+        self.raw_responses = raw_responses
+
+    def __getattr__(self, name: str) -> AsyncManager:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        manager = getattr(self._client, name)
+        if not is_manager(manager):
+            raise AttributeError(f'AsyncBoxClient has no manager {name}')
+        async_manager = AsyncManager(manager, raw_responses=self.raw_responses)
+        setattr(self, name, async_manager)
+        return async_manager
+
+    async def aclose(self) -> None:
+        """
+        Close the connections opened by this client.
+        """
+        await self.network_session.aclose()
+
+    async def __aenter__(self) -> 'AsyncBoxClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def with_as_user_header(self, user_id: str) -> 'AsyncBoxClient':
+        """
+        Create a new client to impersonate user with the provided ID. All calls made with the new client will be made in context of the impersonated user, leaving the original client unmodified.
+        :param user_id: ID of an user to impersonate
+        :type user_id: str
+        """
+        return AsyncBoxClient(
+            auth=self.auth,
+            network_session=self.network_session.with_additional_headers(
+                {'As-User': user_id}
+            ),
+            raw_responses=self.raw_responses,
+        )
+
+    def with_suppressed_notifications(self) -> 'AsyncBoxClient':
+        """
+        Create a new client with suppressed notifications. Calls made with the new client will not trigger email or webhook notifications
+        """
+        return AsyncBoxClient(
+            auth=self.auth,
+            network_session=self.network_session.with_additional_headers(
+                {'Box-Notifications': 'off'}
+            ),
+            raw_responses=self.raw_responses,
+        )
+
+    def with_extra_headers(
+        self, *, extra_headers: Dict[str, str] = None
+    ) -> 'AsyncBoxClient':
+        """
+        Create a new client with a custom set of headers that will be included in every API call
+        :param extra_headers: Custom set of headers that will be included in every API call, defaults to None
+        :type extra_headers: Dict[str, str], optional
+        """
+        if extra_headers is None:
+            extra_headers = {}
+        return AsyncBoxClient(
+            auth=self.auth,
+            network_session=self.network_session.with_additional_headers(extra_headers),
+            raw_responses=self.raw_responses,
+        )
+
+    def with_custom_base_urls(self, base_urls: BaseUrls) -> 'AsyncBoxClient':
+        """
+        Create a new client with a custom set of base urls that will be used for every API call
+        :param base_urls: Custom set of base urls that will be used for every API call
+        :type base_urls: BaseUrls
+        """
+        return AsyncBoxClient(
+            auth=self.auth,
+            network_session=self.network_session.with_custom_base_urls(base_urls),
+            raw_responses=self.raw_responses,
+        )
+
+    def with_retry_policy(self, retry_policy: RetryPolicy) -> 'AsyncBoxClient':
+        """
+        Create a new client, which retries failed API calls according to the given policy
+        :param retry_policy: Policy deciding which failed API calls are retried and how long to wait between attempts
+        :type retry_policy: RetryPolicy
+        """
+        return AsyncBoxClient(
+            auth=self.auth,
+            network_session=self.network_session.with_retry_policy(retry_policy),
+            raw_responses=self.raw_responses,
+        )
+
+    def with_raw_responses(self, raw_responses: bool = True) -> 'AsyncBoxClient':
+        """
+        Create a new client, whose endpoint methods return the parsed JSON of responses as dicts and lists
+        instead of schema objects. The new client shares the network session of this client.
+        :param raw_responses: Whether the new client returns raw responses, defaults to True
+        :type raw_responses: bool, optional
+        """
+        return AsyncBoxClient(
+            auth=self.auth,
+            network_session=self.network_session,
+            raw_responses=raw_responses,
+        )
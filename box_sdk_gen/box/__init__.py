@@ -2,6 +2,10 @@ from box_sdk_gen.box.errors import *
 
 from box_sdk_gen.box.token_storage import *
 
+from box_sdk_gen.box.token_refresher import *
+
+from box_sdk_gen.box.upload_session_journal import *
+
 from box_sdk_gen.box.developer_token_auth import *
 
 from box_sdk_gen.box.oauth import *
@@ -9,3 +13,7 @@ from box_sdk_gen.box.oauth import *
 from box_sdk_gen.box.jwt_auth import *
 
 from box_sdk_gen.box.ccg_auth import *
+
+from box_sdk_gen.box.token_pool import *
+
+from box_sdk_gen.box.downscoped_token_cache import *
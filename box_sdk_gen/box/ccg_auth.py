@@ -1,3 +1,5 @@
+import threading
+
 from typing import Optional
 
 from typing import List
@@ -18,6 +20,10 @@ from box_sdk_gen.box.token_storage import TokenStorage
 
 from box_sdk_gen.box.token_storage import InMemoryTokenStorage
 
+from box_sdk_gen.box.token_refresher import refresh_token_once
+
+from box_sdk_gen.box.token_refresher import is_token_expiring
+
 from box_sdk_gen.managers.authorization import AuthorizationManager
 
 from box_sdk_gen.box.errors import BoxSDKError
@@ -67,6 +73,7 @@ class BoxCCGAuth(Authentication):
         super().__init__(**kwargs)
         self.config = config
         self.token_storage = self.config.token_storage
+        self._token_lock = threading.RLock()
         self.subject_id = (
             self.config.user_id
             if not self.config.user_id == None
@@ -86,20 +93,32 @@ class BoxCCGAuth(Authentication):
         :param network_session: An object to keep network session state, defaults to None
         :type network_session: Optional[NetworkSession], optional
         """
+        return refresh_token_once(
+            self.token_storage,
+            self._token_lock,
+            lambda current_token: self._request_token(
+                current_token, network_session=network_session
+            ),
+        )
+
+    def _request_token(
+        self,
+        current_token: Optional[AccessToken],
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
         auth_manager: AuthorizationManager = AuthorizationManager(
             network_session=(
                 network_session if not network_session == None else NetworkSession()
             )
         )
-        token: AccessToken = auth_manager.request_access_token(
+        return auth_manager.request_access_token(
             PostOAuth2TokenGrantTypeField.CLIENT_CREDENTIALS.value,
             client_id=self.config.client_id,
             client_secret=self.config.client_secret,
             box_subject_type=self.subject_type,
             box_subject_id=self.subject_id,
         )
-        self.token_storage.store(token)
-        return token
 
     def retrieve_token(
         self, *, network_session: Optional[NetworkSession] = None
@@ -110,9 +129,14 @@ class BoxCCGAuth(Authentication):
         :type network_session: Optional[NetworkSession], optional
         """
         old_token: Optional[AccessToken] = self.token_storage.get()
-        if old_token == None:
-            new_token: AccessToken = self.refresh_token(network_session=network_session)
-            return new_token
+        if old_token == None or is_token_expiring(old_token):
+            with self._token_lock, self.token_storage.lock():
+                old_token = self.token_storage.get()
+                if old_token == None or is_token_expiring(old_token):
+                    new_token: AccessToken = self.refresh_token(
+                        network_session=network_session
+                    )
+                    return new_token
         return old_token
 
     def retrieve_authorization_header(
@@ -0,0 +1,103 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from .token_refresher import is_token_expiring, set_token_issue_time
+from ..networking.auth import Authentication
+from ..networking.network import NetworkSession
+from ..schemas.access_token import AccessToken
+
+_CacheKey = Tuple[Tuple[str, ...], Optional[str], Optional[str]]
+
+
+class DownscopedTokenCache:
+    def __init__(
+        self, auth: Authentication, *, max_size: int = 1000, expiry_margin: float = 60
+    ):
+        """
+        Cache of downscoped tokens of an auth object, which reuses a token obtained for the same
+        scopes, resource and shared link until it is about to expire.
+        :param auth: Auth object, whose token is downscoped
+        :param max_size: Maximum number of cached tokens. The least recently used ones are removed first
+        :param expiry_margin: Number of seconds before expiry, after which a cached token is no longer returned,
+            so that it does not expire while it is being used
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        self.auth = auth
+        self.max_size = max_size
+        self.expiry_margin = expiry_margin
+        self._tokens: 'OrderedDict[_CacheKey, AccessToken]' = OrderedDict()
+        self._pending: Dict[_CacheKey, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def downscope_token(
+        self,
+        scopes: List[str],
+        *,
+        resource: Optional[str] = None,
+        shared_link: Optional[str] = None,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Return a cached downscoped token for the provided scopes, resource and shared link, or downscope the
+        access token of the auth object, when no token which is still valid is cached.
+        Concurrent calls for the same token wait for one token exchange.
+        :param scopes: The scope(s) to apply to the resulting token.
+        :type scopes: List[str]
+        :param resource: The file or folder to get a downscoped token for, defaults to None
+        :type resource: Optional[str], optional
+        :param shared_link: The shared link to get a downscoped token for, defaults to None
+        :type shared_link: Optional[str], optional
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        key: _CacheKey = (tuple(sorted(set(scopes))), resource, shared_link)
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is not None:
+                if not is_token_expiring(token, self.expiry_margin):
+                    self._tokens.move_to_end(key)
+                    return token
+                del self._tokens[key]
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = Future()
+                exchanging = True
+            else:
+                exchanging = False
+        if not exchanging:
+            return pending.result()
+
+        try:
+            token = set_token_issue_time(
+                self.auth.downscope_token(
+                    scopes,
+                    resource=resource,
+                    shared_link=shared_link,
+                    network_session=network_session,
+                )
+            )
+        except BaseException as error:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(error)
+            raise
+        with self._lock:
+            del self._pending[key]
+            self._tokens[key] = token
+            while len(self._tokens) > self.max_size:
+                self._tokens.popitem(last=False)
+        pending.set_result(token)
+        return token
+
+    def clear(self) -> None:
+        """
+        Remove all cached tokens, e.g. after the access token of the auth object was revoked.
+        """
+        with self._lock:
+            self._tokens.clear()
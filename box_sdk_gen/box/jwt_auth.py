@@ -1,3 +1,5 @@
+import threading
+
 from typing import Dict
 
 from box_sdk_gen.internal.base_object import BaseObject
@@ -26,6 +28,10 @@ from box_sdk_gen.box.token_storage import TokenStorage
 
 from box_sdk_gen.box.token_storage import InMemoryTokenStorage
 
+from box_sdk_gen.box.token_refresher import refresh_token_once
+
+from box_sdk_gen.box.token_refresher import is_token_expiring
+
 from box_sdk_gen.serialization.json.json_data import json_to_serialized_data
 
 from box_sdk_gen.serialization.json.json_data import SerializedData
@@ -261,6 +267,7 @@ class BoxJWTAuth(Authentication):
         super().__init__(**kwargs)
         self.config = config
         self.token_storage = self.config.token_storage
+        self._token_lock = threading.RLock()
         self.subject_id = (
             self.config.enterprise_id
             if not self.config.enterprise_id == None
@@ -278,6 +285,20 @@ class BoxJWTAuth(Authentication):
         :param network_session: An object to keep network session state, defaults to None
         :type network_session: Optional[NetworkSession], optional
         """
+        return refresh_token_once(
+            self.token_storage,
+            self._token_lock,
+            lambda current_token: self._request_token(
+                current_token, network_session=network_session
+            ),
+        )
+
+    def _request_token(
+        self,
+        current_token: Optional[AccessToken],
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
         if is_browser():
             raise BoxSDKError(
                 message='JWT auth is not supported in browser environment.'
@@ -300,7 +321,8 @@ class BoxJWTAuth(Authentication):
             keyid=self.config.jwt_key_id,
         )
         jwt_key: JwtKey = JwtKey(
-            key=self.config.private_key, passphrase=self.config.private_key_passphrase
+            key=self.config.private_key,
+            passphrase=self.config.private_key_passphrase,
         )
         assertion: str = create_jwt_assertion(claims, jwt_key, jwt_options)
         auth_manager: AuthorizationManager = AuthorizationManager(
@@ -308,14 +330,12 @@ class BoxJWTAuth(Authentication):
                 network_session if not network_session == None else NetworkSession()
             )
         )
-        token: AccessToken = auth_manager.request_access_token(
+        return auth_manager.request_access_token(
             PostOAuth2TokenGrantTypeField.URN_IETF_PARAMS_OAUTH_GRANT_TYPE_JWT_BEARER.value,
             assertion=assertion,
             client_id=self.config.client_id,
             client_secret=self.config.client_secret,
         )
-        self.token_storage.store(token)
-        return token
 
     def retrieve_token(
         self, *, network_session: Optional[NetworkSession] = None
@@ -326,9 +346,14 @@ class BoxJWTAuth(Authentication):
         :type network_session: Optional[NetworkSession], optional
         """
         old_token: Optional[AccessToken] = self.token_storage.get()
-        if old_token == None:
-            new_token: AccessToken = self.refresh_token(network_session=network_session)
-            return new_token
+        if old_token == None or is_token_expiring(old_token):
+            with self._token_lock, self.token_storage.lock():
+                old_token = self.token_storage.get()
+                if old_token == None or is_token_expiring(old_token):
+                    new_token: AccessToken = self.refresh_token(
+                        network_session=network_session
+                    )
+                    return new_token
         return old_token
 
     def retrieve_authorization_header(
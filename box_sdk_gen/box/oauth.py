@@ -1,3 +1,5 @@
+import threading
+
 from typing import Optional
 
 from typing import Dict
@@ -26,6 +28,12 @@ from box_sdk_gen.box.token_storage import TokenStorage
 
 from box_sdk_gen.box.token_storage import InMemoryTokenStorage
 
+from box_sdk_gen.box.token_refresher import set_token_issue_time
+
+from box_sdk_gen.box.token_refresher import refresh_token_once
+
+from box_sdk_gen.box.token_refresher import is_token_expiring
+
 from box_sdk_gen.serialization.json.json_data import sd_to_url_params
 
 from box_sdk_gen.internal.utils import prepare_params
@@ -84,6 +92,7 @@ class BoxOAuth(Authentication):
         super().__init__(**kwargs)
         self.config = config
         self.token_storage = self.config.token_storage
+        self._token_lock = threading.RLock()
 
     def get_authorize_url(self, *, options: GetAuthorizeUrlOptions = None) -> str:
         """
@@ -133,13 +142,13 @@ class BoxOAuth(Authentication):
                 network_session if not network_session == None else NetworkSession()
             )
         )
-        token: AccessToken = auth_manager.request_access_token(
+        return auth_manager.request_access_token(
             PostOAuth2TokenGrantTypeField.AUTHORIZATION_CODE.value,
             code=authorization_code,
             client_id=self.config.client_id,
             client_secret=self.config.client_secret,
         )
-        self.token_storage.store(token)
+        self.token_storage.store(set_token_issue_time(token))
         return token
 
     def retrieve_token(
@@ -155,6 +164,11 @@ class BoxOAuth(Authentication):
             raise BoxSDKError(
                 message='Access and refresh tokens not available. Authenticate before making any API call first.'
             )
+        if is_token_expiring(token) and not token.refresh_token == None:
+            with self._token_lock, self.token_storage.lock():
+                token = self.token_storage.get()
+                if is_token_expiring(token):
+                    return self.refresh_token(network_session=network_session)
         return token
 
     def refresh_token(
@@ -165,23 +179,34 @@ class BoxOAuth(Authentication):
         :param network_session: An object to keep network session state, defaults to None
         :type network_session: Optional[NetworkSession], optional
         """
-        old_token: Optional[AccessToken] = self.token_storage.get()
+        return refresh_token_once(
+            self.token_storage,
+            self._token_lock,
+            lambda current_token: self._request_token(
+                current_token, network_session=network_session
+            ),
+        )
+
+    def _request_token(
+        self,
+        current_token: Optional[AccessToken],
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
         token_used_for_refresh: Optional[str] = (
-            old_token.refresh_token if not old_token == None else None
+            current_token.refresh_token if not current_token == None else None
         )
         auth_manager: AuthorizationManager = AuthorizationManager(
             network_session=(
                 network_session if not network_session == None else NetworkSession()
             )
         )
-        token: AccessToken = auth_manager.request_access_token(
+        return auth_manager.request_access_token(
             PostOAuth2TokenGrantTypeField.REFRESH_TOKEN.value,
             client_id=self.config.client_id,
             client_secret=self.config.client_secret,
             refresh_token=token_used_for_refresh,
         )
-        self.token_storage.store(token)
-        return token
 
     def retrieve_authorization_header(
         self, *, network_session: Optional[NetworkSession] = None
@@ -0,0 +1,129 @@
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+
+from .ccg_auth import BoxCCGAuth
+from .errors import BoxSDKError
+from .jwt_auth import BoxJWTAuth
+from .token_refresher import is_token_expiring
+from ..client import BoxClient
+from ..networking.base_urls import BaseUrls
+from ..networking.network import NetworkSession
+
+SubjectAuth = Union[BoxJWTAuth, BoxCCGAuth]
+
+
+class _PoolEntry:
+    def __init__(self, auth: SubjectAuth):
+        self.auth = auth
+        self.client: Optional[BoxClient] = None
+
+
+def _has_expired_token(auth: SubjectAuth) -> bool:
+    token = auth.token_storage.get()
+    return token is not None and is_token_expiring(token, 0)
+
+
+class TokenPool:
+    def __init__(
+        self,
+        auth: SubjectAuth,
+        *,
+        max_size: int = 1000,
+        network_session: Optional[NetworkSession] = None,
+    ):
+        """
+        Pool of auth objects and tokens for many users or enterprises of one JWT or CCG app.
+        Each subject gets its own token, which is reused until it expires or the subject
+        is evicted as the least recently used one, when the pool is full.
+        :param auth: Auth object of the app, whose with_user_subject and with_enterprise_subject are used to create auth objects of subjects
+        :param max_size: Maximum number of subjects, whose tokens are kept
+        :param network_session: Network session shared by the clients returned by the pool, defaults to None
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        if not isinstance(auth, (BoxJWTAuth, BoxCCGAuth)):
+            raise BoxSDKError(
+                message='TokenPool requires the auth object of a JWT or CCG app, whose tokens can be requested for other subjects.'
+            )
+        if network_session is None:
+            network_session = NetworkSession(base_urls=BaseUrls())
+        self.auth = auth
+        self.max_size = max_size
+        self.network_session = network_session
+        self._entries: 'OrderedDict[Tuple[str, str], _PoolEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_entry(self, subject_type: str, subject_id: str) -> _PoolEntry:
+        key = (subject_type, subject_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        # The token is read outside of the lock, as the token storage can be slow, e.g. SQLiteTokenStorage.
+        # A subject, whose token has expired, gets a new auth object, so that no expired token is kept in the pool.
+        if entry is not None and not _has_expired_token(entry.auth):
+            return entry
+        with self._lock:
+            current_entry = self._entries.get(key)
+            if current_entry is not None and current_entry is not entry:
+                self._entries.move_to_end(key)
+                return current_entry
+            # Creating an auth object does not request a token, so it is cheap enough to do under the lock.
+            # The token is requested on first use, with the single-flight locking of the auth object.
+            if subject_type == 'user':
+                auth = self.auth.with_user_subject(subject_id)
+            else:
+                auth = self.auth.with_enterprise_subject(subject_id)
+            entry = self._entries[key] = _PoolEntry(auth)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return entry
+
+    def get_user_auth(self, user_id: str) -> SubjectAuth:
+        """
+        Get the auth object authenticating as the given user.
+        :param user_id: The id of the user
+        :type user_id: str
+        """
+        return self._get_entry('user', user_id).auth
+
+    def get_enterprise_auth(self, enterprise_id: str) -> SubjectAuth:
+        """
+        Get the auth object authenticating as the service account of the given enterprise.
+        :param enterprise_id: The id of the enterprise
+        :type enterprise_id: str
+        """
+        return self._get_entry('enterprise', enterprise_id).auth
+
+    def get_user_client(self, user_id: str) -> BoxClient:
+        """
+        Get a client making API calls as the given user. Clients of all subjects share the network session of the pool.
+        :param user_id: The id of the user
+        :type user_id: str
+        """
+        return self._get_client(self._get_entry('user', user_id))
+
+    def get_enterprise_client(self, enterprise_id: str) -> BoxClient:
+        """
+        Get a client making API calls as the service account of the given enterprise.
+        :param enterprise_id: The id of the enterprise
+        :type enterprise_id: str
+        """
+        return self._get_client(self._get_entry('enterprise', enterprise_id))
+
+    def _get_client(self, entry: _PoolEntry) -> BoxClient:
+        client = entry.client
+        if client is None:
+            client = entry.client = BoxClient(
+                auth=entry.auth, network_session=self.network_session
+            )
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
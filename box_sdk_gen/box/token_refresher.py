@@ -0,0 +1,134 @@
+import threading
+from typing import Callable, ContextManager, Optional
+
+from ..internal.utils import get_epoch_time_in_seconds
+from ..networking.auth import Authentication
+from ..networking.network import NetworkSession
+from ..schemas.access_token import AccessToken
+from .token_storage import TokenStorage
+
+TOKEN_EXPIRY_MARGIN = 30
+_RETRY_INTERVAL = 10
+
+
+def set_token_issue_time(token: AccessToken) -> AccessToken:
+    """
+    Record when a token was issued, so that its expiry can be computed from its `expires_in`.
+    The time is stored as the `issued_at` attribute of the token, in seconds since the epoch.
+    """
+    token.issued_at = get_epoch_time_in_seconds()
+    return token
+
+
+def get_token_expiry_time(token: AccessToken) -> Optional[int]:
+    issued_at = getattr(token, 'issued_at', None)
+    if issued_at is None or token.expires_in is None:
+        return None
+    return issued_at + token.expires_in
+
+
+def is_token_expiring(token: AccessToken, margin: float = TOKEN_EXPIRY_MARGIN) -> bool:
+    """
+    Check whether a token expires within the given number of seconds. Tokens with an unknown
+    issue time are assumed to be valid, as they are refreshed when the API rejects them.
+    """
+    expiry_time = get_token_expiry_time(token)
+    return (
+        expiry_time is not None and expiry_time - margin <= get_epoch_time_in_seconds()
+    )
+
+
+def refresh_token_once(
+    token_storage: TokenStorage,
+    token_lock: ContextManager,
+    request_token: Callable[[Optional[AccessToken]], AccessToken],
+) -> AccessToken:
+    """
+    Request a new token with `request_token` and store it, unless the stored token was already replaced
+    while waiting for the locks. Callers which waited for a refresh made by another thread or process
+    receive its token instead of requesting another one.
+    :param token_storage: Token storage of the auth object
+    :param token_lock: Lock of the auth object, held together with the lock of the token storage
+    :param request_token: Function requesting a new token, which receives the currently stored token
+    """
+    token_to_refresh: Optional[AccessToken] = token_storage.get()
+    access_token_to_refresh: Optional[str] = (
+        token_to_refresh.access_token if not token_to_refresh == None else None
+    )
+    with token_lock, token_storage.lock():
+        current_token: Optional[AccessToken] = token_storage.get()
+        if (
+            not current_token == None
+            and not current_token.access_token == access_token_to_refresh
+        ):
+            return current_token
+        token: AccessToken = request_token(current_token)
+        token_storage.store(set_token_issue_time(token))
+        return token
+
+
+class TokenRefresher:
+    def __init__(
+        self,
+        auth: Authentication,
+        *,
+        refresh_margin: float = 300,
+        network_session: Optional[NetworkSession] = None,
+    ):
+        """
+        Refreshes the token of an auth object in a background thread ahead of its expiry,
+        so that API calls never wait for a new token.
+        :param auth: Auth object with a token storage, e.g. BoxJWTAuth, BoxCCGAuth or BoxOAuth
+        :param refresh_margin: Number of seconds before the expiry of the token, when it is refreshed
+        :param network_session: Network session used for token requests, defaults to None
+        """
+        self.auth = auth
+        self.refresh_margin = refresh_margin
+        self.network_session = network_session
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'TokenRefresher':
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='box-token-refresher', daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'TokenRefresher':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _seconds_until_refresh(self) -> Optional[float]:
+        token: Optional[AccessToken] = self.auth.token_storage.get()
+        if token is None:
+            return 0
+        expiry_time = get_token_expiry_time(token)
+        if expiry_time is None:
+            return None
+        return expiry_time - self.refresh_margin - get_epoch_time_in_seconds()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            seconds_until_refresh = self._seconds_until_refresh()
+            if seconds_until_refresh is not None and seconds_until_refresh <= 0:
+                try:
+                    self.auth.refresh_token(network_session=self.network_session)
+                    seconds_until_refresh = self._seconds_until_refresh()
+                except Exception:
+                    # API calls still refresh the token themselves, so the refresh is just retried later.
+                    seconds_until_refresh = None
+            # Tokens without a known expiry are checked again later, as another process may replace them.
+            if seconds_until_refresh is None or seconds_until_refresh <= 0:
+                seconds_until_refresh = _RETRY_INTERVAL
+            self._stopped.wait(seconds_until_refresh)
@@ -1,9 +1,19 @@
+import json
+import os
 import shelve
+import sqlite3
+import threading
+import time
+import uuid
 from abc import abstractmethod
-from typing import Optional
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator, Optional
 
+from .errors import BoxSDKError
 from ..schemas.access_token import AccessToken
 
+_LOCK_POLL_INTERVAL = 0.05
+
 
 class TokenStorage:
     @abstractmethod
@@ -18,6 +28,13 @@ class TokenStorage:
     def clear(self) -> None:
         pass
 
+    def lock(self) -> ContextManager:
+        """
+        Lock held by auth objects while they request and store a new token. Storages shared by several
+        processes override it, so that one process requests a token and the others wait and reuse it.
+        """
+        return nullcontext()
+
 
 class InMemoryTokenStorage(TokenStorage):
     def __init__(self, token: Optional[AccessToken] = None):
@@ -72,3 +89,143 @@ class FileWithInMemoryCacheTokenStorage(TokenStorage):
             if 'token' in file:
                 del file['token']
         self.cached_token = None
+
+
+class SQLiteTokenStorage(TokenStorage):
+    def __init__(
+        self,
+        filename: str = 'token_storage.db',
+        *,
+        key: str = 'token',
+        timeout: float = 30,
+    ):
+        """
+        Token storage, which can be shared by several processes on one host. The token is kept in an SQLite
+        database and cached in memory until another process stores a new one. While one process requests
+        a new token, the others wait for it instead of requesting their own.
+        :param filename: Path of the database file
+        :param key: Key of the token in the database, so that one file can hold tokens of several subjects
+        :param timeout: Seconds to wait for another process, which is requesting a token. A process holding
+            the lock for longer, e.g. because it crashed, is assumed to be gone and the lock is taken over
+        """
+        self.filename = filename
+        self.key = key
+        self.timeout = timeout
+        self._pid: Optional[int] = None
+        self._read_connection: Optional[sqlite3.Connection] = None
+        self._write_connection: Optional[sqlite3.Connection] = None
+        self._read_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_owner: Optional[str] = None
+        self._cached_version: Optional[int] = None
+        self._cached_token: Optional[AccessToken] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.filename,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, token TEXT NOT NULL)'
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)'
+        )
+        return connection
+
+    def _ensure_connections(self) -> None:
+        # Connections must not be shared with processes forked after they were opened.
+        if self._pid != os.getpid():
+            self._write_connection = self._connect()
+            self._read_connection = self._connect()
+            self._cached_version = None
+            self._pid = os.getpid()
+
+    def get(self) -> Optional[AccessToken]:
+        with self._read_lock:
+            self._ensure_connections()
+            # data_version changes only when another connection commits, so an unchanged
+            # database is detected without reading the token.
+            version = self._read_connection.execute('PRAGMA data_version').fetchone()[0]
+            if version != self._cached_version:
+                row = self._read_connection.execute(
+                    'SELECT token FROM tokens WHERE key = ?', (self.key,)
+                ).fetchone()
+                self._cached_token = (
+                    AccessToken.from_dict(json.loads(row[0])) if row else None
+                )
+                self._cached_version = version
+            return self._cached_token
+
+    def store(self, token: AccessToken) -> None:
+        with self._write_lock:
+            self._ensure_connections()
+            self._write_connection.execute(
+                'INSERT OR REPLACE INTO tokens (key, token) VALUES (?, ?)',
+                (self.key, json.dumps(token.to_dict())),
+            )
+
+    def clear(self) -> None:
+        with self._write_lock:
+            self._ensure_connections()
+            self._write_connection.execute(
+                'DELETE FROM tokens WHERE key = ?', (self.key,)
+            )
+
+    def _try_acquire_lock(self, owner: str) -> bool:
+        # The lock is a row of the locks table. Taking it is a short write transaction,
+        # so the database is never locked while the token is requested.
+        now = time.time()
+        self._write_connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = self._write_connection.execute(
+                'SELECT expires_at FROM locks WHERE key = ?', (self.key,)
+            ).fetchone()
+            acquired = row is None or row[0] <= now
+            if acquired:
+                self._write_connection.execute(
+                    'INSERT OR REPLACE INTO locks (key, owner, expires_at) VALUES (?, ?, ?)',
+                    (self.key, owner, now + self.timeout),
+                )
+        except BaseException:
+            self._write_connection.execute('ROLLBACK')
+            raise
+        self._write_connection.execute('COMMIT')
+        return acquired
+
+    def _acquire_lock(self) -> None:
+        owner = uuid.uuid4().hex
+        give_up_at = time.monotonic() + self.timeout
+        while not self._try_acquire_lock(owner):
+            if time.monotonic() >= give_up_at:
+                raise BoxSDKError(
+                    message='Timed out waiting for another process requesting a token.'
+                )
+            time.sleep(_LOCK_POLL_INTERVAL)
+        self._lock_owner = owner
+
+    def _release_lock(self) -> None:
+        self._write_connection.execute(
+            'DELETE FROM locks WHERE key = ? AND owner = ?',
+            (self.key, self._lock_owner),
+        )
+        self._lock_owner = None
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        with self._write_lock:
+            self._ensure_connections()
+            if self._lock_depth == 0:
+                # Other processes wait for the lock, while they can still read the current token.
+                self._acquire_lock()
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    self._release_lock()
@@ -0,0 +1,96 @@
+import shelve
+from abc import abstractmethod
+from typing import List, Optional
+
+from ..internal.base_object import BaseObject
+from ..schemas.upload_part import UploadPart
+
+
+class UploadSessionProgress(BaseObject):
+    def __init__(
+        self,
+        upload_session_id: str,
+        file_name: str,
+        file_size: int,
+        parent_folder_id: str,
+        part_size: int,
+        *,
+        parts: Optional[List[UploadPart]] = None,
+        **kwargs
+    ):
+        """
+        :param upload_session_id: The ID of the upload session.
+        :type upload_session_id: str
+        :param file_name: The name of the file being uploaded.
+        :type file_name: str
+        :param file_size: The total size of the file in bytes.
+        :type file_size: int
+        :param parent_folder_id: The ID of the folder the file is uploaded to.
+        :type parent_folder_id: str
+        :param part_size: The part size assigned to the upload session.
+        :type part_size: int
+        :param parts: Parts acknowledged by the API so far, defaults to None
+        :type parts: Optional[List[UploadPart]], optional
+        """
+        super().__init__(**kwargs)
+        if parts is None:
+            parts = []
+        self.upload_session_id = upload_session_id
+        self.file_name = file_name
+        self.file_size = file_size
+        self.parent_folder_id = parent_folder_id
+        self.part_size = part_size
+        self.parts = parts
+
+    def matches(self, file_name: str, file_size: int, parent_folder_id: str) -> bool:
+        return (
+            self.file_name == file_name
+            and self.file_size == file_size
+            and self.parent_folder_id == parent_folder_id
+        )
+
+
+class UploadSessionJournal:
+    @abstractmethod
+    def store(self, progress: UploadSessionProgress) -> None:
+        pass
+
+    @abstractmethod
+    def get(self) -> Optional[UploadSessionProgress]:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class InMemoryUploadSessionJournal(UploadSessionJournal):
+    def __init__(self, progress: Optional[UploadSessionProgress] = None):
+        self._progress = progress
+
+    def store(self, progress: UploadSessionProgress) -> None:
+        self._progress = progress
+
+    def get(self) -> Optional[UploadSessionProgress]:
+        return self._progress
+
+    def clear(self) -> None:
+        self._progress = None
+
+
+class FileUploadSessionJournal(UploadSessionJournal):
+    def __init__(self, filename: str = 'upload_session_journal'):
+        self.filename = filename
+
+    def store(self, progress: UploadSessionProgress) -> None:
+        with shelve.open(self.filename) as file:
+            file['upload_session'] = progress
+
+    def get(self) -> Optional[UploadSessionProgress]:
+        with shelve.open(self.filename) as file:
+            return file.get('upload_session', None)
+
+    def clear(self) -> None:
+        with shelve.open(self.filename) as file:
+            if 'upload_session' in file:
+                del file['upload_session']
@@ -1,166 +1,5 @@
-from typing import Dict
-
-from box_sdk_gen.managers.authorization import AuthorizationManager
-
-from box_sdk_gen.managers.files import FilesManager
-
-from box_sdk_gen.managers.trashed_files import TrashedFilesManager
-
-from box_sdk_gen.managers.downloads import DownloadsManager
-
-from box_sdk_gen.managers.uploads import UploadsManager
-
-from box_sdk_gen.managers.chunked_uploads import ChunkedUploadsManager
-
-from box_sdk_gen.managers.list_collaborations import ListCollaborationsManager
-
-from box_sdk_gen.managers.comments import CommentsManager
-
-from box_sdk_gen.managers.tasks import TasksManager
-
-from box_sdk_gen.managers.file_versions import FileVersionsManager
-
-from box_sdk_gen.managers.file_metadata import FileMetadataManager
-
-from box_sdk_gen.managers.file_classifications import FileClassificationsManager
-
-from box_sdk_gen.managers.skills import SkillsManager
-
-from box_sdk_gen.managers.file_watermarks import FileWatermarksManager
-
-from box_sdk_gen.managers.file_requests import FileRequestsManager
-
-from box_sdk_gen.managers.folders import FoldersManager
-
-from box_sdk_gen.managers.trashed_folders import TrashedFoldersManager
-
-from box_sdk_gen.managers.folder_metadata import FolderMetadataManager
-
-from box_sdk_gen.managers.folder_classifications import FolderClassificationsManager
-
-from box_sdk_gen.managers.trashed_items import TrashedItemsManager
-
-from box_sdk_gen.managers.folder_watermarks import FolderWatermarksManager
-
-from box_sdk_gen.managers.folder_locks import FolderLocksManager
-
-from box_sdk_gen.managers.metadata_templates import MetadataTemplatesManager
-
-from box_sdk_gen.managers.classifications import ClassificationsManager
-
-from box_sdk_gen.managers.metadata_cascade_policies import (
-    MetadataCascadePoliciesManager,
-)
-
-from box_sdk_gen.managers.search import SearchManager
-
-from box_sdk_gen.managers.user_collaborations import UserCollaborationsManager
-
-from box_sdk_gen.managers.task_assignments import TaskAssignmentsManager
-
-from box_sdk_gen.managers.shared_links_files import SharedLinksFilesManager
-
-from box_sdk_gen.managers.shared_links_folders import SharedLinksFoldersManager
-
-from box_sdk_gen.managers.web_links import WebLinksManager
-
-from box_sdk_gen.managers.trashed_web_links import TrashedWebLinksManager
-
-from box_sdk_gen.managers.shared_links_web_links import SharedLinksWebLinksManager
-
-from box_sdk_gen.managers.users import UsersManager
-
-from box_sdk_gen.managers.session_termination import SessionTerminationManager
-
-from box_sdk_gen.managers.avatars import AvatarsManager
-
-from box_sdk_gen.managers.transfer import TransferManager
-
-from box_sdk_gen.managers.email_aliases import EmailAliasesManager
-
-from box_sdk_gen.managers.memberships import MembershipsManager
-
-from box_sdk_gen.managers.invites import InvitesManager
-
-from box_sdk_gen.managers.groups import GroupsManager
-
-from box_sdk_gen.managers.webhooks import WebhooksManager
-
-from box_sdk_gen.managers.events import EventsManager
-
-from box_sdk_gen.managers.collections import CollectionsManager
-
-from box_sdk_gen.managers.recent_items import RecentItemsManager
-
-from box_sdk_gen.managers.retention_policies import RetentionPoliciesManager
-
-from box_sdk_gen.managers.retention_policy_assignments import (
-    RetentionPolicyAssignmentsManager,
-)
-
-from box_sdk_gen.managers.legal_hold_policies import LegalHoldPoliciesManager
-
-from box_sdk_gen.managers.legal_hold_policy_assignments import (
-    LegalHoldPolicyAssignmentsManager,
-)
-
-from box_sdk_gen.managers.file_version_retentions import FileVersionRetentionsManager
-
-from box_sdk_gen.managers.file_version_legal_holds import FileVersionLegalHoldsManager
-
-from box_sdk_gen.managers.shield_information_barriers import (
-    ShieldInformationBarriersManager,
-)
-
-from box_sdk_gen.managers.shield_information_barrier_reports import (
-    ShieldInformationBarrierReportsManager,
-)
-
-from box_sdk_gen.managers.shield_information_barrier_segments import (
-    ShieldInformationBarrierSegmentsManager,
-)
-
-from box_sdk_gen.managers.shield_information_barrier_segment_members import (
-    ShieldInformationBarrierSegmentMembersManager,
-)
-
-from box_sdk_gen.managers.shield_information_barrier_segment_restrictions import (
-    ShieldInformationBarrierSegmentRestrictionsManager,
-)
-
-from box_sdk_gen.managers.device_pinners import DevicePinnersManager
-
-from box_sdk_gen.managers.terms_of_services import TermsOfServicesManager
-
-from box_sdk_gen.managers.terms_of_service_user_statuses import (
-    TermsOfServiceUserStatusesManager,
-)
-
-from box_sdk_gen.managers.collaboration_allowlist_entries import (
-    CollaborationAllowlistEntriesManager,
-)
-
-from box_sdk_gen.managers.collaboration_allowlist_exempt_targets import (
-    CollaborationAllowlistExemptTargetsManager,
-)
-
-from box_sdk_gen.managers.storage_policies import StoragePoliciesManager
-
-from box_sdk_gen.managers.storage_policy_assignments import (
-    StoragePolicyAssignmentsManager,
-)
-
-from box_sdk_gen.managers.zip_downloads import ZipDownloadsManager
-
-from box_sdk_gen.managers.sign_requests import SignRequestsManager
-
-from box_sdk_gen.managers.workflows import WorkflowsManager
-
-from box_sdk_gen.managers.sign_templates import SignTemplatesManager
-
-from box_sdk_gen.managers.integration_mappings import IntegrationMappingsManager
-
-from box_sdk_gen.managers.ai import AiManager
+import importlib
+from typing import TYPE_CHECKING, Dict, Optional
 
 from box_sdk_gen.networking.auth import Authentication
 
@@ -168,222 +7,365 @@ from box_sdk_gen.networking.network import NetworkSession
 
 from box_sdk_gen.networking.base_urls import BaseUrls
 
+from box_sdk_gen.networking.retries import RetryPolicy
+
+from box_sdk_gen.raw_client import RawBoxClient
+
+if TYPE_CHECKING:
+    from box_sdk_gen.box.token_pool import TokenPool
+    from box_sdk_gen.managers.authorization import AuthorizationManager
+    from box_sdk_gen.managers.files import FilesManager
+    from box_sdk_gen.managers.trashed_files import TrashedFilesManager
+    from box_sdk_gen.managers.downloads import DownloadsManager
+    from box_sdk_gen.managers.uploads import UploadsManager
+    from box_sdk_gen.managers.chunked_uploads import ChunkedUploadsManager
+    from box_sdk_gen.managers.list_collaborations import ListCollaborationsManager
+    from box_sdk_gen.managers.comments import CommentsManager
+    from box_sdk_gen.managers.tasks import TasksManager
+    from box_sdk_gen.managers.file_versions import FileVersionsManager
+    from box_sdk_gen.managers.file_metadata import FileMetadataManager
+    from box_sdk_gen.managers.file_classifications import FileClassificationsManager
+    from box_sdk_gen.managers.skills import SkillsManager
+    from box_sdk_gen.managers.file_watermarks import FileWatermarksManager
+    from box_sdk_gen.managers.file_requests import FileRequestsManager
+    from box_sdk_gen.managers.folders import FoldersManager
+    from box_sdk_gen.managers.trashed_folders import TrashedFoldersManager
+    from box_sdk_gen.managers.folder_metadata import FolderMetadataManager
+    from box_sdk_gen.managers.folder_classifications import FolderClassificationsManager
+    from box_sdk_gen.managers.trashed_items import TrashedItemsManager
+    from box_sdk_gen.managers.folder_watermarks import FolderWatermarksManager
+    from box_sdk_gen.managers.folder_locks import FolderLocksManager
+    from box_sdk_gen.managers.metadata_templates import MetadataTemplatesManager
+    from box_sdk_gen.managers.classifications import ClassificationsManager
+    from box_sdk_gen.managers.metadata_cascade_policies import (
+        MetadataCascadePoliciesManager,
+    )
+    from box_sdk_gen.managers.search import SearchManager
+    from box_sdk_gen.managers.user_collaborations import UserCollaborationsManager
+    from box_sdk_gen.managers.task_assignments import TaskAssignmentsManager
+    from box_sdk_gen.managers.shared_links_files import SharedLinksFilesManager
+    from box_sdk_gen.managers.shared_links_folders import SharedLinksFoldersManager
+    from box_sdk_gen.managers.web_links import WebLinksManager
+    from box_sdk_gen.managers.trashed_web_links import TrashedWebLinksManager
+    from box_sdk_gen.managers.shared_links_web_links import SharedLinksWebLinksManager
+    from box_sdk_gen.managers.users import UsersManager
+    from box_sdk_gen.managers.session_termination import SessionTerminationManager
+    from box_sdk_gen.managers.avatars import AvatarsManager
+    from box_sdk_gen.managers.transfer import TransferManager
+    from box_sdk_gen.managers.email_aliases import EmailAliasesManager
+    from box_sdk_gen.managers.memberships import MembershipsManager
+    from box_sdk_gen.managers.invites import InvitesManager
+    from box_sdk_gen.managers.groups import GroupsManager
+    from box_sdk_gen.managers.webhooks import WebhooksManager
+    from box_sdk_gen.managers.events import EventsManager
+    from box_sdk_gen.managers.collections import CollectionsManager
+    from box_sdk_gen.managers.recent_items import RecentItemsManager
+    from box_sdk_gen.managers.retention_policies import RetentionPoliciesManager
+    from box_sdk_gen.managers.retention_policy_assignments import (
+        RetentionPolicyAssignmentsManager,
+    )
+    from box_sdk_gen.managers.legal_hold_policies import LegalHoldPoliciesManager
+    from box_sdk_gen.managers.legal_hold_policy_assignments import (
+        LegalHoldPolicyAssignmentsManager,
+    )
+    from box_sdk_gen.managers.file_version_retentions import (
+        FileVersionRetentionsManager,
+    )
+    from box_sdk_gen.managers.file_version_legal_holds import (
+        FileVersionLegalHoldsManager,
+    )
+    from box_sdk_gen.managers.shield_information_barriers import (
+        ShieldInformationBarriersManager,
+    )
+    from box_sdk_gen.managers.shield_information_barrier_reports import (
+        ShieldInformationBarrierReportsManager,
+    )
+    from box_sdk_gen.managers.shield_information_barrier_segments import (
+        ShieldInformationBarrierSegmentsManager,
+    )
+    from box_sdk_gen.managers.shield_information_barrier_segment_members import (
+        ShieldInformationBarrierSegmentMembersManager,
+    )
+    from box_sdk_gen.managers.shield_information_barrier_segment_restrictions import (
+        ShieldInformationBarrierSegmentRestrictionsManager,
+    )
+    from box_sdk_gen.managers.device_pinners import DevicePinnersManager
+    from box_sdk_gen.managers.terms_of_services import TermsOfServicesManager
+    from box_sdk_gen.managers.terms_of_service_user_statuses import (
+        TermsOfServiceUserStatusesManager,
+    )
+    from box_sdk_gen.managers.collaboration_allowlist_entries import (
+        CollaborationAllowlistEntriesManager,
+    )
+    from box_sdk_gen.managers.collaboration_allowlist_exempt_targets import (
+        CollaborationAllowlistExemptTargetsManager,
+    )
+    from box_sdk_gen.managers.storage_policies import StoragePoliciesManager
+    from box_sdk_gen.managers.storage_policy_assignments import (
+        StoragePolicyAssignmentsManager,
+    )
+    from box_sdk_gen.managers.zip_downloads import ZipDownloadsManager
+    from box_sdk_gen.managers.sign_requests import SignRequestsManager
+    from box_sdk_gen.managers.workflows import WorkflowsManager
+    from box_sdk_gen.managers.sign_templates import SignTemplatesManager
+    from box_sdk_gen.managers.integration_mappings import IntegrationMappingsManager
+    from box_sdk_gen.managers.ai import AiManager
+
+
+class _LazyManager:
+    def __init__(self, module_name: str, class_name: str):
+        self.module_name = module_name
+        self.class_name = class_name
+        self.attribute_name = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attribute_name = name
+
+    def __get__(self, client: Optional['BoxClient'], owner: type):
+        # Managers are imported and created on first access and then cached on the client,
+        # so that creating a client, e.g. for each request with with_as_user_header(), is cheap.
+        if client is None:
+            return self
+        manager_class = getattr(
+            importlib.import_module(self.module_name), self.class_name
+        )
+        manager = manager_class(
+            auth=client.auth, network_session=client.network_session
+        )
+        client.__dict__[self.attribute_name] = manager
+        return manager
+
 
 class BoxClient:
+    authorization: 'AuthorizationManager' = _LazyManager(
+        'box_sdk_gen.managers.authorization', 'AuthorizationManager'
+    )
+    files: 'FilesManager' = _LazyManager('box_sdk_gen.managers.files', 'FilesManager')
+    trashed_files: 'TrashedFilesManager' = _LazyManager(
+        'box_sdk_gen.managers.trashed_files', 'TrashedFilesManager'
+    )
+    downloads: 'DownloadsManager' = _LazyManager(
+        'box_sdk_gen.managers.downloads', 'DownloadsManager'
+    )
+    uploads: 'UploadsManager' = _LazyManager(
+        'box_sdk_gen.managers.uploads', 'UploadsManager'
+    )
+    chunked_uploads: 'ChunkedUploadsManager' = _LazyManager(
+        'box_sdk_gen.managers.chunked_uploads', 'ChunkedUploadsManager'
+    )
+    list_collaborations: 'ListCollaborationsManager' = _LazyManager(
+        'box_sdk_gen.managers.list_collaborations', 'ListCollaborationsManager'
+    )
+    comments: 'CommentsManager' = _LazyManager(
+        'box_sdk_gen.managers.comments', 'CommentsManager'
+    )
+    tasks: 'TasksManager' = _LazyManager('box_sdk_gen.managers.tasks', 'TasksManager')
+    file_versions: 'FileVersionsManager' = _LazyManager(
+        'box_sdk_gen.managers.file_versions', 'FileVersionsManager'
+    )
+    file_metadata: 'FileMetadataManager' = _LazyManager(
+        'box_sdk_gen.managers.file_metadata', 'FileMetadataManager'
+    )
+    file_classifications: 'FileClassificationsManager' = _LazyManager(
+        'box_sdk_gen.managers.file_classifications', 'FileClassificationsManager'
+    )
+    skills: 'SkillsManager' = _LazyManager(
+        'box_sdk_gen.managers.skills', 'SkillsManager'
+    )
+    file_watermarks: 'FileWatermarksManager' = _LazyManager(
+        'box_sdk_gen.managers.file_watermarks', 'FileWatermarksManager'
+    )
+    file_requests: 'FileRequestsManager' = _LazyManager(
+        'box_sdk_gen.managers.file_requests', 'FileRequestsManager'
+    )
+    folders: 'FoldersManager' = _LazyManager(
+        'box_sdk_gen.managers.folders', 'FoldersManager'
+    )
+    trashed_folders: 'TrashedFoldersManager' = _LazyManager(
+        'box_sdk_gen.managers.trashed_folders', 'TrashedFoldersManager'
+    )
+    folder_metadata: 'FolderMetadataManager' = _LazyManager(
+        'box_sdk_gen.managers.folder_metadata', 'FolderMetadataManager'
+    )
+    folder_classifications: 'FolderClassificationsManager' = _LazyManager(
+        'box_sdk_gen.managers.folder_classifications', 'FolderClassificationsManager'
+    )
+    trashed_items: 'TrashedItemsManager' = _LazyManager(
+        'box_sdk_gen.managers.trashed_items', 'TrashedItemsManager'
+    )
+    folder_watermarks: 'FolderWatermarksManager' = _LazyManager(
+        'box_sdk_gen.managers.folder_watermarks', 'FolderWatermarksManager'
+    )
+    folder_locks: 'FolderLocksManager' = _LazyManager(
+        'box_sdk_gen.managers.folder_locks', 'FolderLocksManager'
+    )
+    metadata_templates: 'MetadataTemplatesManager' = _LazyManager(
+        'box_sdk_gen.managers.metadata_templates', 'MetadataTemplatesManager'
+    )
+    classifications: 'ClassificationsManager' = _LazyManager(
+        'box_sdk_gen.managers.classifications', 'ClassificationsManager'
+    )
+    metadata_cascade_policies: 'MetadataCascadePoliciesManager' = _LazyManager(
+        'box_sdk_gen.managers.metadata_cascade_policies',
+        'MetadataCascadePoliciesManager',
+    )
+    search: 'SearchManager' = _LazyManager(
+        'box_sdk_gen.managers.search', 'SearchManager'
+    )
+    user_collaborations: 'UserCollaborationsManager' = _LazyManager(
+        'box_sdk_gen.managers.user_collaborations', 'UserCollaborationsManager'
+    )
+    task_assignments: 'TaskAssignmentsManager' = _LazyManager(
+        'box_sdk_gen.managers.task_assignments', 'TaskAssignmentsManager'
+    )
+    shared_links_files: 'SharedLinksFilesManager' = _LazyManager(
+        'box_sdk_gen.managers.shared_links_files', 'SharedLinksFilesManager'
+    )
+    shared_links_folders: 'SharedLinksFoldersManager' = _LazyManager(
+        'box_sdk_gen.managers.shared_links_folders', 'SharedLinksFoldersManager'
+    )
+    web_links: 'WebLinksManager' = _LazyManager(
+        'box_sdk_gen.managers.web_links', 'WebLinksManager'
+    )
+    trashed_web_links: 'TrashedWebLinksManager' = _LazyManager(
+        'box_sdk_gen.managers.trashed_web_links', 'TrashedWebLinksManager'
+    )
+    shared_links_web_links: 'SharedLinksWebLinksManager' = _LazyManager(
+        'box_sdk_gen.managers.shared_links_web_links', 'SharedLinksWebLinksManager'
+    )
+    users: 'UsersManager' = _LazyManager('box_sdk_gen.managers.users', 'UsersManager')
+    session_termination: 'SessionTerminationManager' = _LazyManager(
+        'box_sdk_gen.managers.session_termination', 'SessionTerminationManager'
+    )
+    avatars: 'AvatarsManager' = _LazyManager(
+        'box_sdk_gen.managers.avatars', 'AvatarsManager'
+    )
+    transfer: 'TransferManager' = _LazyManager(
+        'box_sdk_gen.managers.transfer', 'TransferManager'
+    )
+    email_aliases: 'EmailAliasesManager' = _LazyManager(
+        'box_sdk_gen.managers.email_aliases', 'EmailAliasesManager'
+    )
+    memberships: 'MembershipsManager' = _LazyManager(
+        'box_sdk_gen.managers.memberships', 'MembershipsManager'
+    )
+    invites: 'InvitesManager' = _LazyManager(
+        'box_sdk_gen.managers.invites', 'InvitesManager'
+    )
+    groups: 'GroupsManager' = _LazyManager(
+        'box_sdk_gen.managers.groups', 'GroupsManager'
+    )
+    webhooks: 'WebhooksManager' = _LazyManager(
+        'box_sdk_gen.managers.webhooks', 'WebhooksManager'
+    )
+    events: 'EventsManager' = _LazyManager(
+        'box_sdk_gen.managers.events', 'EventsManager'
+    )
+    collections: 'CollectionsManager' = _LazyManager(
+        'box_sdk_gen.managers.collections', 'CollectionsManager'
+    )
+    recent_items: 'RecentItemsManager' = _LazyManager(
+        'box_sdk_gen.managers.recent_items', 'RecentItemsManager'
+    )
+    retention_policies: 'RetentionPoliciesManager' = _LazyManager(
+        'box_sdk_gen.managers.retention_policies', 'RetentionPoliciesManager'
+    )
+    retention_policy_assignments: 'RetentionPolicyAssignmentsManager' = _LazyManager(
+        'box_sdk_gen.managers.retention_policy_assignments',
+        'RetentionPolicyAssignmentsManager',
+    )
+    legal_hold_policies: 'LegalHoldPoliciesManager' = _LazyManager(
+        'box_sdk_gen.managers.legal_hold_policies', 'LegalHoldPoliciesManager'
+    )
+    legal_hold_policy_assignments: 'LegalHoldPolicyAssignmentsManager' = _LazyManager(
+        'box_sdk_gen.managers.legal_hold_policy_assignments',
+        'LegalHoldPolicyAssignmentsManager',
+    )
+    file_version_retentions: 'FileVersionRetentionsManager' = _LazyManager(
+        'box_sdk_gen.managers.file_version_retentions', 'FileVersionRetentionsManager'
+    )
+    file_version_legal_holds: 'FileVersionLegalHoldsManager' = _LazyManager(
+        'box_sdk_gen.managers.file_version_legal_holds', 'FileVersionLegalHoldsManager'
+    )
+    shield_information_barriers: 'ShieldInformationBarriersManager' = _LazyManager(
+        'box_sdk_gen.managers.shield_information_barriers',
+        'ShieldInformationBarriersManager',
+    )
+    shield_information_barrier_reports: 'ShieldInformationBarrierReportsManager' = (
+        _LazyManager(
+            'box_sdk_gen.managers.shield_information_barrier_reports',
+            'ShieldInformationBarrierReportsManager',
+        )
+    )
+    shield_information_barrier_segments: 'ShieldInformationBarrierSegmentsManager' = (
+        _LazyManager(
+            'box_sdk_gen.managers.shield_information_barrier_segments',
+            'ShieldInformationBarrierSegmentsManager',
+        )
+    )
+    shield_information_barrier_segment_members: (
+        'ShieldInformationBarrierSegmentMembersManager'
+    ) = _LazyManager(
+        'box_sdk_gen.managers.shield_information_barrier_segment_members',
+        'ShieldInformationBarrierSegmentMembersManager',
+    )
+    shield_information_barrier_segment_restrictions: (
+        'ShieldInformationBarrierSegmentRestrictionsManager'
+    ) = _LazyManager(
+        'box_sdk_gen.managers.shield_information_barrier_segment_restrictions',
+        'ShieldInformationBarrierSegmentRestrictionsManager',
+    )
+    device_pinners: 'DevicePinnersManager' = _LazyManager(
+        'box_sdk_gen.managers.device_pinners', 'DevicePinnersManager'
+    )
+    terms_of_services: 'TermsOfServicesManager' = _LazyManager(
+        'box_sdk_gen.managers.terms_of_services', 'TermsOfServicesManager'
+    )
+    terms_of_service_user_statuses: 'TermsOfServiceUserStatusesManager' = _LazyManager(
+        'box_sdk_gen.managers.terms_of_service_user_statuses',
+        'TermsOfServiceUserStatusesManager',
+    )
+    collaboration_allowlist_entries: 'CollaborationAllowlistEntriesManager' = (
+        _LazyManager(
+            'box_sdk_gen.managers.collaboration_allowlist_entries',
+            'CollaborationAllowlistEntriesManager',
+        )
+    )
+    collaboration_allowlist_exempt_targets: (
+        'CollaborationAllowlistExemptTargetsManager'
+    ) = _LazyManager(
+        'box_sdk_gen.managers.collaboration_allowlist_exempt_targets',
+        'CollaborationAllowlistExemptTargetsManager',
+    )
+    storage_policies: 'StoragePoliciesManager' = _LazyManager(
+        'box_sdk_gen.managers.storage_policies', 'StoragePoliciesManager'
+    )
+    storage_policy_assignments: 'StoragePolicyAssignmentsManager' = _LazyManager(
+        'box_sdk_gen.managers.storage_policy_assignments',
+        'StoragePolicyAssignmentsManager',
+    )
+    zip_downloads: 'ZipDownloadsManager' = _LazyManager(
+        'box_sdk_gen.managers.zip_downloads', 'ZipDownloadsManager'
+    )
+    sign_requests: 'SignRequestsManager' = _LazyManager(
+        'box_sdk_gen.managers.sign_requests', 'SignRequestsManager'
+    )
+    workflows: 'WorkflowsManager' = _LazyManager(
+        'box_sdk_gen.managers.workflows', 'WorkflowsManager'
+    )
+    sign_templates: 'SignTemplatesManager' = _LazyManager(
+        'box_sdk_gen.managers.sign_templates', 'SignTemplatesManager'
+    )
+    integration_mappings: 'IntegrationMappingsManager' = _LazyManager(
+        'box_sdk_gen.managers.integration_mappings', 'IntegrationMappingsManager'
+    )
+    ai: 'AiManager' = _LazyManager('box_sdk_gen.managers.ai', 'AiManager')
+
     def __init__(self, auth: Authentication, *, network_session: NetworkSession = None):
         if network_session is None:
             network_session = NetworkSession(base_urls=BaseUrls())
         self.auth = auth
         self.network_session = network_session
-        self.authorization = AuthorizationManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.files = FilesManager(auth=self.auth, network_session=self.network_session)
-        self.trashed_files = TrashedFilesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.downloads = DownloadsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.uploads = UploadsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.chunked_uploads = ChunkedUploadsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.list_collaborations = ListCollaborationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.comments = CommentsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.tasks = TasksManager(auth=self.auth, network_session=self.network_session)
-        self.file_versions = FileVersionsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_metadata = FileMetadataManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_classifications = FileClassificationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.skills = SkillsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_watermarks = FileWatermarksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_requests = FileRequestsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.folders = FoldersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.trashed_folders = TrashedFoldersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.folder_metadata = FolderMetadataManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.folder_classifications = FolderClassificationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.trashed_items = TrashedItemsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.folder_watermarks = FolderWatermarksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.folder_locks = FolderLocksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.metadata_templates = MetadataTemplatesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.classifications = ClassificationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.metadata_cascade_policies = MetadataCascadePoliciesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.search = SearchManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.user_collaborations = UserCollaborationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.task_assignments = TaskAssignmentsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shared_links_files = SharedLinksFilesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shared_links_folders = SharedLinksFoldersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.web_links = WebLinksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.trashed_web_links = TrashedWebLinksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shared_links_web_links = SharedLinksWebLinksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.users = UsersManager(auth=self.auth, network_session=self.network_session)
-        self.session_termination = SessionTerminationManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.avatars = AvatarsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.transfer = TransferManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.email_aliases = EmailAliasesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.memberships = MembershipsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.invites = InvitesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.groups = GroupsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.webhooks = WebhooksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.events = EventsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.collections = CollectionsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.recent_items = RecentItemsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.retention_policies = RetentionPoliciesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.retention_policy_assignments = RetentionPolicyAssignmentsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.legal_hold_policies = LegalHoldPoliciesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.legal_hold_policy_assignments = LegalHoldPolicyAssignmentsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_version_retentions = FileVersionRetentionsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_version_legal_holds = FileVersionLegalHoldsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shield_information_barriers = ShieldInformationBarriersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shield_information_barrier_reports = (
-            ShieldInformationBarrierReportsManager(
-                auth=self.auth, network_session=self.network_session
-            )
-        )
-        self.shield_information_barrier_segments = (
-            ShieldInformationBarrierSegmentsManager(
-                auth=self.auth, network_session=self.network_session
-            )
-        )
-        self.shield_information_barrier_segment_members = (
-            ShieldInformationBarrierSegmentMembersManager(
-                auth=self.auth, network_session=self.network_session
-            )
-        )
-        self.shield_information_barrier_segment_restrictions = (
-            ShieldInformationBarrierSegmentRestrictionsManager(
-                auth=self.auth, network_session=self.network_session
-            )
-        )
-        self.device_pinners = DevicePinnersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.terms_of_services = TermsOfServicesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.terms_of_service_user_statuses = TermsOfServiceUserStatusesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.collaboration_allowlist_entries = CollaborationAllowlistEntriesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.collaboration_allowlist_exempt_targets = (
-            CollaborationAllowlistExemptTargetsManager(
-                auth=self.auth, network_session=self.network_session
-            )
-        )
-        self.storage_policies = StoragePoliciesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.storage_policy_assignments = StoragePolicyAssignmentsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.zip_downloads = ZipDownloadsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.sign_requests = SignRequestsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.workflows = WorkflowsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.sign_templates = SignTemplatesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.integration_mappings = IntegrationMappingsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.ai = AiManager(auth=self.auth, network_session=self.network_session)
 
     def with_as_user_header(self, user_id: str) -> 'BoxClient':
         """
@@ -434,3 +416,35 @@ class BoxClient:
             auth=self.auth,
             network_session=self.network_session.with_custom_base_urls(base_urls),
         )
+
+    def with_retry_policy(self, retry_policy: RetryPolicy) -> 'BoxClient':
+        """
+        Create a new client, which retries failed API calls according to the given policy
+        :param retry_policy: Policy deciding which failed API calls are retried and how long to wait between attempts
+        :type retry_policy: RetryPolicy
+        """
+        return BoxClient(
+            auth=self.auth,
+            network_session=self.network_session.with_retry_policy(retry_policy),
+        )
+
+    def with_token_pool(self, *, max_size: int = 1000) -> 'TokenPool':
+        """
+        Create a pool of tokens of users and enterprises of the JWT or CCG app authenticating this client. The clients returned by the pool make API calls with the network session of this client, so they keep its headers, base urls and retry policy.
+        :param max_size: Maximum number of subjects, whose tokens are kept, defaults to 1000
+        :type max_size: int, optional
+        """
+        from box_sdk_gen.box.token_pool import TokenPool
+
+        return TokenPool(
+            self.auth, max_size=max_size, network_session=self.network_session
+        )
+
+    def with_raw_responses(self) -> RawBoxClient:
+        """
+        Get a view of this client, whose endpoint methods return the parsed JSON of responses as dicts and lists instead of schema objects. Methods making several requests, like `chunked_uploads.upload_big_file()`, are only available in BoxClient.
+        """
+        raw_client = self.__dict__.get('_raw_client')
+        if raw_client is None:
+            raw_client = self._raw_client = RawBoxClient(self)
+        return raw_client
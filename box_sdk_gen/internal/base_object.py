@@ -1,9 +1,26 @@
+from contextvars import ContextVar
 from datetime import datetime, date
 from enum import EnumMeta, Enum
-from typing import get_args, get_origin, Union, Optional
+from typing import get_args, get_origin, Any, Callable, Dict, Optional, Tuple, Union
+
+Decoder = Callable[[Any], Any]
+
+# Per class map of JSON keys to the name of the field, the decoder of its value and whether it contains schema objects,
+# filled on first use of each key, so that annotations are inspected only once.
+_deserialization_plans: Dict[type, Dict[str, Tuple[str, Optional[Decoder], bool]]] = {}
+# Whether from_dict() calls without the lazy argument, like the ones of nested objects, deserialize lazily.
+# It is set only while an object is deserialized with the lazy argument or a lazily deserialized field is built.
+_lazy_deserialization: ContextVar[bool] = ContextVar(
+    'lazy_deserialization', default=False
+)
+# Decoders of type annotations. None stands for values, which are kept as they are.
+_decoders: Dict[Any, Optional[Decoder]] = {}
 
 
 class BaseObject:
+    # Fields containing schema objects, which were left undecoded by lazy deserialization, are kept
+    # in a slot instead of the instance dict, so that they do not show up in vars() and to_dict().
+    __slots__ = ('__dict__', '__weakref__', '_lazy_fields')
     _discriminator = (None, {})
     _json_to_fields_mapping = {}
     _fields_to_json_mapping = {}
@@ -12,17 +29,83 @@ class BaseObject:
         self.__dict__.update(kwargs)
 
     @classmethod
-    def from_dict(cls, data: dict):
+    def from_dict(cls, data: dict, *, lazy: Optional[bool] = None):
+        """
+        Deserialize an object of this class from the parsed JSON.
+        :param data: Parsed JSON of the object
+        :param lazy: If True, fields containing other schema objects, e.g. `path_collection` of `FileFull`
+            or `entries` of `Items`, are kept as the parsed JSON until they are first accessed, so that fields
+            which are never read are never built. Fields of nested objects are deserialized the same way.
+            If None, nested objects are deserialized like the object containing them, and eagerly otherwise
+        """
+        if lazy is None:
+            lazy = _lazy_deserialization.get()
+        elif lazy is not _lazy_deserialization.get():
+            return _call_with_lazy_deserialization(lazy, cls.from_dict, data)
+        plan = _deserialization_plans.get(cls)
+        if plan is None:
+            plan = _deserialization_plans.setdefault(cls, {})
         unpacked_attributes = {}
+        lazy_fields = None
         for key, value in data.items():
-            mapping_field_name = cls._json_to_fields_mapping.get(key, key)
-            annotation = cls.__init__.__annotations__.get(mapping_field_name, None)
-            unpacked_attributes[mapping_field_name] = cls._deserialize(
-                key, value, annotation
-            )
-        return cls(**unpacked_attributes)
+            entry = plan.get(key)
+            if entry is None:
+                entry = plan[key] = cls._get_deserialization_plan_entry(key)
+            field_name, decoder, nested = entry
+            if value is None or decoder is None:
+                unpacked_attributes[field_name] = value
+            elif nested and lazy:
+                if lazy_fields is None:
+                    lazy_fields = {}
+                lazy_fields[field_name] = (key, value)
+                unpacked_attributes[field_name] = None
+            else:
+                unpacked_attributes[field_name] = decoder(value)
+        obj = cls(**unpacked_attributes)
+        if lazy_fields is not None:
+            for field_name in lazy_fields:
+                obj.__dict__.pop(field_name, None)
+            obj._lazy_fields = lazy_fields
+        return obj
+
+    @classmethod
+    def _get_deserialization_plan_entry(
+        cls, key: str
+    ) -> Tuple[str, Optional[Decoder], bool]:
+        field_name = cls._json_to_fields_mapping.get(key, key)
+        annotation = cls.__init__.__annotations__.get(field_name, None)
+        return field_name, _get_decoder(annotation), _contains_objects(annotation)
+
+    def __getattr__(self, name: str):
+        # Only called for attributes, which are not set, like nested fields left undecoded by lazy deserialization
+        lazy_fields = _get_lazy_fields(self)
+        if lazy_fields:
+            lazy_field = lazy_fields.get(name)
+            if lazy_field is not None:
+                key, value = lazy_field
+                # The plan is missing, if the object was unpickled in another process
+                plan = _deserialization_plans.get(type(self), {})
+                entry = plan.get(key) or type(self)._get_deserialization_plan_entry(key)
+                decoder = entry[1]
+                decoded_value = _call_with_lazy_deserialization(True, decoder, value)
+                # setdefault is atomic, so threads building the same field at once all get the value stored first
+                decoded_value = self.__dict__.setdefault(name, decoded_value)
+                lazy_fields.pop(name, None)
+                return decoded_value
+        instance_dict = self.__dict__
+        if name in instance_dict:
+            # Built by another thread in the meantime
+            return instance_dict[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
     def to_dict(self) -> dict:
+        lazy_fields = _get_lazy_fields(self)
+        if lazy_fields:
+            # Fields, which were not accessed yet, are deserialized, so that the result is the same as without lazy deserialization
+            for field_name in list(lazy_fields):
+                getattr(self, field_name)
         result_dict = {}
         for k, v in vars(self).items():
             if v is None:
@@ -148,3 +231,178 @@ class BaseObject:
 
     def __repr__(self) -> str:
         return f'{self.__class__} {self.to_dict()}'
+
+
+_lazy_fields_slot = BaseObject._lazy_fields
+
+
+def _get_lazy_fields(obj: BaseObject) -> Optional[dict]:
+    # Reading the slot through its descriptor does not fall back to __getattr__, when it is not set
+    try:
+        return _lazy_fields_slot.__get__(obj)
+    except AttributeError:
+        return None
+
+
+def _call_with_lazy_deserialization(lazy: bool, function: Callable, *args):
+    token = _lazy_deserialization.set(lazy)
+    try:
+        return function(*args)
+    finally:
+        _lazy_deserialization.reset(token)
+
+
+def _contains_objects(annotation) -> bool:
+    origin = get_origin(annotation)
+    if origin == Union or origin == list:
+        return any(_contains_objects(arg) for arg in get_args(annotation))
+    return isinstance(annotation, type) and issubclass(annotation, BaseObject)
+
+
+def _get_decoder(annotation) -> Optional[Decoder]:
+    """
+    Get a function deserializing non-null values of the given type annotation, like BaseObject._deserialize().
+    """
+    try:
+        return _decoders[annotation]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable annotations are not cached
+        return _create_decoder(annotation)
+    decoder = _decoders[annotation] = _create_decoder(annotation)
+    return decoder
+
+
+def _create_decoder(annotation) -> Optional[Decoder]:
+    if annotation is None:
+        return None
+    origin = get_origin(annotation)
+    if origin == Union:
+        union_without_none_type = [
+            arg for arg in get_args(annotation) if arg is not type(None)
+        ]
+        if len(union_without_none_type) == 1:
+            return _get_decoder(union_without_none_type[0])
+        return _create_union_decoder(annotation)
+    if origin == list:
+        return _create_list_decoder(annotation)
+    if isinstance(annotation, EnumMeta):
+        return _create_enum_decoder(annotation)
+    if annotation == datetime:
+        return _decode_datetime
+    if annotation == date:
+        return _decode_date
+    if isinstance(annotation, type) and issubclass(annotation, BaseObject):
+        return _create_nested_type_decoder(annotation)
+    return None
+
+
+def _decode(decoder: Optional[Decoder], value):
+    return value if value is None or decoder is None else decoder(value)
+
+
+def _create_list_decoder(annotation) -> Decoder:
+    args = get_args(annotation)
+    if not args:
+        # Like BaseObject._deserialize_list(), a bare list annotation leaves the value as it is
+        return lambda value: value
+    entry_decoder = _get_decoder(args[0])
+
+    def decode_list(value):
+        try:
+            return [_decode(entry_decoder, list_entry) for list_entry in value]
+        except Exception:
+            return value
+
+    return decode_list
+
+
+def _create_union_decoder(annotation) -> Decoder:
+    possible_types = get_args(annotation)
+    object_types = [
+        possible_type
+        for possible_type in possible_types
+        if isinstance(possible_type, type) and issubclass(possible_type, BaseObject)
+    ]
+    discriminator_fields = {
+        object_type._discriminator[0] for object_type in object_types
+    }
+    # Variants discriminated by the same field are looked up by its value. The first matching
+    # variant wins, as in BaseObject._deserialize_union().
+    discriminator_field = None
+    variant_decoders: Optional[Dict[Any, Optional[Decoder]]] = None
+    if len(discriminator_fields) == 1:
+        discriminator_field = discriminator_fields.pop()
+        variant_decoders = {}
+        for object_type in object_types:
+            for discriminator_value in object_type._discriminator[1]:
+                variant_decoders.setdefault(
+                    discriminator_value, _get_decoder(object_type)
+                )
+    possible_decoders = [
+        _get_decoder(possible_type) for possible_type in possible_types
+    ]
+
+    def decode_union(value):
+        try:
+            if variant_decoders is not None:
+                discriminator_value = value.get(discriminator_field, None)
+                if discriminator_value in variant_decoders:
+                    return _decode(variant_decoders[discriminator_value], value)
+            else:
+                for object_type in object_types:
+                    if (
+                        value.get(object_type._discriminator[0], None)
+                        in object_type._discriminator[1]
+                    ):
+                        return _decode(_get_decoder(object_type), value)
+
+            for decoder in possible_decoders:
+                try:
+                    return _decode(decoder, value)
+                except Exception:
+                    continue
+            return value
+        except Exception:
+            return value
+
+    return decode_union
+
+
+def _create_enum_decoder(annotation: EnumMeta) -> Decoder:
+    members = annotation.__members__
+
+    def decode_enum(value):
+        try:
+            name = value.upper().replace(' ', '_')
+            member = members.get(name)
+            return member if member is not None else getattr(annotation, name)
+        except Exception:
+            return value
+
+    return decode_enum
+
+
+def _decode_datetime(value):
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except Exception:
+        return value
+
+
+def _decode_date(value):
+    try:
+        return date.fromisoformat(value)
+    except Exception:
+        return value
+
+
+def _create_nested_type_decoder(annotation) -> Decoder:
+    def decode_nested_type(value):
+        try:
+            return annotation.from_dict(value)
+        except Exception:
+            return value
+
+    return decode_nested_type
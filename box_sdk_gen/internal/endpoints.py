@@ -0,0 +1,75 @@
+import functools
+import inspect
+from typing import Any, Callable, Optional, Tuple
+
+from box_sdk_gen.networking.fetch import FetchOptions
+
+
+class Endpoint:
+    def __init__(self, name: str, request_builder: Callable, return_type: Any):
+        """
+        Endpoint method of a manager, whose request can be built without sending it.
+        :param name: Name of the method
+        :param request_builder: Method of the manager taking the same arguments as the endpoint method
+            and returning the url and options, which the endpoint method passes to fetch()
+        :param return_type: Return annotation of the method
+        """
+        self.name = name
+        self.request_builder = request_builder
+        self.return_type = return_type
+
+    def build_request(self, manager: Any, *args, **kwargs) -> Tuple[str, FetchOptions]:
+        """
+        Build the request of the endpoint method called with the given arguments.
+        :return: The url and options, which the method passes to fetch()
+        """
+        return self.request_builder(manager, *args, **kwargs)
+
+    @property
+    def returns_nothing(self) -> bool:
+        return self.return_type is None or self.return_type is inspect.Signature.empty
+
+
+@functools.lru_cache(maxsize=None)
+def _build_endpoint(manager_class: type, name: str) -> Optional[Endpoint]:
+    # Endpoint methods of the generated managers, which send a single request, build it with
+    # a method named _<name>_request, so that it can be sent and its response handled differently.
+    # Composite methods, which make several requests or call other methods, have no such method.
+    method = getattr(manager_class, name, None)
+    request_builder = getattr(manager_class, f'_{name}_request', None)
+    if not inspect.isfunction(method) or not inspect.isfunction(request_builder):
+        return None
+    return Endpoint(name, request_builder, inspect.signature(method).return_annotation)
+
+
+def get_endpoint(manager: Any, name: str) -> Endpoint:
+    """
+    Get the endpoint method of a manager of BoxClient with the given name.
+    Raises AttributeError, if the manager has no such method or the method makes several requests.
+    """
+    method = getattr(type(manager), name, None)
+    if name.startswith('_') or not inspect.isfunction(method):
+        raise AttributeError(f'{type(manager).__name__} has no endpoint method {name}')
+    endpoint = _build_endpoint(type(manager), name)
+    if endpoint is None:
+        raise AttributeError(
+            f'{type(manager).__name__}.{name} makes several requests and is only available in BoxClient'
+        )
+    return endpoint
+
+
+def list_endpoints(manager: Any) -> list:
+    """
+    List the names of the endpoint methods of a manager of BoxClient.
+    """
+    return [
+        name
+        for name, method in vars(type(manager)).items()
+        if not name.startswith('_')
+        and inspect.isfunction(method)
+        and _build_endpoint(type(manager), name) is not None
+    ]
+
+
+def is_manager(manager: Any) -> bool:
+    return type(manager).__module__.startswith('box_sdk_gen.managers.')
@@ -0,0 +1,61 @@
+import importlib
+import inspect
+import pkgutil
+import re
+from typing import Dict, Tuple
+
+# Packages using lazy_package(), whose registries of the names defined by each submodule are generated
+# by running this module: python -m box_sdk_gen.internal.generate_lazy_exports
+LAZY_PACKAGES = ('box_sdk_gen.schemas', 'box_sdk_gen.managers')
+
+
+def collect_exports(package_name: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Import all submodules of a package and collect the public classes defined by each of them,
+    which are the names registered for lazy_package().
+    :param package_name: Name of the package, e.g. 'box_sdk_gen.schemas'
+    """
+    package = importlib.import_module(package_name)
+    exports = {}
+    for module_info in sorted(
+        pkgutil.iter_modules(package.__path__), key=lambda info: info.name
+    ):
+        if module_info.name.startswith('_'):
+            continue
+        module = importlib.import_module(f'{package_name}.{module_info.name}')
+        exports[module_info.name] = tuple(
+            name
+            for name, value in vars(module).items()
+            if inspect.isclass(value)
+            and value.__module__ == module.__name__
+            and not name.startswith('_')
+        )
+    return exports
+
+
+def write_exports(package_name: str) -> None:
+    """
+    Regenerate the registry in the __init__.py of a package, between the `# fmt: off` and `# fmt: on` comments.
+    :param package_name: Name of the package, e.g. 'box_sdk_gen.schemas'
+    """
+    package = importlib.import_module(package_name)
+    lines = ['_exports = {']
+    for module_name, names in collect_exports(package_name).items():
+        lines.append(f'    {module_name!r}: {names!r},')
+    lines.append('}')
+    with open(package.__file__, encoding='utf-8') as file:
+        source = file.read()
+    source = re.sub(
+        r'(# fmt: off\n).*?(# fmt: on\n)',
+        lambda match: match.group(1) + '\n'.join(lines) + '\n' + match.group(2),
+        source,
+        count=1,
+        flags=re.S,
+    )
+    with open(package.__file__, 'w', encoding='utf-8') as file:
+        file.write(source)
+
+
+if __name__ == '__main__':
+    for lazy_package_name in LAZY_PACKAGES:
+        write_exports(lazy_package_name)
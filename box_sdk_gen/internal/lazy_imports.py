@@ -0,0 +1,58 @@
+import importlib
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_package(
+    package_name: str, exports: Dict[str, Tuple[str, ...]], package_globals: dict
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Create the module level __getattr__ and __dir__ functions of a package, whose submodules are imported
+    on first access of a name they define, instead of being star-imported when the package is imported.
+    :param package_name: Name of the package, e.g. 'box_sdk_gen.schemas'
+    :param exports: Names defined by each submodule, keyed by the name of the submodule, in the order
+        of the star imports they replace
+    :param package_globals: The globals() of the package, where imported names are cached
+    """
+    modules_by_name = {
+        name: module_name for module_name, names in exports.items() for name in names
+    }
+    import_all_lock = threading.Lock()
+    imported_all = False
+
+    def import_all() -> None:
+        # Names which are not in the registry, e.g. typing names re-exported by the star imports,
+        # are found by importing all submodules, like the package did before.
+        nonlocal imported_all
+        with import_all_lock:
+            if imported_all:
+                return
+            for module_name in exports:
+                module = importlib.import_module(f'{package_name}.{module_name}')
+                public_names = getattr(module, '__all__', None)
+                if public_names is None:
+                    public_names = [
+                        name for name in vars(module) if not name.startswith('_')
+                    ]
+                for name in public_names:
+                    package_globals[name] = getattr(module, name)
+            imported_all = True
+
+    def __getattr__(name: str) -> Any:
+        module_name = modules_by_name.get(name)
+        if module_name is not None:
+            module = importlib.import_module(f'{package_name}.{module_name}')
+            value = package_globals[name] = getattr(module, name)
+            return value
+        if name in exports:
+            return importlib.import_module(f'{package_name}.{name}')
+        if not name.startswith('__'):
+            import_all()
+            if name in package_globals:
+                return package_globals[name]
+        raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(modules_by_name))
+
+    return __getattr__, __dir__
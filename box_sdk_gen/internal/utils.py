@@ -1,19 +1,35 @@
 import base64
 import datetime
+import functools
 import hashlib
+import itertools
+import mmap
 import os
+import threading
 import uuid
 from time import time
 from enum import Enum
-from io import SEEK_END, SEEK_SET, BufferedIOBase, BytesIO
-from typing import Any, Callable, Dict, Iterable, Optional, TypeVar
-
-try:
-    import jwt
-    from cryptography.hazmat.backends import default_backend
-    from cryptography.hazmat.primitives import serialization
-except ImportError:
-    jwt, default_backend, serialization = None, None, None
+from io import (
+    SEEK_CUR,
+    SEEK_END,
+    SEEK_SET,
+    BufferedIOBase,
+    BytesIO,
+    UnsupportedOperation,
+)
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from requests import RequestException
 
 from .base_object import BaseObject
 from ..serialization.json.json_data import sd_to_json
@@ -61,6 +77,298 @@ class ResponseByteStream(ByteStream):
         else:
             self._bytes.seek(position, whence)
 
+    def download_to(self, destination: Union[str, os.PathLike, ByteStream]) -> int:
+        """
+        Write the rest of the stream to a file path or a writable file object.
+        Content which is not buffered yet is written directly, without being kept in memory.
+        :return: the number of bytes written
+        """
+        chunks = itertools.chain([self._bytes.read()], self._iterator)
+        return _write_chunks(chunks, destination)
+
+
+class StreamingResponseByteStream(ByteStream):
+    """
+    Forward-only stream over the chunks of a response body. Unlike ResponseByteStream,
+    it does not keep the content which was already read, so at most one chunk is held in memory.
+    """
+
+    def __init__(self, request_iterator):
+        self._iterator = iter(request_iterator)
+        self._chunk = memoryview(b'')
+        self._position = 0
+
+    def _next_chunk(self) -> bool:
+        for chunk in self._iterator:
+            if chunk:
+                self._chunk = memoryview(chunk)
+                return True
+        return False
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self._position
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            data = b''.join(itertools.chain([self._chunk], self._iterator))
+            self._chunk = memoryview(b'')
+            self._position += len(data)
+            return data
+        pieces = []
+        missing = size
+        while missing > 0 and (self._chunk or self._next_chunk()):
+            piece = self._chunk[:missing]
+            self._chunk = self._chunk[len(piece) :]
+            pieces.append(piece)
+            missing -= len(piece)
+        self._position += size - missing
+        return b''.join(pieces)
+
+    def read1(self, size: Optional[int] = -1) -> bytes:
+        if not self._chunk and not self._next_chunk():
+            return b''
+        if size is None or size < 0:
+            size = len(self._chunk)
+        return self.read(min(size, len(self._chunk)))
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast('B')
+        copied_length = 0
+        while copied_length < len(view) and (self._chunk or self._next_chunk()):
+            piece = self._chunk[: len(view) - copied_length]
+            view[copied_length : copied_length + len(piece)] = piece
+            self._chunk = self._chunk[len(piece) :]
+            copied_length += len(piece)
+        self._position += copied_length
+        return copied_length
+
+    def seek(self, position: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_SET:
+            position -= self._position
+        elif whence != SEEK_CUR:
+            raise UnsupportedOperation('Stream can only be seeked forward.')
+        if position < 0:
+            raise UnsupportedOperation('Stream can only be seeked forward.')
+        while position > 0 and (self._chunk or self._next_chunk()):
+            skipped = min(position, len(self._chunk))
+            self._chunk = self._chunk[skipped:]
+            self._position += skipped
+            position -= skipped
+        return self._position
+
+    def close(self) -> None:
+        # Closing the iterator of a streamed transport response releases its connection
+        close = getattr(self._iterator, 'close', None)
+        if close is not None:
+            close()
+        self._chunk = memoryview(b'')
+        super().close()
+
+    def download_to(self, destination: Union[str, os.PathLike, ByteStream]) -> int:
+        """
+        Write the rest of the stream to a file path or a writable file object, one chunk at a time.
+        :return: the number of bytes written
+        """
+        chunks = itertools.chain([self._chunk], self._iterator)
+        self._chunk = memoryview(b'')
+        written = _write_chunks(chunks, destination)
+        self._position += written
+        return written
+
+
+def _is_network_error(error: Exception) -> bool:
+    # Imported here, as the modules of the networking and box packages import this module
+    from ..box.errors import BoxAPIError, BoxSDKError
+    from ..networking.transport import TransportError
+
+    if isinstance(error, BoxSDKError) and not isinstance(error, BoxAPIError):
+        # Raised by fetch() for requests failing with a network error
+        error = error.error
+    return isinstance(
+        error, (RequestException, TransportError, ConnectionError, TimeoutError)
+    )
+
+
+class ResumableByteStream(ByteStream):
+    """
+    Forward-only stream, which transparently reopens the underlying stream at the current
+    position when reading from it fails, e.g. because the connection dropped mid-body.
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[[int], ByteStream],
+        *,
+        max_attempts: int = 5,
+        chunk_size: int = 64 * 1024,
+    ):
+        """
+        :param open_stream: Function returning a new stream, which starts at the given byte offset
+        :param max_attempts: Maximum number of attempts to read, when no data could be read in between
+        :param chunk_size: Size of the chunks in which the whole content is read by read() and download_to()
+        """
+        self._open_stream = open_stream
+        self._max_attempts = max_attempts
+        self._chunk_size = chunk_size
+        self._position = 0
+        self._stream: Optional[ByteStream] = open_stream(0)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self._position
+
+    def _iterate_chunks(self) -> Iterable[bytes]:
+        chunk = self.read(self._chunk_size)
+        while chunk:
+            yield chunk
+            chunk = self.read(self._chunk_size)
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            return b''.join(self._iterate_chunks())
+        attempt_nr = 1
+        while True:
+            try:
+                if self._stream is None:
+                    self._stream = self._open_stream(self._position)
+                data = self._stream.read(size)
+                break
+            except Exception as error:
+                # Failing to reopen the stream counts as an attempt too. Errors of the API, like a deleted file,
+                # and programming errors are not retried.
+                self._close_stream()
+                if not _is_network_error(error) or attempt_nr >= self._max_attempts:
+                    raise
+                attempt_nr += 1
+        self._position += len(data)
+        return data
+
+    def _close_stream(self) -> None:
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        self._close_stream()
+        super().close()
+
+    def read1(self, size: Optional[int] = -1) -> bytes:
+        return self.read(self._chunk_size if size is None or size < 0 else size)
+
+    def download_to(self, destination: Union[str, os.PathLike, ByteStream]) -> int:
+        """
+        Write the rest of the stream to a file path or a writable file object, one chunk at a time.
+        :return: the number of bytes written
+        """
+        return _write_chunks(self._iterate_chunks(), destination)
+
+
+class AsyncByteStream:
+    """
+    Forward-only stream over the chunks of a response body, which are read from the network
+    asynchronously. Returned by the async client wherever the sync client returns a ByteStream.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[bytes],
+        close: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        self._chunks = chunks
+        self._close = close
+        self._chunk = memoryview(b'')
+        self._position = 0
+
+    async def _next_chunk(self) -> bool:
+        async for chunk in self._chunks:
+            if chunk:
+                self._chunk = memoryview(chunk)
+                return True
+        return False
+
+    def tell(self) -> int:
+        return self._position
+
+    async def read(self, size: Optional[int] = -1) -> bytes:
+        pieces = []
+        missing = -1 if size is None or size < 0 else size
+        while missing != 0 and (self._chunk or await self._next_chunk()):
+            piece = self._chunk if missing < 0 else self._chunk[:missing]
+            self._chunk = self._chunk[len(piece) :]
+            pieces.append(piece)
+            if missing > 0:
+                missing -= len(piece)
+        data = b''.join(pieces)
+        self._position += len(data)
+        return data
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[bytes]:
+        while self._chunk or await self._next_chunk():
+            chunk = bytes(self._chunk)
+            self._chunk = memoryview(b'')
+            self._position += len(chunk)
+            yield chunk
+
+    async def download_to(
+        self, destination: Union[str, os.PathLike, ByteStream]
+    ) -> int:
+        """
+        Write the rest of the stream to a file path or a writable file object, one chunk at a time.
+        :return: the number of bytes written
+        """
+        if isinstance(destination, (str, os.PathLike)):
+            with open(destination, 'wb') as file:
+                return await self.download_to(file)
+        written = 0
+        async for chunk in self:
+            destination.write(chunk)
+            written += len(chunk)
+        return written
+
+    async def aclose(self) -> None:
+        """
+        Release the connection of the response, when the stream is not read until its end.
+        """
+        if self._close is not None:
+            await self._close()
+
+    async def __aenter__(self) -> 'AsyncByteStream':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+def _write_chunks(
+    chunks: Iterable[bytes], destination: Union[str, os.PathLike, ByteStream]
+) -> int:
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, 'wb') as file:
+            return _write_chunks(chunks, file)
+    written = 0
+    for chunk in chunks:
+        if chunk:
+            destination.write(chunk)
+            written += len(chunk)
+    return written
+
 
 def get_env_var(name: str) -> str:
     return os.getenv(name)
@@ -152,13 +460,116 @@ Iterator = Iterable[T]
 Accumulator = TypeVar('Accumulator')
 
 
+class MemoryViewByteStream(ByteStream):
+    """
+    Read-only stream over a buffer, which does not copy the buffer it wraps.
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview]):
+        self._view = memoryview(buffer)
+        self._position = 0
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, position: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            position += self._position
+        elif whence == SEEK_END:
+            position += len(self._view)
+        self._position = min(max(position, 0), len(self._view))
+        return self._position
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return bytes(self.read_view(size))
+
+    def read1(self, size: Optional[int] = -1) -> bytes:
+        return self.read(size)
+
+    def readinto(self, buffer) -> int:
+        view = self.read_view(len(buffer))
+        buffer[: len(view)] = view
+        return len(view)
+
+    def read_view(self, size: Optional[int] = -1) -> memoryview:
+        """
+        Read up to size bytes as a view into the underlying buffer, without copying them.
+        """
+        end = len(self._view)
+        if size is not None and size >= 0:
+            end = min(self._position + size, end)
+        view = self._view[self._position : end]
+        self._position = end
+        return view
+
+
+class MemoryMappedFileStream(MemoryViewByteStream):
+    """
+    Read-only stream over a memory-mapped local file. Reads and views are served
+    from the OS page cache instead of being buffered in Python memory.
+    """
+
+    def __init__(self, file_path: str):
+        with open(file_path, 'rb') as file:
+            # Empty files cannot be memory-mapped.
+            self._mmap = (
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                if os.fstat(file.fileno()).st_size
+                else None
+            )
+        super().__init__(self._mmap if self._mmap is not None else b'')
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._view.release()
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views handed out by read_view are still alive. The mapping is
+                # closed when the last of them is garbage collected.
+                pass
+            self._mmap = None
+        super().close()
+
+
+def read_byte_stream_view(byte_stream: ByteStream) -> memoryview:
+    if isinstance(byte_stream, MemoryViewByteStream):
+        return byte_stream.read_view()
+    return memoryview(read_byte_stream(byte_stream))
+
+
 def iterate_chunks(stream: ByteStream, chunk_size: int) -> Iterable[ByteStream]:
+    if isinstance(stream, MemoryViewByteStream):
+        # The data is already in memory (or mapped), so chunks are views into it.
+        chunk = stream.read_view(chunk_size)
+        while chunk:
+            yield MemoryViewByteStream(chunk)
+            chunk = stream.read_view(chunk_size)
+        return
+    readinto = getattr(stream, 'readinto', None)
     stream_is_finished = False
     while not stream_is_finished:
         copied_length = 0
-        chunk = b''
+        # Each chunk is read straight into its own preallocated buffer, so every byte
+        # is copied once and the chunk is handed over without further copies.
+        chunk = memoryview(bytearray(chunk_size))
         while copied_length < chunk_size:
-            bytes_read = stream.read(chunk_size - copied_length)
+            if readinto is not None:
+                bytes_read = readinto(chunk[copied_length:])
+            else:
+                data = stream.read(chunk_size - copied_length)
+                bytes_read = None if data is None else len(data)
+                if bytes_read:
+                    chunk[copied_length : copied_length + bytes_read] = data
             if bytes_read is None:
                 # stream returns none when no bytes are ready currently but there are
                 # potentially more bytes in the stream to be read.
@@ -167,9 +578,9 @@ def iterate_chunks(stream: ByteStream, chunk_size: int) -> Iterable[ByteStream]:
                 # stream is exhausted.
                 stream_is_finished = True
                 break
-            chunk += bytes_read
-            copied_length += len(bytes_read)
-        yield BytesIO(chunk)
+            copied_length += bytes_read
+        if copied_length:
+            yield MemoryViewByteStream(chunk[:copied_length])
 
 
 def reduce_iterator(
@@ -254,10 +665,25 @@ def encode_str_ascii_or_raise(passphrase: str) -> bytes:
         ) from unicode_error
 
 
+_rsa_private_key_lock = threading.Lock()
+
+
 def get_rsa_private_key(
     private_key: str,
     passphrase: str,
 ) -> Any:
+    # Loading a key derives the decryption key from the passphrase, which is expensive. Loaded keys are
+    # cached by their content, so that token refreshes of all subjects of an app share one loaded key.
+    with _rsa_private_key_lock:
+        return _load_rsa_private_key(private_key, passphrase)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_rsa_private_key(private_key: str, passphrase: str) -> Any:
+    # The optional dependencies of JWT auth are imported on first use, as importing them is slow
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+
     encoded_private_key = encode_str_ascii_or_raise(private_key)
     encoded_passphrase = encode_str_ascii_or_raise(passphrase)
 
@@ -269,6 +695,8 @@ def get_rsa_private_key(
 
 
 def create_jwt_assertion(claims: dict, key: JwtKey, options: JwtSignOptions) -> str:
+    import jwt
+
     return jwt.encode(
         {
             'iss': options.issuer,
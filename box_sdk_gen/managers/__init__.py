@@ -1,137 +1,82 @@
-from box_sdk_gen.managers.authorization import *
-
-from box_sdk_gen.managers.files import *
-
-from box_sdk_gen.managers.trashed_files import *
-
-from box_sdk_gen.managers.downloads import *
-
-from box_sdk_gen.managers.uploads import *
-
-from box_sdk_gen.managers.chunked_uploads import *
-
-from box_sdk_gen.managers.list_collaborations import *
-
-from box_sdk_gen.managers.comments import *
-
-from box_sdk_gen.managers.tasks import *
-
-from box_sdk_gen.managers.file_versions import *
-
-from box_sdk_gen.managers.file_metadata import *
-
-from box_sdk_gen.managers.file_classifications import *
-
-from box_sdk_gen.managers.skills import *
-
-from box_sdk_gen.managers.file_watermarks import *
-
-from box_sdk_gen.managers.file_requests import *
-
-from box_sdk_gen.managers.folders import *
-
-from box_sdk_gen.managers.trashed_folders import *
-
-from box_sdk_gen.managers.folder_metadata import *
-
-from box_sdk_gen.managers.folder_classifications import *
-
-from box_sdk_gen.managers.trashed_items import *
-
-from box_sdk_gen.managers.folder_watermarks import *
-
-from box_sdk_gen.managers.folder_locks import *
-
-from box_sdk_gen.managers.metadata_templates import *
-
-from box_sdk_gen.managers.classifications import *
-
-from box_sdk_gen.managers.metadata_cascade_policies import *
-
-from box_sdk_gen.managers.search import *
-
-from box_sdk_gen.managers.user_collaborations import *
-
-from box_sdk_gen.managers.task_assignments import *
-
-from box_sdk_gen.managers.shared_links_files import *
-
-from box_sdk_gen.managers.shared_links_folders import *
-
-from box_sdk_gen.managers.web_links import *
-
-from box_sdk_gen.managers.trashed_web_links import *
-
-from box_sdk_gen.managers.shared_links_web_links import *
-
-from box_sdk_gen.managers.users import *
-
-from box_sdk_gen.managers.session_termination import *
-
-from box_sdk_gen.managers.avatars import *
-
-from box_sdk_gen.managers.transfer import *
-
-from box_sdk_gen.managers.email_aliases import *
-
-from box_sdk_gen.managers.memberships import *
-
-from box_sdk_gen.managers.invites import *
-
-from box_sdk_gen.managers.groups import *
-
-from box_sdk_gen.managers.webhooks import *
-
-from box_sdk_gen.managers.events import *
-
-from box_sdk_gen.managers.collections import *
-
-from box_sdk_gen.managers.recent_items import *
-
-from box_sdk_gen.managers.retention_policies import *
-
-from box_sdk_gen.managers.retention_policy_assignments import *
-
-from box_sdk_gen.managers.legal_hold_policies import *
-
-from box_sdk_gen.managers.legal_hold_policy_assignments import *
-
-from box_sdk_gen.managers.file_version_retentions import *
-
-from box_sdk_gen.managers.file_version_legal_holds import *
-
-from box_sdk_gen.managers.shield_information_barriers import *
-
-from box_sdk_gen.managers.shield_information_barrier_reports import *
-
-from box_sdk_gen.managers.shield_information_barrier_segments import *
-
-from box_sdk_gen.managers.shield_information_barrier_segment_members import *
-
-from box_sdk_gen.managers.shield_information_barrier_segment_restrictions import *
-
-from box_sdk_gen.managers.device_pinners import *
-
-from box_sdk_gen.managers.terms_of_services import *
-
-from box_sdk_gen.managers.terms_of_service_user_statuses import *
-
-from box_sdk_gen.managers.collaboration_allowlist_entries import *
-
-from box_sdk_gen.managers.collaboration_allowlist_exempt_targets import *
-
-from box_sdk_gen.managers.storage_policies import *
-
-from box_sdk_gen.managers.storage_policy_assignments import *
-
-from box_sdk_gen.managers.zip_downloads import *
-
-from box_sdk_gen.managers.sign_requests import *
-
-from box_sdk_gen.managers.workflows import *
-
-from box_sdk_gen.managers.sign_templates import *
-
-from box_sdk_gen.managers.integration_mappings import *
-
-from box_sdk_gen.managers.ai import *
+from box_sdk_gen.internal.lazy_imports import lazy_package
+
+# Submodules are imported on first access of a name they define.
+# The registry of the classes defined by each submodule is generated with `python -m box_sdk_gen.internal.generate_lazy_exports`,
+# which has to be run again, when submodules are added or changed.
+# fmt: off
+_exports = {
+    'ai': ('CreateAiAskMode', 'CreateAiAskItemsTypeField', 'CreateAiAskItems', 'CreateAiTextGenItemsTypeField', 'CreateAiTextGenItems', 'CreateAiTextGenDialogueHistory', 'AiManager'),
+    'authorization': ('AuthorizeUserResponseType', 'RequestAccessTokenGrantType', 'RequestAccessTokenSubjectTokenType', 'RequestAccessTokenActorTokenType', 'RequestAccessTokenBoxSubjectType', 'RefreshAccessTokenGrantType', 'AuthorizationManager'),
+    'avatars': ('AvatarsManager',),
+    'chunked_uploads': ('ChunkedUploadsManager',),
+    'classifications': ('AddClassificationRequestBodyOpField', 'AddClassificationRequestBodyFieldKeyField', 'AddClassificationRequestBodyDataStaticConfigClassificationField', 'AddClassificationRequestBodyDataStaticConfigField', 'AddClassificationRequestBodyDataField', 'AddClassificationRequestBody', 'UpdateClassificationRequestBodyOpField', 'UpdateClassificationRequestBodyFieldKeyField', 'UpdateClassificationRequestBodyDataStaticConfigClassificationField', 'UpdateClassificationRequestBodyDataStaticConfigField', 'UpdateClassificationRequestBodyDataField', 'UpdateClassificationRequestBody', 'CreateClassificationTemplateScope', 'CreateClassificationTemplateTemplateKey', 'CreateClassificationTemplateDisplayName', 'CreateClassificationTemplateFieldsTypeField', 'CreateClassificationTemplateFieldsKeyField', 'CreateClassificationTemplateFieldsDisplayNameField', 'CreateClassificationTemplateFieldsOptionsStaticConfigClassificationField', 'CreateClassificationTemplateFieldsOptionsStaticConfigField', 'CreateClassificationTemplateFieldsOptionsField', 'CreateClassificationTemplateFields', 'ClassificationsManager'),
+    'collaboration_allowlist_entries': ('CreateCollaborationWhitelistEntryDirection', 'CollaborationAllowlistEntriesManager'),
+    'collaboration_allowlist_exempt_targets': ('CreateCollaborationWhitelistExemptTargetUser', 'CollaborationAllowlistExemptTargetsManager'),
+    'collections': ('CollectionsManager',),
+    'comments': ('CreateCommentItemTypeField', 'CreateCommentItem', 'CommentsManager'),
+    'device_pinners': ('GetEnterpriseDevicePinnersDirection', 'DevicePinnersManager'),
+    'downloads': ('DownloadsManager',),
+    'email_aliases': ('EmailAliasesManager',),
+    'events': ('GetEventsStreamType', 'GetEventsEventType', 'EventsManager'),
+    'file_classifications': ('UpdateClassificationOnFileRequestBodyOpField', 'UpdateClassificationOnFileRequestBodyPathField', 'UpdateClassificationOnFileRequestBody', 'FileClassificationsManager'),
+    'file_metadata': ('GetFileMetadataByIdScope', 'CreateFileMetadataByIdScope', 'UpdateFileMetadataByIdScope', 'UpdateFileMetadataByIdRequestBodyOpField', 'UpdateFileMetadataByIdRequestBody', 'DeleteFileMetadataByIdScope', 'FileMetadataManager'),
+    'file_requests': ('UpdateFileRequestByIdStatus', 'CreateFileRequestCopyFolderTypeField', 'CreateFileRequestCopyFolder', 'CreateFileRequestCopyStatus', 'FileRequestsManager'),
+    'file_version_legal_holds': ('FileVersionLegalHoldsManager',),
+    'file_version_retentions': ('GetFileVersionRetentionsDispositionAction', 'FileVersionRetentionsManager'),
+    'file_versions': ('PromoteFileVersionType', 'FileVersionsManager'),
+    'file_watermarks': ('UpdateFileWatermarkWatermarkImprintField', 'UpdateFileWatermarkWatermark', 'FileWatermarksManager'),
+    'files': ('UpdateFileByIdParent', 'UpdateFileByIdSharedLinkAccessField', 'UpdateFileByIdSharedLinkPermissionsField', 'UpdateFileByIdSharedLink', 'UpdateFileByIdLockAccessField', 'UpdateFileByIdLock', 'UpdateFileByIdPermissionsCanDownloadField', 'UpdateFileByIdPermissions', 'UpdateFileByIdCollections', 'CopyFileParent', 'GetFileThumbnailByIdExtension', 'FilesManager'),
+    'folder_classifications': ('UpdateClassificationOnFolderRequestBodyOpField', 'UpdateClassificationOnFolderRequestBodyPathField', 'UpdateClassificationOnFolderRequestBody', 'FolderClassificationsManager'),
+    'folder_locks': ('CreateFolderLockLockedOperations', 'CreateFolderLockFolder', 'FolderLocksManager'),
+    'folder_metadata': ('GetFolderMetadataByIdScope', 'CreateFolderMetadataByIdScope', 'UpdateFolderMetadataByIdScope', 'UpdateFolderMetadataByIdRequestBodyOpField', 'UpdateFolderMetadataByIdRequestBody', 'DeleteFolderMetadataByIdScope', 'FolderMetadataManager'),
+    'folder_watermarks': ('UpdateFolderWatermarkWatermarkImprintField', 'UpdateFolderWatermarkWatermark', 'FolderWatermarksManager'),
+    'folders': ('GetFolderByIdSort', 'GetFolderByIdDirection', 'UpdateFolderByIdSyncState', 'UpdateFolderByIdParent', 'UpdateFolderByIdSharedLinkAccessField', 'UpdateFolderByIdSharedLinkPermissionsField', 'UpdateFolderByIdSharedLink', 'UpdateFolderByIdFolderUploadEmailAccessField', 'UpdateFolderByIdFolderUploadEmail', 'UpdateFolderByIdCollections', 'GetFolderItemsSort', 'GetFolderItemsDirection', 'CreateFolderParent', 'CreateFolderFolderUploadEmailAccessField', 'CreateFolderFolderUploadEmail', 'CreateFolderSyncState', 'CopyFolderParent', 'FoldersManager'),
+    'groups': ('CreateGroupInvitabilityLevel', 'CreateGroupMemberViewabilityLevel', 'UpdateGroupByIdInvitabilityLevel', 'UpdateGroupByIdMemberViewabilityLevel', 'GroupsManager'),
+    'integration_mappings': ('GetSlackIntegrationMappingPartnerItemType', 'GetSlackIntegrationMappingBoxItemType', 'IntegrationMappingsManager'),
+    'invites': ('CreateInviteEnterprise', 'CreateInviteActionableBy', 'InvitesManager'),
+    'legal_hold_policies': ('LegalHoldPoliciesManager',),
+    'legal_hold_policy_assignments': ('GetLegalHoldPolicyAssignmentsAssignToType', 'CreateLegalHoldPolicyAssignmentAssignToTypeField', 'CreateLegalHoldPolicyAssignmentAssignTo', 'LegalHoldPolicyAssignmentsManager'),
+    'list_collaborations': ('GetCollaborationsStatus', 'ListCollaborationsManager'),
+    'memberships': ('CreateGroupMembershipUser', 'CreateGroupMembershipGroup', 'CreateGroupMembershipRole', 'UpdateGroupMembershipByIdRole', 'MembershipsManager'),
+    'metadata_cascade_policies': ('CreateMetadataCascadePolicyScope', 'ApplyMetadataCascadePolicyConflictResolution', 'MetadataCascadePoliciesManager'),
+    'metadata_templates': ('GetMetadataTemplateScope', 'UpdateMetadataTemplateScope', 'UpdateMetadataTemplateRequestBodyOpField', 'UpdateMetadataTemplateRequestBody', 'DeleteMetadataTemplateScope', 'CreateMetadataTemplateFieldsTypeField', 'CreateMetadataTemplateFieldsOptionsField', 'CreateMetadataTemplateFields', 'MetadataTemplatesManager'),
+    'recent_items': ('RecentItemsManager',),
+    'retention_policies': ('GetRetentionPoliciesPolicyType', 'CreateRetentionPolicyPolicyType', 'CreateRetentionPolicyDispositionAction', 'CreateRetentionPolicyRetentionType', 'RetentionPoliciesManager'),
+    'retention_policy_assignments': ('GetRetentionPolicyAssignmentsType', 'CreateRetentionPolicyAssignmentAssignToTypeField', 'CreateRetentionPolicyAssignmentAssignTo', 'CreateRetentionPolicyAssignmentFilterFields', 'RetentionPolicyAssignmentsManager'),
+    'search': ('SearchByMetadataQueryOrderByDirectionField', 'SearchByMetadataQueryOrderBy', 'SearchForContentScope', 'SearchForContentContentTypes', 'SearchForContentType', 'SearchForContentTrashContent', 'SearchForContentSort', 'SearchForContentDirection', 'SearchManager'),
+    'session_termination': ('SessionTerminationManager',),
+    'shared_links_files': ('AddShareLinkToFileSharedLinkAccessField', 'AddShareLinkToFileSharedLinkPermissionsField', 'AddShareLinkToFileSharedLink', 'UpdateSharedLinkOnFileSharedLinkAccessField', 'UpdateSharedLinkOnFileSharedLinkPermissionsField', 'UpdateSharedLinkOnFileSharedLink', 'RemoveSharedLinkFromFileSharedLink', 'SharedLinksFilesManager'),
+    'shared_links_folders': ('AddShareLinkToFolderSharedLinkAccessField', 'AddShareLinkToFolderSharedLinkPermissionsField', 'AddShareLinkToFolderSharedLink', 'UpdateSharedLinkOnFolderSharedLinkAccessField', 'UpdateSharedLinkOnFolderSharedLinkPermissionsField', 'UpdateSharedLinkOnFolderSharedLink', 'RemoveSharedLinkFromFolderSharedLink', 'SharedLinksFoldersManager'),
+    'shared_links_web_links': ('AddShareLinkToWebLinkSharedLinkAccessField', 'AddShareLinkToWebLinkSharedLinkPermissionsField', 'AddShareLinkToWebLinkSharedLink', 'UpdateSharedLinkOnWebLinkSharedLinkAccessField', 'UpdateSharedLinkOnWebLinkSharedLinkPermissionsField', 'UpdateSharedLinkOnWebLinkSharedLink', 'RemoveSharedLinkFromWebLinkSharedLink', 'SharedLinksWebLinksManager'),
+    'shield_information_barrier_reports': ('ShieldInformationBarrierReportsManager',),
+    'shield_information_barrier_segment_members': ('CreateShieldInformationBarrierSegmentMemberType', 'CreateShieldInformationBarrierSegmentMemberShieldInformationBarrierSegmentTypeField', 'CreateShieldInformationBarrierSegmentMemberShieldInformationBarrierSegment', 'ShieldInformationBarrierSegmentMembersManager'),
+    'shield_information_barrier_segment_restrictions': ('CreateShieldInformationBarrierSegmentRestrictionType', 'CreateShieldInformationBarrierSegmentRestrictionShieldInformationBarrierSegmentTypeField', 'CreateShieldInformationBarrierSegmentRestrictionShieldInformationBarrierSegment', 'CreateShieldInformationBarrierSegmentRestrictionRestrictedSegmentTypeField', 'CreateShieldInformationBarrierSegmentRestrictionRestrictedSegment', 'ShieldInformationBarrierSegmentRestrictionsManager'),
+    'shield_information_barrier_segments': ('ShieldInformationBarrierSegmentsManager',),
+    'shield_information_barriers': ('UpdateShieldInformationBarrierStatusStatus', 'ShieldInformationBarriersManager'),
+    'sign_requests': ('CreateSignRequestSignatureColor', 'SignRequestsManager'),
+    'sign_templates': ('SignTemplatesManager',),
+    'skills': ('UpdateBoxSkillCardsOnFileRequestBodyOpField', 'UpdateBoxSkillCardsOnFileRequestBody', 'UpdateAllSkillCardsOnFileStatus', 'UpdateAllSkillCardsOnFileMetadata', 'UpdateAllSkillCardsOnFileFileTypeField', 'UpdateAllSkillCardsOnFileFile', 'UpdateAllSkillCardsOnFileFileVersionTypeField', 'UpdateAllSkillCardsOnFileFileVersion', 'UpdateAllSkillCardsOnFileUsage', 'SkillsManager'),
+    'storage_policies': ('StoragePoliciesManager',),
+    'storage_policy_assignments': ('GetStoragePolicyAssignmentsResolvedForType', 'CreateStoragePolicyAssignmentStoragePolicyTypeField', 'CreateStoragePolicyAssignmentStoragePolicy', 'CreateStoragePolicyAssignmentAssignedToTypeField', 'CreateStoragePolicyAssignmentAssignedTo', 'UpdateStoragePolicyAssignmentByIdStoragePolicyTypeField', 'UpdateStoragePolicyAssignmentByIdStoragePolicy', 'StoragePolicyAssignmentsManager'),
+    'task_assignments': ('CreateTaskAssignmentTaskTypeField', 'CreateTaskAssignmentTask', 'CreateTaskAssignmentAssignTo', 'UpdateTaskAssignmentByIdResolutionState', 'TaskAssignmentsManager'),
+    'tasks': ('CreateTaskItemTypeField', 'CreateTaskItem', 'CreateTaskAction', 'CreateTaskCompletionRule', 'UpdateTaskByIdAction', 'UpdateTaskByIdCompletionRule', 'TasksManager'),
+    'terms_of_service_user_statuses': ('CreateTermsOfServiceStatusForUserTosTypeField', 'CreateTermsOfServiceStatusForUserTos', 'CreateTermsOfServiceStatusForUserUserTypeField', 'CreateTermsOfServiceStatusForUserUser', 'TermsOfServiceUserStatusesManager'),
+    'terms_of_services': ('GetTermsOfServiceTosType', 'CreateTermsOfServiceStatus', 'CreateTermsOfServiceTosType', 'UpdateTermsOfServiceByIdStatus', 'TermsOfServicesManager'),
+    'transfer': ('TransferOwnedFolderOwnedBy', 'TransferManager'),
+    'trashed_files': ('RestoreFileFromTrashParent', 'TrashedFilesManager'),
+    'trashed_folders': ('RestoreFolderFromTrashParent', 'TrashedFoldersManager'),
+    'trashed_items': ('GetTrashedItemsDirection', 'GetTrashedItemsSort', 'TrashedItemsManager'),
+    'trashed_web_links': ('RestoreWeblinkFromTrashParent', 'TrashedWebLinksManager'),
+    'uploads': ('UploadFileVersionAttributes', 'UploadFileAttributesParentField', 'UploadFileAttributes', 'PreflightFileUploadCheckParent', 'UploadsManager'),
+    'user_collaborations': ('UpdateCollaborationByIdRole', 'UpdateCollaborationByIdStatus', 'CreateCollaborationItemTypeField', 'CreateCollaborationItem', 'CreateCollaborationAccessibleByTypeField', 'CreateCollaborationAccessibleBy', 'CreateCollaborationRole', 'UserCollaborationsManager'),
+    'users': ('GetUsersUserType', 'CreateUserRole', 'CreateUserStatus', 'UpdateUserByIdRole', 'UpdateUserByIdStatus', 'UpdateUserByIdNotificationEmail', 'UsersManager'),
+    'web_links': ('CreateWebLinkParent', 'UpdateWebLinkByIdParent', 'UpdateWebLinkByIdSharedLinkAccessField', 'UpdateWebLinkByIdSharedLink', 'WebLinksManager'),
+    'webhooks': ('CreateWebhookTargetTypeField', 'CreateWebhookTarget', 'CreateWebhookTriggers', 'UpdateWebhookByIdTargetTypeField', 'UpdateWebhookByIdTarget', 'UpdateWebhookByIdTriggers', 'WebhooksManager'),
+    'workflows': ('StartWorkflowType', 'StartWorkflowFlow', 'StartWorkflowFilesTypeField', 'StartWorkflowFiles', 'StartWorkflowFolderTypeField', 'StartWorkflowFolder', 'WorkflowsManager'),
+    'zip_downloads': ('CreateZipDownloadItemsTypeField', 'CreateZipDownloadItems', 'DownloadZipItemsTypeField', 'DownloadZipItems', 'ZipDownloadsManager'),
+}
+# fmt: on
+
+__all__ = [name for names in _exports.values() for name in names]
+
+__getattr__, __dir__ = lazy_package(__name__, _exports, globals())
@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.serialization.json.serializer import serialize
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -162,11 +164,28 @@ class AiManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_ai_ask_request(
+                mode, prompt, items, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, AiResponse, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_ai_ask_request(
+        self,
+        mode: CreateAiAskMode,
+        prompt: str,
+        items: List[CreateAiAskItems],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'mode': mode, 'prompt': prompt, 'items': items}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/ai/ask']),
             FetchOptions(
                 method='POST',
@@ -178,7 +197,6 @@ class AiManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, AiResponse)
 
     def create_ai_text_gen(
         self,
@@ -203,6 +221,26 @@ class AiManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_ai_text_gen_request(
+                prompt,
+                items,
+                dialogue_history=dialogue_history,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, AiResponse, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_ai_text_gen_request(
+        self,
+        prompt: str,
+        items: List[CreateAiTextGenItems],
+        *,
+        dialogue_history: Optional[List[CreateAiTextGenDialogueHistory]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -211,7 +249,7 @@ class AiManager:
             'dialogue_history': dialogue_history,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/ai/text_gen']),
             FetchOptions(
                 method='POST',
@@ -223,4 +261,3 @@ class AiManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, AiResponse)
@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import serialize
@@ -156,6 +158,28 @@ class AuthorizationManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._authorize_user_request(
+                response_type,
+                client_id,
+                redirect_uri=redirect_uri,
+                state=state,
+                scope=scope,
+                extra_headers=extra_headers,
+            )
+        )
+        return None
+
+    def _authorize_user_request(
+        self,
+        response_type: AuthorizeUserResponseType,
+        client_id: str,
+        *,
+        redirect_uri: Optional[str] = None,
+        state: Optional[str] = None,
+        scope: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -168,7 +192,7 @@ class AuthorizationManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.oauth_2_url, '/authorize']),
             FetchOptions(
                 method='GET',
@@ -179,7 +203,6 @@ class AuthorizationManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def request_access_token(
         self,
@@ -302,6 +325,50 @@ class AuthorizationManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._request_access_token_request(
+                grant_type,
+                client_id=client_id,
+                client_secret=client_secret,
+                code=code,
+                refresh_token=refresh_token,
+                assertion=assertion,
+                subject_token=subject_token,
+                subject_token_type=subject_token_type,
+                actor_token=actor_token,
+                actor_token_type=actor_token_type,
+                scope=scope,
+                resource=resource,
+                box_subject_type=box_subject_type,
+                box_subject_id=box_subject_id,
+                box_shared_link=box_shared_link,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, AccessToken, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _request_access_token_request(
+        self,
+        grant_type: RequestAccessTokenGrantType,
+        *,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        code: Optional[str] = None,
+        refresh_token: Optional[str] = None,
+        assertion: Optional[str] = None,
+        subject_token: Optional[str] = None,
+        subject_token_type: Optional[RequestAccessTokenSubjectTokenType] = None,
+        actor_token: Optional[str] = None,
+        actor_token_type: Optional[RequestAccessTokenActorTokenType] = None,
+        scope: Optional[str] = None,
+        resource: Optional[str] = None,
+        box_subject_type: Optional[RequestAccessTokenBoxSubjectType] = None,
+        box_subject_id: Optional[str] = None,
+        box_shared_link: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -322,7 +389,7 @@ class AuthorizationManager:
             'box_shared_link': box_shared_link,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/oauth2/token']),
             FetchOptions(
                 method='POST',
@@ -334,7 +401,6 @@ class AuthorizationManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, AccessToken)
 
     def refresh_access_token(
         self,
@@ -358,6 +424,28 @@ class AuthorizationManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._refresh_access_token_request(
+                client_id,
+                client_secret,
+                refresh_token,
+                grant_type=grant_type,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, AccessToken, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _refresh_access_token_request(
+        self,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        *,
+        grant_type: RefreshAccessTokenGrantType = RefreshAccessTokenGrantType.REFRESH_TOKEN.value,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -367,7 +455,7 @@ class AuthorizationManager:
             'refresh_token': refresh_token,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/oauth2/token#refresh']),
             FetchOptions(
                 method='POST',
@@ -379,7 +467,6 @@ class AuthorizationManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, AccessToken)
 
     def revoke_access_token(
         self,
@@ -405,6 +492,24 @@ class AuthorizationManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._revoke_access_token_request(
+                client_id=client_id,
+                client_secret=client_secret,
+                token=token,
+                extra_headers=extra_headers,
+            )
+        )
+        return None
+
+    def _revoke_access_token_request(
+        self,
+        *,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        token: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -413,7 +518,7 @@ class AuthorizationManager:
             'token': token,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/oauth2/revoke']),
             FetchOptions(
                 method='POST',
@@ -425,4 +530,3 @@ class AuthorizationManager:
                 network_session=self.network_session,
             ),
         )
-        return None
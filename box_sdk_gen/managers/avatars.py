@@ -2,6 +2,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -56,10 +58,18 @@ class AvatarsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_user_avatar_request(user_id, extra_headers=extra_headers)
+        )
+        return response.content
+
+    def _get_user_avatar_request(
+        self, user_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -76,7 +86,6 @@ class AvatarsManager:
                 network_session=self.network_session,
             ),
         )
-        return response.content
 
     def create_user_avatar(
         self,
@@ -99,6 +108,28 @@ class AvatarsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_user_avatar_request(
+                user_id,
+                pic,
+                pic_file_name=pic_file_name,
+                pic_content_type=pic_content_type,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, UserAvatar, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_user_avatar_request(
+        self,
+        user_id: str,
+        pic: ByteStream,
+        *,
+        pic_file_name: Optional[str] = None,
+        pic_content_type: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -107,7 +138,7 @@ class AvatarsManager:
             'pic_content_type': pic_content_type,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -133,7 +164,6 @@ class AvatarsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UserAvatar)
 
     def delete_user_avatar(
         self, user_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
@@ -149,10 +179,18 @@ class AvatarsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_user_avatar_request(user_id, extra_headers=extra_headers)
+        )
+        return None
+
+    def _delete_user_avatar_request(
+        self, user_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -169,4 +207,3 @@ class AvatarsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
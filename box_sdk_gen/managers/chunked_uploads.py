@@ -4,6 +4,20 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Set
+
+from typing import Callable
+
+from typing import Tuple
+
+from concurrent.futures import Future
+
+from concurrent.futures import ThreadPoolExecutor
+
+from concurrent.futures import FIRST_COMPLETED
+
+from concurrent.futures import wait
+
 from box_sdk_gen.serialization.json.serializer import serialize
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -50,13 +64,15 @@ from box_sdk_gen.serialization.json.json_data import SerializedData
 
 from box_sdk_gen.serialization.json.json_data import sd_to_json
 
-from box_sdk_gen.internal.utils import generate_byte_stream_from_buffer
-
 from box_sdk_gen.internal.utils import hex_to_base_64
 
 from box_sdk_gen.internal.utils import iterate_chunks
 
-from box_sdk_gen.internal.utils import read_byte_stream
+from box_sdk_gen.internal.utils import read_byte_stream_view
+
+from box_sdk_gen.internal.utils import MemoryViewByteStream
+
+from box_sdk_gen.internal.utils import MemoryMappedFileStream
 
 from box_sdk_gen.internal.utils import reduce_iterator
 
@@ -64,6 +80,14 @@ from box_sdk_gen.internal.utils import Hash
 
 from box_sdk_gen.internal.utils import buffer_length
 
+from box_sdk_gen.box.errors import BoxSDKError
+
+from box_sdk_gen.box.errors import BoxAPIError
+
+from box_sdk_gen.box.upload_session_journal import UploadSessionJournal
+
+from box_sdk_gen.box.upload_session_journal import UploadSessionProgress
+
 
 class _PartAccumulator:
     def __init__(
@@ -112,6 +136,23 @@ class ChunkedUploadsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_file_upload_session_request(
+                folder_id, file_size, file_name, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, UploadSession, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_file_upload_session_request(
+        self,
+        folder_id: str,
+        file_size: int,
+        file_name: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -120,7 +161,7 @@ class ChunkedUploadsManager:
             'file_name': file_name,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.upload_url,
@@ -137,7 +178,6 @@ class ChunkedUploadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UploadSession)
 
     def create_file_upload_session_for_existing_file(
         self,
@@ -165,11 +205,28 @@ class ChunkedUploadsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_file_upload_session_for_existing_file_request(
+                file_id, file_size, file_name=file_name, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, UploadSession, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_file_upload_session_for_existing_file_request(
+        self,
+        file_id: str,
+        file_size: int,
+        *,
+        file_name: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'file_size': file_size, 'file_name': file_name}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.upload_url,
@@ -188,7 +245,6 @@ class ChunkedUploadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UploadSession)
 
     def get_file_upload_session_by_id(
         self,
@@ -204,10 +260,25 @@ class ChunkedUploadsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_upload_session_by_id_request(
+                upload_session_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, UploadSession, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_file_upload_session_by_id_request(
+        self,
+        upload_session_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.upload_url,
@@ -223,7 +294,6 @@ class ChunkedUploadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UploadSession)
 
     def upload_file_part(
         self,
@@ -270,6 +340,28 @@ class ChunkedUploadsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._upload_file_part_request(
+                upload_session_id,
+                request_body,
+                digest,
+                content_range,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, UploadedPart, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _upload_file_part_request(
+        self,
+        upload_session_id: str,
+        request_body: ByteStream,
+        digest: str,
+        content_range: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params(
@@ -279,7 +371,7 @@ class ChunkedUploadsManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.upload_url,
@@ -297,7 +389,6 @@ class ChunkedUploadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UploadedPart)
 
     def delete_file_upload_session_by_id(
         self,
@@ -316,10 +407,23 @@ class ChunkedUploadsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_file_upload_session_by_id_request(
+                upload_session_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_file_upload_session_by_id_request(
+        self,
+        upload_session_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.upload_url,
@@ -335,7 +439,6 @@ class ChunkedUploadsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def get_file_upload_session_parts(
         self,
@@ -364,13 +467,33 @@ class ChunkedUploadsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_upload_session_parts_request(
+                upload_session_id,
+                offset=offset,
+                limit=limit,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, UploadParts, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_file_upload_session_parts_request(
+        self,
+        upload_session_id: str,
+        *,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'offset': to_string(offset), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.upload_url,
@@ -388,7 +511,6 @@ class ChunkedUploadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UploadParts)
 
     def create_file_upload_session_commit(
         self,
@@ -436,6 +558,30 @@ class ChunkedUploadsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_file_upload_session_commit_request(
+                upload_session_id,
+                parts,
+                digest,
+                if_match=if_match,
+                if_none_match=if_none_match,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Files, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_file_upload_session_commit_request(
+        self,
+        upload_session_id: str,
+        parts: List[UploadPart],
+        digest: str,
+        *,
+        if_match: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'parts': parts}
@@ -447,7 +593,7 @@ class ChunkedUploadsManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.upload_url,
@@ -466,19 +612,20 @@ class ChunkedUploadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Files)
 
-    def _reducer(self, acc: _PartAccumulator, chunk: ByteStream) -> _PartAccumulator:
-        last_index: int = acc.last_index
-        parts: List[UploadPart] = acc.parts
-        chunk_buffer: Buffer = read_byte_stream(chunk)
+    def _upload_part(
+        self,
+        upload_session_id: str,
+        chunk_buffer: Buffer,
+        bytes_start: int,
+        file_size: int,
+    ) -> UploadPart:
         hash: Hash = Hash(algorithm=HashName.SHA1.value)
         hash.update_hash(chunk_buffer)
         sha_1: str = hash.digest_hash('base64')
         digest: str = ''.join(['sha=', sha_1])
         chunk_size: int = buffer_length(chunk_buffer)
-        bytes_start: int = last_index + 1
-        bytes_end: int = last_index + chunk_size
+        bytes_end: int = bytes_start + chunk_size - 1
         content_range: str = ''.join(
             [
                 'bytes ',
@@ -486,12 +633,12 @@ class ChunkedUploadsManager:
                 '-',
                 to_string(bytes_end),
                 '/',
-                to_string(acc.file_size),
+                to_string(file_size),
             ]
         )
         uploaded_part: UploadedPart = self.upload_file_part(
-            acc.upload_session_id,
-            generate_byte_stream_from_buffer(chunk_buffer),
+            upload_session_id,
+            MemoryViewByteStream(chunk_buffer),
             digest,
             content_range,
         )
@@ -500,17 +647,143 @@ class ChunkedUploadsManager:
         assert part_sha_1 == sha_1
         assert part.size == chunk_size
         assert part.offset == bytes_start
+        return part
+
+    def _reducer(self, acc: _PartAccumulator, chunk: ByteStream) -> _PartAccumulator:
+        last_index: int = acc.last_index
+        parts: List[UploadPart] = acc.parts
+        chunk_buffer: Buffer = read_byte_stream_view(chunk)
+        part: UploadPart = self._upload_part(
+            acc.upload_session_id, chunk_buffer, last_index + 1, acc.file_size
+        )
         acc.file_hash.update_hash(chunk_buffer)
+        parts.append(part)
         return _PartAccumulator(
-            last_index=bytes_end,
-            parts=parts + [part],
+            last_index=last_index + buffer_length(chunk_buffer),
+            parts=parts,
             file_size=acc.file_size,
             upload_session_id=acc.upload_session_id,
             file_hash=acc.file_hash,
         )
 
+    def _upload_parts_concurrently(
+        self,
+        chunks_iterator: Iterator,
+        upload_session_id: str,
+        file_size: int,
+        file_hash: Hash,
+        max_workers: int,
+        max_parts_in_flight: int,
+        *,
+        acknowledged_parts: Optional[Dict[int, UploadPart]] = None,
+        on_parts_acknowledged: Optional[Callable[[List[UploadPart]], None]] = None,
+    ) -> List[UploadPart]:
+        if acknowledged_parts is None:
+            acknowledged_parts = {}
+        parts: List[UploadPart] = []
+        in_flight: Set[Future] = set()
+        bytes_start: int = 0
+
+        def collect(done: Set[Future]) -> None:
+            new_parts: List[UploadPart] = [
+                future.result()
+                for future in done
+                if not future.cancelled() and future.exception() is None
+            ]
+            parts.extend(new_parts)
+            if on_parts_acknowledged is not None and new_parts:
+                on_parts_acknowledged(new_parts)
+            for future in done:
+                if not future.cancelled() and future.exception() is not None:
+                    raise future.exception()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for chunk in chunks_iterator:
+                    chunk_buffer: Buffer = read_byte_stream_view(chunk)
+                    # The whole-file digest must be fed in file order, so it is
+                    # updated here on the reading thread rather than in the workers.
+                    file_hash.update_hash(chunk_buffer)
+                    acknowledged_part: Optional[UploadPart] = acknowledged_parts.get(
+                        bytes_start
+                    )
+                    if acknowledged_part is not None:
+                        self._verify_acknowledged_part(acknowledged_part, chunk_buffer)
+                        parts.append(acknowledged_part)
+                    else:
+                        in_flight.add(
+                            executor.submit(
+                                self._upload_part,
+                                upload_session_id,
+                                chunk_buffer,
+                                bytes_start,
+                                file_size,
+                            )
+                        )
+                    bytes_start += buffer_length(chunk_buffer)
+                    if len(in_flight) >= max_parts_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        collect(done)
+                done, in_flight = wait(in_flight)
+                collect(done)
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                # Parts that were acknowledged before the failure are still reported,
+                # so that a resumed upload does not send them again.
+                done, in_flight = wait(in_flight)
+                try:
+                    collect(done)
+                except Exception:
+                    pass
+                raise
+        return sorted(parts, key=lambda part: part.offset)
+
+    def _verify_acknowledged_part(self, part: UploadPart, chunk_buffer: Buffer) -> None:
+        hash: Hash = Hash(algorithm=HashName.SHA1.value)
+        hash.update_hash(chunk_buffer)
+        if part.size != buffer_length(chunk_buffer) or hex_to_base_64(
+            part.sha_1
+        ) != hash.digest_hash('base64'):
+            raise BoxSDKError(
+                message=f'Content of the part at offset {part.offset} does not match the part already uploaded to upload session. The file has changed since the upload was started.'
+            )
+
+    def _get_acknowledged_parts(self, upload_session_id: str) -> Dict[int, UploadPart]:
+        acknowledged_parts: Dict[int, UploadPart] = {}
+        offset: int = 0
+        while True:
+            upload_parts: UploadParts = self.get_file_upload_session_parts(
+                upload_session_id, offset=offset, limit=1000
+            )
+            entries: List[UploadPart] = upload_parts.entries or []
+            for part in entries:
+                acknowledged_parts[part.offset] = part
+            offset += len(entries)
+            if not entries or offset >= (upload_parts.total_count or 0):
+                return acknowledged_parts
+
+    def _resume_upload_session(
+        self, progress: UploadSessionProgress
+    ) -> Optional[UploadSession]:
+        try:
+            return self.get_file_upload_session_by_id(progress.upload_session_id)
+        except BoxAPIError as error:
+            if error.response_info.status_code == 404:
+                # The session expired or was aborted, so the upload has to start over.
+                return None
+            raise
+
     def upload_big_file(
-        self, file: ByteStream, file_name: str, file_size: int, parent_folder_id: str
+        self,
+        file: ByteStream,
+        file_name: str,
+        file_size: int,
+        parent_folder_id: str,
+        *,
+        max_workers: int = 1,
+        max_parts_in_flight: Optional[int] = None,
+        journal: Optional[UploadSessionJournal] = None,
     ) -> FileFull:
         """
         Starts the process of chunk uploading a big file. Should return a File object representing uploaded file.
@@ -522,29 +795,84 @@ class ChunkedUploadsManager:
         :type file_size: int
         :param parent_folder_id: The ID of the folder where the file should be uploaded.
         :type parent_folder_id: str
+        :param max_workers: The number of threads used to upload parts concurrently. When set to 1, parts are uploaded one after another., defaults to 1
+        :type max_workers: int, optional
+        :param max_parts_in_flight: The maximum number of parts read from the stream and not yet acknowledged by the API. Bounds memory usage to roughly this many parts. If None, it is equal to max_workers., defaults to None
+        :type max_parts_in_flight: Optional[int], optional
+        :param journal: Object responsible for persisting the progress of the upload. If it holds the progress of an interrupted upload of the same file, that upload session is resumed and only the missing parts are uploaded. The stream must then contain the whole file again., defaults to None
+        :type journal: Optional[UploadSessionJournal], optional
         """
-        upload_session: UploadSession = self.create_file_upload_session(
-            parent_folder_id, file_size, file_name
+        if max_workers < 1:
+            raise BoxSDKError(message='max_workers must be a positive integer.')
+        if max_parts_in_flight is None:
+            max_parts_in_flight = max_workers
+        if max_parts_in_flight < max_workers:
+            raise BoxSDKError(
+                message='max_parts_in_flight must not be lower than max_workers.'
+            )
+        progress: Optional[UploadSessionProgress] = (
+            journal.get() if not journal == None else None
         )
+        upload_session: Optional[UploadSession] = None
+        acknowledged_parts: Dict[int, UploadPart] = {}
+        if not progress == None and progress.matches(
+            file_name, file_size, parent_folder_id
+        ):
+            upload_session = self._resume_upload_session(progress)
+        if not upload_session == None:
+            acknowledged_parts = self._get_acknowledged_parts(upload_session.id)
+            progress.parts = list(acknowledged_parts.values())
+            journal.store(progress)
+        else:
+            upload_session = self.create_file_upload_session(
+                parent_folder_id, file_size, file_name
+            )
+            assert upload_session.num_parts_processed == 0
+            if not journal == None:
+                progress = UploadSessionProgress(
+                    upload_session.id,
+                    file_name,
+                    file_size,
+                    parent_folder_id,
+                    upload_session.part_size,
+                )
+                journal.store(progress)
         upload_session_id: str = upload_session.id
         part_size: int = upload_session.part_size
         total_parts: int = upload_session.total_parts
         assert part_size * total_parts >= file_size
-        assert upload_session.num_parts_processed == 0
         file_hash: Hash = Hash(algorithm=HashName.SHA1.value)
         chunks_iterator: Iterator = iterate_chunks(file, part_size)
-        results: _PartAccumulator = reduce_iterator(
-            chunks_iterator,
-            self._reducer,
-            _PartAccumulator(
-                last_index=-1,
-                parts=[],
-                file_size=file_size,
-                upload_session_id=upload_session_id,
-                file_hash=file_hash,
-            ),
-        )
-        parts: List[UploadPart] = results.parts
+        if max_workers == 1 and journal == None:
+            results: _PartAccumulator = reduce_iterator(
+                chunks_iterator,
+                self._reducer,
+                _PartAccumulator(
+                    last_index=-1,
+                    parts=[],
+                    file_size=file_size,
+                    upload_session_id=upload_session_id,
+                    file_hash=file_hash,
+                ),
+            )
+            parts: List[UploadPart] = results.parts
+        else:
+
+            def on_parts_acknowledged(new_parts: List[UploadPart]) -> None:
+                if not journal == None:
+                    progress.parts = progress.parts + new_parts
+                    journal.store(progress)
+
+            parts: List[UploadPart] = self._upload_parts_concurrently(
+                chunks_iterator,
+                upload_session_id,
+                file_size,
+                file_hash,
+                max_workers,
+                max_parts_in_flight,
+                acknowledged_parts=acknowledged_parts,
+                on_parts_acknowledged=on_parts_acknowledged,
+            )
         processed_session_parts: UploadParts = self.get_file_upload_session_parts(
             upload_session_id
         )
@@ -558,4 +886,43 @@ class ChunkedUploadsManager:
         committed_session: Files = self.create_file_upload_session_commit(
             upload_session_id, parts, digest
         )
+        if not journal == None:
+            journal.clear()
         return committed_session.entries[0]
+
+    def upload_big_file_from_path(
+        self,
+        file_path: str,
+        file_name: str,
+        parent_folder_id: str,
+        *,
+        max_workers: int = 1,
+        max_parts_in_flight: Optional[int] = None,
+        journal: Optional[UploadSessionJournal] = None,
+    ) -> FileFull:
+        """
+        Starts the process of chunk uploading a big local file. The file is memory-mapped, so parts and their SHA-1 digests are
+        read straight from the mapping and buffered by the OS page cache instead of Python memory.
+        :param file_path: Path to the local file to upload.
+        :type file_path: str
+        :param file_name: The name of the file, which will be used for storage in Box.
+        :type file_name: str
+        :param parent_folder_id: The ID of the folder where the file should be uploaded.
+        :type parent_folder_id: str
+        :param max_workers: The number of threads used to upload parts concurrently. When set to 1, parts are uploaded one after another., defaults to 1
+        :type max_workers: int, optional
+        :param max_parts_in_flight: The maximum number of parts not yet acknowledged by the API. If None, it is equal to max_workers., defaults to None
+        :type max_parts_in_flight: Optional[int], optional
+        :param journal: Object responsible for persisting the progress of the upload, so that an interrupted upload can be resumed., defaults to None
+        :type journal: Optional[UploadSessionJournal], optional
+        """
+        with MemoryMappedFileStream(file_path) as file:
+            return self.upload_big_file(
+                file,
+                file_name,
+                len(file),
+                parent_folder_id,
+                max_workers=max_workers,
+                max_parts_in_flight=max_parts_in_flight,
+                journal=journal,
+            )
@@ -8,6 +8,8 @@ from box_sdk_gen.internal.base_object import BaseObject
 
 from typing import List
 
+from typing import Tuple
+
 from box_sdk_gen.serialization.json.serializer import deserialize
 
 from box_sdk_gen.serialization.json.serializer import serialize
@@ -508,10 +510,22 @@ class ClassificationsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_classification_template_request(extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data,
+            ClassificationTemplate,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_classification_template_request(
+        self, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -526,7 +540,6 @@ class ClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ClassificationTemplate)
 
     def add_classification(
         self,
@@ -553,10 +566,25 @@ class ClassificationsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._add_classification_request(request_body, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data,
+            ClassificationTemplate,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _add_classification_request(
+        self,
+        request_body: List[AddClassificationRequestBody],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -573,7 +601,6 @@ class ClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ClassificationTemplate)
 
     def update_classification(
         self,
@@ -600,10 +627,27 @@ class ClassificationsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_classification_request(
+                request_body, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            ClassificationTemplate,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_classification_request(
+        self,
+        request_body: List[UpdateClassificationRequestBody],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -620,7 +664,6 @@ class ClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ClassificationTemplate)
 
     def create_classification_template(
         self,
@@ -674,6 +717,34 @@ class ClassificationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_classification_template_request(
+                fields,
+                scope=scope,
+                template_key=template_key,
+                display_name=display_name,
+                hidden=hidden,
+                copy_instance_on_item_copy=copy_instance_on_item_copy,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ClassificationTemplate,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_classification_template_request(
+        self,
+        fields: List[CreateClassificationTemplateFields],
+        *,
+        scope: CreateClassificationTemplateScope = CreateClassificationTemplateScope.ENTERPRISE.value,
+        template_key: CreateClassificationTemplateTemplateKey = CreateClassificationTemplateTemplateKey.SECURITYCLASSIFICATION_6VMVOCHWUWO.value,
+        display_name: CreateClassificationTemplateDisplayName = CreateClassificationTemplateDisplayName.CLASSIFICATION.value,
+        hidden: Optional[bool] = None,
+        copy_instance_on_item_copy: Optional[bool] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -685,7 +756,7 @@ class ClassificationsManager:
             'fields': fields,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -702,4 +773,3 @@ class ClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ClassificationTemplate)
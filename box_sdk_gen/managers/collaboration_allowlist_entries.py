@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -81,13 +83,31 @@ class CollaborationAllowlistEntriesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_collaboration_whitelist_entries_request(
+                marker=marker, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            CollaborationAllowlistEntries,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_collaboration_whitelist_entries_request(
+        self,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -103,7 +123,6 @@ class CollaborationAllowlistEntriesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, CollaborationAllowlistEntries)
 
     def create_collaboration_whitelist_entry(
         self,
@@ -124,11 +143,29 @@ class CollaborationAllowlistEntriesManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_collaboration_whitelist_entry_request(
+                domain, direction, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            CollaborationAllowlistEntry,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_collaboration_whitelist_entry_request(
+        self,
+        domain: str,
+        direction: CreateCollaborationWhitelistEntryDirection,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'domain': domain, 'direction': direction}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -145,7 +182,6 @@ class CollaborationAllowlistEntriesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, CollaborationAllowlistEntry)
 
     def get_collaboration_whitelist_entry_by_id(
         self,
@@ -164,10 +200,27 @@ class CollaborationAllowlistEntriesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_collaboration_whitelist_entry_by_id_request(
+                collaboration_whitelist_entry_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            CollaborationAllowlistEntry,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_collaboration_whitelist_entry_by_id_request(
+        self,
+        collaboration_whitelist_entry_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -183,7 +236,6 @@ class CollaborationAllowlistEntriesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, CollaborationAllowlistEntry)
 
     def delete_collaboration_whitelist_entry_by_id(
         self,
@@ -202,10 +254,23 @@ class CollaborationAllowlistEntriesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_collaboration_whitelist_entry_by_id_request(
+                collaboration_whitelist_entry_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_collaboration_whitelist_entry_by_id_request(
+        self,
+        collaboration_whitelist_entry_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -221,4 +286,3 @@ class CollaborationAllowlistEntriesManager:
                 network_session=self.network_session,
             ),
         )
-        return None
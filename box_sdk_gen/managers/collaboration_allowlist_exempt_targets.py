@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -85,13 +87,31 @@ class CollaborationAllowlistExemptTargetsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_collaboration_whitelist_exempt_targets_request(
+                marker=marker, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            CollaborationAllowlistExemptTargets,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_collaboration_whitelist_exempt_targets_request(
+        self,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -107,7 +127,6 @@ class CollaborationAllowlistExemptTargetsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, CollaborationAllowlistExemptTargets)
 
     def create_collaboration_whitelist_exempt_target(
         self,
@@ -125,11 +144,28 @@ class CollaborationAllowlistExemptTargetsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_collaboration_whitelist_exempt_target_request(
+                user, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            CollaborationAllowlistExemptTarget,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_collaboration_whitelist_exempt_target_request(
+        self,
+        user: CreateCollaborationWhitelistExemptTargetUser,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'user': user}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -146,7 +182,6 @@ class CollaborationAllowlistExemptTargetsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, CollaborationAllowlistExemptTarget)
 
     def get_collaboration_whitelist_exempt_target_by_id(
         self,
@@ -165,10 +200,27 @@ class CollaborationAllowlistExemptTargetsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_collaboration_whitelist_exempt_target_by_id_request(
+                collaboration_whitelist_exempt_target_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            CollaborationAllowlistExemptTarget,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_collaboration_whitelist_exempt_target_by_id_request(
+        self,
+        collaboration_whitelist_exempt_target_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -184,7 +236,6 @@ class CollaborationAllowlistExemptTargetsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, CollaborationAllowlistExemptTarget)
 
     def delete_collaboration_whitelist_exempt_target_by_id(
         self,
@@ -203,10 +254,23 @@ class CollaborationAllowlistExemptTargetsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_collaboration_whitelist_exempt_target_by_id_request(
+                collaboration_whitelist_exempt_target_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_collaboration_whitelist_exempt_target_by_id_request(
+        self,
+        collaboration_whitelist_exempt_target_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -222,4 +286,3 @@ class CollaborationAllowlistExemptTargetsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
@@ -4,6 +4,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -84,6 +86,23 @@ class CollectionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_collections_request(
+                fields=fields, offset=offset, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, Collections, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_collections_request(
+        self,
+        *,
+        fields: Optional[List[str]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -94,7 +113,7 @@ class CollectionsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/collections']),
             FetchOptions(
                 method='GET',
@@ -105,7 +124,6 @@ class CollectionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Collections)
 
     def get_collection_items(
         self,
@@ -145,6 +163,28 @@ class CollectionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_collection_items_request(
+                collection_id,
+                fields=fields,
+                offset=offset,
+                limit=limit,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Items, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_collection_items_request(
+        self,
+        collection_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -155,7 +195,7 @@ class CollectionsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -173,4 +213,3 @@ class CollectionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Items)
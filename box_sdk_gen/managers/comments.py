@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -114,6 +116,28 @@ class CommentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_comments_request(
+                file_id,
+                fields=fields,
+                limit=limit,
+                offset=offset,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Comments, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_file_comments_request(
+        self,
+        file_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -124,7 +148,7 @@ class CommentsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -142,7 +166,6 @@ class CommentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Comments)
 
     def get_comment_by_id(
         self,
@@ -172,11 +195,27 @@ class CommentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_comment_by_id_request(
+                comment_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, CommentFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_comment_by_id_request(
+        self,
+        comment_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -193,7 +232,6 @@ class CommentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, CommentFull)
 
     def update_comment_by_id(
         self,
@@ -223,12 +261,29 @@ class CommentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_comment_by_id_request(
+                comment_id, message=message, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, CommentFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_comment_by_id_request(
+        self,
+        comment_id: str,
+        *,
+        message: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'message': message}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -247,7 +302,6 @@ class CommentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, CommentFull)
 
     def delete_comment_by_id(
         self,
@@ -263,10 +317,21 @@ class CommentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_comment_by_id_request(comment_id, extra_headers=extra_headers)
+        )
+        return None
+
+    def _delete_comment_by_id_request(
+        self,
+        comment_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -282,7 +347,6 @@ class CommentsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def create_comment(
         self,
@@ -330,6 +394,28 @@ class CommentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_comment_request(
+                message,
+                item,
+                tagged_message=tagged_message,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, CommentFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_comment_request(
+        self,
+        message: str,
+        item: CreateCommentItem,
+        *,
+        tagged_message: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -339,7 +425,7 @@ class CommentsManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/comments']),
             FetchOptions(
                 method='POST',
@@ -352,4 +438,3 @@ class CommentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, CommentFull)
@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -66,10 +68,25 @@ class DevicePinnersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_device_pinner_by_id_request(
+                device_pinner_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, DevicePinner, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_device_pinner_by_id_request(
+        self,
+        device_pinner_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -85,7 +102,6 @@ class DevicePinnersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, DevicePinner)
 
     def delete_device_pinner_by_id(
         self,
@@ -101,10 +117,23 @@ class DevicePinnersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_device_pinner_by_id_request(
+                device_pinner_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_device_pinner_by_id_request(
+        self,
+        device_pinner_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -120,7 +149,6 @@ class DevicePinnersManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def get_enterprise_device_pinners(
         self,
@@ -155,6 +183,28 @@ class DevicePinnersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_enterprise_device_pinners_request(
+                enterprise_id,
+                marker=marker,
+                limit=limit,
+                direction=direction,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, DevicePinners, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_enterprise_device_pinners_request(
+        self,
+        enterprise_id: str,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        direction: Optional[GetEnterpriseDevicePinnersDirection] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -165,7 +215,7 @@ class DevicePinnersManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -183,4 +233,3 @@ class DevicePinnersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, DevicePinners)
@@ -1,7 +1,23 @@
+import os
+
+import mmap
+
+from io import BytesIO
+
+from typing import List
+
+from concurrent.futures import Future
+
+from concurrent.futures import ThreadPoolExecutor
+
 from typing import Optional
 
+from typing import Union
+
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.schemas.client_error import ClientError
@@ -16,6 +32,30 @@ from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.internal.utils import ByteStream
 
+from box_sdk_gen.internal.utils import Buffer
+
+from box_sdk_gen.internal.utils import ResumableByteStream
+
+from box_sdk_gen.internal.utils import Hash
+
+from box_sdk_gen.internal.utils import HashName
+
+from box_sdk_gen.internal.utils import hex_to_base_64
+
+from box_sdk_gen.schemas.file_full import FileFull
+
+from box_sdk_gen.schemas.file_version_full import FileVersionFull
+
+from box_sdk_gen.managers.files import FilesManager
+
+from box_sdk_gen.managers.file_versions import FileVersionsManager
+
+from box_sdk_gen.box.errors import BoxSDKError
+
+from box_sdk_gen.box.errors import BoxAPIError
+
+from box_sdk_gen.box.developer_token_auth import BoxDeveloperTokenAuth
+
 from box_sdk_gen.serialization.json.json_data import sd_to_json
 
 from box_sdk_gen.networking.fetch import FetchOptions
@@ -25,6 +65,35 @@ from box_sdk_gen.networking.fetch import FetchResponse
 from box_sdk_gen.networking.fetch import fetch
 
 
+class _RangeWriter:
+    def __init__(self, target: mmap.mmap, start: int, length: int):
+        self._target = target
+        self._start = start
+        self.length = length
+        self.written = 0
+
+    def write(self, chunk: Buffer) -> int:
+        end: int = self.written + len(chunk)
+        if end > self.length:
+            raise BoxSDKError(
+                message='Received more data than the requested byte range contains.'
+            )
+        self._target[self._start + self.written : self._start + end] = chunk
+        self.written = end
+        return len(chunk)
+
+
+def _get_content_range(headers: Dict[str, str]) -> Optional[Tuple[int, int]]:
+    # Parses the first and last byte of a header like `Content-Range: bytes 0-1023/4096`.
+    for name, value in headers.items():
+        if name.lower() == 'content-range':
+            unit, _, byte_range = value.partition(' ')
+            first_byte, _, last_byte = byte_range.partition('/')[0].partition('-')
+            if unit == 'bytes' and first_byte.isdigit() and last_byte.isdigit():
+                return int(first_byte), int(last_byte)
+    return None
+
+
 class DownloadsManager:
     def __init__(
         self,
@@ -82,6 +151,28 @@ class DownloadsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._download_file_request(
+                file_id,
+                version=version,
+                access_token=access_token,
+                range=range,
+                boxapi=boxapi,
+                extra_headers=extra_headers,
+            )
+        )
+        return response.content
+
+    def _download_file_request(
+        self,
+        file_id: str,
+        *,
+        version: Optional[str] = None,
+        access_token: Optional[str] = None,
+        range: Optional[str] = None,
+        boxapi: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -90,7 +181,7 @@ class DownloadsManager:
         headers_map: Dict[str, str] = prepare_params(
             {'range': to_string(range), 'boxapi': to_string(boxapi), **extra_headers}
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -108,4 +199,296 @@ class DownloadsManager:
                 network_session=self.network_session,
             ),
         )
-        return response.content
+
+    def download_file_to(
+        self,
+        file_id: str,
+        destination: Union[str, os.PathLike, ByteStream],
+        *,
+        version: Optional[str] = None,
+        access_token: Optional[str] = None,
+        range: Optional[str] = None,
+        boxapi: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None,
+    ) -> int:
+        """
+        Downloads the contents of a file to a local path or a writable file object.
+        The content is written chunk by chunk as it arrives, so the file is never held in memory as a whole.
+        :param file_id: The unique identifier that represents a file.
+        :type file_id: str
+        :param destination: Path of the local file to write to, or a writable file object.
+        :type destination: Union[str, os.PathLike, ByteStream]
+        :param version: The file version to download, defaults to None
+        :type version: Optional[str], optional
+        :param access_token: An optional access token that can be used to pre-authenticate this request., defaults to None
+        :type access_token: Optional[str], optional
+        :param range: The byte range of the content to download., defaults to None
+        :type range: Optional[str], optional
+        :param boxapi: The URL, and optional password, for the shared link of this item., defaults to None
+        :type boxapi: Optional[str], optional
+        :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
+        :type extra_headers: Optional[Dict[str, Optional[str]]], optional
+        :return: The number of bytes written.
+        """
+        content: ByteStream = self.download_file(
+            file_id,
+            version=version,
+            access_token=access_token,
+            range=range,
+            boxapi=boxapi,
+            extra_headers=extra_headers,
+        )
+        return content.download_to(destination)
+
+    def _fetch_file_content(
+        self,
+        file_id: str,
+        *,
+        version: Optional[str] = None,
+        access_token: Optional[str] = None,
+        range: Optional[str] = None,
+        boxapi: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None,
+    ) -> FetchResponse:
+        # Like download_file, but the content is always a forward-only stream, so bytes already
+        # read are not kept in memory, and the status and headers of the response are returned too.
+        url, options = self._download_file_request(
+            file_id,
+            version=version,
+            access_token=access_token,
+            range=range,
+            boxapi=boxapi,
+            extra_headers=extra_headers,
+        )
+        options.network_session = self.network_session.with_stream_downloads()
+        return fetch(url, options)
+
+    def _download_range(
+        self,
+        file_id: str,
+        writer: _RangeWriter,
+        range_start: int,
+        version: Optional[str],
+        max_attempts: int,
+        extra_headers: Optional[Dict[str, Optional[str]]],
+    ) -> None:
+        range_end: int = range_start + writer.length - 1
+        attempt_nr: int = 1
+        while True:
+            requested_start: int = range_start + writer.written
+            try:
+                response: FetchResponse = self._fetch_file_content(
+                    file_id,
+                    version=version,
+                    range=''.join(
+                        [
+                            'bytes=',
+                            to_string(requested_start),
+                            '-',
+                            to_string(range_end),
+                        ]
+                    ),
+                    extra_headers=extra_headers,
+                )
+            except BoxAPIError:
+                raise
+            except BoxSDKError:
+                # The request failed with network errors, which fetch() stopped retrying.
+                if attempt_nr >= max_attempts:
+                    raise
+                attempt_nr += 1
+                continue
+            if not response.status == 206 or not _get_content_range(
+                response.headers
+            ) == (requested_start, range_end):
+                # E.g. a proxy ignoring the range header would send the whole file with status 200.
+                response.content.close()
+                raise BoxSDKError(
+                    message=f'Response to the request of bytes {requested_start}-{range_end} does not contain the requested byte range.'
+                )
+            try:
+                response.content.download_to(writer)
+                if writer.written == writer.length:
+                    return None
+            except BoxSDKError:
+                # Raised by the writer, when more data was received than requested.
+                raise
+            except Exception:
+                # The connection dropped mid-body. The range is requested again
+                # from the last byte that was written.
+                if attempt_nr >= max_attempts:
+                    raise
+            else:
+                if attempt_nr >= max_attempts:
+                    raise BoxSDKError(
+                        message=f'Byte range starting at {range_start} was not fully downloaded.'
+                    )
+            attempt_nr += 1
+
+    def download_file_in_parallel(
+        self,
+        file_id: str,
+        file_path: str,
+        *,
+        version: Optional[str] = None,
+        range_size: int = 8 * 1024 * 1024,
+        max_workers: int = 4,
+        max_attempts_per_range: int = 3,
+        verify_sha_1: bool = True,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None,
+    ) -> None:
+        """
+        Downloads a file to a local path over several connections at once. The file is split into byte ranges,
+        which are fetched concurrently straight into a memory-mapped target file. A range which fails mid-body
+        is requested again from the last byte written. The file version is pinned, so a file changing
+        during the download cannot mix the content of two versions.
+        :param file_id: The unique identifier that represents a file.
+        :type file_id: str
+        :param file_path: Path of the local file to write to. An existing file is overwritten.
+        :type file_path: str
+        :param version: The file version to download. If None, the current version is downloaded., defaults to None
+        :type version: Optional[str], optional
+        :param range_size: The size in bytes of each byte range requested, defaults to 8 MiB
+        :type range_size: int, optional
+        :param max_workers: The number of byte ranges downloaded concurrently, defaults to 4
+        :type max_workers: int, optional
+        :param max_attempts_per_range: The number of attempts made to download a single byte range, defaults to 3
+        :type max_attempts_per_range: int, optional
+        :param verify_sha_1: Whether to check the downloaded content against the SHA-1 of the file version, defaults to True
+        :type verify_sha_1: bool, optional
+        :param extra_headers: Extra headers that will be included in the HTTP requests., defaults to None
+        :type extra_headers: Optional[Dict[str, Optional[str]]], optional
+        """
+        if version == None:
+            file: FileFull = FilesManager(
+                auth=self.auth, network_session=self.network_session
+            ).get_file_by_id(
+                file_id,
+                fields=['size', 'sha1', 'file_version'],
+                extra_headers=extra_headers,
+            )
+            version = file.file_version.id
+            file_size: int = file.size
+            sha_1: str = file.sha_1
+        else:
+            file_version: FileVersionFull = FileVersionsManager(
+                auth=self.auth, network_session=self.network_session
+            ).get_file_version_by_id(
+                file_id, version, fields=['size', 'sha1'], extra_headers=extra_headers
+            )
+            file_size: int = file_version.size
+            sha_1: str = file_version.sha_1
+        with open(file_path, 'wb+') as target_file:
+            target_file.truncate(file_size)
+            if file_size == 0:
+                return None
+            with mmap.mmap(target_file.fileno(), file_size) as target:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures: List[Future] = [
+                        executor.submit(
+                            self._download_range,
+                            file_id,
+                            _RangeWriter(
+                                target,
+                                range_start,
+                                min(range_size, file_size - range_start),
+                            ),
+                            range_start,
+                            version,
+                            max_attempts_per_range,
+                            extra_headers,
+                        )
+                        for range_start in range(0, file_size, range_size)
+                    ]
+                    try:
+                        for future in futures:
+                            future.result()
+                    except BaseException:
+                        for future in futures:
+                            future.cancel()
+                        raise
+                if verify_sha_1 and not sha_1 == None:
+                    file_hash: Hash = Hash(algorithm=HashName.SHA1.value)
+                    file_hash.update_hash(target)
+                    if not file_hash.digest_hash('base64') == hex_to_base_64(sha_1):
+                        raise BoxSDKError(
+                            message='SHA-1 of the downloaded content does not match the SHA-1 of the file.'
+                        )
+                target.flush()
+        return None
+
+    def download_file_resumable(
+        self,
+        file_id: str,
+        *,
+        version: Optional[str] = None,
+        access_token: Optional[str] = None,
+        boxapi: Optional[str] = None,
+        max_attempts: int = 5,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None,
+    ) -> ByteStream:
+        """
+        Returns the contents of a file as a forward-only stream, which survives dropped connections.
+        When reading fails mid-body, the download is transparently requested again with a `range` header
+        starting at the last byte read. The file version is pinned, so a file changing during the download
+        cannot splice the content of two versions together.
+        :param file_id: The unique identifier that represents a file.
+        :type file_id: str
+        :param version: The file version to download. If None, the current version is looked up and pinned., defaults to None
+        :type version: Optional[str], optional
+        :param access_token: An optional access token that can be used to pre-authenticate this request., defaults to None
+        :type access_token: Optional[str], optional
+        :param boxapi: The URL, and optional password, for the shared link of this item., defaults to None
+        :type boxapi: Optional[str], optional
+        :param max_attempts: The maximum number of attempts to continue the download when no data could be read in between, defaults to 5
+        :type max_attempts: int, optional
+        :param extra_headers: Extra headers that will be included in the HTTP requests., defaults to None
+        :type extra_headers: Optional[Dict[str, Optional[str]]], optional
+        """
+        if version == None:
+            # The version is looked up with the same credentials as the content
+            file: FileFull = FilesManager(
+                auth=(
+                    BoxDeveloperTokenAuth(token=access_token)
+                    if access_token
+                    else self.auth
+                ),
+                network_session=self.network_session,
+            ).get_file_by_id(
+                file_id,
+                fields=['file_version'],
+                boxapi=boxapi,
+                extra_headers=extra_headers,
+            )
+            version = file.file_version.id
+
+        def open_stream(offset: int) -> ByteStream:
+            try:
+                response: FetchResponse = self._fetch_file_content(
+                    file_id,
+                    version=version,
+                    access_token=access_token,
+                    range=(
+                        ''.join(['bytes=', to_string(offset), '-']) if offset else None
+                    ),
+                    boxapi=boxapi,
+                    extra_headers=extra_headers,
+                )
+            except BoxAPIError as error:
+                if error.response_info.status_code == 416:
+                    # The connection dropped after the last byte was read.
+                    return BytesIO()
+                raise
+            if offset and not response.status == 206:
+                # The whole file was sent instead of the rest of it.
+                response.content.close()
+                raise BoxSDKError(
+                    message=f'Response to the request of bytes from {offset} does not contain the requested byte range.'
+                )
+            return response.content
+
+        return ResumableByteStream(
+            open_stream,
+            max_attempts=max_attempts,
+            chunk_size=self.network_session.download_chunk_size,
+        )
@@ -2,6 +2,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -61,10 +63,20 @@ class EmailAliasesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_user_email_aliases_request(user_id, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data, EmailAliases, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_user_email_aliases_request(
+        self, user_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -81,7 +93,6 @@ class EmailAliasesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, EmailAliases)
 
     def create_user_email_alias(
         self,
@@ -106,11 +117,27 @@ class EmailAliasesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_user_email_alias_request(
+                user_id, email, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, EmailAlias, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_user_email_alias_request(
+        self,
+        user_id: str,
+        email: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'email': email}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -129,7 +156,6 @@ class EmailAliasesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, EmailAlias)
 
     def delete_user_email_alias_by_id(
         self,
@@ -149,10 +175,24 @@ class EmailAliasesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_user_email_alias_by_id_request(
+                user_id, email_alias_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_user_email_alias_by_id_request(
+        self,
+        user_id: str,
+        email_alias_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -170,4 +210,3 @@ class EmailAliasesManager:
                 network_session=self.network_session,
             ),
         )
-        return None
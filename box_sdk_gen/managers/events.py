@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -275,6 +277,32 @@ class EventsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_events_request(
+                stream_type=stream_type,
+                stream_position=stream_position,
+                limit=limit,
+                event_type=event_type,
+                created_after=created_after,
+                created_before=created_before,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Events, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_events_request(
+        self,
+        *,
+        stream_type: Optional[GetEventsStreamType] = None,
+        stream_position: Optional[str] = None,
+        limit: Optional[int] = None,
+        event_type: Optional[List[GetEventsEventType]] = None,
+        created_after: Optional[DateTime] = None,
+        created_before: Optional[DateTime] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -288,7 +316,7 @@ class EventsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/events']),
             FetchOptions(
                 method='GET',
@@ -299,7 +327,6 @@ class EventsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Events)
 
     def get_events_with_long_polling(
         self, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
@@ -381,10 +408,22 @@ class EventsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_events_with_long_polling_request(extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data,
+            RealtimeServers,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_events_with_long_polling_request(
+        self, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/events']),
             FetchOptions(
                 method='OPTIONS',
@@ -394,4 +433,3 @@ class EventsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, RealtimeServers)
@@ -14,6 +14,8 @@ from box_sdk_gen.serialization.json.serializer import serialize
 
 from typing import List
 
+from typing import Tuple
+
 from box_sdk_gen.schemas.classification import Classification
 
 from box_sdk_gen.schemas.client_error import ClientError
@@ -117,10 +119,24 @@ class FileClassificationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_classification_on_file_request(
+                file_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            Classification,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_classification_on_file_request(
+        self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -137,7 +153,6 @@ class FileClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Classification)
 
     def add_classification_to_file(
         self,
@@ -179,13 +194,33 @@ class FileClassificationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._add_classification_to_file_request(
+                file_id,
+                box_security_classification_key=box_security_classification_key,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            Classification,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _add_classification_to_file_request(
+        self,
+        file_id: str,
+        *,
+        box_security_classification_key: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
             'Box__Security__Classification__Key': box_security_classification_key
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -204,7 +239,6 @@ class FileClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Classification)
 
     def update_classification_on_file(
         self,
@@ -238,10 +272,28 @@ class FileClassificationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_classification_on_file_request(
+                file_id, request_body, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            Classification,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_classification_on_file_request(
+        self,
+        file_id: str,
+        request_body: List[UpdateClassificationOnFileRequestBody],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -260,7 +312,6 @@ class FileClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Classification)
 
     def delete_classification_from_file(
         self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
@@ -288,10 +339,20 @@ class FileClassificationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_classification_from_file_request(
+                file_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_classification_from_file_request(
+        self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -308,4 +369,3 @@ class FileClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
@@ -14,6 +14,8 @@ from box_sdk_gen.serialization.json.serializer import serialize
 
 from typing import List
 
+from typing import Tuple
+
 from box_sdk_gen.schemas.metadatas import Metadatas
 
 from box_sdk_gen.schemas.client_error import ClientError
@@ -152,10 +154,20 @@ class FileMetadataManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_metadata_request(file_id, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data, Metadatas, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_file_metadata_request(
+        self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -172,7 +184,6 @@ class FileMetadataManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Metadatas)
 
     def get_file_metadata_by_id(
         self,
@@ -205,10 +216,27 @@ class FileMetadataManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_metadata_by_id_request(
+                file_id, scope, template_key, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, MetadataFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_file_metadata_by_id_request(
+        self,
+        file_id: str,
+        scope: GetFileMetadataByIdScope,
+        template_key: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -228,7 +256,6 @@ class FileMetadataManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataFull)
 
     def create_file_metadata_by_id(
         self,
@@ -270,10 +297,28 @@ class FileMetadataManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_file_metadata_by_id_request(
+                file_id, scope, template_key, request_body, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, MetadataFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_file_metadata_by_id_request(
+        self,
+        file_id: str,
+        scope: CreateFileMetadataByIdScope,
+        template_key: str,
+        request_body: Dict,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -295,7 +340,6 @@ class FileMetadataManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataFull)
 
     def update_file_metadata_by_id(
         self,
@@ -343,10 +387,28 @@ class FileMetadataManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_file_metadata_by_id_request(
+                file_id, scope, template_key, request_body, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, MetadataFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_file_metadata_by_id_request(
+        self,
+        file_id: str,
+        scope: UpdateFileMetadataByIdScope,
+        template_key: str,
+        request_body: List[UpdateFileMetadataByIdRequestBody],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -368,7 +430,6 @@ class FileMetadataManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataFull)
 
     def delete_file_metadata_by_id(
         self,
@@ -398,10 +459,25 @@ class FileMetadataManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_file_metadata_by_id_request(
+                file_id, scope, template_key, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_file_metadata_by_id_request(
+        self,
+        file_id: str,
+        scope: DeleteFileMetadataByIdScope,
+        template_key: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -421,4 +497,3 @@ class FileMetadataManager:
                 network_session=self.network_session,
             ),
         )
-        return None
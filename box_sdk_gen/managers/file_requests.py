@@ -6,6 +6,8 @@ from box_sdk_gen.internal.base_object import BaseObject
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -111,10 +113,25 @@ class FileRequestsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_request_by_id_request(
+                file_request_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FileRequest, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_file_request_by_id_request(
+        self,
+        file_request_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -130,7 +147,6 @@ class FileRequestsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileRequest)
 
     def update_file_request_by_id(
         self,
@@ -213,6 +229,36 @@ class FileRequestsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_file_request_by_id_request(
+                file_request_id,
+                title=title,
+                description=description,
+                status=status,
+                is_email_required=is_email_required,
+                is_description_required=is_description_required,
+                expires_at=expires_at,
+                if_match=if_match,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FileRequest, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_file_request_by_id_request(
+        self,
+        file_request_id: str,
+        *,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[UpdateFileRequestByIdStatus] = None,
+        is_email_required: Optional[bool] = None,
+        is_description_required: Optional[bool] = None,
+        expires_at: Optional[DateTime] = None,
+        if_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -226,7 +272,7 @@ class FileRequestsManager:
         headers_map: Dict[str, str] = prepare_params(
             {'if-match': to_string(if_match), **extra_headers}
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -244,7 +290,6 @@ class FileRequestsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileRequest)
 
     def delete_file_request_by_id(
         self,
@@ -266,10 +311,23 @@ class FileRequestsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_file_request_by_id_request(
+                file_request_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_file_request_by_id_request(
+        self,
+        file_request_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -285,7 +343,6 @@ class FileRequestsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def create_file_request_copy(
         self,
@@ -362,6 +419,36 @@ class FileRequestsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_file_request_copy_request(
+                file_request_id,
+                folder,
+                title=title,
+                description=description,
+                status=status,
+                is_email_required=is_email_required,
+                is_description_required=is_description_required,
+                expires_at=expires_at,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FileRequest, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_file_request_copy_request(
+        self,
+        file_request_id: str,
+        folder: CreateFileRequestCopyFolder,
+        *,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[CreateFileRequestCopyStatus] = None,
+        is_email_required: Optional[bool] = None,
+        is_description_required: Optional[bool] = None,
+        expires_at: Optional[DateTime] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -374,7 +461,7 @@ class FileRequestsManager:
             'expires_at': expires_at,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -393,4 +480,3 @@ class FileRequestsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileRequest)
@@ -2,6 +2,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -62,10 +64,27 @@ class FileVersionLegalHoldsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_version_legal_hold_by_id_request(
+                file_version_legal_hold_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            FileVersionLegalHold,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_file_version_legal_hold_by_id_request(
+        self,
+        file_version_legal_hold_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -81,7 +100,6 @@ class FileVersionLegalHoldsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileVersionLegalHold)
 
     def get_file_version_legal_holds(
         self,
@@ -148,6 +166,25 @@ class FileVersionLegalHoldsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_version_legal_holds_request(
+                policy_id, marker=marker, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            FileVersionLegalHolds,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_file_version_legal_holds_request(
+        self,
+        policy_id: str,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -158,7 +195,7 @@ class FileVersionLegalHoldsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -174,4 +211,3 @@ class FileVersionLegalHoldsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileVersionLegalHolds)
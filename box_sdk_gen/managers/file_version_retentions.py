@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -104,6 +106,38 @@ class FileVersionRetentionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_version_retentions_request(
+                file_id=file_id,
+                file_version_id=file_version_id,
+                policy_id=policy_id,
+                disposition_action=disposition_action,
+                disposition_before=disposition_before,
+                disposition_after=disposition_after,
+                limit=limit,
+                marker=marker,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            FileVersionRetentions,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_file_version_retentions_request(
+        self,
+        *,
+        file_id: Optional[str] = None,
+        file_version_id: Optional[str] = None,
+        policy_id: Optional[str] = None,
+        disposition_action: Optional[GetFileVersionRetentionsDispositionAction] = None,
+        disposition_before: Optional[str] = None,
+        disposition_after: Optional[str] = None,
+        limit: Optional[int] = None,
+        marker: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -119,7 +153,7 @@ class FileVersionRetentionsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -135,7 +169,6 @@ class FileVersionRetentionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileVersionRetentions)
 
     def get_file_version_retention_by_id(
         self,
@@ -163,10 +196,27 @@ class FileVersionRetentionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_version_retention_by_id_request(
+                file_version_retention_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            FileVersionRetention,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_file_version_retention_by_id_request(
+        self,
+        file_version_retention_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -182,4 +232,3 @@ class FileVersionRetentionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileVersionRetention)
@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -102,6 +104,28 @@ class FileVersionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_versions_request(
+                file_id,
+                fields=fields,
+                limit=limit,
+                offset=offset,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FileVersions, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_file_versions_request(
+        self,
+        file_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -112,7 +136,7 @@ class FileVersionsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -130,7 +154,6 @@ class FileVersionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileVersions)
 
     def get_file_version_by_id(
         self,
@@ -170,11 +193,30 @@ class FileVersionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_version_by_id_request(
+                file_id, file_version_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            FileVersionFull,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_file_version_by_id_request(
+        self,
+        file_id: str,
+        file_version_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -193,7 +235,6 @@ class FileVersionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileVersionFull)
 
     def update_file_version_by_id(
         self,
@@ -232,11 +273,33 @@ class FileVersionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_file_version_by_id_request(
+                file_id,
+                file_version_id,
+                trashed_at=trashed_at,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            FileVersionFull,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_file_version_by_id_request(
+        self,
+        file_id: str,
+        file_version_id: str,
+        *,
+        trashed_at: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'trashed_at': trashed_at}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -256,7 +319,6 @@ class FileVersionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileVersionFull)
 
     def delete_file_version_by_id(
         self,
@@ -294,12 +356,27 @@ class FileVersionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_file_version_by_id_request(
+                file_id, file_version_id, if_match=if_match, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_file_version_by_id_request(
+        self,
+        file_id: str,
+        file_version_id: str,
+        *,
+        if_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params(
             {'if-match': to_string(if_match), **extra_headers}
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -317,7 +394,6 @@ class FileVersionsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def promote_file_version(
         self,
@@ -389,12 +465,32 @@ class FileVersionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._promote_file_version_request(
+                file_id, id=id, type=type, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            FileVersionFull,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _promote_file_version_request(
+        self,
+        file_id: str,
+        *,
+        id: Optional[str] = None,
+        type: Optional[PromoteFileVersionType] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'id': id, 'type': type}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -414,4 +510,3 @@ class FileVersionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileVersionFull)
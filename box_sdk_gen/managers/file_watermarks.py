@@ -6,6 +6,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -87,10 +89,20 @@ class FileWatermarksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_watermark_request(file_id, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data, Watermark, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_file_watermark_request(
+        self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -107,7 +119,6 @@ class FileWatermarksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Watermark)
 
     def update_file_watermark(
         self,
@@ -132,11 +143,27 @@ class FileWatermarksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_file_watermark_request(
+                file_id, watermark, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, Watermark, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_file_watermark_request(
+        self,
+        file_id: str,
+        watermark: UpdateFileWatermarkWatermark,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'watermark': watermark}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -155,7 +182,6 @@ class FileWatermarksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Watermark)
 
     def delete_file_watermark(
         self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
@@ -174,10 +200,18 @@ class FileWatermarksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_file_watermark_request(file_id, extra_headers=extra_headers)
+        )
+        return None
+
+    def _delete_file_watermark_request(
+        self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -194,4 +228,3 @@ class FileWatermarksManager:
                 network_session=self.network_session,
             ),
         )
-        return None
@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -293,6 +295,30 @@ class FilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_by_id_request(
+                file_id,
+                fields=fields,
+                if_none_match=if_none_match,
+                boxapi=boxapi,
+                x_rep_hints=x_rep_hints,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FileFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_file_by_id_request(
+        self,
+        file_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        if_none_match: Optional[str] = None,
+        boxapi: Optional[str] = None,
+        x_rep_hints: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
@@ -304,7 +330,7 @@ class FilesManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -321,7 +347,6 @@ class FilesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileFull)
 
     def update_file_by_id(
         self,
@@ -415,6 +440,44 @@ class FilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_file_by_id_request(
+                file_id,
+                name=name,
+                description=description,
+                parent=parent,
+                shared_link=shared_link,
+                lock=lock,
+                disposition_at=disposition_at,
+                permissions=permissions,
+                collections=collections,
+                tags=tags,
+                fields=fields,
+                if_match=if_match,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FileFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_file_by_id_request(
+        self,
+        file_id: str,
+        *,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        parent: Optional[UpdateFileByIdParent] = None,
+        shared_link: Optional[UpdateFileByIdSharedLink] = None,
+        lock: Optional[UpdateFileByIdLock] = None,
+        disposition_at: Optional[DateTime] = None,
+        permissions: Optional[UpdateFileByIdPermissions] = None,
+        collections: Optional[List[UpdateFileByIdCollections]] = None,
+        tags: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        if_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -432,7 +495,7 @@ class FilesManager:
         headers_map: Dict[str, str] = prepare_params(
             {'if-match': to_string(if_match), **extra_headers}
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -451,7 +514,6 @@ class FilesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileFull)
 
     def delete_file_by_id(
         self,
@@ -491,12 +553,26 @@ class FilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_file_by_id_request(
+                file_id, if_match=if_match, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_file_by_id_request(
+        self,
+        file_id: str,
+        *,
+        if_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params(
             {'if-match': to_string(if_match), **extra_headers}
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -512,7 +588,6 @@ class FilesManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def copy_file(
         self,
@@ -560,12 +635,36 @@ class FilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._copy_file_request(
+                file_id,
+                parent,
+                name=name,
+                version=version,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FileFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _copy_file_request(
+        self,
+        file_id: str,
+        parent: CopyFileParent,
+        *,
+        name: Optional[str] = None,
+        version: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'name': name, 'version': version, 'parent': parent}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -585,7 +684,6 @@ class FilesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileFull)
 
     def get_file_thumbnail_by_id(
         self,
@@ -641,6 +739,30 @@ class FilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_thumbnail_by_id_request(
+                file_id,
+                extension,
+                min_height=min_height,
+                min_width=min_width,
+                max_height=max_height,
+                max_width=max_width,
+                extra_headers=extra_headers,
+            )
+        )
+        return response.content
+
+    def _get_file_thumbnail_by_id_request(
+        self,
+        file_id: str,
+        extension: GetFileThumbnailByIdExtension,
+        *,
+        min_height: Optional[int] = None,
+        min_width: Optional[int] = None,
+        max_height: Optional[int] = None,
+        max_width: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -652,7 +774,7 @@ class FilesManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -671,4 +793,3 @@ class FilesManager:
                 network_session=self.network_session,
             ),
         )
-        return response.content
@@ -14,6 +14,8 @@ from box_sdk_gen.serialization.json.serializer import serialize
 
 from typing import List
 
+from typing import Tuple
+
 from box_sdk_gen.schemas.classification import Classification
 
 from box_sdk_gen.schemas.client_error import ClientError
@@ -123,10 +125,27 @@ class FolderClassificationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_classification_on_folder_request(
+                folder_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            Classification,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_classification_on_folder_request(
+        self,
+        folder_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -143,7 +162,6 @@ class FolderClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Classification)
 
     def add_classification_to_folder(
         self,
@@ -188,13 +206,33 @@ class FolderClassificationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._add_classification_to_folder_request(
+                folder_id,
+                box_security_classification_key=box_security_classification_key,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            Classification,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _add_classification_to_folder_request(
+        self,
+        folder_id: str,
+        *,
+        box_security_classification_key: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
             'Box__Security__Classification__Key': box_security_classification_key
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -213,7 +251,6 @@ class FolderClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Classification)
 
     def update_classification_on_folder(
         self,
@@ -250,10 +287,28 @@ class FolderClassificationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_classification_on_folder_request(
+                folder_id, request_body, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            Classification,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_classification_on_folder_request(
+        self,
+        folder_id: str,
+        request_body: List[UpdateClassificationOnFolderRequestBody],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -272,7 +327,6 @@ class FolderClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Classification)
 
     def delete_classification_from_folder(
         self,
@@ -306,10 +360,23 @@ class FolderClassificationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_classification_from_folder_request(
+                folder_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_classification_from_folder_request(
+        self,
+        folder_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -326,4 +393,3 @@ class FolderClassificationsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -104,13 +106,26 @@ class FolderLocksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_folder_locks_request(folder_id, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data, FolderLocks, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_folder_locks_request(
+        self,
+        folder_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'folder_id': to_string(folder_id)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/folder_locks']),
             FetchOptions(
                 method='GET',
@@ -121,7 +136,6 @@ class FolderLocksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderLocks)
 
     def create_folder_lock(
         self,
@@ -150,11 +164,27 @@ class FolderLocksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_folder_lock_request(
+                folder, locked_operations=locked_operations, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FolderLock, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_folder_lock_request(
+        self,
+        folder: CreateFolderLockFolder,
+        *,
+        locked_operations: Optional[CreateFolderLockLockedOperations] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'locked_operations': locked_operations, 'folder': folder}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/folder_locks']),
             FetchOptions(
                 method='POST',
@@ -166,7 +196,6 @@ class FolderLocksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderLock)
 
     def delete_folder_lock_by_id(
         self,
@@ -188,10 +217,23 @@ class FolderLocksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_folder_lock_by_id_request(
+                folder_lock_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_folder_lock_by_id_request(
+        self,
+        folder_lock_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -207,4 +249,3 @@ class FolderLocksManager:
                 network_session=self.network_session,
             ),
         )
-        return None
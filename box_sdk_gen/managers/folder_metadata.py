@@ -14,6 +14,8 @@ from box_sdk_gen.serialization.json.serializer import serialize
 
 from typing import List
 
+from typing import Tuple
+
 from box_sdk_gen.schemas.metadatas import Metadatas
 
 from box_sdk_gen.schemas.client_error import ClientError
@@ -161,10 +163,23 @@ class FolderMetadataManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_folder_metadata_request(folder_id, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data, Metadatas, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_folder_metadata_request(
+        self,
+        folder_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -181,7 +196,6 @@ class FolderMetadataManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Metadatas)
 
     def get_folder_metadata_by_id(
         self,
@@ -217,10 +231,27 @@ class FolderMetadataManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_folder_metadata_by_id_request(
+                folder_id, scope, template_key, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, MetadataFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_folder_metadata_by_id_request(
+        self,
+        folder_id: str,
+        scope: GetFolderMetadataByIdScope,
+        template_key: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -240,7 +271,6 @@ class FolderMetadataManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataFull)
 
     def create_folder_metadata_by_id(
         self,
@@ -294,10 +324,32 @@ class FolderMetadataManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_folder_metadata_by_id_request(
+                folder_id,
+                scope,
+                template_key,
+                request_body,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, MetadataFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_folder_metadata_by_id_request(
+        self,
+        folder_id: str,
+        scope: CreateFolderMetadataByIdScope,
+        template_key: str,
+        request_body: Dict,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -319,7 +371,6 @@ class FolderMetadataManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataFull)
 
     def update_folder_metadata_by_id(
         self,
@@ -370,10 +421,32 @@ class FolderMetadataManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_folder_metadata_by_id_request(
+                folder_id,
+                scope,
+                template_key,
+                request_body,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, MetadataFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_folder_metadata_by_id_request(
+        self,
+        folder_id: str,
+        scope: UpdateFolderMetadataByIdScope,
+        template_key: str,
+        request_body: List[UpdateFolderMetadataByIdRequestBody],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -395,7 +468,6 @@ class FolderMetadataManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataFull)
 
     def delete_folder_metadata_by_id(
         self,
@@ -428,10 +500,25 @@ class FolderMetadataManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_folder_metadata_by_id_request(
+                folder_id, scope, template_key, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_folder_metadata_by_id_request(
+        self,
+        folder_id: str,
+        scope: DeleteFolderMetadataByIdScope,
+        template_key: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -451,4 +538,3 @@ class FolderMetadataManager:
                 network_session=self.network_session,
             ),
         )
-        return None
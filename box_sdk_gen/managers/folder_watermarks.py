@@ -6,6 +6,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -93,10 +95,23 @@ class FolderWatermarksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_folder_watermark_request(folder_id, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data, Watermark, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_folder_watermark_request(
+        self,
+        folder_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -113,7 +128,6 @@ class FolderWatermarksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Watermark)
 
     def update_folder_watermark(
         self,
@@ -141,11 +155,27 @@ class FolderWatermarksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_folder_watermark_request(
+                folder_id, watermark, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, Watermark, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_folder_watermark_request(
+        self,
+        folder_id: str,
+        watermark: UpdateFolderWatermarkWatermark,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'watermark': watermark}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -164,7 +194,6 @@ class FolderWatermarksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Watermark)
 
     def delete_folder_watermark(
         self,
@@ -189,10 +218,23 @@ class FolderWatermarksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_folder_watermark_request(
+                folder_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_folder_watermark_request(
+        self,
+        folder_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -209,4 +251,3 @@ class FolderWatermarksManager:
                 network_session=self.network_session,
             ),
         )
-        return None
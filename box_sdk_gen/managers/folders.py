@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -393,6 +395,36 @@ class FoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_folder_by_id_request(
+                folder_id,
+                fields=fields,
+                sort=sort,
+                direction=direction,
+                offset=offset,
+                limit=limit,
+                if_none_match=if_none_match,
+                boxapi=boxapi,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FolderFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_folder_by_id_request(
+        self,
+        folder_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        sort: Optional[GetFolderByIdSort] = None,
+        direction: Optional[GetFolderByIdDirection] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        if_none_match: Optional[str] = None,
+        boxapi: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -411,7 +443,7 @@ class FoldersManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -428,7 +460,6 @@ class FoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderFull)
 
     def update_folder_by_id(
         self,
@@ -537,6 +568,48 @@ class FoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_folder_by_id_request(
+                folder_id,
+                name=name,
+                description=description,
+                sync_state=sync_state,
+                can_non_owners_invite=can_non_owners_invite,
+                parent=parent,
+                shared_link=shared_link,
+                folder_upload_email=folder_upload_email,
+                tags=tags,
+                is_collaboration_restricted_to_enterprise=is_collaboration_restricted_to_enterprise,
+                collections=collections,
+                can_non_owners_view_collaborators=can_non_owners_view_collaborators,
+                fields=fields,
+                if_match=if_match,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FolderFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_folder_by_id_request(
+        self,
+        folder_id: str,
+        *,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        sync_state: Optional[UpdateFolderByIdSyncState] = None,
+        can_non_owners_invite: Optional[bool] = None,
+        parent: Optional[UpdateFolderByIdParent] = None,
+        shared_link: Optional[UpdateFolderByIdSharedLink] = None,
+        folder_upload_email: Optional[UpdateFolderByIdFolderUploadEmail] = None,
+        tags: Optional[List[str]] = None,
+        is_collaboration_restricted_to_enterprise: Optional[bool] = None,
+        collections: Optional[List[UpdateFolderByIdCollections]] = None,
+        can_non_owners_view_collaborators: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
+        if_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -556,7 +629,7 @@ class FoldersManager:
         headers_map: Dict[str, str] = prepare_params(
             {'if-match': to_string(if_match), **extra_headers}
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -575,7 +648,6 @@ class FoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderFull)
 
     def delete_folder_by_id(
         self,
@@ -616,6 +688,24 @@ class FoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_folder_by_id_request(
+                folder_id,
+                recursive=recursive,
+                if_match=if_match,
+                extra_headers=extra_headers,
+            )
+        )
+        return None
+
+    def _delete_folder_by_id_request(
+        self,
+        folder_id: str,
+        *,
+        recursive: Optional[bool] = None,
+        if_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -624,7 +714,7 @@ class FoldersManager:
         headers_map: Dict[str, str] = prepare_params(
             {'if-match': to_string(if_match), **extra_headers}
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -641,7 +731,6 @@ class FoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def get_folder_items(
         self,
@@ -762,6 +851,38 @@ class FoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_folder_items_request(
+                folder_id,
+                fields=fields,
+                usemarker=usemarker,
+                marker=marker,
+                offset=offset,
+                limit=limit,
+                sort=sort,
+                direction=direction,
+                boxapi=boxapi,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Items, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_folder_items_request(
+        self,
+        folder_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        usemarker: Optional[bool] = None,
+        marker: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[GetFolderItemsSort] = None,
+        direction: Optional[GetFolderItemsDirection] = None,
+        boxapi: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -778,7 +899,7 @@ class FoldersManager:
         headers_map: Dict[str, str] = prepare_params(
             {'boxapi': to_string(boxapi), **extra_headers}
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -796,7 +917,6 @@ class FoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Items)
 
     def create_folder(
         self,
@@ -839,6 +959,30 @@ class FoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_folder_request(
+                name,
+                parent,
+                folder_upload_email=folder_upload_email,
+                sync_state=sync_state,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FolderFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_folder_request(
+        self,
+        name: str,
+        parent: CreateFolderParent,
+        *,
+        folder_upload_email: Optional[CreateFolderFolderUploadEmail] = None,
+        sync_state: Optional[CreateFolderSyncState] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -849,7 +993,7 @@ class FoldersManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/folders']),
             FetchOptions(
                 method='POST',
@@ -862,7 +1006,6 @@ class FoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderFull)
 
     def copy_folder(
         self,
@@ -914,12 +1057,30 @@ class FoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._copy_folder_request(
+                folder_id, parent, name=name, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FolderFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _copy_folder_request(
+        self,
+        folder_id: str,
+        parent: CopyFolderParent,
+        *,
+        name: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'name': name, 'parent': parent}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -939,4 +1100,3 @@ class FoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderFull)
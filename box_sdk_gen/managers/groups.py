@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -113,6 +115,28 @@ class GroupsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_groups_request(
+                filter_term=filter_term,
+                fields=fields,
+                limit=limit,
+                offset=offset,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Groups, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_groups_request(
+        self,
+        *,
+        filter_term: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -124,7 +148,7 @@ class GroupsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/groups']),
             FetchOptions(
                 method='GET',
@@ -135,7 +159,6 @@ class GroupsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Groups)
 
     def create_group(
         self,
@@ -213,6 +236,34 @@ class GroupsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_group_request(
+                name,
+                provenance=provenance,
+                external_sync_identifier=external_sync_identifier,
+                description=description,
+                invitability_level=invitability_level,
+                member_viewability_level=member_viewability_level,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, GroupFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_group_request(
+        self,
+        name: str,
+        *,
+        provenance: Optional[str] = None,
+        external_sync_identifier: Optional[str] = None,
+        description: Optional[str] = None,
+        invitability_level: Optional[CreateGroupInvitabilityLevel] = None,
+        member_viewability_level: Optional[CreateGroupMemberViewabilityLevel] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -225,7 +276,7 @@ class GroupsManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/groups']),
             FetchOptions(
                 method='POST',
@@ -238,7 +289,6 @@ class GroupsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, GroupFull)
 
     def get_group_by_id(
         self,
@@ -271,11 +321,27 @@ class GroupsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_group_by_id_request(
+                group_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, GroupFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_group_by_id_request(
+        self,
+        group_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -292,7 +358,6 @@ class GroupsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, GroupFull)
 
     def update_group_by_id(
         self,
@@ -379,6 +444,38 @@ class GroupsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_group_by_id_request(
+                group_id,
+                name=name,
+                provenance=provenance,
+                external_sync_identifier=external_sync_identifier,
+                description=description,
+                invitability_level=invitability_level,
+                member_viewability_level=member_viewability_level,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, GroupFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_group_by_id_request(
+        self,
+        group_id: str,
+        *,
+        name: Optional[str] = None,
+        provenance: Optional[str] = None,
+        external_sync_identifier: Optional[str] = None,
+        description: Optional[str] = None,
+        invitability_level: Optional[UpdateGroupByIdInvitabilityLevel] = None,
+        member_viewability_level: Optional[
+            UpdateGroupByIdMemberViewabilityLevel
+        ] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -391,7 +488,7 @@ class GroupsManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -410,7 +507,6 @@ class GroupsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, GroupFull)
 
     def delete_group_by_id(
         self, group_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
@@ -426,10 +522,18 @@ class GroupsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_group_by_id_request(group_id, extra_headers=extra_headers)
+        )
+        return None
+
+    def _delete_group_by_id_request(
+        self, group_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -445,4 +549,3 @@ class GroupsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -113,6 +115,36 @@ class IntegrationMappingsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_slack_integration_mapping_request(
+                marker=marker,
+                limit=limit,
+                partner_item_type=partner_item_type,
+                partner_item_id=partner_item_id,
+                box_item_id=box_item_id,
+                box_item_type=box_item_type,
+                is_manually_created=is_manually_created,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            IntegrationMappings,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_slack_integration_mapping_request(
+        self,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        partner_item_type: Optional[GetSlackIntegrationMappingPartnerItemType] = None,
+        partner_item_id: Optional[str] = None,
+        box_item_id: Optional[str] = None,
+        box_item_type: Optional[GetSlackIntegrationMappingBoxItemType] = None,
+        is_manually_created: Optional[bool] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -127,7 +159,7 @@ class IntegrationMappingsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -143,7 +175,6 @@ class IntegrationMappingsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, IntegrationMappings)
 
     def create_slack_integration_mapping(
         self,
@@ -167,6 +198,25 @@ class IntegrationMappingsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_slack_integration_mapping_request(
+                partner_item, box_item, options=options, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            IntegrationMapping,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_slack_integration_mapping_request(
+        self,
+        partner_item: IntegrationMappingPartnerItemSlack,
+        box_item: IntegrationMappingBoxItemSlack,
+        *,
+        options: Optional[IntegrationMappingSlackOptions] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -175,7 +225,7 @@ class IntegrationMappingsManager:
             'options': options,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -192,7 +242,6 @@ class IntegrationMappingsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, IntegrationMapping)
 
     def update_slack_integration_mapping_by_id(
         self,
@@ -219,11 +268,33 @@ class IntegrationMappingsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_slack_integration_mapping_by_id_request(
+                integration_mapping_id,
+                box_item=box_item,
+                options=options,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            IntegrationMapping,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_slack_integration_mapping_by_id_request(
+        self,
+        integration_mapping_id: str,
+        *,
+        box_item: Optional[IntegrationMappingBoxItemSlack] = None,
+        options: Optional[IntegrationMappingSlackOptions] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'box_item': box_item, 'options': options}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -241,7 +312,6 @@ class IntegrationMappingsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, IntegrationMapping)
 
     def delete_slack_integration_mapping_by_id(
         self,
@@ -263,10 +333,23 @@ class IntegrationMappingsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_slack_integration_mapping_by_id_request(
+                integration_mapping_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_slack_integration_mapping_by_id_request(
+        self,
+        integration_mapping_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -282,4 +365,3 @@ class IntegrationMappingsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
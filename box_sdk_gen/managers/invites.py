@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import serialize
@@ -114,12 +116,29 @@ class InvitesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_invite_request(
+                enterprise, actionable_by, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, Invite, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_invite_request(
+        self,
+        enterprise: CreateInviteEnterprise,
+        actionable_by: CreateInviteActionableBy,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'enterprise': enterprise, 'actionable_by': actionable_by}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/invites']),
             FetchOptions(
                 method='POST',
@@ -132,7 +151,6 @@ class InvitesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Invite)
 
     def get_invite_by_id(
         self,
@@ -159,11 +177,27 @@ class InvitesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_invite_by_id_request(
+                invite_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, Invite, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_invite_by_id_request(
+        self,
+        invite_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -180,4 +214,3 @@ class InvitesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Invite)
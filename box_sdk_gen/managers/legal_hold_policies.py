@@ -4,6 +4,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -88,6 +90,30 @@ class LegalHoldPoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_legal_hold_policies_request(
+                policy_name=policy_name,
+                fields=fields,
+                marker=marker,
+                limit=limit,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            LegalHoldPolicies,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_legal_hold_policies_request(
+        self,
+        *,
+        policy_name: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -99,7 +125,7 @@ class LegalHoldPoliciesManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/legal_hold_policies']
             ),
@@ -112,7 +138,6 @@ class LegalHoldPoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, LegalHoldPolicies)
 
     def create_legal_hold_policy(
         self,
@@ -166,6 +191,32 @@ class LegalHoldPoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_legal_hold_policy_request(
+                policy_name,
+                description=description,
+                filter_started_at=filter_started_at,
+                filter_ended_at=filter_ended_at,
+                is_ongoing=is_ongoing,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            LegalHoldPolicy,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_legal_hold_policy_request(
+        self,
+        policy_name: str,
+        *,
+        description: Optional[str] = None,
+        filter_started_at: Optional[DateTime] = None,
+        filter_ended_at: Optional[DateTime] = None,
+        is_ongoing: Optional[bool] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -176,7 +227,7 @@ class LegalHoldPoliciesManager:
             'is_ongoing': is_ongoing,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/legal_hold_policies']
             ),
@@ -190,7 +241,6 @@ class LegalHoldPoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, LegalHoldPolicy)
 
     def get_legal_hold_policy_by_id(
         self,
@@ -206,10 +256,27 @@ class LegalHoldPoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_legal_hold_policy_by_id_request(
+                legal_hold_policy_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            LegalHoldPolicy,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_legal_hold_policy_by_id_request(
+        self,
+        legal_hold_policy_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -225,7 +292,6 @@ class LegalHoldPoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, LegalHoldPolicy)
 
     def update_legal_hold_policy_by_id(
         self,
@@ -250,6 +316,30 @@ class LegalHoldPoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_legal_hold_policy_by_id_request(
+                legal_hold_policy_id,
+                policy_name=policy_name,
+                description=description,
+                release_notes=release_notes,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            LegalHoldPolicy,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_legal_hold_policy_by_id_request(
+        self,
+        legal_hold_policy_id: str,
+        *,
+        policy_name: Optional[str] = None,
+        description: Optional[str] = None,
+        release_notes: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -258,7 +348,7 @@ class LegalHoldPoliciesManager:
             'release_notes': release_notes,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -276,7 +366,6 @@ class LegalHoldPoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, LegalHoldPolicy)
 
     def delete_legal_hold_policy_by_id(
         self,
@@ -298,10 +387,23 @@ class LegalHoldPoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_legal_hold_policy_by_id_request(
+                legal_hold_policy_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_legal_hold_policy_by_id_request(
+        self,
+        legal_hold_policy_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -317,4 +419,3 @@ class LegalHoldPoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return None
@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -127,6 +129,34 @@ class LegalHoldPolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_legal_hold_policy_assignments_request(
+                policy_id,
+                assign_to_type=assign_to_type,
+                assign_to_id=assign_to_id,
+                marker=marker,
+                limit=limit,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            LegalHoldPolicyAssignments,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_legal_hold_policy_assignments_request(
+        self,
+        policy_id: str,
+        *,
+        assign_to_type: Optional[GetLegalHoldPolicyAssignmentsAssignToType] = None,
+        assign_to_id: Optional[str] = None,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -140,7 +170,7 @@ class LegalHoldPolicyAssignmentsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -156,7 +186,6 @@ class LegalHoldPolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, LegalHoldPolicyAssignments)
 
     def create_legal_hold_policy_assignment(
         self,
@@ -174,11 +203,29 @@ class LegalHoldPolicyAssignmentsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_legal_hold_policy_assignment_request(
+                policy_id, assign_to, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            LegalHoldPolicyAssignment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_legal_hold_policy_assignment_request(
+        self,
+        policy_id: str,
+        assign_to: CreateLegalHoldPolicyAssignmentAssignTo,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'policy_id': policy_id, 'assign_to': assign_to}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -195,7 +242,6 @@ class LegalHoldPolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, LegalHoldPolicyAssignment)
 
     def get_legal_hold_policy_assignment_by_id(
         self,
@@ -211,10 +257,27 @@ class LegalHoldPolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_legal_hold_policy_assignment_by_id_request(
+                legal_hold_policy_assignment_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            LegalHoldPolicyAssignment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_legal_hold_policy_assignment_by_id_request(
+        self,
+        legal_hold_policy_assignment_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -230,7 +293,6 @@ class LegalHoldPolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, LegalHoldPolicyAssignment)
 
     def delete_legal_hold_policy_assignment_by_id(
         self,
@@ -252,10 +314,23 @@ class LegalHoldPolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_legal_hold_policy_assignment_by_id_request(
+                legal_hold_policy_assignment_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_legal_hold_policy_assignment_by_id_request(
+        self,
+        legal_hold_policy_assignment_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -271,7 +346,6 @@ class LegalHoldPolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def get_legal_hold_policy_assignment_file_on_hold(
         self,
@@ -349,6 +423,28 @@ class LegalHoldPolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_legal_hold_policy_assignment_file_on_hold_request(
+                legal_hold_policy_assignment_id,
+                marker=marker,
+                limit=limit,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FilesOnHold, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_legal_hold_policy_assignment_file_on_hold_request(
+        self,
+        legal_hold_policy_assignment_id: str,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -359,7 +455,7 @@ class LegalHoldPolicyAssignmentsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -377,4 +473,3 @@ class LegalHoldPolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FilesOnHold)
@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -97,6 +99,30 @@ class ListCollaborationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_collaborations_request(
+                file_id,
+                fields=fields,
+                limit=limit,
+                marker=marker,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            Collaborations,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_file_collaborations_request(
+        self,
+        file_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        marker: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -107,7 +133,7 @@ class ListCollaborationsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -125,7 +151,6 @@ class ListCollaborationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Collaborations)
 
     def get_folder_collaborations(
         self,
@@ -164,11 +189,29 @@ class ListCollaborationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_folder_collaborations_request(
+                folder_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            Collaborations,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_folder_collaborations_request(
+        self,
+        folder_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -186,7 +229,6 @@ class ListCollaborationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Collaborations)
 
     def get_collaborations(
         self,
@@ -222,6 +264,30 @@ class ListCollaborationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_collaborations_request(
+                status,
+                fields=fields,
+                offset=offset,
+                limit=limit,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            Collaborations,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_collaborations_request(
+        self,
+        status: GetCollaborationsStatus,
+        *,
+        fields: Optional[List[str]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -233,7 +299,7 @@ class ListCollaborationsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/collaborations']),
             FetchOptions(
                 method='GET',
@@ -244,7 +310,6 @@ class ListCollaborationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Collaborations)
 
     def get_group_collaborations(
         self,
@@ -279,13 +344,32 @@ class ListCollaborationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_group_collaborations_request(
+                group_id, limit=limit, offset=offset, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            Collaborations,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_group_collaborations_request(
+        self,
+        group_id: str,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'limit': to_string(limit), 'offset': to_string(offset)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -303,4 +387,3 @@ class ListCollaborationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Collaborations)
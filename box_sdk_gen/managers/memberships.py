@@ -12,6 +12,8 @@ from box_sdk_gen.serialization.json.serializer import deserialize
 
 from typing import List
 
+from typing import Tuple
+
 from box_sdk_gen.serialization.json.serializer import serialize
 
 from box_sdk_gen.schemas.group_memberships import GroupMemberships
@@ -113,13 +115,32 @@ class MembershipsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_user_memberships_request(
+                user_id, limit=limit, offset=offset, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            GroupMemberships,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_user_memberships_request(
+        self,
+        user_id: str,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'limit': to_string(limit), 'offset': to_string(offset)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -137,7 +158,6 @@ class MembershipsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, GroupMemberships)
 
     def get_group_memberships(
         self,
@@ -169,13 +189,32 @@ class MembershipsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_group_memberships_request(
+                group_id, limit=limit, offset=offset, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            GroupMemberships,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_group_memberships_request(
+        self,
+        group_id: str,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'limit': to_string(limit), 'offset': to_string(offset)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -193,7 +232,6 @@ class MembershipsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, GroupMemberships)
 
     def create_group_membership(
         self,
@@ -240,6 +278,32 @@ class MembershipsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_group_membership_request(
+                user,
+                group,
+                role=role,
+                configurable_permissions=configurable_permissions,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            GroupMembership,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_group_membership_request(
+        self,
+        user: CreateGroupMembershipUser,
+        group: CreateGroupMembershipGroup,
+        *,
+        role: Optional[CreateGroupMembershipRole] = None,
+        configurable_permissions: Optional[Dict[str, bool]] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -250,7 +314,7 @@ class MembershipsManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/group_memberships']
             ),
@@ -265,7 +329,6 @@ class MembershipsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, GroupMembership)
 
     def get_group_membership_by_id(
         self,
@@ -298,11 +361,29 @@ class MembershipsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_group_membership_by_id_request(
+                group_membership_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            GroupMembership,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_group_membership_by_id_request(
+        self,
+        group_membership_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -319,7 +400,6 @@ class MembershipsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, GroupMembership)
 
     def update_group_membership_by_id(
         self,
@@ -367,6 +447,30 @@ class MembershipsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_group_membership_by_id_request(
+                group_membership_id,
+                role=role,
+                configurable_permissions=configurable_permissions,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            GroupMembership,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_group_membership_by_id_request(
+        self,
+        group_membership_id: str,
+        *,
+        role: Optional[UpdateGroupMembershipByIdRole] = None,
+        configurable_permissions: Optional[Dict[str, bool]] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -375,7 +479,7 @@ class MembershipsManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -394,7 +498,6 @@ class MembershipsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, GroupMembership)
 
     def delete_group_membership_by_id(
         self,
@@ -416,10 +519,23 @@ class MembershipsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_group_membership_by_id_request(
+                group_membership_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_group_membership_by_id_request(
+        self,
+        group_membership_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -435,4 +551,3 @@ class MembershipsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -99,6 +101,30 @@ class MetadataCascadePoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_metadata_cascade_policies_request(
+                folder_id,
+                owner_enterprise_id=owner_enterprise_id,
+                marker=marker,
+                offset=offset,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataCascadePolicies,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_metadata_cascade_policies_request(
+        self,
+        folder_id: str,
+        *,
+        owner_enterprise_id: Optional[str] = None,
+        marker: Optional[str] = None,
+        offset: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -110,7 +136,7 @@ class MetadataCascadePoliciesManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -126,7 +152,6 @@ class MetadataCascadePoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataCascadePolicies)
 
     def create_metadata_cascade_policy(
         self,
@@ -176,6 +201,25 @@ class MetadataCascadePoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_metadata_cascade_policy_request(
+                folder_id, scope, template_key, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataCascadePolicy,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_metadata_cascade_policy_request(
+        self,
+        folder_id: str,
+        scope: CreateMetadataCascadePolicyScope,
+        template_key: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -184,7 +228,7 @@ class MetadataCascadePoliciesManager:
             'templateKey': template_key,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -201,7 +245,6 @@ class MetadataCascadePoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataCascadePolicy)
 
     def get_metadata_cascade_policy_by_id(
         self,
@@ -217,10 +260,27 @@ class MetadataCascadePoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_metadata_cascade_policy_by_id_request(
+                metadata_cascade_policy_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataCascadePolicy,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_metadata_cascade_policy_by_id_request(
+        self,
+        metadata_cascade_policy_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -236,7 +296,6 @@ class MetadataCascadePoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataCascadePolicy)
 
     def delete_metadata_cascade_policy_by_id(
         self,
@@ -252,10 +311,23 @@ class MetadataCascadePoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_metadata_cascade_policy_by_id_request(
+                metadata_cascade_policy_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_metadata_cascade_policy_by_id_request(
+        self,
+        metadata_cascade_policy_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -271,7 +343,6 @@ class MetadataCascadePoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def apply_metadata_cascade_policy(
         self,
@@ -305,11 +376,27 @@ class MetadataCascadePoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._apply_metadata_cascade_policy_request(
+                metadata_cascade_policy_id,
+                conflict_resolution,
+                extra_headers=extra_headers,
+            )
+        )
+        return None
+
+    def _apply_metadata_cascade_policy_request(
+        self,
+        metadata_cascade_policy_id: str,
+        conflict_resolution: ApplyMetadataCascadePolicyConflictResolution,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'conflict_resolution': conflict_resolution}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -328,4 +415,3 @@ class MetadataCascadePoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return None
@@ -6,6 +6,8 @@ from typing import Dict
 
 from typing import List
 
+from typing import Tuple
+
 from box_sdk_gen.internal.base_object import BaseObject
 
 from box_sdk_gen.internal.utils import to_string
@@ -244,13 +246,30 @@ class MetadataTemplatesManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_metadata_templates_by_instance_id_request(
+                metadata_instance_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataTemplates,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_metadata_templates_by_instance_id_request(
+        self,
+        metadata_instance_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'metadata_instance_id': to_string(metadata_instance_id)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/metadata_templates']
             ),
@@ -263,7 +282,6 @@ class MetadataTemplatesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataTemplates)
 
     def get_metadata_template(
         self,
@@ -289,10 +307,28 @@ class MetadataTemplatesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_metadata_template_request(
+                scope, template_key, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataTemplate,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_metadata_template_request(
+        self,
+        scope: GetMetadataTemplateScope,
+        template_key: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -311,7 +347,6 @@ class MetadataTemplatesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataTemplate)
 
     def update_metadata_template(
         self,
@@ -346,10 +381,29 @@ class MetadataTemplatesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_metadata_template_request(
+                scope, template_key, request_body, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataTemplate,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_metadata_template_request(
+        self,
+        scope: UpdateMetadataTemplateScope,
+        template_key: str,
+        request_body: List[UpdateMetadataTemplateRequestBody],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -370,7 +424,6 @@ class MetadataTemplatesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataTemplate)
 
     def delete_metadata_template(
         self,
@@ -393,10 +446,24 @@ class MetadataTemplatesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_metadata_template_request(
+                scope, template_key, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_metadata_template_request(
+        self,
+        scope: DeleteMetadataTemplateScope,
+        template_key: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -415,7 +482,6 @@ class MetadataTemplatesManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def get_metadata_template_by_id(
         self,
@@ -431,10 +497,27 @@ class MetadataTemplatesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_metadata_template_by_id_request(
+                template_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataTemplate,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_metadata_template_by_id_request(
+        self,
+        template_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -450,7 +533,6 @@ class MetadataTemplatesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataTemplate)
 
     def get_global_metadata_templates(
         self,
@@ -474,13 +556,31 @@ class MetadataTemplatesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_global_metadata_templates_request(
+                marker=marker, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataTemplates,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_global_metadata_templates_request(
+        self,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -496,7 +596,6 @@ class MetadataTemplatesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataTemplates)
 
     def get_enterprise_metadata_templates(
         self,
@@ -520,13 +619,31 @@ class MetadataTemplatesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_enterprise_metadata_templates_request(
+                marker=marker, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataTemplates,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_enterprise_metadata_templates_request(
+        self,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -542,7 +659,6 @@ class MetadataTemplatesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataTemplates)
 
     def create_metadata_template(
         self,
@@ -590,6 +706,34 @@ class MetadataTemplatesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_metadata_template_request(
+                scope,
+                display_name,
+                template_key=template_key,
+                hidden=hidden,
+                fields=fields,
+                copy_instance_on_item_copy=copy_instance_on_item_copy,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataTemplate,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_metadata_template_request(
+        self,
+        scope: str,
+        display_name: str,
+        *,
+        template_key: Optional[str] = None,
+        hidden: Optional[bool] = None,
+        fields: Optional[List[CreateMetadataTemplateFields]] = None,
+        copy_instance_on_item_copy: Optional[bool] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -601,7 +745,7 @@ class MetadataTemplatesManager:
             'copyInstanceOnItemCopy': copy_instance_on_item_copy,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -618,4 +762,3 @@ class MetadataTemplatesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataTemplate)
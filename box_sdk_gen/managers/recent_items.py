@@ -4,6 +4,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -81,6 +83,23 @@ class RecentItemsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_recent_items_request(
+                fields=fields, limit=limit, marker=marker, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, RecentItems, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_recent_items_request(
+        self,
+        *,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        marker: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -91,7 +110,7 @@ class RecentItemsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/recent_items']),
             FetchOptions(
                 method='GET',
@@ -102,4 +121,3 @@ class RecentItemsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, RecentItems)
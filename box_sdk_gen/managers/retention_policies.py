@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -113,6 +115,34 @@ class RetentionPoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_retention_policies_request(
+                policy_name=policy_name,
+                policy_type=policy_type,
+                created_by_user_id=created_by_user_id,
+                fields=fields,
+                limit=limit,
+                marker=marker,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            RetentionPolicies,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_retention_policies_request(
+        self,
+        *,
+        policy_name: Optional[str] = None,
+        policy_type: Optional[GetRetentionPoliciesPolicyType] = None,
+        created_by_user_id: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        marker: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -126,7 +156,7 @@ class RetentionPoliciesManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/retention_policies']
             ),
@@ -139,7 +169,6 @@ class RetentionPoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, RetentionPolicies)
 
     def create_retention_policy(
         self,
@@ -209,6 +238,40 @@ class RetentionPoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_retention_policy_request(
+                policy_name,
+                policy_type,
+                disposition_action,
+                description=description,
+                retention_length=retention_length,
+                retention_type=retention_type,
+                can_owner_extend_retention=can_owner_extend_retention,
+                are_owners_notified=are_owners_notified,
+                custom_notification_recipients=custom_notification_recipients,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            RetentionPolicy,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_retention_policy_request(
+        self,
+        policy_name: str,
+        policy_type: CreateRetentionPolicyPolicyType,
+        disposition_action: CreateRetentionPolicyDispositionAction,
+        *,
+        description: Optional[str] = None,
+        retention_length: Optional[str] = None,
+        retention_type: Optional[CreateRetentionPolicyRetentionType] = None,
+        can_owner_extend_retention: Optional[bool] = None,
+        are_owners_notified: Optional[bool] = None,
+        custom_notification_recipients: Optional[List[UserMini]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -223,7 +286,7 @@ class RetentionPoliciesManager:
             'custom_notification_recipients': custom_notification_recipients,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/retention_policies']
             ),
@@ -237,7 +300,6 @@ class RetentionPoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, RetentionPolicy)
 
     def get_retention_policy_by_id(
         self,
@@ -264,11 +326,29 @@ class RetentionPoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_retention_policy_by_id_request(
+                retention_policy_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            RetentionPolicy,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_retention_policy_by_id_request(
+        self,
+        retention_policy_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -285,7 +365,6 @@ class RetentionPoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, RetentionPolicy)
 
     def update_retention_policy_by_id(
         self,
@@ -365,6 +444,42 @@ class RetentionPoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_retention_policy_by_id_request(
+                retention_policy_id,
+                policy_name=policy_name,
+                description=description,
+                disposition_action=disposition_action,
+                retention_type=retention_type,
+                retention_length=retention_length,
+                status=status,
+                can_owner_extend_retention=can_owner_extend_retention,
+                are_owners_notified=are_owners_notified,
+                custom_notification_recipients=custom_notification_recipients,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            RetentionPolicy,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_retention_policy_by_id_request(
+        self,
+        retention_policy_id: str,
+        *,
+        policy_name: Optional[str] = None,
+        description: Optional[str] = None,
+        disposition_action: Optional[str] = None,
+        retention_type: Optional[str] = None,
+        retention_length: Optional[str] = None,
+        status: Optional[str] = None,
+        can_owner_extend_retention: Optional[bool] = None,
+        are_owners_notified: Optional[bool] = None,
+        custom_notification_recipients: Optional[List[UserBase]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -379,7 +494,7 @@ class RetentionPoliciesManager:
             'custom_notification_recipients': custom_notification_recipients,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -397,7 +512,6 @@ class RetentionPoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, RetentionPolicy)
 
     def delete_retention_policy_by_id(
         self,
@@ -413,10 +527,23 @@ class RetentionPoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_retention_policy_by_id_request(
+                retention_policy_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_retention_policy_by_id_request(
+        self,
+        retention_policy_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -432,4 +559,3 @@ class RetentionPoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return None
@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -144,6 +146,32 @@ class RetentionPolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_retention_policy_assignments_request(
+                retention_policy_id,
+                type=type,
+                fields=fields,
+                marker=marker,
+                limit=limit,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            RetentionPolicyAssignments,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_retention_policy_assignments_request(
+        self,
+        retention_policy_id: str,
+        *,
+        type: Optional[GetRetentionPolicyAssignmentsType] = None,
+        fields: Optional[List[str]] = None,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -155,7 +183,7 @@ class RetentionPolicyAssignmentsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -173,7 +201,6 @@ class RetentionPolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, RetentionPolicyAssignments)
 
     def create_retention_policy_assignment(
         self,
@@ -205,6 +232,32 @@ class RetentionPolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_retention_policy_assignment_request(
+                policy_id,
+                assign_to,
+                filter_fields=filter_fields,
+                start_date_field=start_date_field,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            RetentionPolicyAssignment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_retention_policy_assignment_request(
+        self,
+        policy_id: str,
+        assign_to: CreateRetentionPolicyAssignmentAssignTo,
+        *,
+        filter_fields: Optional[
+            List[CreateRetentionPolicyAssignmentFilterFields]
+        ] = None,
+        start_date_field: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -214,7 +267,7 @@ class RetentionPolicyAssignmentsManager:
             'start_date_field': start_date_field,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -231,7 +284,6 @@ class RetentionPolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, RetentionPolicyAssignment)
 
     def get_retention_policy_assignment_by_id(
         self,
@@ -258,11 +310,31 @@ class RetentionPolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_retention_policy_assignment_by_id_request(
+                retention_policy_assignment_id,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            RetentionPolicyAssignment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_retention_policy_assignment_by_id_request(
+        self,
+        retention_policy_assignment_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -279,7 +351,6 @@ class RetentionPolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, RetentionPolicyAssignment)
 
     def delete_retention_policy_assignment_by_id(
         self,
@@ -298,10 +369,23 @@ class RetentionPolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_retention_policy_assignment_by_id_request(
+                retention_policy_assignment_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_retention_policy_assignment_by_id_request(
+        self,
+        retention_policy_assignment_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -317,7 +401,6 @@ class RetentionPolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def get_files_under_retention_policy_assignment(
         self,
@@ -342,13 +425,35 @@ class RetentionPolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_files_under_retention_policy_assignment_request(
+                retention_policy_assignment_id,
+                marker=marker,
+                limit=limit,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            FilesUnderRetention,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_files_under_retention_policy_assignment_request(
+        self,
+        retention_policy_assignment_id: str,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -366,4 +471,3 @@ class RetentionPolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FilesUnderRetention)
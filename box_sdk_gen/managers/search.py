@@ -16,6 +16,8 @@ from box_sdk_gen.internal.utils import to_string
 
 from typing import Union
 
+from typing import Tuple
+
 from box_sdk_gen.schemas.metadata_query_results import MetadataQueryResults
 
 from box_sdk_gen.schemas.client_error import ClientError
@@ -210,6 +212,38 @@ class SearchManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._search_by_metadata_query_request(
+                from_,
+                ancestor_folder_id,
+                query=query,
+                query_params=query_params,
+                order_by=order_by,
+                limit=limit,
+                marker=marker,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            MetadataQueryResults,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _search_by_metadata_query_request(
+        self,
+        from_: str,
+        ancestor_folder_id: str,
+        *,
+        query: Optional[str] = None,
+        query_params: Optional[Dict[str, str]] = None,
+        order_by: Optional[List[SearchByMetadataQueryOrderBy]] = None,
+        limit: Optional[int] = None,
+        marker: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -223,7 +257,7 @@ class SearchManager:
             'fields': fields,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -240,7 +274,6 @@ class SearchManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, MetadataQueryResults)
 
     def search_for_content(
         self,
@@ -514,6 +547,64 @@ class SearchManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._search_for_content_request(
+                query=query,
+                scope=scope,
+                file_extensions=file_extensions,
+                created_at_range=created_at_range,
+                updated_at_range=updated_at_range,
+                size_range=size_range,
+                owner_user_ids=owner_user_ids,
+                recent_updater_user_ids=recent_updater_user_ids,
+                ancestor_folder_ids=ancestor_folder_ids,
+                content_types=content_types,
+                type=type,
+                trash_content=trash_content,
+                mdfilters=mdfilters,
+                sort=sort,
+                direction=direction,
+                limit=limit,
+                include_recent_shared_links=include_recent_shared_links,
+                fields=fields,
+                offset=offset,
+                deleted_user_ids=deleted_user_ids,
+                deleted_at_range=deleted_at_range,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            Union[SearchResults, SearchResultsWithSharedLinks],
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _search_for_content_request(
+        self,
+        *,
+        query: Optional[str] = None,
+        scope: Optional[SearchForContentScope] = None,
+        file_extensions: Optional[List[str]] = None,
+        created_at_range: Optional[List[str]] = None,
+        updated_at_range: Optional[List[str]] = None,
+        size_range: Optional[List[int]] = None,
+        owner_user_ids: Optional[List[str]] = None,
+        recent_updater_user_ids: Optional[List[str]] = None,
+        ancestor_folder_ids: Optional[List[str]] = None,
+        content_types: Optional[List[SearchForContentContentTypes]] = None,
+        type: Optional[SearchForContentType] = None,
+        trash_content: Optional[SearchForContentTrashContent] = None,
+        mdfilters: Optional[List[MetadataFilter]] = None,
+        sort: Optional[SearchForContentSort] = None,
+        direction: Optional[SearchForContentDirection] = None,
+        limit: Optional[int] = None,
+        include_recent_shared_links: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
+        offset: Optional[int] = None,
+        deleted_user_ids: Optional[List[str]] = None,
+        deleted_at_range: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -542,7 +633,7 @@ class SearchManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/search']),
             FetchOptions(
                 method='GET',
@@ -553,6 +644,3 @@ class SearchManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(
-            response.data, Union[SearchResults, SearchResultsWithSharedLinks]
-        )
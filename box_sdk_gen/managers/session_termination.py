@@ -4,6 +4,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.serialization.json.serializer import serialize
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -68,11 +70,29 @@ class SessionTerminationManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._terminate_users_sessions_request(
+                user_ids, user_logins, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            SessionTerminationMessage,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _terminate_users_sessions_request(
+        self,
+        user_ids: List[str],
+        user_logins: List[str],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'user_ids': user_ids, 'user_logins': user_logins}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -89,7 +109,6 @@ class SessionTerminationManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SessionTerminationMessage)
 
     def terminate_groups_sessions(
         self,
@@ -113,11 +132,28 @@ class SessionTerminationManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._terminate_groups_sessions_request(
+                group_ids, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            SessionTerminationMessage,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _terminate_groups_sessions_request(
+        self,
+        group_ids: List[str],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'group_ids': group_ids}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -134,4 +170,3 @@ class SessionTerminationManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SessionTerminationMessage)
@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -293,6 +295,26 @@ class SharedLinksFilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._find_file_for_shared_link_request(
+                boxapi,
+                fields=fields,
+                if_none_match=if_none_match,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FileFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _find_file_for_shared_link_request(
+        self,
+        boxapi: str,
+        *,
+        fields: Optional[List[str]] = None,
+        if_none_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
@@ -303,7 +325,7 @@ class SharedLinksFilesManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/shared_items']),
             FetchOptions(
                 method='GET',
@@ -314,7 +336,6 @@ class SharedLinksFilesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileFull)
 
     def get_shared_link_for_file(
         self,
@@ -340,11 +361,27 @@ class SharedLinksFilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shared_link_for_file_request(
+                file_id, fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FileFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_shared_link_for_file_request(
+        self,
+        file_id: str,
+        fields: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -362,7 +399,6 @@ class SharedLinksFilesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileFull)
 
     def add_share_link_to_file(
         self,
@@ -393,12 +429,29 @@ class SharedLinksFilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._add_share_link_to_file_request(
+                file_id, fields, shared_link=shared_link, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FileFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _add_share_link_to_file_request(
+        self,
+        file_id: str,
+        fields: str,
+        *,
+        shared_link: Optional[AddShareLinkToFileSharedLink] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'shared_link': shared_link}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -418,7 +471,6 @@ class SharedLinksFilesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileFull)
 
     def update_shared_link_on_file(
         self,
@@ -447,12 +499,29 @@ class SharedLinksFilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_shared_link_on_file_request(
+                file_id, fields, shared_link=shared_link, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FileFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_shared_link_on_file_request(
+        self,
+        file_id: str,
+        fields: str,
+        *,
+        shared_link: Optional[UpdateSharedLinkOnFileSharedLink] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'shared_link': shared_link}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -472,7 +541,6 @@ class SharedLinksFilesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileFull)
 
     def remove_shared_link_from_file(
         self,
@@ -502,12 +570,29 @@ class SharedLinksFilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._remove_shared_link_from_file_request(
+                file_id, fields, shared_link=shared_link, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FileFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _remove_shared_link_from_file_request(
+        self,
+        file_id: str,
+        fields: str,
+        *,
+        shared_link: Optional[RemoveSharedLinkFromFileSharedLink] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'shared_link': shared_link}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -527,4 +612,3 @@ class SharedLinksFilesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FileFull)
@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -283,6 +285,26 @@ class SharedLinksFoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._find_folder_for_shared_link_request(
+                boxapi,
+                fields=fields,
+                if_none_match=if_none_match,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FolderFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _find_folder_for_shared_link_request(
+        self,
+        boxapi: str,
+        *,
+        fields: Optional[List[str]] = None,
+        if_none_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
@@ -293,7 +315,7 @@ class SharedLinksFoldersManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/shared_items#folders']
             ),
@@ -306,7 +328,6 @@ class SharedLinksFoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderFull)
 
     def get_shared_link_for_folder(
         self,
@@ -335,11 +356,27 @@ class SharedLinksFoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shared_link_for_folder_request(
+                folder_id, fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FolderFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_shared_link_for_folder_request(
+        self,
+        folder_id: str,
+        fields: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -357,7 +394,6 @@ class SharedLinksFoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderFull)
 
     def add_share_link_to_folder(
         self,
@@ -392,12 +428,29 @@ class SharedLinksFoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._add_share_link_to_folder_request(
+                folder_id, fields, shared_link=shared_link, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FolderFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _add_share_link_to_folder_request(
+        self,
+        folder_id: str,
+        fields: str,
+        *,
+        shared_link: Optional[AddShareLinkToFolderSharedLink] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'shared_link': shared_link}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -417,7 +470,6 @@ class SharedLinksFoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderFull)
 
     def update_shared_link_on_folder(
         self,
@@ -449,12 +501,29 @@ class SharedLinksFoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_shared_link_on_folder_request(
+                folder_id, fields, shared_link=shared_link, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FolderFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_shared_link_on_folder_request(
+        self,
+        folder_id: str,
+        fields: str,
+        *,
+        shared_link: Optional[UpdateSharedLinkOnFolderSharedLink] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'shared_link': shared_link}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -474,7 +543,6 @@ class SharedLinksFoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderFull)
 
     def remove_shared_link_from_folder(
         self,
@@ -507,12 +575,29 @@ class SharedLinksFoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._remove_shared_link_from_folder_request(
+                folder_id, fields, shared_link=shared_link, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, FolderFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _remove_shared_link_from_folder_request(
+        self,
+        folder_id: str,
+        fields: str,
+        *,
+        shared_link: Optional[RemoveSharedLinkFromFolderSharedLink] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'shared_link': shared_link}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -532,4 +617,3 @@ class SharedLinksFoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderFull)
@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -281,6 +283,26 @@ class SharedLinksWebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._find_web_link_for_shared_link_request(
+                boxapi,
+                fields=fields,
+                if_none_match=if_none_match,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, WebLink, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _find_web_link_for_shared_link_request(
+        self,
+        boxapi: str,
+        *,
+        fields: Optional[List[str]] = None,
+        if_none_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
@@ -291,7 +313,7 @@ class SharedLinksWebLinksManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/shared_items#web_links']
             ),
@@ -304,7 +326,6 @@ class SharedLinksWebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, WebLink)
 
     def get_shared_link_for_web_link(
         self,
@@ -324,11 +345,27 @@ class SharedLinksWebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shared_link_for_web_link_request(
+                web_link_id, fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, WebLink, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_shared_link_for_web_link_request(
+        self,
+        web_link_id: str,
+        fields: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -346,7 +383,6 @@ class SharedLinksWebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, WebLink)
 
     def add_share_link_to_web_link(
         self,
@@ -372,12 +408,32 @@ class SharedLinksWebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._add_share_link_to_web_link_request(
+                web_link_id,
+                fields,
+                shared_link=shared_link,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, WebLink, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _add_share_link_to_web_link_request(
+        self,
+        web_link_id: str,
+        fields: str,
+        *,
+        shared_link: Optional[AddShareLinkToWebLinkSharedLink] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'shared_link': shared_link}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -397,7 +453,6 @@ class SharedLinksWebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, WebLink)
 
     def update_shared_link_on_web_link(
         self,
@@ -420,12 +475,32 @@ class SharedLinksWebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_shared_link_on_web_link_request(
+                web_link_id,
+                fields,
+                shared_link=shared_link,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, WebLink, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_shared_link_on_web_link_request(
+        self,
+        web_link_id: str,
+        fields: str,
+        *,
+        shared_link: Optional[UpdateSharedLinkOnWebLinkSharedLink] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'shared_link': shared_link}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -445,7 +520,6 @@ class SharedLinksWebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, WebLink)
 
     def remove_shared_link_from_web_link(
         self,
@@ -469,12 +543,32 @@ class SharedLinksWebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._remove_shared_link_from_web_link_request(
+                web_link_id,
+                fields,
+                shared_link=shared_link,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, WebLink, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _remove_shared_link_from_web_link_request(
+        self,
+        web_link_id: str,
+        fields: str,
+        *,
+        shared_link: Optional[RemoveSharedLinkFromWebLinkSharedLink] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'shared_link': shared_link}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -494,4 +588,3 @@ class SharedLinksWebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, WebLink)
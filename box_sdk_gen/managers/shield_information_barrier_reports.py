@@ -2,6 +2,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -81,6 +83,28 @@ class ShieldInformationBarrierReportsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shield_information_barrier_reports_request(
+                shield_information_barrier_id,
+                marker=marker,
+                limit=limit,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierReports,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_shield_information_barrier_reports_request(
+        self,
+        shield_information_barrier_id: str,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -93,7 +117,7 @@ class ShieldInformationBarrierReportsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -109,7 +133,6 @@ class ShieldInformationBarrierReportsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierReports)
 
     def create_shield_information_barrier_report(
         self,
@@ -122,11 +145,29 @@ class ShieldInformationBarrierReportsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_shield_information_barrier_report_request(
+                shield_information_barrier=shield_information_barrier,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierReport,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_shield_information_barrier_report_request(
+        self,
+        *,
+        shield_information_barrier: Optional[ShieldInformationBarrierBase] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'shield_information_barrier': shield_information_barrier}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -143,7 +184,6 @@ class ShieldInformationBarrierReportsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierReport)
 
     def get_shield_information_barrier_report_by_id(
         self,
@@ -159,10 +199,27 @@ class ShieldInformationBarrierReportsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shield_information_barrier_report_by_id_request(
+                shield_information_barrier_report_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierReport,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_shield_information_barrier_report_by_id_request(
+        self,
+        shield_information_barrier_report_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -178,4 +235,3 @@ class ShieldInformationBarrierReportsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierReport)
@@ -6,6 +6,8 @@ from box_sdk_gen.internal.base_object import BaseObject
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -116,10 +118,28 @@ class ShieldInformationBarrierSegmentMembersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shield_information_barrier_segment_member_by_id_request(
+                shield_information_barrier_segment_member_id,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierSegmentMember,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_shield_information_barrier_segment_member_by_id_request(
+        self,
+        shield_information_barrier_segment_member_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -135,7 +155,6 @@ class ShieldInformationBarrierSegmentMembersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierSegmentMember)
 
     def delete_shield_information_barrier_segment_member_by_id(
         self,
@@ -154,10 +173,24 @@ class ShieldInformationBarrierSegmentMembersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_shield_information_barrier_segment_member_by_id_request(
+                shield_information_barrier_segment_member_id,
+                extra_headers=extra_headers,
+            )
+        )
+        return None
+
+    def _delete_shield_information_barrier_segment_member_by_id_request(
+        self,
+        shield_information_barrier_segment_member_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -173,7 +206,6 @@ class ShieldInformationBarrierSegmentMembersManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def get_shield_information_barrier_segment_members(
         self,
@@ -200,6 +232,28 @@ class ShieldInformationBarrierSegmentMembersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shield_information_barrier_segment_members_request(
+                shield_information_barrier_segment_id,
+                marker=marker,
+                limit=limit,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierSegmentMembers,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_shield_information_barrier_segment_members_request(
+        self,
+        shield_information_barrier_segment_id: str,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -212,7 +266,7 @@ class ShieldInformationBarrierSegmentMembersManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -228,7 +282,6 @@ class ShieldInformationBarrierSegmentMembersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierSegmentMembers)
 
     def create_shield_information_barrier_segment_member(
         self,
@@ -251,6 +304,30 @@ class ShieldInformationBarrierSegmentMembersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_shield_information_barrier_segment_member_request(
+                shield_information_barrier_segment,
+                user,
+                type=type,
+                shield_information_barrier=shield_information_barrier,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierSegmentMember,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_shield_information_barrier_segment_member_request(
+        self,
+        shield_information_barrier_segment: CreateShieldInformationBarrierSegmentMemberShieldInformationBarrierSegment,
+        user: UserBase,
+        *,
+        type: Optional[CreateShieldInformationBarrierSegmentMemberType] = None,
+        shield_information_barrier: Optional[ShieldInformationBarrierBase] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -260,7 +337,7 @@ class ShieldInformationBarrierSegmentMembersManager:
             'user': user,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -277,4 +354,3 @@ class ShieldInformationBarrierSegmentMembersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierSegmentMember)
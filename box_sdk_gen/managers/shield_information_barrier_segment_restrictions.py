@@ -6,6 +6,8 @@ from box_sdk_gen.internal.base_object import BaseObject
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -145,10 +147,28 @@ class ShieldInformationBarrierSegmentRestrictionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shield_information_barrier_segment_restriction_by_id_request(
+                shield_information_barrier_segment_restriction_id,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierSegmentRestriction,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_shield_information_barrier_segment_restriction_by_id_request(
+        self,
+        shield_information_barrier_segment_restriction_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -164,7 +184,6 @@ class ShieldInformationBarrierSegmentRestrictionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierSegmentRestriction)
 
     def delete_shield_information_barrier_segment_restriction_by_id(
         self,
@@ -183,10 +202,24 @@ class ShieldInformationBarrierSegmentRestrictionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_shield_information_barrier_segment_restriction_by_id_request(
+                shield_information_barrier_segment_restriction_id,
+                extra_headers=extra_headers,
+            )
+        )
+        return None
+
+    def _delete_shield_information_barrier_segment_restriction_by_id_request(
+        self,
+        shield_information_barrier_segment_restriction_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -202,7 +235,6 @@ class ShieldInformationBarrierSegmentRestrictionsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def get_shield_information_barrier_segment_restrictions(
         self,
@@ -229,6 +261,28 @@ class ShieldInformationBarrierSegmentRestrictionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shield_information_barrier_segment_restrictions_request(
+                shield_information_barrier_segment_id,
+                marker=marker,
+                limit=limit,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierSegmentRestrictions,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_shield_information_barrier_segment_restrictions_request(
+        self,
+        shield_information_barrier_segment_id: str,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -241,7 +295,7 @@ class ShieldInformationBarrierSegmentRestrictionsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -257,7 +311,6 @@ class ShieldInformationBarrierSegmentRestrictionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierSegmentRestrictions)
 
     def create_shield_information_barrier_segment_restriction(
         self,
@@ -285,6 +338,30 @@ class ShieldInformationBarrierSegmentRestrictionsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_shield_information_barrier_segment_restriction_request(
+                shield_information_barrier_segment,
+                restricted_segment,
+                type=type,
+                shield_information_barrier=shield_information_barrier,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierSegmentRestriction,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_shield_information_barrier_segment_restriction_request(
+        self,
+        shield_information_barrier_segment: CreateShieldInformationBarrierSegmentRestrictionShieldInformationBarrierSegment,
+        restricted_segment: CreateShieldInformationBarrierSegmentRestrictionRestrictedSegment,
+        *,
+        type: CreateShieldInformationBarrierSegmentRestrictionType = CreateShieldInformationBarrierSegmentRestrictionType.SHIELD_INFORMATION_BARRIER_SEGMENT_RESTRICTION.value,
+        shield_information_barrier: Optional[ShieldInformationBarrierBase] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -294,7 +371,7 @@ class ShieldInformationBarrierSegmentRestrictionsManager:
             'restricted_segment': restricted_segment,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -311,4 +388,3 @@ class ShieldInformationBarrierSegmentRestrictionsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierSegmentRestriction)
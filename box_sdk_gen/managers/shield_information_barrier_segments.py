@@ -2,6 +2,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -69,10 +71,27 @@ class ShieldInformationBarrierSegmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shield_information_barrier_segment_by_id_request(
+                shield_information_barrier_segment_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierSegment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_shield_information_barrier_segment_by_id_request(
+        self,
+        shield_information_barrier_segment_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -88,7 +107,6 @@ class ShieldInformationBarrierSegmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierSegment)
 
     def update_shield_information_barrier_segment_by_id(
         self,
@@ -111,11 +129,33 @@ class ShieldInformationBarrierSegmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_shield_information_barrier_segment_by_id_request(
+                shield_information_barrier_segment_id,
+                name=name,
+                description=description,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierSegment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_shield_information_barrier_segment_by_id_request(
+        self,
+        shield_information_barrier_segment_id: str,
+        *,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'name': name, 'description': description}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -133,7 +173,6 @@ class ShieldInformationBarrierSegmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierSegment)
 
     def delete_shield_information_barrier_segment_by_id(
         self,
@@ -152,10 +191,23 @@ class ShieldInformationBarrierSegmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_shield_information_barrier_segment_by_id_request(
+                shield_information_barrier_segment_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_shield_information_barrier_segment_by_id_request(
+        self,
+        shield_information_barrier_segment_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -171,7 +223,6 @@ class ShieldInformationBarrierSegmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def get_shield_information_barrier_segments(
         self,
@@ -198,6 +249,28 @@ class ShieldInformationBarrierSegmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shield_information_barrier_segments_request(
+                shield_information_barrier_id,
+                marker=marker,
+                limit=limit,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierSegments,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_shield_information_barrier_segments_request(
+        self,
+        shield_information_barrier_id: str,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -210,7 +283,7 @@ class ShieldInformationBarrierSegmentsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -226,7 +299,6 @@ class ShieldInformationBarrierSegmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierSegments)
 
     def create_shield_information_barrier_segment(
         self,
@@ -245,6 +317,28 @@ class ShieldInformationBarrierSegmentsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_shield_information_barrier_segment_request(
+                shield_information_barrier,
+                name,
+                description=description,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrierSegment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_shield_information_barrier_segment_request(
+        self,
+        shield_information_barrier: ShieldInformationBarrierBase,
+        name: str,
+        *,
+        description: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -253,7 +347,7 @@ class ShieldInformationBarrierSegmentsManager:
             'description': description,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -270,4 +364,3 @@ class ShieldInformationBarrierSegmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrierSegment)
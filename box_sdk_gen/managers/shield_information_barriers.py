@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -70,10 +72,27 @@ class ShieldInformationBarriersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shield_information_barrier_by_id_request(
+                shield_information_barrier_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrier,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_shield_information_barrier_by_id_request(
+        self,
+        shield_information_barrier_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -89,7 +108,6 @@ class ShieldInformationBarriersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrier)
 
     def update_shield_information_barrier_status(
         self,
@@ -107,11 +125,29 @@ class ShieldInformationBarriersManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_shield_information_barrier_status_request(
+                id, status, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrier,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_shield_information_barrier_status_request(
+        self,
+        id: str,
+        status: UpdateShieldInformationBarrierStatusStatus,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'id': id, 'status': status}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -128,7 +164,6 @@ class ShieldInformationBarriersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrier)
 
     def get_shield_information_barriers(
         self,
@@ -150,13 +185,31 @@ class ShieldInformationBarriersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_shield_information_barriers_request(
+                marker=marker, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarriers,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_shield_information_barriers_request(
+        self,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -172,7 +225,6 @@ class ShieldInformationBarriersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarriers)
 
     def create_shield_information_barrier(
         self,
@@ -193,11 +245,28 @@ class ShieldInformationBarriersManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_shield_information_barrier_request(
+                enterprise, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            ShieldInformationBarrier,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_shield_information_barrier_request(
+        self,
+        enterprise: EnterpriseBase,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'enterprise': enterprise}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -214,4 +283,3 @@ class ShieldInformationBarriersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ShieldInformationBarrier)
@@ -10,6 +10,8 @@ from box_sdk_gen.serialization.json.serializer import deserialize
 
 from typing import List
 
+from typing import Tuple
+
 from box_sdk_gen.serialization.json.serializer import serialize
 
 from box_sdk_gen.schemas.file_base import FileBase
@@ -81,10 +83,25 @@ class SignRequestsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._cancel_sign_request_request(
+                sign_request_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, SignRequest, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _cancel_sign_request_request(
+        self,
+        sign_request_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -101,7 +118,6 @@ class SignRequestsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SignRequest)
 
     def resend_sign_request(
         self,
@@ -117,10 +133,23 @@ class SignRequestsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._resend_sign_request_request(
+                sign_request_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _resend_sign_request_request(
+        self,
+        sign_request_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -137,7 +166,6 @@ class SignRequestsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def get_sign_request_by_id(
         self,
@@ -153,10 +181,25 @@ class SignRequestsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_sign_request_by_id_request(
+                sign_request_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, SignRequest, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_sign_request_by_id_request(
+        self,
+        sign_request_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -172,7 +215,6 @@ class SignRequestsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SignRequest)
 
     def get_sign_requests(
         self,
@@ -196,13 +238,29 @@ class SignRequestsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_sign_requests_request(
+                marker=marker, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, SignRequests, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_sign_requests_request(
+        self,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/sign_requests']),
             FetchOptions(
                 method='GET',
@@ -213,7 +271,6 @@ class SignRequestsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SignRequests)
 
     def create_sign_request(
         self,
@@ -280,6 +337,56 @@ class SignRequestsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_sign_request_request(
+                signers,
+                source_files=source_files,
+                signature_color=signature_color,
+                parent_folder=parent_folder,
+                is_document_preparation_needed=is_document_preparation_needed,
+                redirect_url=redirect_url,
+                declined_redirect_url=declined_redirect_url,
+                are_text_signatures_enabled=are_text_signatures_enabled,
+                email_subject=email_subject,
+                email_message=email_message,
+                are_reminders_enabled=are_reminders_enabled,
+                name=name,
+                prefill_tags=prefill_tags,
+                days_valid=days_valid,
+                external_id=external_id,
+                is_phone_verification_required_to_view=is_phone_verification_required_to_view,
+                template_id=template_id,
+                external_system_name=external_system_name,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, SignRequest, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_sign_request_request(
+        self,
+        signers: List[SignRequestCreateSigner],
+        *,
+        source_files: Optional[List[FileBase]] = None,
+        signature_color: Optional[CreateSignRequestSignatureColor] = None,
+        parent_folder: Optional[FolderMini] = None,
+        is_document_preparation_needed: Optional[bool] = None,
+        redirect_url: Optional[str] = None,
+        declined_redirect_url: Optional[str] = None,
+        are_text_signatures_enabled: Optional[bool] = None,
+        email_subject: Optional[str] = None,
+        email_message: Optional[str] = None,
+        are_reminders_enabled: Optional[bool] = None,
+        name: Optional[str] = None,
+        prefill_tags: Optional[List[SignRequestPrefillTag]] = None,
+        days_valid: Optional[int] = None,
+        external_id: Optional[str] = None,
+        is_phone_verification_required_to_view: Optional[bool] = None,
+        template_id: Optional[str] = None,
+        external_system_name: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -303,7 +410,7 @@ class SignRequestsManager:
             'external_system_name': external_system_name,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/sign_requests']),
             FetchOptions(
                 method='POST',
@@ -315,4 +422,3 @@ class SignRequestsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SignRequest)
@@ -2,6 +2,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -64,13 +66,29 @@ class SignTemplatesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_sign_templates_request(
+                marker=marker, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, SignTemplates, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_sign_templates_request(
+        self,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/sign_templates']),
             FetchOptions(
                 method='GET',
@@ -81,7 +99,6 @@ class SignTemplatesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SignTemplates)
 
     def get_sign_template_by_id(
         self,
@@ -97,10 +114,25 @@ class SignTemplatesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_sign_template_by_id_request(
+                template_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, SignTemplate, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_sign_template_by_id_request(
+        self,
+        template_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -116,4 +148,3 @@ class SignTemplatesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SignTemplate)
@@ -10,6 +10,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -209,10 +211,24 @@ class SkillsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_box_skill_cards_on_file_request(
+                file_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            SkillCardsMetadata,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_box_skill_cards_on_file_request(
+        self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -229,7 +245,6 @@ class SkillsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SkillCardsMetadata)
 
     def create_box_skill_cards_on_file(
         self,
@@ -261,11 +276,36 @@ class SkillsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_box_skill_cards_on_file_request(
+                file_id, cards, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            SkillCardsMetadata,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_box_skill_cards_on_file_request(
+        self,
+        file_id: str,
+        cards: List[
+            Union[
+                KeywordSkillCard,
+                TimelineSkillCard,
+                TranscriptSkillCard,
+                StatusSkillCard,
+            ]
+        ],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'cards': cards}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -284,7 +324,6 @@ class SkillsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SkillCardsMetadata)
 
     def update_box_skill_cards_on_file(
         self,
@@ -309,10 +348,28 @@ class SkillsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_box_skill_cards_on_file_request(
+                file_id, request_body, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            SkillCardsMetadata,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_box_skill_cards_on_file_request(
+        self,
+        file_id: str,
+        request_body: List[UpdateBoxSkillCardsOnFileRequestBody],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -331,7 +388,6 @@ class SkillsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, SkillCardsMetadata)
 
     def delete_box_skill_cards_from_file(
         self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
@@ -350,10 +406,20 @@ class SkillsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_box_skill_cards_from_file_request(
+                file_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_box_skill_cards_from_file_request(
+        self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -370,7 +436,6 @@ class SkillsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def update_all_skill_cards_on_file(
         self,
@@ -409,6 +474,30 @@ class SkillsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_all_skill_cards_on_file_request(
+                skill_id,
+                status,
+                metadata,
+                file,
+                file_version=file_version,
+                usage=usage,
+                extra_headers=extra_headers,
+            )
+        )
+        return None
+
+    def _update_all_skill_cards_on_file_request(
+        self,
+        skill_id: str,
+        status: UpdateAllSkillCardsOnFileStatus,
+        metadata: UpdateAllSkillCardsOnFileMetadata,
+        file: UpdateAllSkillCardsOnFileFile,
+        *,
+        file_version: Optional[UpdateAllSkillCardsOnFileFileVersion] = None,
+        usage: Optional[UpdateAllSkillCardsOnFileUsage] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -419,7 +508,7 @@ class SkillsManager:
             'usage': usage,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -437,4 +526,3 @@ class SkillsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
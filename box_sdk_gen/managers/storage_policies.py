@@ -4,6 +4,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -77,6 +79,25 @@ class StoragePoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_storage_policies_request(
+                fields=fields, marker=marker, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            StoragePolicies,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_storage_policies_request(
+        self,
+        *,
+        fields: Optional[List[str]] = None,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -87,7 +108,7 @@ class StoragePoliciesManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/storage_policies']),
             FetchOptions(
                 method='GET',
@@ -98,7 +119,6 @@ class StoragePoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, StoragePolicies)
 
     def get_storage_policy_by_id(
         self,
@@ -114,10 +134,25 @@ class StoragePoliciesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_storage_policy_by_id_request(
+                storage_policy_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, StoragePolicy, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_storage_policy_by_id_request(
+        self,
+        storage_policy_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -133,4 +168,3 @@ class StoragePoliciesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, StoragePolicy)
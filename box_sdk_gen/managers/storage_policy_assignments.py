@@ -6,6 +6,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -150,6 +152,28 @@ class StoragePolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_storage_policy_assignments_request(
+                resolved_for_type,
+                resolved_for_id,
+                marker=marker,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            StoragePolicyAssignments,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_storage_policy_assignments_request(
+        self,
+        resolved_for_type: GetStoragePolicyAssignmentsResolvedForType,
+        resolved_for_id: str,
+        *,
+        marker: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -160,7 +184,7 @@ class StoragePolicyAssignmentsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -176,7 +200,6 @@ class StoragePolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, StoragePolicyAssignments)
 
     def create_storage_policy_assignment(
         self,
@@ -196,6 +219,24 @@ class StoragePolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_storage_policy_assignment_request(
+                storage_policy, assigned_to, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            StoragePolicyAssignment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_storage_policy_assignment_request(
+        self,
+        storage_policy: CreateStoragePolicyAssignmentStoragePolicy,
+        assigned_to: CreateStoragePolicyAssignmentAssignedTo,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -203,7 +244,7 @@ class StoragePolicyAssignmentsManager:
             'assigned_to': assigned_to,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -220,7 +261,6 @@ class StoragePolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, StoragePolicyAssignment)
 
     def get_storage_policy_assignment_by_id(
         self,
@@ -236,10 +276,27 @@ class StoragePolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_storage_policy_assignment_by_id_request(
+                storage_policy_assignment_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            StoragePolicyAssignment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_storage_policy_assignment_by_id_request(
+        self,
+        storage_policy_assignment_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -255,7 +312,6 @@ class StoragePolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, StoragePolicyAssignment)
 
     def update_storage_policy_assignment_by_id(
         self,
@@ -275,11 +331,31 @@ class StoragePolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_storage_policy_assignment_by_id_request(
+                storage_policy_assignment_id,
+                storage_policy,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            StoragePolicyAssignment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_storage_policy_assignment_by_id_request(
+        self,
+        storage_policy_assignment_id: str,
+        storage_policy: UpdateStoragePolicyAssignmentByIdStoragePolicy,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'storage_policy': storage_policy}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -297,7 +373,6 @@ class StoragePolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, StoragePolicyAssignment)
 
     def delete_storage_policy_assignment_by_id(
         self,
@@ -328,10 +403,23 @@ class StoragePolicyAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_storage_policy_assignment_by_id_request(
+                storage_policy_assignment_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_storage_policy_assignment_by_id_request(
+        self,
+        storage_policy_assignment_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -347,4 +435,3 @@ class StoragePolicyAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
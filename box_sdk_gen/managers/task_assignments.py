@@ -6,6 +6,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -114,10 +116,22 @@ class TaskAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_task_assignments_request(task_id, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data,
+            TaskAssignments,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_task_assignments_request(
+        self, task_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -134,7 +148,6 @@ class TaskAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TaskAssignments)
 
     def create_task_assignment(
         self,
@@ -158,11 +171,29 @@ class TaskAssignmentsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_task_assignment_request(
+                task, assign_to, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            TaskAssignment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_task_assignment_request(
+        self,
+        task: CreateTaskAssignmentTask,
+        assign_to: CreateTaskAssignmentAssignTo,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'task': task, 'assign_to': assign_to}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/task_assignments']),
             FetchOptions(
                 method='POST',
@@ -174,7 +205,6 @@ class TaskAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TaskAssignment)
 
     def get_task_assignment_by_id(
         self,
@@ -190,10 +220,27 @@ class TaskAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_task_assignment_by_id_request(
+                task_assignment_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            TaskAssignment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_task_assignment_by_id_request(
+        self,
+        task_assignment_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -209,7 +256,6 @@ class TaskAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TaskAssignment)
 
     def update_task_assignment_by_id(
         self,
@@ -239,11 +285,33 @@ class TaskAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_task_assignment_by_id_request(
+                task_assignment_id,
+                message=message,
+                resolution_state=resolution_state,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            TaskAssignment,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_task_assignment_by_id_request(
+        self,
+        task_assignment_id: str,
+        *,
+        message: Optional[str] = None,
+        resolution_state: Optional[UpdateTaskAssignmentByIdResolutionState] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'message': message, 'resolution_state': resolution_state}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -261,7 +329,6 @@ class TaskAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TaskAssignment)
 
     def delete_task_assignment_by_id(
         self,
@@ -277,10 +344,23 @@ class TaskAssignmentsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_task_assignment_by_id_request(
+                task_assignment_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_task_assignment_by_id_request(
+        self,
+        task_assignment_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -296,4 +376,3 @@ class TaskAssignmentsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
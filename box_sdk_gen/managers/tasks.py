@@ -6,6 +6,8 @@ from box_sdk_gen.internal.base_object import BaseObject
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -118,10 +120,20 @@ class TasksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_file_tasks_request(file_id, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data, Tasks, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_file_tasks_request(
+        self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -138,7 +150,6 @@ class TasksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Tasks)
 
     def create_task(
         self,
@@ -179,6 +190,30 @@ class TasksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_task_request(
+                item,
+                action=action,
+                message=message,
+                due_at=due_at,
+                completion_rule=completion_rule,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Task, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_task_request(
+        self,
+        item: CreateTaskItem,
+        *,
+        action: Optional[CreateTaskAction] = None,
+        message: Optional[str] = None,
+        due_at: Optional[DateTime] = None,
+        completion_rule: Optional[CreateTaskCompletionRule] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -189,7 +224,7 @@ class TasksManager:
             'completion_rule': completion_rule,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/tasks']),
             FetchOptions(
                 method='POST',
@@ -201,7 +236,6 @@ class TasksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Task)
 
     def get_task_by_id(
         self, task_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
@@ -214,10 +248,20 @@ class TasksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_task_by_id_request(task_id, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data, Task, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_task_by_id_request(
+        self, task_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -233,7 +277,6 @@ class TasksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Task)
 
     def update_task_by_id(
         self,
@@ -274,6 +317,30 @@ class TasksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_task_by_id_request(
+                task_id,
+                action=action,
+                message=message,
+                due_at=due_at,
+                completion_rule=completion_rule,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Task, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_task_by_id_request(
+        self,
+        task_id: str,
+        *,
+        action: Optional[UpdateTaskByIdAction] = None,
+        message: Optional[str] = None,
+        due_at: Optional[DateTime] = None,
+        completion_rule: Optional[UpdateTaskByIdCompletionRule] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -283,7 +350,7 @@ class TasksManager:
             'completion_rule': completion_rule,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -301,7 +368,6 @@ class TasksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Task)
 
     def delete_task_by_id(
         self, task_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
@@ -314,10 +380,18 @@ class TasksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_task_by_id_request(task_id, extra_headers=extra_headers)
+        )
+        return None
+
+    def _delete_task_by_id_request(
+        self, task_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -333,4 +407,3 @@ class TasksManager:
                 network_session=self.network_session,
             ),
         )
-        return None
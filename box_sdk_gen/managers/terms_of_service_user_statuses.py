@@ -6,6 +6,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -125,13 +127,31 @@ class TermsOfServiceUserStatusesManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_terms_of_service_user_statuses_request(
+                tos_id, user_id=user_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            TermsOfServiceUserStatuses,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_terms_of_service_user_statuses_request(
+        self,
+        tos_id: str,
+        *,
+        user_id: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'tos_id': to_string(tos_id), 'user_id': to_string(user_id)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -147,7 +167,6 @@ class TermsOfServiceUserStatusesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TermsOfServiceUserStatuses)
 
     def create_terms_of_service_status_for_user(
         self,
@@ -168,11 +187,30 @@ class TermsOfServiceUserStatusesManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_terms_of_service_status_for_user_request(
+                tos, user, is_accepted, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            TermsOfServiceUserStatus,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_terms_of_service_status_for_user_request(
+        self,
+        tos: CreateTermsOfServiceStatusForUserTos,
+        user: CreateTermsOfServiceStatusForUserUser,
+        is_accepted: bool,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'tos': tos, 'user': user, 'is_accepted': is_accepted}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -189,7 +227,6 @@ class TermsOfServiceUserStatusesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TermsOfServiceUserStatus)
 
     def update_terms_of_service_status_for_user_by_id(
         self,
@@ -208,11 +245,31 @@ class TermsOfServiceUserStatusesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_terms_of_service_status_for_user_by_id_request(
+                terms_of_service_user_status_id,
+                is_accepted,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            TermsOfServiceUserStatus,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_terms_of_service_status_for_user_by_id_request(
+        self,
+        terms_of_service_user_status_id: str,
+        is_accepted: bool,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'is_accepted': is_accepted}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -230,4 +287,3 @@ class TermsOfServiceUserStatusesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TermsOfServiceUserStatus)
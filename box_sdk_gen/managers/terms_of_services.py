@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -85,13 +87,30 @@ class TermsOfServicesManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_terms_of_service_request(
+                tos_type=tos_type, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            TermsOfServices,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_terms_of_service_request(
+        self,
+        *,
+        tos_type: Optional[GetTermsOfServiceTosType] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'tos_type': to_string(tos_type)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/terms_of_services']
             ),
@@ -104,7 +123,6 @@ class TermsOfServicesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TermsOfServices)
 
     def create_terms_of_service(
         self,
@@ -131,11 +149,30 @@ class TermsOfServicesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_terms_of_service_request(
+                status, text, tos_type=tos_type, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            TermsOfService,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _create_terms_of_service_request(
+        self,
+        status: CreateTermsOfServiceStatus,
+        text: str,
+        *,
+        tos_type: Optional[CreateTermsOfServiceTosType] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'status': status, 'tos_type': tos_type, 'text': text}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/terms_of_services']
             ),
@@ -149,7 +186,6 @@ class TermsOfServicesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TermsOfService)
 
     def get_terms_of_service_by_id(
         self,
@@ -165,10 +201,27 @@ class TermsOfServicesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_terms_of_service_by_id_request(
+                terms_of_service_id, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            TermsOfService,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_terms_of_service_by_id_request(
+        self,
+        terms_of_service_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -184,7 +237,6 @@ class TermsOfServicesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TermsOfService)
 
     def update_terms_of_service_by_id(
         self,
@@ -208,11 +260,30 @@ class TermsOfServicesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_terms_of_service_by_id_request(
+                terms_of_service_id, status, text, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            TermsOfService,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _update_terms_of_service_by_id_request(
+        self,
+        terms_of_service_id: str,
+        status: UpdateTermsOfServiceByIdStatus,
+        text: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'status': status, 'text': text}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -230,4 +301,3 @@ class TermsOfServicesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TermsOfService)
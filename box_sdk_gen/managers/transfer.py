@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import serialize
@@ -158,6 +160,28 @@ class TransferManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._transfer_owned_folder_request(
+                user_id,
+                owned_by,
+                fields=fields,
+                notify=notify,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, FolderFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _transfer_owned_folder_request(
+        self,
+        user_id: str,
+        owned_by: TransferOwnedFolderOwnedBy,
+        *,
+        fields: Optional[List[str]] = None,
+        notify: Optional[bool] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'owned_by': owned_by}
@@ -165,7 +189,7 @@ class TransferManager:
             {'fields': to_string(fields), 'notify': to_string(notify)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -185,4 +209,3 @@ class TransferManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, FolderFull)
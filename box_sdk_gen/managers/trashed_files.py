@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import serialize
@@ -102,12 +104,36 @@ class TrashedFilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._restore_file_from_trash_request(
+                file_id,
+                name=name,
+                parent=parent,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            TrashFileRestored,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _restore_file_from_trash_request(
+        self,
+        file_id: str,
+        *,
+        name: Optional[str] = None,
+        parent: Optional[RestoreFileFromTrashParent] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'name': name, 'parent': parent}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -126,7 +152,6 @@ class TrashedFilesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TrashFileRestored)
 
     def get_trashed_file_by_id(
         self,
@@ -183,11 +208,27 @@ class TrashedFilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_trashed_file_by_id_request(
+                file_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, TrashFile, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_trashed_file_by_id_request(
+        self,
+        file_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -205,7 +246,6 @@ class TrashedFilesManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TrashFile)
 
     def delete_trashed_file_by_id(
         self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
@@ -227,10 +267,20 @@ class TrashedFilesManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_trashed_file_by_id_request(
+                file_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_trashed_file_by_id_request(
+        self, file_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -247,4 +297,3 @@ class TrashedFilesManager:
                 network_session=self.network_session,
             ),
         )
-        return None
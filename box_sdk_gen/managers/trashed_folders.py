@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import serialize
@@ -123,12 +125,36 @@ class TrashedFoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._restore_folder_from_trash_request(
+                folder_id,
+                name=name,
+                parent=parent,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            TrashFolderRestored,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _restore_folder_from_trash_request(
+        self,
+        folder_id: str,
+        *,
+        name: Optional[str] = None,
+        parent: Optional[RestoreFolderFromTrashParent] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'name': name, 'parent': parent}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -147,7 +173,6 @@ class TrashedFoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TrashFolderRestored)
 
     def get_trashed_folder_by_id(
         self,
@@ -207,11 +232,27 @@ class TrashedFoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_trashed_folder_by_id_request(
+                folder_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, TrashFolder, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_trashed_folder_by_id_request(
+        self,
+        folder_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -229,7 +270,6 @@ class TrashedFoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TrashFolder)
 
     def delete_trashed_folder_by_id(
         self,
@@ -257,10 +297,23 @@ class TrashedFoldersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_trashed_folder_by_id_request(
+                folder_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_trashed_folder_by_id_request(
+        self,
+        folder_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -277,4 +330,3 @@ class TrashedFoldersManager:
                 network_session=self.network_session,
             ),
         )
-        return None
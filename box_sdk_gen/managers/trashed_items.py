@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -136,6 +138,34 @@ class TrashedItemsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_trashed_items_request(
+                fields=fields,
+                limit=limit,
+                offset=offset,
+                usemarker=usemarker,
+                marker=marker,
+                direction=direction,
+                sort=sort,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Items, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_trashed_items_request(
+        self,
+        *,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        usemarker: Optional[bool] = None,
+        marker: Optional[str] = None,
+        direction: Optional[GetTrashedItemsDirection] = None,
+        sort: Optional[GetTrashedItemsSort] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -150,7 +180,7 @@ class TrashedItemsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [self.network_session.base_urls.base_url, '/2.0/folders/trash/items']
             ),
@@ -163,4 +193,3 @@ class TrashedItemsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Items)
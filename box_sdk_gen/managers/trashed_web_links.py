@@ -6,6 +6,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import serialize
@@ -96,12 +98,36 @@ class TrashedWebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._restore_weblink_from_trash_request(
+                web_link_id,
+                name=name,
+                parent=parent,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data,
+            TrashWebLinkRestored,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _restore_weblink_from_trash_request(
+        self,
+        web_link_id: str,
+        *,
+        name: Optional[str] = None,
+        parent: Optional[RestoreWeblinkFromTrashParent] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'name': name, 'parent': parent}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -120,7 +146,6 @@ class TrashedWebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TrashWebLinkRestored)
 
     def get_trashed_web_link_by_id(
         self,
@@ -147,11 +172,27 @@ class TrashedWebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_trashed_web_link_by_id_request(
+                web_link_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, TrashWebLink, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_trashed_web_link_by_id_request(
+        self,
+        web_link_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -169,7 +210,6 @@ class TrashedWebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, TrashWebLink)
 
     def delete_trashed_web_link_by_id(
         self,
@@ -188,10 +228,23 @@ class TrashedWebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_trashed_web_link_by_id_request(
+                web_link_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_trashed_web_link_by_id_request(
+        self,
+        web_link_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -208,4 +261,3 @@ class TrashedWebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return None
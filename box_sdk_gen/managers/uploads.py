@@ -1,3 +1,5 @@
+import os
+
 from typing import Optional
 
 from box_sdk_gen.internal.base_object import BaseObject
@@ -6,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import serialize
@@ -30,6 +34,8 @@ from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.internal.utils import ByteStream
 
+from box_sdk_gen.internal.utils import MemoryMappedFileStream
+
 from box_sdk_gen.internal.utils import DateTime
 
 from box_sdk_gen.serialization.json.json_data import sd_to_json
@@ -217,6 +223,36 @@ class UploadsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._upload_file_version_request(
+                file_id,
+                attributes,
+                file,
+                file_file_name=file_file_name,
+                file_content_type=file_content_type,
+                fields=fields,
+                if_match=if_match,
+                content_md_5=content_md_5,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Files, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _upload_file_version_request(
+        self,
+        file_id: str,
+        attributes: UploadFileVersionAttributes,
+        file: ByteStream,
+        *,
+        file_file_name: Optional[str] = None,
+        file_content_type: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        if_match: Optional[str] = None,
+        content_md_5: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -233,7 +269,7 @@ class UploadsManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.upload_url,
@@ -264,7 +300,6 @@ class UploadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Files)
 
     def upload_file(
         self,
@@ -337,6 +372,32 @@ class UploadsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._upload_file_request(
+                attributes,
+                file,
+                file_file_name=file_file_name,
+                file_content_type=file_content_type,
+                fields=fields,
+                content_md_5=content_md_5,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Files, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _upload_file_request(
+        self,
+        attributes: UploadFileAttributes,
+        file: ByteStream,
+        *,
+        file_file_name: Optional[str] = None,
+        file_content_type: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        content_md_5: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -349,7 +410,7 @@ class UploadsManager:
         headers_map: Dict[str, str] = prepare_params(
             {'content-md5': to_string(content_md_5), **extra_headers}
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.upload_url, '/2.0/files/content']),
             FetchOptions(
                 method='POST',
@@ -373,7 +434,6 @@ class UploadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Files)
 
     def preflight_file_upload_check(
         self,
@@ -395,11 +455,28 @@ class UploadsManager:
         :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
         :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._preflight_file_upload_check_request(
+                name=name, size=size, parent=parent, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, UploadUrl, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _preflight_file_upload_check_request(
+        self,
+        *,
+        name: Optional[str] = None,
+        size: Optional[int] = None,
+        parent: Optional[PreflightFileUploadCheckParent] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'name': name, 'size': size, 'parent': parent}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/files/content']),
             FetchOptions(
                 method='OPTIONS',
@@ -411,4 +488,85 @@ class UploadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UploadUrl)
+
+    def upload_file_version_from_path(
+        self,
+        file_id: str,
+        attributes: UploadFileVersionAttributes,
+        file_path: str,
+        *,
+        file_content_type: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        if_match: Optional[str] = None,
+        content_md_5: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Files:
+        """
+        Update a file's content with the content of a local file. The local file is memory-mapped,
+        so its content is read from the OS page cache instead of being buffered in Python memory.
+        :param file_id: The unique identifier that represents a file.
+        :type file_id: str
+        :param attributes: The additional attributes of the file being uploaded.
+        :type attributes: UploadFileVersionAttributes
+        :param file_path: Path to the local file to upload.
+        :type file_path: str
+        :param file_content_type: The content type of the file, defaults to None
+        :type file_content_type: Optional[str], optional
+        :param fields: A comma-separated list of attributes to include in the response., defaults to None
+        :type fields: Optional[List[str]], optional
+        :param if_match: Ensures this item hasn't recently changed before making changes., defaults to None
+        :type if_match: Optional[str], optional
+        :param content_md_5: An optional header containing the SHA1 hash of the file to ensure that the file was not corrupted in transit., defaults to None
+        :type content_md_5: Optional[str], optional
+        :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
+        :type extra_headers: Optional[Dict[str, Optional[str]]], optional
+        """
+        with MemoryMappedFileStream(file_path) as file:
+            return self.upload_file_version(
+                file_id,
+                attributes,
+                file,
+                file_file_name=os.path.basename(file_path),
+                file_content_type=file_content_type,
+                fields=fields,
+                if_match=if_match,
+                content_md_5=content_md_5,
+                extra_headers=extra_headers,
+            )
+
+    def upload_file_from_path(
+        self,
+        attributes: UploadFileAttributes,
+        file_path: str,
+        *,
+        file_content_type: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        content_md_5: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Files:
+        """
+        Uploads a small local file to Box. The local file is memory-mapped,
+        so its content is read from the OS page cache instead of being buffered in Python memory.
+        :param attributes: The additional attributes of the file being uploaded. Mainly the name and the parent folder.
+        :type attributes: UploadFileAttributes
+        :param file_path: Path to the local file to upload.
+        :type file_path: str
+        :param file_content_type: The content type of the file, defaults to None
+        :type file_content_type: Optional[str], optional
+        :param fields: A comma-separated list of attributes to include in the response., defaults to None
+        :type fields: Optional[List[str]], optional
+        :param content_md_5: An optional header containing the SHA1 hash of the file to ensure that the file was not corrupted in transit., defaults to None
+        :type content_md_5: Optional[str], optional
+        :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
+        :type extra_headers: Optional[Dict[str, Optional[str]]], optional
+        """
+        with MemoryMappedFileStream(file_path) as file:
+            return self.upload_file(
+                attributes,
+                file,
+                file_file_name=os.path.basename(file_path),
+                file_content_type=file_content_type,
+                fields=fields,
+                content_md_5=content_md_5,
+                extra_headers=extra_headers,
+            )
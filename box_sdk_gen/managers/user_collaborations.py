@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -167,11 +169,27 @@ class UserCollaborationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_collaboration_by_id_request(
+                collaboration_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, Collaboration, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_collaboration_by_id_request(
+        self,
+        collaboration_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -188,7 +206,6 @@ class UserCollaborationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Collaboration)
 
     def update_collaboration_by_id(
         self,
@@ -248,6 +265,30 @@ class UserCollaborationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_collaboration_by_id_request(
+                collaboration_id,
+                role,
+                status=status,
+                expires_at=expires_at,
+                can_view_path=can_view_path,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Collaboration, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_collaboration_by_id_request(
+        self,
+        collaboration_id: str,
+        role: UpdateCollaborationByIdRole,
+        *,
+        status: Optional[UpdateCollaborationByIdStatus] = None,
+        expires_at: Optional[DateTime] = None,
+        can_view_path: Optional[bool] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -257,7 +298,7 @@ class UserCollaborationsManager:
             'can_view_path': can_view_path,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -275,7 +316,6 @@ class UserCollaborationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Collaboration)
 
     def delete_collaboration_by_id(
         self,
@@ -291,10 +331,23 @@ class UserCollaborationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_collaboration_by_id_request(
+                collaboration_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_collaboration_by_id_request(
+        self,
+        collaboration_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -310,7 +363,6 @@ class UserCollaborationsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
 
     def create_collaboration(
         self,
@@ -409,6 +461,36 @@ class UserCollaborationsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_collaboration_request(
+                item,
+                accessible_by,
+                role,
+                is_access_only=is_access_only,
+                can_view_path=can_view_path,
+                expires_at=expires_at,
+                fields=fields,
+                notify=notify,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Collaboration, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_collaboration_request(
+        self,
+        item: CreateCollaborationItem,
+        accessible_by: CreateCollaborationAccessibleBy,
+        role: CreateCollaborationRole,
+        *,
+        is_access_only: Optional[bool] = None,
+        can_view_path: Optional[bool] = None,
+        expires_at: Optional[DateTime] = None,
+        fields: Optional[List[str]] = None,
+        notify: Optional[bool] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -423,7 +505,7 @@ class UserCollaborationsManager:
             {'fields': to_string(fields), 'notify': to_string(notify)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/collaborations']),
             FetchOptions(
                 method='POST',
@@ -436,4 +518,3 @@ class UserCollaborationsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Collaboration)
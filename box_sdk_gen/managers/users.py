@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -184,6 +186,36 @@ class UsersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_users_request(
+                filter_term=filter_term,
+                user_type=user_type,
+                external_app_user_id=external_app_user_id,
+                fields=fields,
+                offset=offset,
+                limit=limit,
+                usemarker=usemarker,
+                marker=marker,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Users, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_users_request(
+        self,
+        *,
+        filter_term: Optional[str] = None,
+        user_type: Optional[GetUsersUserType] = None,
+        external_app_user_id: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        usemarker: Optional[bool] = None,
+        marker: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -199,7 +231,7 @@ class UsersManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/users']),
             FetchOptions(
                 method='GET',
@@ -210,7 +242,6 @@ class UsersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Users)
 
     def create_user(
         self,
@@ -305,6 +336,58 @@ class UsersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_user_request(
+                name,
+                login=login,
+                is_platform_access_only=is_platform_access_only,
+                role=role,
+                language=language,
+                is_sync_enabled=is_sync_enabled,
+                job_title=job_title,
+                phone=phone,
+                address=address,
+                space_amount=space_amount,
+                tracking_codes=tracking_codes,
+                can_see_managed_users=can_see_managed_users,
+                timezone=timezone,
+                is_external_collab_restricted=is_external_collab_restricted,
+                is_exempt_from_device_limits=is_exempt_from_device_limits,
+                is_exempt_from_login_verification=is_exempt_from_login_verification,
+                status=status,
+                external_app_user_id=external_app_user_id,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, UserFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_user_request(
+        self,
+        name: str,
+        *,
+        login: Optional[str] = None,
+        is_platform_access_only: Optional[bool] = None,
+        role: Optional[CreateUserRole] = None,
+        language: Optional[str] = None,
+        is_sync_enabled: Optional[bool] = None,
+        job_title: Optional[str] = None,
+        phone: Optional[str] = None,
+        address: Optional[str] = None,
+        space_amount: Optional[int] = None,
+        tracking_codes: Optional[List[TrackingCode]] = None,
+        can_see_managed_users: Optional[bool] = None,
+        timezone: Optional[str] = None,
+        is_external_collab_restricted: Optional[bool] = None,
+        is_exempt_from_device_limits: Optional[bool] = None,
+        is_exempt_from_login_verification: Optional[bool] = None,
+        status: Optional[CreateUserStatus] = None,
+        external_app_user_id: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -329,7 +412,7 @@ class UsersManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/users']),
             FetchOptions(
                 method='POST',
@@ -342,7 +425,6 @@ class UsersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UserFull)
 
     def get_user_me(
         self,
@@ -383,11 +465,24 @@ class UsersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_user_me_request(fields=fields, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data, UserFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_user_me_request(
+        self,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/users/me']),
             FetchOptions(
                 method='GET',
@@ -398,7 +493,6 @@ class UsersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UserFull)
 
     def get_user_by_id(
         self,
@@ -449,11 +543,27 @@ class UsersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_user_by_id_request(
+                user_id, fields=fields, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, UserFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_user_by_id_request(
+        self,
+        user_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -470,7 +580,6 @@ class UsersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UserFull)
 
     def update_user_by_id(
         self,
@@ -588,6 +697,66 @@ class UsersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_user_by_id_request(
+                user_id,
+                enterprise=enterprise,
+                notify=notify,
+                name=name,
+                login=login,
+                role=role,
+                language=language,
+                is_sync_enabled=is_sync_enabled,
+                job_title=job_title,
+                phone=phone,
+                address=address,
+                tracking_codes=tracking_codes,
+                can_see_managed_users=can_see_managed_users,
+                timezone=timezone,
+                is_external_collab_restricted=is_external_collab_restricted,
+                is_exempt_from_device_limits=is_exempt_from_device_limits,
+                is_exempt_from_login_verification=is_exempt_from_login_verification,
+                is_password_reset_required=is_password_reset_required,
+                status=status,
+                space_amount=space_amount,
+                notification_email=notification_email,
+                external_app_user_id=external_app_user_id,
+                fields=fields,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, UserFull, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_user_by_id_request(
+        self,
+        user_id: str,
+        *,
+        enterprise: Optional[str] = None,
+        notify: Optional[bool] = None,
+        name: Optional[str] = None,
+        login: Optional[str] = None,
+        role: Optional[UpdateUserByIdRole] = None,
+        language: Optional[str] = None,
+        is_sync_enabled: Optional[bool] = None,
+        job_title: Optional[str] = None,
+        phone: Optional[str] = None,
+        address: Optional[str] = None,
+        tracking_codes: Optional[List[TrackingCode]] = None,
+        can_see_managed_users: Optional[bool] = None,
+        timezone: Optional[str] = None,
+        is_external_collab_restricted: Optional[bool] = None,
+        is_exempt_from_device_limits: Optional[bool] = None,
+        is_exempt_from_login_verification: Optional[bool] = None,
+        is_password_reset_required: Optional[bool] = None,
+        status: Optional[UpdateUserByIdStatus] = None,
+        space_amount: Optional[int] = None,
+        notification_email: Optional[UpdateUserByIdNotificationEmail] = None,
+        external_app_user_id: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -618,7 +787,7 @@ class UsersManager:
         json_body: SerializedData = serialize(request_body)
         if request_body['enterprise'] == 'null':
             json_body['enterprise'] = None
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -637,7 +806,6 @@ class UsersManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, UserFull)
 
     def delete_user_by_id(
         self,
@@ -670,13 +838,28 @@ class UsersManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_user_by_id_request(
+                user_id, notify=notify, force=force, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_user_by_id_request(
+        self,
+        user_id: str,
+        *,
+        notify: Optional[bool] = None,
+        force: Optional[bool] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'notify': to_string(notify), 'force': to_string(force)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -693,4 +876,3 @@ class UsersManager:
                 network_session=self.network_session,
             ),
         )
-        return None
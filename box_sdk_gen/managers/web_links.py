@@ -6,6 +6,8 @@ from enum import Enum
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.serialization.json.serializer import serialize
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -151,6 +153,28 @@ class WebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_web_link_request(
+                url,
+                parent,
+                name=name,
+                description=description,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, WebLink, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_web_link_request(
+        self,
+        url: str,
+        parent: CreateWebLinkParent,
+        *,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -160,7 +184,7 @@ class WebLinksManager:
             'description': description,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/web_links']),
             FetchOptions(
                 method='POST',
@@ -172,7 +196,6 @@ class WebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, WebLink)
 
     def get_web_link_by_id(
         self,
@@ -200,12 +223,28 @@ class WebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_web_link_by_id_request(
+                web_link_id, boxapi=boxapi, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, WebLink, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_web_link_by_id_request(
+        self,
+        web_link_id: str,
+        *,
+        boxapi: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params(
             {'boxapi': to_string(boxapi), **extra_headers}
         )
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -221,7 +260,6 @@ class WebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, WebLink)
 
     def update_web_link_by_id(
         self,
@@ -251,6 +289,32 @@ class WebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_web_link_by_id_request(
+                web_link_id,
+                url=url,
+                parent=parent,
+                name=name,
+                description=description,
+                shared_link=shared_link,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, WebLink, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_web_link_by_id_request(
+        self,
+        web_link_id: str,
+        *,
+        url: Optional[str] = None,
+        parent: Optional[UpdateWebLinkByIdParent] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        shared_link: Optional[UpdateWebLinkByIdSharedLink] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -261,7 +325,7 @@ class WebLinksManager:
             'shared_link': shared_link,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -279,7 +343,6 @@ class WebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, WebLink)
 
     def delete_web_link_by_id(
         self,
@@ -295,10 +358,23 @@ class WebLinksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_web_link_by_id_request(
+                web_link_id, extra_headers=extra_headers
+            )
+        )
+        return None
+
+    def _delete_web_link_by_id_request(
+        self,
+        web_link_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -314,4 +390,3 @@ class WebLinksManager:
                 network_session=self.network_session,
             ),
         )
-        return None
@@ -12,6 +12,8 @@ from box_sdk_gen.serialization.json.serializer import deserialize
 
 from typing import List
 
+from typing import Tuple
+
 from box_sdk_gen.serialization.json.serializer import serialize
 
 from box_sdk_gen.schemas.webhooks import Webhooks
@@ -222,13 +224,29 @@ class WebhooksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_webhooks_request(
+                marker=marker, limit=limit, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, Webhooks, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_webhooks_request(
+        self,
+        *,
+        marker: Optional[str] = None,
+        limit: Optional[int] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/webhooks']),
             FetchOptions(
                 method='GET',
@@ -239,7 +257,6 @@ class WebhooksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Webhooks)
 
     def create_webhook(
         self,
@@ -261,6 +278,23 @@ class WebhooksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_webhook_request(
+                target, address, triggers, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data, Webhook, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_webhook_request(
+        self,
+        target: CreateWebhookTarget,
+        address: str,
+        triggers: List[CreateWebhookTriggers],
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -269,7 +303,7 @@ class WebhooksManager:
             'triggers': triggers,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/webhooks']),
             FetchOptions(
                 method='POST',
@@ -281,7 +315,6 @@ class WebhooksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Webhook)
 
     def get_webhook_by_id(
         self,
@@ -297,10 +330,23 @@ class WebhooksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_webhook_by_id_request(webhook_id, extra_headers=extra_headers)
+        )
+        return deserialize(
+            response.data, Webhook, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_webhook_by_id_request(
+        self,
+        webhook_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -316,7 +362,6 @@ class WebhooksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Webhook)
 
     def update_webhook_by_id(
         self,
@@ -342,6 +387,28 @@ class WebhooksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._update_webhook_by_id_request(
+                webhook_id,
+                target=target,
+                address=address,
+                triggers=triggers,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Webhook, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _update_webhook_by_id_request(
+        self,
+        webhook_id: str,
+        *,
+        target: Optional[UpdateWebhookByIdTarget] = None,
+        address: Optional[str] = None,
+        triggers: Optional[List[UpdateWebhookByIdTriggers]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -350,7 +417,7 @@ class WebhooksManager:
             'triggers': triggers,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -368,7 +435,6 @@ class WebhooksManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Webhook)
 
     def delete_webhook_by_id(
         self,
@@ -384,10 +450,21 @@ class WebhooksManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._delete_webhook_by_id_request(webhook_id, extra_headers=extra_headers)
+        )
+        return None
+
+    def _delete_webhook_by_id_request(
+        self,
+        webhook_id: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -403,4 +480,3 @@ class WebhooksManager:
                 network_session=self.network_session,
             ),
         )
-        return None
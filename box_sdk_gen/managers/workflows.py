@@ -12,6 +12,8 @@ from box_sdk_gen.serialization.json.serializer import deserialize
 
 from typing import List
 
+from typing import Tuple
+
 from box_sdk_gen.serialization.json.serializer import serialize
 
 from box_sdk_gen.schemas.workflows import Workflows
@@ -165,6 +167,28 @@ class WorkflowsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_workflows_request(
+                folder_id,
+                trigger_type=trigger_type,
+                limit=limit,
+                marker=marker,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, Workflows, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _get_workflows_request(
+        self,
+        folder_id: str,
+        *,
+        trigger_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        marker: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params(
@@ -176,7 +200,7 @@ class WorkflowsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/workflows']),
             FetchOptions(
                 method='GET',
@@ -187,7 +211,6 @@ class WorkflowsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, Workflows)
 
     def start_workflow(
         self,
@@ -225,6 +248,30 @@ class WorkflowsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._start_workflow_request(
+                workflow_id,
+                flow,
+                files,
+                folder,
+                type=type,
+                outcomes=outcomes,
+                extra_headers=extra_headers,
+            )
+        )
+        return None
+
+    def _start_workflow_request(
+        self,
+        workflow_id: str,
+        flow: StartWorkflowFlow,
+        files: List[StartWorkflowFiles],
+        folder: StartWorkflowFolder,
+        *,
+        type: Optional[StartWorkflowType] = None,
+        outcomes: Optional[List[Outcome]] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {
@@ -235,7 +282,7 @@ class WorkflowsManager:
             'outcomes': outcomes,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join(
                 [
                     self.network_session.base_urls.base_url,
@@ -254,4 +301,3 @@ class WorkflowsManager:
                 network_session=self.network_session,
             ),
         )
-        return None
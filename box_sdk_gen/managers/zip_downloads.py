@@ -8,6 +8,8 @@ from typing import List
 
 from typing import Dict
 
+from typing import Tuple
+
 from box_sdk_gen.serialization.json.serializer import serialize
 
 from box_sdk_gen.serialization.json.serializer import deserialize
@@ -152,11 +154,29 @@ class ZipDownloadsManager:
                 :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                 :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._create_zip_download_request(
+                items,
+                download_file_name=download_file_name,
+                extra_headers=extra_headers,
+            )
+        )
+        return deserialize(
+            response.data, ZipDownload, lazy=self.network_session.lazy_deserialization
+        )
+
+    def _create_zip_download_request(
+        self,
+        items: List[CreateZipDownloadItems],
+        *,
+        download_file_name: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         request_body: Dict = {'items': items, 'download_file_name': download_file_name}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             ''.join([self.network_session.base_urls.base_url, '/2.0/zip_downloads']),
             FetchOptions(
                 method='POST',
@@ -168,7 +188,6 @@ class ZipDownloadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ZipDownload)
 
     def get_zip_download_content(
         self,
@@ -214,10 +233,23 @@ class ZipDownloadsManager:
                :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_zip_download_content_request(
+                download_url, extra_headers=extra_headers
+            )
+        )
+        return response.content
+
+    def _get_zip_download_content_request(
+        self,
+        download_url: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             download_url,
             FetchOptions(
                 method='GET',
@@ -227,7 +259,6 @@ class ZipDownloadsManager:
                 network_session=self.network_session,
             ),
         )
-        return response.content
 
     def get_zip_download_status(
         self,
@@ -270,10 +301,27 @@ class ZipDownloadsManager:
                :param extra_headers: Extra headers that will be included in the HTTP request., defaults to None
                :type extra_headers: Optional[Dict[str, Optional[str]]], optional
         """
+        response: FetchResponse = fetch(
+            *self._get_zip_download_status_request(
+                status_url, extra_headers=extra_headers
+            )
+        )
+        return deserialize(
+            response.data,
+            ZipDownloadStatus,
+            lazy=self.network_session.lazy_deserialization,
+        )
+
+    def _get_zip_download_status_request(
+        self,
+        status_url: str,
+        *,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[str, FetchOptions]:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = fetch(
+        return (
             status_url,
             FetchOptions(
                 method='GET',
@@ -283,7 +331,6 @@ class ZipDownloadsManager:
                 network_session=self.network_session,
             ),
         )
-        return deserialize(response.data, ZipDownloadStatus)
 
     def download_zip(
         self,
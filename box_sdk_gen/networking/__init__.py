@@ -2,8 +2,28 @@ from box_sdk_gen.networking.fetch import *
 
 from box_sdk_gen.networking.network import *
 
+from box_sdk_gen.networking.connection_pool import *
+
+from box_sdk_gen.networking.transport import *
+
+from box_sdk_gen.networking.retries import *
+
 from box_sdk_gen.networking.auth import *
 
 from box_sdk_gen.networking.base_urls import *
 
 from box_sdk_gen.networking.version import *
+
+from box_sdk_gen.internal.lazy_imports import lazy_package as _lazy_package
+
+# The async fetch and the httpx transport are imported on first use, as they import httpx
+_exports = {
+    'async_fetch': ('create_async_http_client', 'fetch_async'),
+    'httpx_transport': (
+        'httpx_transport_options',
+        'create_httpx_transport',
+        'HttpxTransport',
+    ),
+}
+
+__getattr__, __dir__ = _lazy_package(__name__, _exports, globals())
@@ -0,0 +1,114 @@
+import asyncio
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .connection_pool import ConnectionPoolConfig
+from .fetch import (
+    APIRequest,
+    APIResponse,
+    FetchAttempts,
+    FetchOptions,
+    FetchResponse,
+    get_default_network_session,
+)
+from .httpx_transport import (
+    build_httpx_request,
+    create_httpx_transport,
+    httpx_transport_options,
+)
+from .network import DEFAULT_DOWNLOAD_CHUNK_SIZE
+from ..box.errors import BoxSDKError
+from ..internal.utils import AsyncByteStream
+from ..serialization.json.json_data import json_to_serialized_data
+
+
+def create_async_http_client(
+    connection_pool_config: ConnectionPoolConfig,
+) -> 'httpx.AsyncClient':
+    """
+    Create the asynchronous HTTP client used by fetch_async(), sized like the connection pool of a NetworkSession.
+    """
+    if httpx is None:
+        raise BoxSDKError(
+            message='The async client requires httpx. Install it with `pip install box-sdk-gen[async]`.'
+        )
+    transport = create_httpx_transport(
+        httpx.AsyncHTTPTransport, **httpx_transport_options(connection_pool_config)
+    )
+    return httpx.AsyncClient(transport=transport, timeout=None)
+
+
+async def fetch_async(url: str, options: FetchOptions) -> FetchResponse:
+    """
+    Asynchronous counterpart of fetch(), with the same retry and authentication behaviour.
+    Binary responses are returned as AsyncByteStream.
+    """
+    network_session = options.network_session or get_default_network_session()
+    http_client = network_session.async_http_client
+    chunk_size = (
+        network_session.download_chunk_size
+        if options.network_session
+        else DEFAULT_DOWNLOAD_CHUNK_SIZE
+    )
+    attempts = FetchAttempts(url, options)
+
+    while True:
+        if options.auth:
+            # Retrieving and refreshing the token make blocking calls, which must not stall the event loop.
+            request = await asyncio.get_running_loop().run_in_executor(
+                None, attempts.prepare_request
+            )
+        else:
+            request = attempts.prepare_request()
+        response: APIResponse = await __make_async_request(
+            request=request, http_client=http_client
+        )
+
+        network_response = response.network_response
+        if network_response is not None:
+            if network_response.is_success:
+                if options.response_format == 'binary':
+                    return FetchResponse(
+                        status=network_response.status_code,
+                        headers=dict(network_response.headers),
+                        content=AsyncByteStream(
+                            network_response.aiter_bytes(chunk_size=chunk_size),
+                            network_response.aclose,
+                        ),
+                    )
+                content = await network_response.aread()
+                return FetchResponse(
+                    status=network_response.status_code,
+                    headers=dict(network_response.headers),
+                    data=json_to_serialized_data(content) if content else None,
+                )
+            await network_response.aread()
+
+        await asyncio.sleep(attempts.get_retry_delay(response))
+
+
+async def __make_async_request(
+    request: APIRequest, http_client: 'httpx.AsyncClient'
+) -> APIResponse:
+    raised_exception = None
+    reauthentication_needed = False
+    try:
+        network_response = await http_client.send(
+            build_httpx_request(http_client, request), stream=True
+        )
+        reauthentication_needed = network_response.status_code == 401
+    except httpx.TransportError as request_exc:
+        raised_exception = request_exc
+        network_response = None
+
+        if 'EOF occurred in violation of protocol' in str(request_exc):
+            reauthentication_needed = True
+
+    return APIResponse(
+        network_response=network_response,
+        reauthentication_needed=reauthentication_needed,
+        raised_exception=raised_exception,
+    )
@@ -0,0 +1,103 @@
+import socket
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+class ConnectionPoolConfig:
+    def __init__(
+        self,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        tcp_keep_alive: bool = True,
+        keep_alive_idle: Optional[int] = 60,
+        keep_alive_interval: Optional[int] = 15,
+        keep_alive_count: Optional[int] = 4,
+        idle_timeout: Optional[float] = None,
+        http2: bool = False,
+    ):
+        """
+        :param pool_connections: Number of hosts for which connection pools are kept
+        :param pool_maxsize: Maximum number of connections kept open per host. It should be at least
+            the number of threads making API calls concurrently with one client
+        :param pool_block: If True, a thread waits for a free connection when the pool of a host is exhausted,
+            instead of opening a new connection, which is discarded after use
+        :param tcp_keep_alive: Whether TCP keep-alive probes are enabled on pooled connections
+        :param keep_alive_idle: Seconds of inactivity after which keep-alive probes are sent, where supported by the OS
+        :param keep_alive_interval: Seconds between keep-alive probes, where supported by the OS
+        :param keep_alive_count: Number of unanswered probes after which a connection is dropped, where supported by the OS
+        :param idle_timeout: Seconds after which pooled connections are closed instead of reused when no request
+            was made in the meantime. Should be lower than the keep-alive timeout of the server. If None, connections
+            are reused regardless of how long they were idle
+        :param http2: If True, requests are sent with httpx over HTTP/2, where the server supports it, so that
+            concurrent requests to a host share a few connections instead of using one connection each.
+            Requires the http2 extra: `pip install box-sdk-gen[http2]`
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.tcp_keep_alive = tcp_keep_alive
+        self.keep_alive_idle = keep_alive_idle
+        self.keep_alive_interval = keep_alive_interval
+        self.keep_alive_count = keep_alive_count
+        self.idle_timeout = idle_timeout
+        self.http2 = http2
+
+    def socket_options(self) -> List[Tuple[int, int, int]]:
+        options = list(HTTPConnection.default_socket_options)
+        if not self.tcp_keep_alive:
+            return options
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # TCP_KEEPALIVE is the macOS name of TCP_KEEPIDLE.
+        keep_alive_idle_option = getattr(
+            socket, 'TCP_KEEPIDLE', getattr(socket, 'TCP_KEEPALIVE', None)
+        )
+        for option, value in (
+            (keep_alive_idle_option, self.keep_alive_idle),
+            (getattr(socket, 'TCP_KEEPINTVL', None), self.keep_alive_interval),
+            (getattr(socket, 'TCP_KEEPCNT', None), self.keep_alive_count),
+        ):
+            if option is not None and value is not None:
+                options.append((socket.IPPROTO_TCP, option, value))
+        return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    __attrs__ = HTTPAdapter.__attrs__ + ['pool_config']
+
+    def __init__(self, pool_config: ConnectionPoolConfig):
+        self.pool_config = pool_config
+        self._last_request_time = time.monotonic()
+        self._idle_lock = threading.Lock()
+        super().__init__(
+            pool_connections=pool_config.pool_connections,
+            pool_maxsize=pool_config.pool_maxsize,
+            pool_block=pool_config.pool_block,
+        )
+
+    def __setstate__(self, state):
+        self._last_request_time = time.monotonic()
+        self._idle_lock = threading.Lock()
+        super().__setstate__(state)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault('socket_options', self.pool_config.socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def send(self, request, *args, **kwargs):
+        idle_timeout = self.pool_config.idle_timeout
+        with self._idle_lock:
+            now = time.monotonic()
+            if (
+                idle_timeout is not None
+                and now - self._last_request_time > idle_timeout
+            ):
+                # The server has most likely closed the idle connections already.
+                self.poolmanager.clear()
+            self._last_request_time = now
+        return super().send(request, *args, **kwargs)
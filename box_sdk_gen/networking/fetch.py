@@ -1,33 +1,44 @@
-import io
 from datetime import datetime
 
-import math
-import random
+import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional, Dict, List, Union
+from weakref import WeakKeyDictionary
 from sys import version_info as py_version
 
 import requests
 from requests import RequestException, Session, Response
 from requests_toolbelt import MultipartEncoder
 
-from .network import NetworkSession
+from .network import NetworkSession, DEFAULT_DOWNLOAD_CHUNK_SIZE
+
+# DEFAULT_MAX_ATTEMPTS used to be defined in this module and is still imported from here by applications.
+from .retries import DEFAULT_MAX_ATTEMPTS, RetryPolicy, get_remaining_time
+from .transport import (
+    HTTPTransport,
+    RequestsTransport,
+    TransportError,
+    TransportResponse,
+)
 from ..box.errors import BoxAPIError, BoxSDKError, RequestInfo, ResponseInfo
 from .auth import Authentication
-from ..internal.utils import ByteStream, ResponseByteStream
+from ..internal.utils import (
+    ByteStream,
+    ResponseByteStream,
+    StreamingResponseByteStream,
+)
 from ..serialization.json.json_data import (
     SerializedData,
     sd_to_json,
+    sd_to_json_bytes,
     sd_to_url_params,
     json_to_serialized_data,
 )
 from .version import __version__
 
-DEFAULT_MAX_ATTEMPTS = 5
-_RETRY_RANDOMIZATION_FACTOR = 0.5
-_RETRY_BASE_INTERVAL = 1
+_DEFAULT_RETRY_POLICY = RetryPolicy()
 SDK_VERSION = __version__
 USER_AGENT_HEADER = f'box-python-generated-sdk-{SDK_VERSION}'
 X_BOX_UA_HEADER = (
@@ -74,11 +85,12 @@ class APIRequest:
     headers: Dict[str, str]
     params: Dict[str, str]
     data: Optional[Union[str, ByteStream, MultipartEncoder]]
+    timeout: Optional[float] = None
 
 
 @dataclass
 class APIResponse:
-    network_response: Optional[Response] = None
+    network_response: Optional[Union[Response, TransportResponse]] = None
     reauthentication_needed: Optional[bool] = False
     raised_exception: Optional[Exception] = None
 
@@ -91,78 +103,159 @@ class APIResponse:
             return default_value
 
 
-def fetch(url: str, options: FetchOptions) -> FetchResponse:
-    if options.network_session:
-        max_attempts = options.network_session.MAX_ATTEMPTS
-        requests_session = options.network_session.requests_session
-    else:
-        max_attempts = DEFAULT_MAX_ATTEMPTS
-        requests_session = requests.Session()
-
-    attempt_nr = 1
-    response = APIResponse()
-
-    while True:
-        request: APIRequest = __prepare_request(
-            url=url, options=options, reauthenticate=response.reauthentication_needed
-        )
-        response: APIResponse = __make_request(
-            request=request, session=requests_session
+_default_network_session: Optional[NetworkSession] = None
+_default_network_session_lock = threading.Lock()
+
+
+def get_default_network_session() -> NetworkSession:
+    """
+    Network session, whose connection pools are shared by the calls of fetch() and fetch_async() made without one,
+    so that they reuse pooled connections instead of paying a TCP and TLS handshake every time.
+    """
+    global _default_network_session
+    if _default_network_session is None:
+        with _default_network_session_lock:
+            if _default_network_session is None:
+                _default_network_session = NetworkSession()
+    return _default_network_session
+
+
+def _get_default_requests_session() -> Session:
+    return get_default_network_session().requests_session
+
+
+class FetchAttempts:
+    def __init__(self, url: str, options: FetchOptions):
+        """
+        Attempts of an API call made by fetch() or fetch_async(), which prepare the request of each attempt
+        and decide whether a failed attempt is retried, so that both retry alike.
+        :param url: Url of the API call
+        :param options: Options of the API call
+        """
+        self.url = url
+        self.options = options
+        if options.network_session:
+            self.retry_policy = options.network_session.retry_policy
+            self.max_attempts = self.retry_policy.get_max_attempts(
+                options.network_session.MAX_ATTEMPTS
+            )
+        else:
+            self.retry_policy = _DEFAULT_RETRY_POLICY
+            self.max_attempts = self.retry_policy.get_max_attempts()
+        self.deadline = self.retry_policy.get_deadline()
+        self.attempt_nr = 1
+        self.network_error_count = 0
+        self.request: Optional[APIRequest] = None
+        self.response = APIResponse()
+
+    def prepare_request(self) -> APIRequest:
+        """
+        Prepare the request of the next attempt, reauthenticating if the previous one was rejected.
+        It retrieves the access token, which may make a blocking API call.
+        """
+        request = prepare_request(
+            url=self.url,
+            options=self.options,
+            reauthenticate=self.response.reauthentication_needed,
+            rejected_authorization_header=(
+                self.request.headers.get('Authorization') if self.request else None
+            ),
         )
-
-        # Retry network exception only once
-        if response.raised_exception and attempt_nr > 1:
-            break
-
+        # The remaining time is taken after the access token was retrieved, which counts towards the deadline.
+        request.timeout = get_remaining_time(self.deadline)
+        self.request = request
+        return request
+
+    def get_retry_delay(self, response: APIResponse) -> float:
+        """
+        Decide whether the failed attempt, whose response is given, is retried.
+        Raises the error of the API call, if it is not retried.
+        :return: Number of seconds to wait before the next attempt
+        """
+        self.response = response
+        status_code = None
         if response.network_response is not None:
-            network_response = response.network_response
-            if network_response.ok:
-                if options.response_format == 'binary':
-                    return FetchResponse(
-                        status=network_response.status_code,
-                        headers=dict(response.network_response.headers),
-                        content=ResponseByteStream(
-                            response.network_response.iter_content(chunk_size=1024)
-                        ),
-                    )
-                else:
-                    return FetchResponse(
-                        status=network_response.status_code,
-                        headers=dict(response.network_response.headers),
-                        data=(
-                            json_to_serialized_data(network_response.text)
-                            if network_response.text
-                            else None
-                        ),
-                        content=io.BytesIO(network_response.content),
-                    )
-
-            if (
-                not (response.reauthentication_needed and options.auth)
-                and network_response.status_code != 429
-                and network_response.status_code < 500
+            status_code = response.network_response.status_code
+            if not (
+                response.reauthentication_needed and self.options.auth
+            ) and not self.retry_policy.is_status_retried(
+                self.request.method, status_code, self.attempt_nr
+            ):
+                raise_on_unsuccessful_request(request=self.request, response=response)
+        else:
+            self.network_error_count += 1
+            if not self.retry_policy.is_network_error_retried(
+                self.request.method, self.network_error_count
             ):
-                __raise_on_unsuccessful_request(request=request, response=response)
+                raise_on_unsuccessful_request(request=self.request, response=response)
+
+        if self.attempt_nr >= self.max_attempts:
+            raise_on_unsuccessful_request(request=self.request, response=response)
+        retry_delay = self.retry_policy.get_retry_delay(
+            attempt_number=self.attempt_nr,
+            status_code=status_code,
+            retry_after_header=response.get_header('Retry-After', None),
+        )
+        if not self.retry_policy.is_retry_within_deadline(self.deadline, retry_delay):
+            raise_on_unsuccessful_request(request=self.request, response=response)
+        self.attempt_nr += 1
+        return retry_delay
 
-        if attempt_nr >= max_attempts:
-            break
 
-        time.sleep(
-            __get_retry_after_time(
-                attempt_number=attempt_nr,
-                retry_after_header=response.get_header('Retry-After', None),
-            )
+def fetch(url: str, options: FetchOptions) -> FetchResponse:
+    if options.network_session:
+        transport = options.network_session.transport or RequestsTransport(
+            options.network_session.requests_session
         )
+        chunk_size = options.network_session.download_chunk_size
+        stream_downloads = options.network_session.stream_downloads
+    else:
+        transport = RequestsTransport(_get_default_requests_session())
+        chunk_size = DEFAULT_DOWNLOAD_CHUNK_SIZE
+        stream_downloads = False
+    attempts = FetchAttempts(url, options)
 
-        attempt_nr += 1
+    while True:
+        request = attempts.prepare_request()
+        response: APIResponse = __make_request(request=request, transport=transport)
+
+        network_response = response.network_response
+        if network_response is not None and network_response.ok:
+            if options.response_format == 'binary':
+                chunks = network_response.iter_content(chunk_size=chunk_size)
+                return FetchResponse(
+                    status=network_response.status_code,
+                    headers=dict(network_response.headers),
+                    content=(
+                        StreamingResponseByteStream(chunks)
+                        if stream_downloads
+                        else ResponseByteStream(chunks)
+                    ),
+                )
+            # The body is read and parsed once. Callers needing the raw body request the binary format.
+            body = network_response.content
+            return FetchResponse(
+                status=network_response.status_code,
+                headers=dict(network_response.headers),
+                data=json_to_serialized_data(body) if body else None,
+            )
 
-    __raise_on_unsuccessful_request(request=request, response=response)
+        time.sleep(attempts.get_retry_delay(response))
 
 
-def __prepare_request(
-    url: str, options: FetchOptions, reauthenticate: bool = False
+def prepare_request(
+    url: str,
+    options: FetchOptions,
+    reauthenticate: bool = False,
+    rejected_authorization_header: Optional[str] = None,
 ) -> APIRequest:
-    headers = __prepare_headers(options, reauthenticate)
+    """
+    Build the request of an API call made with the given options, retrieving the access token of its auth.
+    :param reauthenticate: Whether the token is refreshed first, as the previous attempt was rejected
+    :param rejected_authorization_header: Authorization header of the rejected attempt. The token is only refreshed,
+        if it was not replaced in the meantime
+    """
+    headers = __prepare_headers(options, reauthenticate, rejected_authorization_header)
     params = options.params or {}
     data = __prepare_body(options.content_type, options.file_stream or options.data)
 
@@ -189,12 +282,18 @@ def __prepare_request(
             headers['Content-Type'] = options.content_type
 
     return APIRequest(
-        method=options.method, url=url, headers=headers, params=params, data=data
+        method=options.method,
+        url=url,
+        headers=headers,
+        params=params,
+        data=data,
     )
 
 
 def __prepare_headers(
-    options: FetchOptions, reauthenticate: bool = False
+    options: FetchOptions,
+    reauthenticate: bool = False,
+    rejected_authorization_header: Optional[str] = None,
 ) -> Dict[str, str]:
     headers = {}
     if options.network_session:
@@ -203,7 +302,7 @@ def __prepare_headers(
         headers.update(options.headers)
     if options.auth:
         if reauthenticate:
-            options.auth.refresh_token(network_session=options.network_session)
+            __reauthenticate(options, rejected_authorization_header)
         headers['Authorization'] = options.auth.retrieve_authorization_header(
             network_session=options.network_session
         )
@@ -213,14 +312,38 @@ def __prepare_headers(
     return headers
 
 
+_reauthentication_locks: 'WeakKeyDictionary[Authentication, threading.Lock]' = (
+    WeakKeyDictionary()
+)
+_reauthentication_locks_lock = threading.Lock()
+
+
+def __reauthenticate(
+    options: FetchOptions, rejected_authorization_header: Optional[str] = None
+) -> None:
+    with _reauthentication_locks_lock:
+        lock = _reauthentication_locks.setdefault(options.auth, threading.Lock())
+    with lock:
+        # When many requests are rejected at once, only the first one refreshes the token.
+        # The others find the token already replaced and are retried with the new one.
+        if (
+            rejected_authorization_header is None
+            or options.auth.retrieve_authorization_header(
+                network_session=options.network_session
+            )
+            == rejected_authorization_header
+        ):
+            options.auth.refresh_token(network_session=options.network_session)
+
+
 def __prepare_body(
     content_type: str, data: Union[dict, ByteStream]
-) -> Optional[Union[str, ByteStream]]:
+) -> Optional[Union[str, bytes, ByteStream]]:
     if (
         content_type == 'application/json'
         or content_type == 'application/json-patch+json'
     ):
-        return sd_to_json(data) if data else None
+        return sd_to_json_bytes(data) if data else None
     if content_type == 'application/x-www-form-urlencoded':
         return sd_to_url_params(data)
     if (
@@ -231,20 +354,13 @@ def __prepare_body(
     raise
 
 
-def __make_request(request: APIRequest, session: Session) -> APIResponse:
+def __make_request(request: APIRequest, transport: HTTPTransport) -> APIResponse:
     raised_exception = None
     reauthentication_needed = False
     try:
-        network_response = session.request(
-            method=request.method,
-            url=request.url,
-            headers=request.headers,
-            data=request.data,
-            params=request.params,
-            stream=True,
-        )
+        network_response = transport.send(request)
         reauthentication_needed = network_response.status_code == 401
-    except RequestException as request_exc:
+    except (RequestException, TransportError) as request_exc:
         raised_exception = request_exc
         network_response = None
 
@@ -258,7 +374,10 @@ def __make_request(request: APIRequest, session: Session) -> APIResponse:
     )
 
 
-def __raise_on_unsuccessful_request(request: APIRequest, response: APIResponse) -> None:
+def raise_on_unsuccessful_request(request: APIRequest, response: APIResponse) -> None:
+    """
+    Raise the error of an API call, whose last attempt failed.
+    """
     if response.raised_exception:
         raise BoxSDKError(
             message=str(response.raised_exception), error=response.raised_exception
@@ -293,18 +412,6 @@ def __raise_on_unsuccessful_request(request: APIRequest, response: APIResponse)
     )
 
 
-def __get_retry_after_time(
-    attempt_number: int, retry_after_header: Optional[str] = None
-) -> float:
-    if retry_after_header is not None:
-        try:
-            return int(retry_after_header)
-        except (ValueError, TypeError):
-            pass
-    min_randomization = 1 - _RETRY_RANDOMIZATION_FACTOR
-    max_randomization = 1 + _RETRY_RANDOMIZATION_FACTOR
-    randomization = (
-        random.uniform(0, 1) * (max_randomization - min_randomization)
-    ) + min_randomization
-    exponential = math.pow(2, attempt_number)
-    return exponential * _RETRY_BASE_INTERVAL * randomization
+# The helpers shared with fetch_async() used to be private, and are still importable under their former names.
+__prepare_request = prepare_request
+__raise_on_unsuccessful_request = raise_on_unsuccessful_request
@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import weakref
+from typing import AsyncIterator, Awaitable, Iterator, TypeVar
+
+from requests.utils import super_len
+from requests_toolbelt import MultipartEncoder
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .connection_pool import ConnectionPoolConfig
+from .fetch import APIRequest
+from .transport import HTTPTransport, TransportError, TransportResponse
+from ..box.errors import BoxSDKError
+
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+T = TypeVar('T')
+
+
+def httpx_transport_options(connection_pool_config: ConnectionPoolConfig) -> dict:
+    """
+    Arguments of the httpx transports, which size their connection pool like the one of a NetworkSession.
+    """
+    max_connections = (
+        connection_pool_config.pool_connections * connection_pool_config.pool_maxsize
+    )
+    limits = httpx.Limits(
+        # Like requests, a non-blocking pool opens extra connections when it is exhausted
+        # and only limits the number of connections kept alive.
+        max_connections=max_connections if connection_pool_config.pool_block else None,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=connection_pool_config.idle_timeout,
+    )
+    return {
+        'limits': limits,
+        'socket_options': connection_pool_config.socket_options(),
+        'http2': connection_pool_config.http2,
+    }
+
+
+def build_httpx_request(
+    http_client: 'httpx.AsyncClient', request: APIRequest
+) -> 'httpx.Request':
+    """
+    Build the httpx request of a request prepared by fetch(), used by HttpxTransport and fetch_async().
+    """
+    headers = dict(request.headers)
+    content = request.data
+    if content is not None and not isinstance(content, (str, bytes)):
+        # httpx only streams asynchronous bodies, so file streams and multipart bodies are read in chunks.
+        # The length is sent upfront, as the API does not accept chunked uploads.
+        headers['Content-Length'] = str(
+            content.len if isinstance(content, MultipartEncoder) else super_len(content)
+        )
+        content = _iterate_body(content)
+    return http_client.build_request(
+        method=request.method,
+        url=request.url,
+        headers=headers,
+        params=request.params,
+        content=content,
+        timeout=request.timeout,
+    )
+
+
+def create_httpx_transport(transport_class: type, **options):
+    if options.get('http2'):
+        # httpx would import h2 only when the first HTTP/2 connection is made
+        try:
+            import h2
+        except ImportError:
+            raise BoxSDKError(
+                message='HTTP/2 requires the h2 package. Install it with `pip install box-sdk-gen[http2]`.'
+            )
+    return transport_class(**options)
+
+
+class HttpxTransport(HTTPTransport):
+    def __init__(
+        self, connection_pool_config: ConnectionPoolConfig = None, **transport_options
+    ):
+        """
+        Transport sending requests with httpx. With http2 enabled in the connection pool config, requests
+        to servers supporting HTTP/2 are multiplexed over a few connections instead of using one connection each.
+        It is used by NetworkSession, when its connection pool config enables http2.
+        Requests of all threads are sent by an event loop running in a background thread until close() is called,
+        as the connections of the synchronous httpx client cannot be shared by threads over HTTP/2.
+        :param connection_pool_config: Sizing and keep-alive settings of the pool of connections
+        :param transport_options: Further arguments of httpx.AsyncHTTPTransport, e.g. verify or proxy
+        """
+        if httpx is None:
+            raise BoxSDKError(
+                message='HttpxTransport requires httpx. Install it with `pip install box-sdk-gen[http2]`.'
+            )
+        if connection_pool_config is None:
+            connection_pool_config = ConnectionPoolConfig()
+        self.client = httpx.AsyncClient(
+            transport=create_httpx_transport(
+                httpx.AsyncHTTPTransport,
+                **{
+                    **httpx_transport_options(connection_pool_config),
+                    **transport_options,
+                },
+            ),
+            timeout=None,
+        )
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=_run_loop,
+            args=(self._loop, self.client),
+            name='box-sdk-httpx',
+            daemon=True,
+        )
+        self._thread.start()
+        # The loop is stopped, and so the client and the loop are closed, also if the transport
+        # is garbage collected without being closed
+        self._finalizer = weakref.finalize(
+            self, self._loop.call_soon_threadsafe, self._loop.stop
+        )
+
+    def _run(self, coroutine: Awaitable[T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def send(self, request: APIRequest) -> TransportResponse:
+        try:
+            response = self._run(self._send(build_httpx_request(self.client, request)))
+        except httpx.TransportError as error:
+            raise TransportError(str(error)) from error
+        if response.is_stream_consumed:
+            return TransportResponse(
+                response.status_code, response.headers, response.content
+            )
+        return TransportResponse(
+            response.status_code,
+            response.headers,
+            chunks=self._iterate_response(response),
+            close=lambda: self._run(response.aclose()),
+        )
+
+    async def _send(self, request: 'httpx.Request') -> 'httpx.Response':
+        response = await self.client.send(request, stream=True)
+        if not response.is_success:
+            # Error responses are short. Reading them right away releases the stream,
+            # also when the request is retried without reading the body.
+            await response.aread()
+        return response
+
+    def _iterate_response(self, response: 'httpx.Response') -> Iterator[bytes]:
+        chunks = response.aiter_bytes()
+        while True:
+            try:
+                yield self._run(chunks.__anext__())
+            except StopAsyncIteration:
+                return
+            except httpx.TransportError as error:
+                # Like the errors of send(), so that dropped downloads can be resumed
+                raise TransportError(str(error)) from error
+
+    def close(self) -> None:
+        if self._finalizer.alive:
+            self._finalizer()
+            self._thread.join()
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop, client: 'httpx.AsyncClient') -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+        # The loop was stopped by closing the transport
+        loop.run_until_complete(client.aclose())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+async def _iterate_body(body) -> AsyncIterator[bytes]:
+    # Reading a file stream blocks, so it is read in a thread instead of on the event loop.
+    loop = asyncio.get_running_loop()
+    chunk = await loop.run_in_executor(None, body.read, _UPLOAD_CHUNK_SIZE)
+    while chunk:
+        yield chunk
+        chunk = await loop.run_in_executor(None, body.read, _UPLOAD_CHUNK_SIZE)
@@ -1,21 +1,132 @@
+import asyncio
+import copy
 import requests
-from typing import Dict
+import threading
+from weakref import WeakKeyDictionary
+from typing import Dict, Optional
 from .base_urls import BaseUrls
+from .connection_pool import ConnectionPoolConfig, PooledHTTPAdapter
+from .retries import DEFAULT_MAX_ATTEMPTS, RetryPolicy
+from .transport import HTTPTransport
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 class NetworkSession:
-    MAX_ATTEMPTS = 5
+    # Maximum number of attempts of an API call, used unless the retry policy sets max_attempts.
+    # It can be changed for a session, or for all sessions on the class.
+    MAX_ATTEMPTS = DEFAULT_MAX_ATTEMPTS
 
     def __init__(
-        self, additional_headers: Dict[str, str] = None, base_urls: BaseUrls = None
+        self,
+        additional_headers: Dict[str, str] = None,
+        base_urls: BaseUrls = None,
+        *,
+        download_chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        stream_downloads: bool = False,
+        connection_pool_config: ConnectionPoolConfig = None,
+        transport: HTTPTransport = None,
+        retry_policy: RetryPolicy = None,
+        lazy_deserialization: bool = False,
     ):
+        """
+        :param additional_headers: Dict of headers, which are appended to each API request
+        :param base_urls: Base urls, which are used for each API call
+        :param download_chunk_size: Size in bytes of the chunks in which binary responses are read from the network
+        :param stream_downloads: If True, binary responses are returned as forward-only streams, which keep
+            at most one chunk in memory instead of buffering everything that was read
+        :param connection_pool_config: Sizing and keep-alive settings of the pool of connections
+            reused by all API calls made with this session
+        :param transport: Transport sending the requests of the synchronous client. If None, requests are sent
+            with requests_session, or with HttpxTransport, if the connection pool config enables http2
+        :param retry_policy: Policy deciding which failed API calls are retried and how long to wait between attempts.
+            If None, RetryPolicy() is used
+        :param lazy_deserialization: If True, fields of responses containing other schema objects, e.g. `entries`
+            of `Items`, are deserialized on first access instead of when the response is received
+        """
         if additional_headers is None:
             additional_headers = {}
         if base_urls is None:
             base_urls = BaseUrls()
+        if connection_pool_config is None:
+            connection_pool_config = ConnectionPoolConfig()
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
         self.requests_session = requests.Session()
+        adapter = PooledHTTPAdapter(connection_pool_config)
+        self.requests_session.mount('https://', adapter)
+        self.requests_session.mount('http://', adapter)
         self.additional_headers = additional_headers
         self.base_urls = base_urls
+        self.download_chunk_size = download_chunk_size
+        self.stream_downloads = stream_downloads
+        if transport is None and connection_pool_config.http2:
+            from .httpx_transport import HttpxTransport
+
+            transport = HttpxTransport(connection_pool_config)
+        self.connection_pool_config = connection_pool_config
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.lazy_deserialization = lazy_deserialization
+        # Asynchronous HTTP clients by the event loop they are used on, as they cannot be shared by loops
+        self._async_http_clients: (
+            'WeakKeyDictionary[asyncio.AbstractEventLoop, object]'
+        ) = WeakKeyDictionary()
+        self._async_http_clients_lock = threading.Lock()
+        # Session, whose connection pools are shared by this session, if it was derived from another one
+        self._parent: Optional['NetworkSession'] = None
+
+    @property
+    def async_http_client(self):
+        """
+        Asynchronous HTTP client used by the async client on the running event loop, created on first use on each loop
+        with the same connection pool settings. Its connections are bound to the loop, so every loop gets its own client.
+        """
+        if self._parent is not None:
+            return self._parent.async_http_client
+        loop = asyncio.get_running_loop()
+        async_http_client = self._async_http_clients.get(loop)
+        if async_http_client is None:
+            from .async_fetch import create_async_http_client
+
+            with self._async_http_clients_lock:
+                # Clients of closed loops cannot be used anymore, but may keep their loop alive through their connections
+                for closed_loop in [
+                    other_loop
+                    for other_loop in self._async_http_clients
+                    if other_loop.is_closed()
+                ]:
+                    del self._async_http_clients[closed_loop]
+                async_http_client = self._async_http_clients.get(loop)
+                if async_http_client is None:
+                    async_http_client = self._async_http_clients[loop] = (
+                        create_async_http_client(self.connection_pool_config)
+                    )
+        return async_http_client
+
+    async def aclose(self) -> None:
+        """
+        Close the connections opened by the asynchronous HTTP client of this session on the running event loop,
+        if it was created. Sessions derived with the with_* methods share the connections of the session they were
+        derived from, so closing them closes nothing.
+        """
+        async_http_client = self._async_http_clients.pop(
+            asyncio.get_running_loop(), None
+        )
+        if async_http_client is not None:
+            await async_http_client.aclose()
+
+    def close(self) -> None:
+        """
+        Close the connections opened by the transport and the requests session of this session, and stop
+        the background thread of HttpxTransport. Sessions derived with the with_* methods share the connections
+        of the session they were derived from, so closing them closes nothing.
+        """
+        if self._parent is not None:
+            return
+        if self.transport is not None:
+            self.transport.close()
+        self.requests_session.close()
 
     def with_additional_headers(
         self, additional_headers: Dict[str, str] = None
@@ -23,18 +134,50 @@ class NetworkSession:
         """
         Generate a fresh network session by duplicating the existing configuration and network parameters,
         while also including additional headers to be attached to every API call.
+        The new session shares the connection pools of this session.
         :param additional_headers: Dict of headers, which are appended to each API request
         :return: a new instance of NetworkSession
         """
-        return NetworkSession(
-            {**self.additional_headers, **additional_headers}, self.base_urls
+        return self._derive(
+            additional_headers={**self.additional_headers, **additional_headers}
         )
 
     def with_custom_base_urls(self, base_urls: BaseUrls) -> 'NetworkSession':
         """
         Generate a fresh network session by duplicating the existing configuration and network parameters,
         while also including additional base urls to be used for each API call.
+        The new session shares the connection pools of this session.
         :param base_urls: Dict of base urls, which are appended to each API request
         :return: a new instance of NetworkSession
         """
-        return NetworkSession(self.additional_headers, base_urls)
+        return self._derive(base_urls=base_urls)
+
+    def with_retry_policy(self, retry_policy: RetryPolicy) -> 'NetworkSession':
+        """
+        Generate a fresh network session by duplicating the existing configuration and network parameters,
+        while also using another retry policy for each API call.
+        The new session shares the connection pools of this session.
+        :param retry_policy: Policy deciding which failed API calls are retried and how long to wait between attempts
+        :return: a new instance of NetworkSession
+        """
+        return self._derive(retry_policy=retry_policy)
+
+    def with_stream_downloads(self, stream_downloads: bool = True) -> 'NetworkSession':
+        """
+        Generate a fresh network session by duplicating the existing configuration and network parameters,
+        while also returning binary responses as forward-only streams or buffering them.
+        The new session shares the connection pools of this session.
+        :param stream_downloads: If True, binary responses are returned as forward-only streams, which keep
+            at most one chunk in memory instead of buffering everything that was read
+        :return: a new instance of NetworkSession
+        """
+        return self._derive(stream_downloads=stream_downloads)
+
+    def _derive(self, **changes) -> 'NetworkSession':
+        # A shallow copy keeps the requests session, and so its pool of warm connections, and any other
+        # attributes set on this session, e.g. the retry policy.
+        network_session = copy.copy(self)
+        network_session.__dict__.update(changes)
+        network_session._async_http_clients = WeakKeyDictionary()
+        network_session._parent = self._parent or self
+        return network_session
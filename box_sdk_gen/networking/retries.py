@@ -0,0 +1,207 @@
+import random
+import time
+from enum import Enum
+from typing import Dict, Optional, Union
+
+from ..box.errors import BoxSDKError
+
+DEFAULT_MAX_ATTEMPTS = 5
+
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'))
+
+
+class RetryJitter(str, Enum):
+    NONE = 'none'
+    FULL = 'full'
+    EQUAL = 'equal'
+    PROPORTIONAL = 'proportional'
+
+
+class StatusRetryRule:
+    def __init__(
+        self,
+        *,
+        retry: bool = True,
+        max_attempts: Optional[int] = None,
+        respect_retry_after: bool = True,
+        retry_non_idempotent: Optional[bool] = None,
+    ):
+        """
+        :param retry: Whether requests failing with the status code are retried
+        :param max_attempts: Maximum number of attempts of requests failing with the status code.
+            If None, max_attempts of the policy applies
+        :param respect_retry_after: Whether the delay requested by the Retry-After header of the response
+            is waited instead of the backoff of the policy
+        :param retry_non_idempotent: Whether requests made with methods other than GET, HEAD, OPTIONS, PUT,
+            DELETE and TRACE, e.g. POST, are retried. If None, retry_non_idempotent_methods of the policy applies
+        """
+        self.retry = retry
+        self.max_attempts = max_attempts
+        self.respect_retry_after = respect_retry_after
+        self.retry_non_idempotent = retry_non_idempotent
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        *,
+        max_attempts: Optional[int] = None,
+        base_backoff: float = 2,
+        max_backoff: Optional[float] = None,
+        jitter: RetryJitter = RetryJitter.PROPORTIONAL,
+        status_rules: Dict[Union[int, str], StatusRetryRule] = None,
+        retry_non_idempotent_methods: bool = True,
+        network_error_retries: int = 1,
+        deadline: Optional[float] = None,
+        min_attempt_time: float = 1,
+    ):
+        """
+        Decides which failed API calls are retried and how long fetch() waits before the next attempt.
+        :param max_attempts: Maximum number of attempts of a request, including the first one.
+            If None, MAX_ATTEMPTS of the network session applies, which is 5 by default
+        :param base_backoff: Seconds waited before the first retry. The backoff doubles with every further retry
+        :param max_backoff: Maximum number of seconds waited between attempts, unless the response requests
+            a longer delay with the Retry-After header. If None, the backoff is not capped
+        :param jitter: How the backoff is randomized, so that clients failing at once do not retry at once:
+            NONE waits the backoff, FULL a random delay up to it, EQUAL at least half of it
+            and PROPORTIONAL between half and one and a half of it
+        :param status_rules: How responses are retried, keyed by status code, e.g. 503, or class of status codes,
+            e.g. '5XX'. Rules for status codes take precedence over rules for their class. Responses with other
+            unsuccessful status codes are not retried. By default responses with status 429 and 5XX are retried
+        :param retry_non_idempotent_methods: Whether requests made with methods other than GET, HEAD, OPTIONS,
+            PUT, DELETE and TRACE, e.g. POST, are retried after server errors and network errors, which could
+            have happened after the request was processed. Rules can override it per status code. Requests
+            rejected with status 429 are retried by default regardless, as they were not processed
+        :param network_error_retries: Maximum number of retries of a request failing with network errors,
+            e.g. a refused connection or a timeout
+        :param deadline: Maximum number of seconds spent on a request across all attempts and the delays
+            between them, including the time spent retrieving the access token. Requests are sent with a timeout
+            of the remaining time, and a request is not retried, when less than min_attempt_time would be left
+            after the delay before the next attempt. The timeout bounds connecting and every single read
+            from the connection, not the whole response, so a response arriving slowly in many pieces,
+            or a streamed download read later, can take longer. If None, there is no deadline
+        :param min_attempt_time: Minimum number of seconds, which must be left until the deadline for a request
+            to be retried. Attempts with less time left are unlikely to succeed before they time out
+        """
+        if status_rules is None:
+            status_rules = {
+                429: StatusRetryRule(retry_non_idempotent=True),
+                '5XX': StatusRetryRule(),
+            }
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_rules = status_rules
+        self.retry_non_idempotent_methods = retry_non_idempotent_methods
+        self.network_error_retries = network_error_retries
+        self.deadline = deadline
+        self.min_attempt_time = min_attempt_time
+
+    def get_status_rule(self, status_code: int) -> Optional[StatusRetryRule]:
+        rule = self.status_rules.get(status_code)
+        if rule is None:
+            rule = self.status_rules.get(f'{status_code // 100}XX')
+        return rule
+
+    def is_status_retried(
+        self, method: str, status_code: int, attempt_number: int
+    ) -> bool:
+        """
+        Whether a request, whose attempt with the given number failed with the status code, is retried.
+        """
+        rule = self.get_status_rule(status_code)
+        if rule is None or not rule.retry:
+            return False
+        if rule.max_attempts is not None and attempt_number >= rule.max_attempts:
+            return False
+        retry_non_idempotent = (
+            self.retry_non_idempotent_methods
+            if rule.retry_non_idempotent is None
+            else rule.retry_non_idempotent
+        )
+        return retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS
+
+    def is_network_error_retried(self, method: str, network_error_count: int) -> bool:
+        """
+        Whether a request, which failed with the given number of network errors so far, is retried.
+        """
+        if network_error_count > self.network_error_retries:
+            return False
+        return self.retry_non_idempotent_methods or method.upper() in IDEMPOTENT_METHODS
+
+    def get_backoff(self, attempt_number: int) -> float:
+        """
+        Seconds waited after the failed attempt with the given number, starting with 1.
+        """
+        backoff = self.base_backoff * 2 ** (attempt_number - 1)
+        if self.max_backoff is not None:
+            backoff = min(backoff, self.max_backoff)
+        if self.jitter == RetryJitter.FULL:
+            backoff = random.uniform(0, backoff)
+        elif self.jitter == RetryJitter.EQUAL:
+            backoff = backoff / 2 + random.uniform(0, backoff / 2)
+        elif self.jitter == RetryJitter.PROPORTIONAL:
+            backoff = backoff * random.uniform(0.5, 1.5)
+        if self.max_backoff is not None:
+            backoff = min(backoff, self.max_backoff)
+        return backoff
+
+    def get_retry_delay(
+        self,
+        attempt_number: int,
+        status_code: Optional[int] = None,
+        retry_after_header: Optional[str] = None,
+    ) -> float:
+        """
+        Seconds waited after the failed attempt with the given number, starting with 1, before the next one.
+        :param status_code: Status code of the response, if one was received
+        :param retry_after_header: Value of the Retry-After header of the response
+        """
+        rule = self.get_status_rule(status_code) if status_code is not None else None
+        if retry_after_header is not None and (
+            rule is None or rule.respect_retry_after
+        ):
+            try:
+                return float(retry_after_header)
+            except (ValueError, TypeError):
+                pass
+        return self.get_backoff(attempt_number)
+
+    def get_max_attempts(self, default: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        """
+        Maximum number of attempts of a request, or the given default, if the policy does not limit it.
+        """
+        return self.max_attempts if self.max_attempts is not None else default
+
+    def is_retry_within_deadline(
+        self, deadline: Optional[float], retry_delay: float
+    ) -> bool:
+        """
+        Whether enough time is left until the deadline to make another attempt after the delay.
+        """
+        return (
+            deadline is None
+            or time.monotonic() + retry_delay + self.min_attempt_time <= deadline
+        )
+
+    def get_deadline(self) -> Optional[float]:
+        """
+        Time of time.monotonic(), until which a request started now may be retried.
+        """
+        if self.deadline is None:
+            return None
+        return time.monotonic() + self.deadline
+
+
+def get_remaining_time(deadline: Optional[float]) -> Optional[float]:
+    """
+    Seconds left until the deadline, used as the timeout of the next attempt.
+    Raises BoxSDKError, if the deadline has passed, e.g. while the access token was retrieved.
+    """
+    if deadline is None:
+        return None
+    remaining_time = deadline - time.monotonic()
+    if remaining_time <= 0:
+        raise BoxSDKError(message='Deadline of the retry policy was exceeded.')
+    return remaining_time
@@ -0,0 +1,171 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, Optional, Union
+
+from requests import Response, Session
+from requests.structures import CaseInsensitiveDict
+
+from ..serialization.json.json_data import SerializedData, json_to_serialized_data
+
+if TYPE_CHECKING:
+    from .fetch import APIRequest
+
+
+class TransportError(Exception):
+    """
+    Network failure of a transport, e.g. a refused connection or a timeout.
+    Requests failing with it are retried by fetch() like requests failing with a requests exception.
+    """
+
+
+class TransportResponse:
+    def __init__(
+        self,
+        status_code: int,
+        headers: Dict[str, str] = None,
+        content: Optional[bytes] = None,
+        *,
+        chunks: Optional[Iterable[bytes]] = None,
+        close: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Response returned by a transport. It provides the part of the interface of requests.Response,
+        which is used by fetch().
+        :param status_code: HTTP status code of the response
+        :param headers: Headers of the response, which are looked up case-insensitively
+        :param content: The whole body of the response
+        :param chunks: Iterable over the body of the response, read as it is consumed, used instead of content
+            to stream downloads
+        :param close: Function releasing the connection of a streamed response, called once the body was read
+        """
+        if headers is None:
+            headers = {}
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self._content = content
+        self._chunks = chunks
+        self._close = close
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = b''.join(self._chunks or ())
+            self.close()
+        return self._content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> SerializedData:
+        return json_to_serialized_data(self.content)
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        if self._content is not None:
+            for start in range(0, len(self._content), chunk_size):
+                yield self._content[start : start + chunk_size]
+            return
+        try:
+            # Full chunks are copied out of the buffer through a memoryview and the consumed bytes are dropped
+            # once per received chunk, so that the rest of the buffer is not copied for every chunk yielded.
+            buffer = bytearray()
+            for chunk in self._chunks or ():
+                if not buffer and len(chunk) == chunk_size:
+                    yield chunk
+                    continue
+                buffer += chunk
+                if len(buffer) < chunk_size:
+                    continue
+                offset = 0
+                with memoryview(buffer) as view:
+                    while len(buffer) - offset >= chunk_size:
+                        yield bytes(view[offset : offset + chunk_size])
+                        offset += chunk_size
+                del buffer[:offset]
+            if buffer:
+                yield bytes(buffer)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+
+class HTTPTransport(ABC):
+    """
+    Sends the requests built by fetch() over the network. Subclass it to plug in another HTTP library
+    with the transport parameter of NetworkSession. Authentication, retries and error handling stay in fetch().
+    """
+
+    @abstractmethod
+    def send(self, request: 'APIRequest') -> Union[TransportResponse, Response]:
+        """
+        Send a request and return its response, without raising on unsuccessful status codes.
+        The body of the response should not be read before it is accessed, so that downloads can be streamed.
+        Network failures are raised as TransportError.
+        :param request: Request with the method, url, query parameters and headers to send. Its data is None,
+            bytes, or a file-like object to read the body from, e.g. the MultipartEncoder of multipart requests,
+            whose len attribute is the length of the body. Its timeout, if not None, is the number of seconds
+            left until the deadline of the retry policy, which should bound connecting and every read from the connection
+        """
+
+    def close(self) -> None:
+        """
+        Close the connections opened by the transport.
+        """
+
+
+class RequestsTransport(HTTPTransport):
+    def __init__(self, session: Session):
+        """
+        Transport sending requests with a requests session, used when no other transport is configured.
+        :param session: Session, whose connection pools are used
+        """
+        self.session = session
+
+    def send(self, request: 'APIRequest') -> Response:
+        # requests.Response provides the interface of TransportResponse. Exceptions of requests
+        # are not converted to TransportError, as they are exposed by BoxSDKError.error.
+        return self.session.request(
+            method=request.method,
+            url=request.url,
+            headers=request.headers,
+            data=request.data,
+            params=request.params,
+            stream=True,
+            timeout=request.timeout,
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class InMemoryTransport(HTTPTransport):
+    def __init__(self, handler: Callable[['APIRequest', bytes], TransportResponse]):
+        """
+        Transport passing requests to a function instead of sending them, e.g. to test code using the SDK
+        or to load test it without a server.
+        :param handler: Function called with each request and its body read to bytes, returning the response
+        """
+        self.handler = handler
+
+    def send(self, request: 'APIRequest') -> TransportResponse:
+        return self.handler(request, read_request_body(request.data))
+
+
+def read_request_body(data) -> bytes:
+    """
+    Read the body of a request built by fetch() to bytes.
+    """
+    if data is None:
+        return b''
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    return data.read()
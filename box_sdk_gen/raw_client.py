@@ -0,0 +1,62 @@
+import functools
+from typing import Any, Callable
+
+from box_sdk_gen.internal.endpoints import get_endpoint, is_manager, list_endpoints
+
+from box_sdk_gen.internal.utils import ByteStream
+
+from box_sdk_gen.networking.fetch import fetch
+
+
+class RawManager:
+    """
+    View of a manager of BoxClient, whose endpoint methods take the same parameters, but return
+    the parsed JSON of responses as dicts and lists instead of schema objects. The request is built
+    by the same _<name>_request method of the manager, which the endpoint method passes to fetch().
+    """
+
+    def __init__(self, manager: Any):
+        self._manager = manager
+
+    def __getattr__(self, name: str) -> Callable:
+        endpoint = get_endpoint(self._manager, name)
+        manager = self._manager
+
+        @functools.wraps(getattr(type(manager), name))
+        def raw_method(*args, **kwargs):
+            url, options = endpoint.build_request(manager, *args, **kwargs)
+            response = fetch(url, options)
+            if endpoint.returns_nothing:
+                return None
+            if endpoint.return_type is ByteStream:
+                return response.content
+            return response.data
+
+        setattr(self, name, raw_method)
+        return raw_method
+
+    def __dir__(self):
+        return list_endpoints(self._manager)
+
+
+class RawBoxClient:
+    """
+    View of BoxClient, whose managers return the parsed JSON of responses instead of schema objects,
+    e.g. `client.with_raw_responses().files.get_file_by_id(file_id)` returns a dict.
+    Skipping the construction of schema objects saves time and memory, when only a few fields are used.
+    """
+
+    def __init__(self, client: Any):
+        self._client = client
+        self.auth = client.auth
+        self.network_session = client.network_session
+
+    def __getattr__(self, name: str) -> RawManager:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        manager = getattr(self._client, name)
+        if not is_manager(manager):
+            raise AttributeError(f'RawBoxClient has no manager {name}')
+        raw_manager = RawManager(manager)
+        setattr(self, name, raw_manager)
+        return raw_manager
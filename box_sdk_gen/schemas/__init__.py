@@ -1,405 +1,216 @@
-from box_sdk_gen.schemas.ai_ask import *
-
-from box_sdk_gen.schemas.ai_text_gen import *
-
-from box_sdk_gen.schemas.post_o_auth_2_token import *
-
-from box_sdk_gen.schemas.post_o_auth_2_token_refresh_access_token import *
-
-from box_sdk_gen.schemas.post_o_auth_2_revoke import *
-
-from box_sdk_gen.schemas.zip_download_request import *
-
-from box_sdk_gen.schemas.metadata_query import *
-
-from box_sdk_gen.schemas.file_request_update_request import *
-
-from box_sdk_gen.schemas.file_request_copy_request import *
-
-from box_sdk_gen.schemas.client_error import *
-
-from box_sdk_gen.schemas.o_auth_2_error import *
-
-from box_sdk_gen.schemas.ai_response import *
-
-from box_sdk_gen.schemas.classification import *
-
-from box_sdk_gen.schemas.classification_template import *
-
-from box_sdk_gen.schemas.collaboration_allowlist_entry import *
-
-from box_sdk_gen.schemas.collaboration_allowlist_entries import *
-
-from box_sdk_gen.schemas.collection import *
-
-from box_sdk_gen.schemas.collections import *
-
-from box_sdk_gen.schemas.comment_base import *
-
-from box_sdk_gen.schemas.email_alias import *
-
-from box_sdk_gen.schemas.email_aliases import *
-
-from box_sdk_gen.schemas.enterprise_base import *
-
-from box_sdk_gen.schemas.file_base import *
-
-from box_sdk_gen.schemas.file_version_base import *
-
-from box_sdk_gen.schemas.file_version_mini import *
-
-from box_sdk_gen.schemas.file_mini import *
-
-from box_sdk_gen.schemas.files_on_hold import *
-
-from box_sdk_gen.schemas.files_under_retention import *
-
-from box_sdk_gen.schemas.file_conflict import *
-
-from box_sdk_gen.schemas.conflict_error import *
-
-from box_sdk_gen.schemas.folder_base import *
-
-from box_sdk_gen.schemas.folder_mini import *
-
-from box_sdk_gen.schemas.file_or_folder_scope import *
-
-from box_sdk_gen.schemas.access_token import *
-
-from box_sdk_gen.schemas.generic_source import *
-
-from box_sdk_gen.schemas.integration_mapping_base import *
-
-from box_sdk_gen.schemas.integration_mapping_mini import *
-
-from box_sdk_gen.schemas.group_base import *
-
-from box_sdk_gen.schemas.group_mini import *
-
-from box_sdk_gen.schemas.group import *
-
-from box_sdk_gen.schemas.group_full import *
-
-from box_sdk_gen.schemas.groups import *
-
-from box_sdk_gen.schemas.legal_hold_policy_mini import *
-
-from box_sdk_gen.schemas.legal_hold_policy_assignment_base import *
-
-from box_sdk_gen.schemas.metadata_base import *
-
-from box_sdk_gen.schemas.metadata import *
-
-from box_sdk_gen.schemas.metadatas import *
-
-from box_sdk_gen.schemas.metadata_full import *
-
-from box_sdk_gen.schemas.metadata_cascade_policy import *
-
-from box_sdk_gen.schemas.metadata_cascade_policies import *
-
-from box_sdk_gen.schemas.metadata_query_index import *
-
-from box_sdk_gen.schemas.metadata_template import *
-
-from box_sdk_gen.schemas.metadata_templates import *
-
-from box_sdk_gen.schemas.realtime_server import *
-
-from box_sdk_gen.schemas.realtime_servers import *
-
-from box_sdk_gen.schemas.retention_policy_base import *
-
-from box_sdk_gen.schemas.retention_policy_mini import *
-
-from box_sdk_gen.schemas.file_version_retention import *
-
-from box_sdk_gen.schemas.file_version_retentions import *
-
-from box_sdk_gen.schemas.retention_policy_assignment_base import *
-
-from box_sdk_gen.schemas.shield_information_barrier_base import *
-
-from box_sdk_gen.schemas.shield_information_barrier_reference import *
-
-from box_sdk_gen.schemas.shield_information_barrier_report_base import *
-
-from box_sdk_gen.schemas.shield_information_barrier_segment_member_base import *
-
-from box_sdk_gen.schemas.shield_information_barrier_segment_restriction_base import *
-
-from box_sdk_gen.schemas.shield_information_barrier_segment_restriction_mini import *
-
-from box_sdk_gen.schemas.session_termination_message import *
-
-from box_sdk_gen.schemas.storage_policy_mini import *
-
-from box_sdk_gen.schemas.storage_policy_assignment import *
-
-from box_sdk_gen.schemas.storage_policy_assignments import *
-
-from box_sdk_gen.schemas.storage_policy import *
-
-from box_sdk_gen.schemas.storage_policies import *
-
-from box_sdk_gen.schemas.terms_of_service_base import *
-
-from box_sdk_gen.schemas.terms_of_service import *
-
-from box_sdk_gen.schemas.terms_of_services import *
-
-from box_sdk_gen.schemas.upload_part_mini import *
-
-from box_sdk_gen.schemas.upload_part import *
-
-from box_sdk_gen.schemas.upload_parts import *
-
-from box_sdk_gen.schemas.uploaded_part import *
-
-from box_sdk_gen.schemas.upload_session import *
-
-from box_sdk_gen.schemas.upload_url import *
-
-from box_sdk_gen.schemas.user_avatar import *
-
-from box_sdk_gen.schemas.user_base import *
-
-from box_sdk_gen.schemas.user_integration_mappings import *
-
-from box_sdk_gen.schemas.user_collaborations import *
-
-from box_sdk_gen.schemas.user_mini import *
-
-from box_sdk_gen.schemas.app_item_event_source import *
-
-from box_sdk_gen.schemas.event_source import *
-
-from box_sdk_gen.schemas.user import *
-
-from box_sdk_gen.schemas.trash_web_link_restored import *
-
-from box_sdk_gen.schemas.trash_folder_restored import *
-
-from box_sdk_gen.schemas.trash_file_restored import *
-
-from box_sdk_gen.schemas.trash_web_link import *
-
-from box_sdk_gen.schemas.trash_folder import *
-
-from box_sdk_gen.schemas.trash_file import *
-
-from box_sdk_gen.schemas.terms_of_service_user_status import *
-
-from box_sdk_gen.schemas.terms_of_service_user_statuses import *
-
-from box_sdk_gen.schemas.task_assignment import *
-
-from box_sdk_gen.schemas.task_assignments import *
-
-from box_sdk_gen.schemas.task import *
-
-from box_sdk_gen.schemas.tasks import *
-
-from box_sdk_gen.schemas.retention_policy_assignment import *
-
-from box_sdk_gen.schemas.retention_policy_assignments import *
-
-from box_sdk_gen.schemas.retention_policy import *
-
-from box_sdk_gen.schemas.retention_policies import *
-
-from box_sdk_gen.schemas.legal_hold_policy import *
-
-from box_sdk_gen.schemas.legal_hold_policies import *
-
-from box_sdk_gen.schemas.invite import *
-
-from box_sdk_gen.schemas.group_membership import *
-
-from box_sdk_gen.schemas.group_memberships import *
-
-from box_sdk_gen.schemas.file_version import *
-
-from box_sdk_gen.schemas.file_version_full import *
-
-from box_sdk_gen.schemas.file_versions import *
-
-from box_sdk_gen.schemas.file_request import *
-
-from box_sdk_gen.schemas.file import *
-
-from box_sdk_gen.schemas.file_full import *
-
-from box_sdk_gen.schemas.files import *
-
-from box_sdk_gen.schemas.device_pinner import *
-
-from box_sdk_gen.schemas.device_pinners import *
-
-from box_sdk_gen.schemas.comment import *
-
-from box_sdk_gen.schemas.comment_full import *
-
-from box_sdk_gen.schemas.comments import *
-
-from box_sdk_gen.schemas.collaboration_allowlist_exempt_target import *
-
-from box_sdk_gen.schemas.collaboration_allowlist_exempt_targets import *
-
-from box_sdk_gen.schemas.shield_information_barrier_segment_restriction import *
-
-from box_sdk_gen.schemas.shield_information_barrier_segment_restrictions import *
-
-from box_sdk_gen.schemas.shield_information_barrier_segment_member_mini import *
-
-from box_sdk_gen.schemas.shield_information_barrier_segment_member import *
-
-from box_sdk_gen.schemas.shield_information_barrier_segment_members import *
-
-from box_sdk_gen.schemas.shield_information_barrier_segment import *
-
-from box_sdk_gen.schemas.shield_information_barrier_segments import *
-
-from box_sdk_gen.schemas.shield_information_barrier import *
-
-from box_sdk_gen.schemas.shield_information_barriers import *
-
-from box_sdk_gen.schemas.folder_lock import *
-
-from box_sdk_gen.schemas.folder_locks import *
-
-from box_sdk_gen.schemas.watermark import *
-
-from box_sdk_gen.schemas.webhook_mini import *
-
-from box_sdk_gen.schemas.webhooks import *
-
-from box_sdk_gen.schemas.webhook import *
-
-from box_sdk_gen.schemas.web_link_base import *
-
-from box_sdk_gen.schemas.web_link_mini import *
-
-from box_sdk_gen.schemas.web_link import *
-
-from box_sdk_gen.schemas.items import *
-
-from box_sdk_gen.schemas.folder import *
-
-from box_sdk_gen.schemas.metadata_query_results import *
-
-from box_sdk_gen.schemas.legal_hold_policy_assignment import *
-
-from box_sdk_gen.schemas.legal_hold_policy_assignments import *
-
-from box_sdk_gen.schemas.file_version_legal_hold import *
-
-from box_sdk_gen.schemas.file_version_legal_holds import *
-
-from box_sdk_gen.schemas.folder_full import *
-
-from box_sdk_gen.schemas.search_result_with_shared_link import *
-
-from box_sdk_gen.schemas.search_results_with_shared_links import *
-
-from box_sdk_gen.schemas.search_results import *
-
-from box_sdk_gen.schemas.recent_item import *
-
-from box_sdk_gen.schemas.recent_items import *
-
-from box_sdk_gen.schemas.event import *
-
-from box_sdk_gen.schemas.events import *
-
-from box_sdk_gen.schemas.skill_invocation import *
-
-from box_sdk_gen.schemas.collaboration import *
-
-from box_sdk_gen.schemas.collaborations import *
-
-from box_sdk_gen.schemas.webhook_invocation import *
-
-from box_sdk_gen.schemas.workflow_mini import *
-
-from box_sdk_gen.schemas.workflow import *
-
-from box_sdk_gen.schemas.workflows import *
-
-from box_sdk_gen.schemas.workflow_full import *
-
-from box_sdk_gen.schemas.zip_download import *
-
-from box_sdk_gen.schemas.zip_download_status import *
-
-from box_sdk_gen.schemas.completion_rule_variable import *
-
-from box_sdk_gen.schemas.collaborator_variable import *
-
-from box_sdk_gen.schemas.keyword_skill_card import *
-
-from box_sdk_gen.schemas.integration_mapping_slack_options import *
-
-from box_sdk_gen.schemas.integration_mapping_partner_item_slack import *
-
-from box_sdk_gen.schemas.integration_mapping import *
-
-from box_sdk_gen.schemas.integration_mappings import *
-
-from box_sdk_gen.schemas.integration_mapping_box_item_slack import *
-
-from box_sdk_gen.schemas.integration_mapping_slack_create_request import *
-
-from box_sdk_gen.schemas.role_variable import *
-
-from box_sdk_gen.schemas.outcome import *
-
-from box_sdk_gen.schemas.timeline_skill_card import *
-
-from box_sdk_gen.schemas.transcript_skill_card import *
-
-from box_sdk_gen.schemas.status_skill_card import *
-
-from box_sdk_gen.schemas.skill_cards_metadata import *
-
-from box_sdk_gen.schemas.sign_request_create_signer import *
-
-from box_sdk_gen.schemas.sign_request_prefill_tag import *
-
-from box_sdk_gen.schemas.sign_request_signer_input import *
-
-from box_sdk_gen.schemas.sign_request_signer import *
-
-from box_sdk_gen.schemas.sign_request_base import *
-
-from box_sdk_gen.schemas.sign_request import *
-
-from box_sdk_gen.schemas.sign_requests import *
-
-from box_sdk_gen.schemas.sign_request_create_request import *
-
-from box_sdk_gen.schemas.template_signer_input import *
-
-from box_sdk_gen.schemas.template_signer import *
-
-from box_sdk_gen.schemas.sign_template import *
-
-from box_sdk_gen.schemas.sign_templates import *
-
-from box_sdk_gen.schemas.shield_information_barrier_report_details import *
-
-from box_sdk_gen.schemas.shield_information_barrier_report import *
-
-from box_sdk_gen.schemas.shield_information_barrier_reports import *
-
-from box_sdk_gen.schemas.tracking_code import *
-
-from box_sdk_gen.schemas.user_full import *
-
-from box_sdk_gen.schemas.users import *
-
-from box_sdk_gen.schemas.metadata_field_filter_float_range import *
-
-from box_sdk_gen.schemas.metadata_field_filter_date_range import *
-
-from box_sdk_gen.schemas.metadata_filter import *
+from box_sdk_gen.internal.lazy_imports import lazy_package
+
+# Submodules are imported on first access of a name they define.
+# The registry of the classes defined by each submodule is generated with `python -m box_sdk_gen.internal.generate_lazy_exports`,
+# which has to be run again, when submodules are added or changed.
+# fmt: off
+_exports = {
+    'access_token': ('AccessTokenTokenTypeField', 'AccessTokenIssuedTokenTypeField', 'AccessToken'),
+    'ai_ask': ('AiAskModeField', 'AiAskItemsTypeField', 'AiAskItemsField', 'AiAsk'),
+    'ai_response': ('AiResponse',),
+    'ai_text_gen': ('AiTextGenItemsTypeField', 'AiTextGenItemsField', 'AiTextGenDialogueHistoryField', 'AiTextGen'),
+    'app_item_event_source': ('AppItemEventSourceTypeField', 'AppItemEventSource'),
+    'classification': ('ClassificationTemplateField', 'Classification'),
+    'classification_template': ('ClassificationTemplateTypeField', 'ClassificationTemplateTemplateKeyField', 'ClassificationTemplateDisplayNameField', 'ClassificationTemplateFieldsTypeField', 'ClassificationTemplateFieldsKeyField', 'ClassificationTemplateFieldsDisplayNameField', 'ClassificationTemplateFieldsOptionsStaticConfigClassificationField', 'ClassificationTemplateFieldsOptionsStaticConfigField', 'ClassificationTemplateFieldsOptionsField', 'ClassificationTemplateFieldsField', 'ClassificationTemplate'),
+    'client_error': ('ClientErrorTypeField', 'ClientErrorCodeField', 'ClientErrorContextInfoField', 'ClientError'),
+    'collaboration': ('CollaborationTypeField', 'CollaborationRoleField', 'CollaborationStatusField', 'CollaborationAcceptanceRequirementsStatusTermsOfServiceRequirementField', 'CollaborationAcceptanceRequirementsStatusStrongPasswordRequirementField', 'CollaborationAcceptanceRequirementsStatusTwoFactorAuthenticationRequirementField', 'CollaborationAcceptanceRequirementsStatusField', 'Collaboration'),
+    'collaboration_allowlist_entries': ('CollaborationAllowlistEntries',),
+    'collaboration_allowlist_entry': ('CollaborationAllowlistEntryTypeField', 'CollaborationAllowlistEntryDirectionField', 'CollaborationAllowlistEntryEnterpriseTypeField', 'CollaborationAllowlistEntryEnterpriseField', 'CollaborationAllowlistEntry'),
+    'collaboration_allowlist_exempt_target': ('CollaborationAllowlistExemptTargetTypeField', 'CollaborationAllowlistExemptTargetEnterpriseTypeField', 'CollaborationAllowlistExemptTargetEnterpriseField', 'CollaborationAllowlistExemptTarget'),
+    'collaboration_allowlist_exempt_targets': ('CollaborationAllowlistExemptTargets',),
+    'collaborations': ('CollaborationsOrderDirectionField', 'CollaborationsOrderField', 'Collaborations'),
+    'collaborator_variable': ('CollaboratorVariableTypeField', 'CollaboratorVariableVariableTypeField', 'CollaboratorVariableVariableValueTypeField', 'CollaboratorVariableVariableValueField', 'CollaboratorVariable'),
+    'collection': ('CollectionTypeField', 'CollectionNameField', 'CollectionCollectionTypeField', 'Collection'),
+    'collections': ('CollectionsOrderDirectionField', 'CollectionsOrderField', 'Collections'),
+    'comment': ('CommentItemField', 'Comment'),
+    'comment_base': ('CommentBaseTypeField', 'CommentBase'),
+    'comment_full': ('CommentFull',),
+    'comments': ('CommentsOrderDirectionField', 'CommentsOrderField', 'Comments'),
+    'completion_rule_variable': ('CompletionRuleVariableTypeField', 'CompletionRuleVariableVariableTypeField', 'CompletionRuleVariableVariableValueField', 'CompletionRuleVariable'),
+    'conflict_error': ('ConflictErrorContextInfoField', 'ConflictError'),
+    'device_pinner': ('DevicePinnerTypeField', 'DevicePinner'),
+    'device_pinners': ('DevicePinnersOrderByField', 'DevicePinnersOrderDirectionField', 'DevicePinnersOrderField', 'DevicePinners'),
+    'email_alias': ('EmailAliasTypeField', 'EmailAlias'),
+    'email_aliases': ('EmailAliases',),
+    'enterprise_base': ('EnterpriseBaseTypeField', 'EnterpriseBase'),
+    'event': ('EventEventTypeField', 'EventAdditionalDetailsField', 'Event'),
+    'event_source': ('EventSourceItemTypeField', 'EventSourceClassificationField', 'EventSource'),
+    'events': ('Events',),
+    'file': ('FilePathCollectionField', 'FileSharedLinkAccessField', 'FileSharedLinkEffectiveAccessField', 'FileSharedLinkEffectivePermissionField', 'FileSharedLinkPermissionsField', 'FileSharedLinkField', 'FileItemStatusField', 'File'),
+    'file_base': ('FileBaseTypeField', 'FileBase'),
+    'file_conflict': ('FileConflict',),
+    'file_full': ('FileFullPermissionsField', 'FileFullLockTypeField', 'FileFullLockAppTypeField', 'FileFullLockField', 'FileFullExpiringEmbedLinkTokenTypeField', 'FileFullExpiringEmbedLinkField', 'FileFullWatermarkInfoField', 'FileFullAllowedInviteeRolesField', 'FileFullMetadataField', 'FileFullRepresentationsEntriesContentField', 'FileFullRepresentationsEntriesInfoField', 'FileFullRepresentationsEntriesPropertiesField', 'FileFullRepresentationsEntriesStatusStateField', 'FileFullRepresentationsEntriesStatusField', 'FileFullRepresentationsEntriesField', 'FileFullRepresentationsField', 'FileFullClassificationField', 'FileFullSharedLinkPermissionOptionsField', 'FileFull'),
+    'file_mini': ('FileMini',),
+    'file_or_folder_scope': ('FileOrFolderScopeScopeField', 'FileOrFolderScope'),
+    'file_request': ('FileRequestTypeField', 'FileRequestStatusField', 'FileRequest'),
+    'file_request_copy_request': ('FileRequestCopyRequestFolderTypeField', 'FileRequestCopyRequestFolderField', 'FileRequestCopyRequest'),
+    'file_request_update_request': ('FileRequestUpdateRequestStatusField', 'FileRequestUpdateRequest'),
+    'file_version': ('FileVersion',),
+    'file_version_base': ('FileVersionBaseTypeField', 'FileVersionBase'),
+    'file_version_full': ('FileVersionFull',),
+    'file_version_legal_hold': ('FileVersionLegalHoldTypeField', 'FileVersionLegalHold'),
+    'file_version_legal_holds': ('FileVersionLegalHolds',),
+    'file_version_mini': ('FileVersionMini',),
+    'file_version_retention': ('FileVersionRetentionTypeField', 'FileVersionRetention'),
+    'file_version_retentions': ('FileVersionRetentions',),
+    'file_versions': ('FileVersionsOrderDirectionField', 'FileVersionsOrderField', 'FileVersions'),
+    'files': ('Files',),
+    'files_on_hold': ('FilesOnHold',),
+    'files_under_retention': ('FilesUnderRetention',),
+    'folder': ('FolderPathCollectionField', 'FolderSharedLinkAccessField', 'FolderSharedLinkEffectiveAccessField', 'FolderSharedLinkEffectivePermissionField', 'FolderSharedLinkPermissionsField', 'FolderSharedLinkField', 'FolderFolderUploadEmailAccessField', 'FolderFolderUploadEmailField', 'FolderItemStatusField', 'Folder'),
+    'folder_base': ('FolderBaseTypeField', 'FolderBase'),
+    'folder_full': ('FolderFullSyncStateField', 'FolderFullPermissionsField', 'FolderFullMetadataField', 'FolderFullAllowedSharedLinkAccessLevelsField', 'FolderFullAllowedInviteeRolesField', 'FolderFullWatermarkInfoField', 'FolderFullClassificationField', 'FolderFull'),
+    'folder_lock': ('FolderLockLockedOperationsField', 'FolderLock'),
+    'folder_locks': ('FolderLocks',),
+    'folder_mini': ('FolderMini',),
+    'generic_source': (),
+    'group': ('Group',),
+    'group_base': ('GroupBaseTypeField', 'GroupBase'),
+    'group_full': ('GroupFullInvitabilityLevelField', 'GroupFullMemberViewabilityLevelField', 'GroupFullPermissionsField', 'GroupFull'),
+    'group_membership': ('GroupMembershipTypeField', 'GroupMembershipRoleField', 'GroupMembership'),
+    'group_memberships': ('GroupMembershipsOrderDirectionField', 'GroupMembershipsOrderField', 'GroupMemberships'),
+    'group_mini': ('GroupMiniGroupTypeField', 'GroupMini'),
+    'groups': ('GroupsOrderDirectionField', 'GroupsOrderField', 'Groups'),
+    'integration_mapping': ('IntegrationMappingTypeField', 'IntegrationMapping'),
+    'integration_mapping_base': ('IntegrationMappingBaseIntegrationTypeField', 'IntegrationMappingBase'),
+    'integration_mapping_box_item_slack': ('IntegrationMappingBoxItemSlackTypeField', 'IntegrationMappingBoxItemSlack'),
+    'integration_mapping_mini': ('IntegrationMappingMiniPartnerItemTypeField', 'IntegrationMappingMiniBoxItemTypeField', 'IntegrationMappingMini'),
+    'integration_mapping_partner_item_slack': ('IntegrationMappingPartnerItemSlackTypeField', 'IntegrationMappingPartnerItemSlack'),
+    'integration_mapping_slack_create_request': ('IntegrationMappingSlackCreateRequest',),
+    'integration_mapping_slack_options': ('IntegrationMappingSlackOptions',),
+    'integration_mappings': ('IntegrationMappings',),
+    'invite': ('InviteTypeField', 'InviteInvitedToTypeField', 'InviteInvitedToField', 'Invite'),
+    'items': ('ItemsOrderDirectionField', 'ItemsOrderField', 'Items'),
+    'keyword_skill_card': ('KeywordSkillCardTypeField', 'KeywordSkillCardSkillCardTypeField', 'KeywordSkillCardSkillCardTitleField', 'KeywordSkillCardSkillTypeField', 'KeywordSkillCardSkillField', 'KeywordSkillCardInvocationTypeField', 'KeywordSkillCardInvocationField', 'KeywordSkillCardEntriesField', 'KeywordSkillCard'),
+    'legal_hold_policies': ('LegalHoldPolicies',),
+    'legal_hold_policy': ('LegalHoldPolicyStatusField', 'LegalHoldPolicyAssignmentCountsField', 'LegalHoldPolicy'),
+    'legal_hold_policy_assignment': ('LegalHoldPolicyAssignment',),
+    'legal_hold_policy_assignment_base': ('LegalHoldPolicyAssignmentBaseTypeField', 'LegalHoldPolicyAssignmentBase'),
+    'legal_hold_policy_assignments': ('LegalHoldPolicyAssignments',),
+    'legal_hold_policy_mini': ('LegalHoldPolicyMiniTypeField', 'LegalHoldPolicyMini'),
+    'metadata': ('Metadata',),
+    'metadata_base': ('MetadataBase',),
+    'metadata_cascade_policies': ('MetadataCascadePolicies',),
+    'metadata_cascade_policy': ('MetadataCascadePolicyTypeField', 'MetadataCascadePolicyOwnerEnterpriseTypeField', 'MetadataCascadePolicyOwnerEnterpriseField', 'MetadataCascadePolicyParentTypeField', 'MetadataCascadePolicyParentField', 'MetadataCascadePolicy'),
+    'metadata_field_filter_date_range': ('MetadataFieldFilterDateRange',),
+    'metadata_field_filter_float_range': ('MetadataFieldFilterFloatRange',),
+    'metadata_filter': ('MetadataFilterScopeField', 'MetadataFilter'),
+    'metadata_full': ('MetadataFull',),
+    'metadata_query': ('MetadataQueryOrderByDirectionField', 'MetadataQueryOrderByField', 'MetadataQuery'),
+    'metadata_query_index': ('MetadataQueryIndexStatusField', 'MetadataQueryIndexFieldsSortDirectionField', 'MetadataQueryIndexFieldsField', 'MetadataQueryIndex'),
+    'metadata_query_results': ('MetadataQueryResults',),
+    'metadata_template': ('MetadataTemplateTypeField', 'MetadataTemplateFieldsTypeField', 'MetadataTemplateFieldsOptionsField', 'MetadataTemplateFieldsField', 'MetadataTemplate'),
+    'metadata_templates': ('MetadataTemplates',),
+    'metadatas': ('Metadatas',),
+    'o_auth_2_error': ('OAuth2Error',),
+    'outcome': ('Outcome',),
+    'post_o_auth_2_revoke': ('PostOAuth2Revoke',),
+    'post_o_auth_2_token': ('PostOAuth2TokenGrantTypeField', 'PostOAuth2TokenSubjectTokenTypeField', 'PostOAuth2TokenActorTokenTypeField', 'PostOAuth2TokenBoxSubjectTypeField', 'PostOAuth2Token'),
+    'post_o_auth_2_token_refresh_access_token': ('PostOAuth2TokenRefreshAccessTokenGrantTypeField', 'PostOAuth2TokenRefreshAccessToken'),
+    'realtime_server': ('RealtimeServer',),
+    'realtime_servers': ('RealtimeServers',),
+    'recent_item': ('RecentItemInteractionTypeField', 'RecentItem'),
+    'recent_items': ('RecentItems',),
+    'retention_policies': ('RetentionPolicies',),
+    'retention_policy': ('RetentionPolicyPolicyTypeField', 'RetentionPolicyRetentionTypeField', 'RetentionPolicyStatusField', 'RetentionPolicyAssignmentCountsField', 'RetentionPolicy'),
+    'retention_policy_assignment': ('RetentionPolicyAssignmentTypeField', 'RetentionPolicyAssignmentAssignedToTypeField', 'RetentionPolicyAssignmentAssignedToField', 'RetentionPolicyAssignmentFilterFieldsField', 'RetentionPolicyAssignment'),
+    'retention_policy_assignment_base': ('RetentionPolicyAssignmentBaseTypeField', 'RetentionPolicyAssignmentBase'),
+    'retention_policy_assignments': ('RetentionPolicyAssignments',),
+    'retention_policy_base': ('RetentionPolicyBaseTypeField', 'RetentionPolicyBase'),
+    'retention_policy_mini': ('RetentionPolicyMiniDispositionActionField', 'RetentionPolicyMini'),
+    'role_variable': ('RoleVariableTypeField', 'RoleVariableVariableTypeField', 'RoleVariableVariableValueField', 'RoleVariable'),
+    'search_result_with_shared_link': ('SearchResultWithSharedLink',),
+    'search_results': ('SearchResultsTypeField', 'SearchResults'),
+    'search_results_with_shared_links': ('SearchResultsWithSharedLinksTypeField', 'SearchResultsWithSharedLinks'),
+    'session_termination_message': ('SessionTerminationMessage',),
+    'shield_information_barrier': ('ShieldInformationBarrierTypeField', 'ShieldInformationBarrierStatusField', 'ShieldInformationBarrier'),
+    'shield_information_barrier_base': ('ShieldInformationBarrierBaseTypeField', 'ShieldInformationBarrierBase'),
+    'shield_information_barrier_reference': ('ShieldInformationBarrierReference',),
+    'shield_information_barrier_report': ('ShieldInformationBarrierReportStatusField', 'ShieldInformationBarrierReport'),
+    'shield_information_barrier_report_base': ('ShieldInformationBarrierReportBaseTypeField', 'ShieldInformationBarrierReportBase'),
+    'shield_information_barrier_report_details': ('ShieldInformationBarrierReportDetailsDetailsField', 'ShieldInformationBarrierReportDetails'),
+    'shield_information_barrier_reports': ('ShieldInformationBarrierReports',),
+    'shield_information_barrier_segment': ('ShieldInformationBarrierSegmentTypeField', 'ShieldInformationBarrierSegment'),
+    'shield_information_barrier_segment_member': ('ShieldInformationBarrierSegmentMemberShieldInformationBarrierSegmentTypeField', 'ShieldInformationBarrierSegmentMemberShieldInformationBarrierSegmentField', 'ShieldInformationBarrierSegmentMember'),
+    'shield_information_barrier_segment_member_base': ('ShieldInformationBarrierSegmentMemberBaseTypeField', 'ShieldInformationBarrierSegmentMemberBase'),
+    'shield_information_barrier_segment_member_mini': ('ShieldInformationBarrierSegmentMemberMini',),
+    'shield_information_barrier_segment_members': ('ShieldInformationBarrierSegmentMembers',),
+    'shield_information_barrier_segment_restriction': ('ShieldInformationBarrierSegmentRestriction',),
+    'shield_information_barrier_segment_restriction_base': ('ShieldInformationBarrierSegmentRestrictionBaseTypeField', 'ShieldInformationBarrierSegmentRestrictionBase'),
+    'shield_information_barrier_segment_restriction_mini': ('ShieldInformationBarrierSegmentRestrictionMiniShieldInformationBarrierSegmentTypeField', 'ShieldInformationBarrierSegmentRestrictionMiniShieldInformationBarrierSegmentField', 'ShieldInformationBarrierSegmentRestrictionMiniRestrictedSegmentTypeField', 'ShieldInformationBarrierSegmentRestrictionMiniRestrictedSegmentField', 'ShieldInformationBarrierSegmentRestrictionMini'),
+    'shield_information_barrier_segment_restrictions': ('ShieldInformationBarrierSegmentRestrictions',),
+    'shield_information_barrier_segments': ('ShieldInformationBarrierSegments',),
+    'shield_information_barriers': ('ShieldInformationBarriers',),
+    'sign_request': ('SignRequestTypeField', 'SignRequestStatusField', 'SignRequestSignFilesField', 'SignRequest'),
+    'sign_request_base': ('SignRequestBase',),
+    'sign_request_create_request': ('SignRequestCreateRequestSignatureColorField', 'SignRequestCreateRequest'),
+    'sign_request_create_signer': ('SignRequestCreateSignerRoleField', 'SignRequestCreateSigner'),
+    'sign_request_prefill_tag': ('SignRequestPrefillTag',),
+    'sign_request_signer': ('SignRequestSignerSignerDecisionTypeField', 'SignRequestSignerSignerDecisionField', 'SignRequestSigner'),
+    'sign_request_signer_input': ('SignRequestSignerInputTypeField', 'SignRequestSignerInputContentTypeField', 'SignRequestSignerInput'),
+    'sign_requests': ('SignRequests',),
+    'sign_template': ('SignTemplateTypeField', 'SignTemplateAdditionalInfoNonEditableField', 'SignTemplateAdditionalInfoRequiredSignersField', 'SignTemplateAdditionalInfoRequiredField', 'SignTemplateAdditionalInfoField', 'SignTemplateReadySignLinkField', 'SignTemplateCustomBrandingField', 'SignTemplate'),
+    'sign_templates': ('SignTemplates',),
+    'skill_cards_metadata': ('SkillCardsMetadata',),
+    'skill_invocation': ('SkillInvocationTypeField', 'SkillInvocationSkillTypeField', 'SkillInvocationSkillField', 'SkillInvocationTokenReadTokenTypeField', 'SkillInvocationTokenReadField', 'SkillInvocationTokenWriteTokenTypeField', 'SkillInvocationTokenWriteField', 'SkillInvocationTokenField', 'SkillInvocationStatusStateField', 'SkillInvocationStatusField', 'SkillInvocationEnterpriseTypeField', 'SkillInvocationEnterpriseField', 'SkillInvocation'),
+    'status_skill_card': ('StatusSkillCardTypeField', 'StatusSkillCardSkillCardTypeField', 'StatusSkillCardSkillCardTitleField', 'StatusSkillCardStatusCodeField', 'StatusSkillCardStatusField', 'StatusSkillCardSkillTypeField', 'StatusSkillCardSkillField', 'StatusSkillCardInvocationTypeField', 'StatusSkillCardInvocationField', 'StatusSkillCard'),
+    'storage_policies': ('StoragePolicies',),
+    'storage_policy': ('StoragePolicy',),
+    'storage_policy_assignment': ('StoragePolicyAssignmentTypeField', 'StoragePolicyAssignmentAssignedToField', 'StoragePolicyAssignment'),
+    'storage_policy_assignments': ('StoragePolicyAssignments',),
+    'storage_policy_mini': ('StoragePolicyMiniTypeField', 'StoragePolicyMini'),
+    'task': ('TaskTypeField', 'TaskActionField', 'TaskCompletionRuleField', 'Task'),
+    'task_assignment': ('TaskAssignmentTypeField', 'TaskAssignmentResolutionStateField', 'TaskAssignment'),
+    'task_assignments': ('TaskAssignments',),
+    'tasks': ('Tasks',),
+    'template_signer': ('TemplateSignerRoleField', 'TemplateSigner'),
+    'template_signer_input': ('TemplateSignerInputTypeField', 'TemplateSignerInputContentTypeField', 'TemplateSignerInputCoordinatesField', 'TemplateSignerInputDimensionsField', 'TemplateSignerInput'),
+    'terms_of_service': ('TermsOfServiceStatusField', 'TermsOfServiceEnterpriseTypeField', 'TermsOfServiceEnterpriseField', 'TermsOfServiceTosTypeField', 'TermsOfService'),
+    'terms_of_service_base': ('TermsOfServiceBaseTypeField', 'TermsOfServiceBase'),
+    'terms_of_service_user_status': ('TermsOfServiceUserStatusTypeField', 'TermsOfServiceUserStatus'),
+    'terms_of_service_user_statuses': ('TermsOfServiceUserStatuses',),
+    'terms_of_services': ('TermsOfServices',),
+    'timeline_skill_card': ('TimelineSkillCardTypeField', 'TimelineSkillCardSkillCardTypeField', 'TimelineSkillCardSkillCardTitleField', 'TimelineSkillCardSkillTypeField', 'TimelineSkillCardSkillField', 'TimelineSkillCardInvocationTypeField', 'TimelineSkillCardInvocationField', 'TimelineSkillCardEntriesAppearsField', 'TimelineSkillCardEntriesField', 'TimelineSkillCard'),
+    'tracking_code': ('TrackingCodeTypeField', 'TrackingCode'),
+    'transcript_skill_card': ('TranscriptSkillCardTypeField', 'TranscriptSkillCardSkillCardTypeField', 'TranscriptSkillCardSkillCardTitleField', 'TranscriptSkillCardSkillTypeField', 'TranscriptSkillCardSkillField', 'TranscriptSkillCardInvocationTypeField', 'TranscriptSkillCardInvocationField', 'TranscriptSkillCardEntriesAppearsField', 'TranscriptSkillCardEntriesField', 'TranscriptSkillCard'),
+    'trash_file': ('TrashFileTypeField', 'TrashFilePathCollectionEntriesTypeField', 'TrashFilePathCollectionEntriesField', 'TrashFilePathCollectionField', 'TrashFileItemStatusField', 'TrashFile'),
+    'trash_file_restored': ('TrashFileRestoredTypeField', 'TrashFileRestoredPathCollectionField', 'TrashFileRestoredItemStatusField', 'TrashFileRestored'),
+    'trash_folder': ('TrashFolderTypeField', 'TrashFolderPathCollectionEntriesTypeField', 'TrashFolderPathCollectionEntriesField', 'TrashFolderPathCollectionField', 'TrashFolderItemStatusField', 'TrashFolder'),
+    'trash_folder_restored': ('TrashFolderRestoredTypeField', 'TrashFolderRestoredPathCollectionField', 'TrashFolderRestoredItemStatusField', 'TrashFolderRestored'),
+    'trash_web_link': ('TrashWebLinkTypeField', 'TrashWebLinkPathCollectionEntriesTypeField', 'TrashWebLinkPathCollectionEntriesField', 'TrashWebLinkPathCollectionField', 'TrashWebLinkItemStatusField', 'TrashWebLink'),
+    'trash_web_link_restored': ('TrashWebLinkRestoredTypeField', 'TrashWebLinkRestoredPathCollectionField', 'TrashWebLinkRestoredItemStatusField', 'TrashWebLinkRestored'),
+    'upload_part': ('UploadPart',),
+    'upload_part_mini': ('UploadPartMini',),
+    'upload_parts': ('UploadPartsOrderDirectionField', 'UploadPartsOrderField', 'UploadParts'),
+    'upload_session': ('UploadSessionTypeField', 'UploadSessionSessionEndpointsField', 'UploadSession'),
+    'upload_url': ('UploadUrl',),
+    'uploaded_part': ('UploadedPart',),
+    'user': ('UserStatusField', 'UserNotificationEmailField', 'User'),
+    'user_avatar': ('UserAvatarPicUrlsField', 'UserAvatar'),
+    'user_base': ('UserBaseTypeField', 'UserBase'),
+    'user_collaborations': ('UserCollaborations',),
+    'user_full': ('UserFullRoleField', 'UserFullEnterpriseTypeField', 'UserFullEnterpriseField', 'UserFull'),
+    'user_integration_mappings': ('UserIntegrationMappings',),
+    'user_mini': ('UserMini',),
+    'users': ('UsersOrderDirectionField', 'UsersOrderField', 'Users'),
+    'watermark': ('WatermarkWatermarkField', 'Watermark'),
+    'web_link': ('WebLinkPathCollectionField', 'WebLinkSharedLinkAccessField', 'WebLinkSharedLinkEffectiveAccessField', 'WebLinkSharedLinkEffectivePermissionField', 'WebLinkSharedLinkPermissionsField', 'WebLinkSharedLinkField', 'WebLinkItemStatusField', 'WebLink'),
+    'web_link_base': ('WebLinkBaseTypeField', 'WebLinkBase'),
+    'web_link_mini': ('WebLinkMini',),
+    'webhook': ('WebhookTriggersField', 'Webhook'),
+    'webhook_invocation': ('WebhookInvocationTypeField', 'WebhookInvocationTriggerField', 'WebhookInvocation'),
+    'webhook_mini': ('WebhookMiniTypeField', 'WebhookMiniTargetTypeField', 'WebhookMiniTargetField', 'WebhookMini'),
+    'webhooks': ('Webhooks',),
+    'workflow': ('WorkflowFlowsTypeField', 'WorkflowFlowsTriggerTypeField', 'WorkflowFlowsTriggerTriggerTypeField', 'WorkflowFlowsTriggerScopeTypeField', 'WorkflowFlowsTriggerScopeObjectTypeField', 'WorkflowFlowsTriggerScopeObjectField', 'WorkflowFlowsTriggerScopeField', 'WorkflowFlowsTriggerField', 'WorkflowFlowsOutcomesTypeField', 'WorkflowFlowsOutcomesActionTypeField', 'WorkflowFlowsOutcomesIfRejectedTypeField', 'WorkflowFlowsOutcomesIfRejectedActionTypeField', 'WorkflowFlowsOutcomesIfRejectedField', 'WorkflowFlowsOutcomesField', 'WorkflowFlowsField', 'Workflow'),
+    'workflow_full': ('WorkflowFull',),
+    'workflow_mini': ('WorkflowMiniTypeField', 'WorkflowMini'),
+    'workflows': ('Workflows',),
+    'zip_download': ('ZipDownloadNameConflictsTypeField', 'ZipDownloadNameConflictsField', 'ZipDownload'),
+    'zip_download_request': ('ZipDownloadRequestItemsTypeField', 'ZipDownloadRequestItemsField', 'ZipDownloadRequest'),
+    'zip_download_status': ('ZipDownloadStatusStateField', 'ZipDownloadStatus'),
+}
+# fmt: on
+
+__all__ = [name for names in _exports.values() for name in names]
+
+__getattr__, __dir__ = lazy_package(__name__, _exports, globals())
@@ -1,16 +1,96 @@
 import json
-from typing import Dict
+from typing import Dict, Union
 from urllib.parse import urlencode
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SerializedData = Dict
 
 
-def json_to_serialized_data(data: str) -> SerializedData:
-    return json.loads(data)
+class JsonBackend:
+    """
+    Library used to parse and produce JSON. Subclass it to plug in another library with set_json_backend().
+    """
+
+    name = 'json'
+
+    def loads(self, data: Union[str, bytes]) -> SerializedData:
+        """
+        Parse JSON from a string or from UTF-8 encoded bytes, e.g. a response body.
+        """
+        return json.loads(data)
+
+    def dumps(self, data: SerializedData) -> str:
+        return json.dumps(data)
+
+    def dumps_bytes(self, data: SerializedData) -> bytes:
+        """
+        Serialize data to UTF-8 encoded JSON, e.g. a request body.
+        """
+        return json.dumps(data).encode('utf-8')
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    JSON backend using orjson, which is used by default, when it is installed.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                'orjson is not installed. Install it with `pip install box-sdk-gen[orjson]`.'
+            )
+
+    def loads(self, data: Union[str, bytes]) -> SerializedData:
+        return orjson.loads(data)
+
+    def dumps(self, data: SerializedData) -> str:
+        return self.dumps_bytes(data).decode('utf-8')
+
+    def dumps_bytes(self, data: SerializedData) -> bytes:
+        # Like the json module, keys which are not strings are converted to strings
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+_json_backends = {JsonBackend.name: JsonBackend, OrjsonBackend.name: OrjsonBackend}
+_json_backend: JsonBackend = OrjsonBackend() if orjson is not None else JsonBackend()
+
+
+def get_json_backend() -> JsonBackend:
+    return _json_backend
+
+
+def set_json_backend(backend: Union[JsonBackend, str]) -> None:
+    """
+    Set the library used to parse responses and serialize request bodies.
+    By default orjson is used, when it is installed, and the json module of the standard library otherwise.
+    :param backend: A JsonBackend, or the name of a built-in one: 'json' or 'orjson'
+    """
+    global _json_backend
+    if isinstance(backend, str):
+        if backend not in _json_backends:
+            raise ValueError(
+                f'Unknown JSON backend {backend}, expected one of: {", ".join(_json_backends)}'
+            )
+        backend = _json_backends[backend]()
+    _json_backend = backend
+
+
+def json_to_serialized_data(data: Union[str, bytes]) -> SerializedData:
+    return _json_backend.loads(data)
 
 
 def sd_to_json(data: SerializedData) -> str:
-    return json.dumps(data)
+    return _json_backend.dumps(data)
+
+
+def sd_to_json_bytes(data: SerializedData) -> bytes:
+    return _json_backend.dumps_bytes(data)
 
 
 def sd_to_url_params(data: SerializedData) -> str:
@@ -1,6 +1,12 @@
-from typing import get_origin, Union, Type
+from typing import get_origin, Optional, Union, Type
 
-from ...internal.base_object import BaseObject
+from ...internal.base_object import (
+    BaseObject,
+    _call_with_lazy_deserialization,
+    _decode,
+    _get_decoder,
+    _lazy_deserialization,
+)
 from .json_data import SerializedData
 
 
@@ -17,8 +23,23 @@ def serialize(obj: Union[BaseObject, dict, list]) -> SerializedData:
     return obj
 
 
-def deserialize(value: SerializedData, type: Type[BaseObject]):
+def deserialize(
+    value: SerializedData, type: Type[BaseObject], *, lazy: Optional[bool] = None
+):
+    """
+    Deserialize the parsed JSON of a response into a schema object.
+    :param lazy: If True, fields containing other schema objects are deserialized on first access,
+        see BaseObject.from_dict()
+    """
+    if lazy is not None and lazy is not _lazy_deserialization.get():
+        return _call_with_lazy_deserialization(lazy, deserialize, value, type)
     if get_origin(type) == Union:
-        type = BaseObject._deserialize_union('', value, type)
+        if value is None:
+            type = BaseObject._deserialize_union('', value, type)
+        else:
+            type = _decode(_get_decoder(type), value)
+            if isinstance(type, BaseObject):
+                # The union was deserialized to one of its variants already
+                return type
 
     return type.from_dict(value)
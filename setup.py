@@ -10,14 +10,20 @@ def main():
     tests_require = ['pytest', 'pytest-timeout', 'pytest-cov']
     dev_requires = ['tox']
     jwt_requires = ['pyjwt>=1.7.0', 'cryptography>=3']
+    async_requires = ['httpx>=0.24']
+    orjson_requires = ['orjson>=3']
+    http2_requires = ['httpx[http2]>=0.24']
     version_file = open(join(dirname(__file__), 'box_sdk_gen/networking/version.py'))
     version_regex = re.compile('.*__version__ = \'(.*?)\'', re.S)
     version_string_grouped = version_regex.match(version_file.read())
     __version__ = version_string_grouped.group(1)
     extras_require = {
-        'test': tests_require + jwt_requires,
+        'test': tests_require + jwt_requires + async_requires + http2_requires,
         'dev': dev_requires,
         'jwt': jwt_requires,
+        'async': async_requires,
+        'orjson': orjson_requires,
+        'http2': http2_requires,
     }
     setup(
         name='box-sdk-gen',
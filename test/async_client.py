@@ -0,0 +1,245 @@
+import asyncio
+import threading
+from io import BytesIO, FileIO
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from box_sdk_gen import (
+    AsyncBoxClient,
+    Authentication,
+    BoxAPIError,
+    FileFull,
+    Files,
+    NetworkSession,
+    RetryPolicy,
+)
+from box_sdk_gen.internal.utils import AsyncByteStream
+from box_sdk_gen.serialization.json.json_data import sd_to_json
+from box_sdk_gen.managers.uploads import (
+    UploadFileAttributes,
+    UploadFileAttributesParentField,
+)
+
+
+@pytest.fixture
+def mock_auth():
+    auth = Mock(Authentication)
+    auth.retrieve_authorization_header.return_value = 'Bearer token'
+    return auth
+
+
+@pytest.fixture
+def mock_handler():
+    handler = Mock()
+    with patch(
+        'box_sdk_gen.networking.async_fetch.create_async_http_client',
+        side_effect=lambda config: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ),
+    ):
+        yield handler
+
+
+@pytest.fixture
+def client(mock_auth, mock_handler):
+    return AsyncBoxClient(auth=mock_auth, network_session=NetworkSession())
+
+
+def test_endpoint_method_returns_deserialized_schema(client, mock_handler):
+    mock_handler.return_value = httpx.Response(
+        200, json={'id': '12345', 'type': 'file', 'name': 'a.txt'}
+    )
+
+    file = asyncio.run(
+        client.with_as_user_header('999').files.get_file_by_id('12345', fields=['name'])
+    )
+
+    assert isinstance(file, FileFull)
+    assert file.id == '12345'
+    assert file.name == 'a.txt'
+    request = mock_handler.call_args.args[0]
+    assert str(request.url) == 'https://api.box.com/2.0/files/12345?fields=name'
+    assert request.headers['Authorization'] == 'Bearer token'
+    assert request.headers['As-User'] == '999'
+
+
+def test_endpoint_method_without_response_body_returns_none(client, mock_handler):
+    mock_handler.return_value = httpx.Response(204)
+
+    assert asyncio.run(client.files.delete_file_by_id('12345')) is None
+    assert mock_handler.call_args.args[0].method == 'DELETE'
+
+
+def test_retrying_429_and_500(client, mock_handler):
+    mock_handler.side_effect = [
+        httpx.Response(429, headers={'Retry-After': '0'}),
+        httpx.Response(500, headers={'Retry-After': '0'}),
+        httpx.Response(200, json={'id': '12345', 'type': 'file'}),
+    ]
+
+    file = asyncio.run(client.files.get_file_by_id('12345'))
+
+    assert file.id == '12345'
+    assert mock_handler.call_count == 3
+
+
+def test_retry_policy_of_client(client, mock_handler):
+    mock_handler.side_effect = [
+        httpx.Response(500, headers={'Retry-After': '0'}),
+        httpx.ConnectError('Connection refused'),
+        httpx.Response(200, json={'id': '12345', 'type': 'file'}),
+    ]
+    client = client.with_retry_policy(RetryPolicy(base_backoff=0, deadline=60))
+
+    file = asyncio.run(client.files.get_file_by_id('12345'))
+
+    assert file.id == '12345'
+    assert mock_handler.call_count == 3
+    assert 0 < mock_handler.call_args.args[0].extensions['timeout']['read'] <= 60
+
+    mock_handler.reset_mock(side_effect=True)
+    mock_handler.return_value = httpx.Response(500)
+    client = client.with_retry_policy(RetryPolicy(retry_non_idempotent_methods=False))
+    with pytest.raises(BoxAPIError):
+        asyncio.run(client.folders.create_folder('name', parent={'id': '0'}))
+    assert mock_handler.call_count == 1
+
+
+def test_refreshing_token_on_401(client, mock_auth, mock_handler):
+    mock_handler.side_effect = [
+        httpx.Response(401),
+        httpx.Response(200, json={'id': '12345', 'type': 'file'}),
+    ]
+
+    asyncio.run(client.files.get_file_by_id('12345'))
+
+    mock_auth.refresh_token.assert_called_once_with(
+        network_session=client.network_session
+    )
+
+
+def test_raising_api_error(client, mock_handler):
+    mock_handler.return_value = httpx.Response(
+        404, json={'code': 'not_found', 'message': 'Not Found', 'request_id': 'r1'}
+    )
+
+    with pytest.raises(BoxAPIError) as error:
+        asyncio.run(client.files.get_file_by_id('12345'))
+
+    assert error.value.response_info.status_code == 404
+    assert error.value.response_info.code == 'not_found'
+
+
+def test_download_returns_async_byte_stream(client, mock_handler):
+    content = bytes(range(256)) * 1024
+
+    mock_handler.return_value = httpx.Response(200, content=content)
+
+    async def download():
+        stream = await client.downloads.download_file('12345')
+        assert isinstance(stream, AsyncByteStream)
+        return await stream.read(10) + await stream.read()
+
+    assert asyncio.run(download()) == content
+
+
+def test_upload_sends_multipart_body_with_content_length(client, mock_handler):
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        assert int(request.headers['Content-Length']) == len(body)
+        bodies.append(body)
+        return httpx.Response(
+            201, json={'total_count': 1, 'entries': [{'id': '1', 'type': 'file'}]}
+        )
+
+    mock_handler.side_effect = handler
+
+    files = asyncio.run(
+        client.uploads.upload_file(
+            UploadFileAttributes(
+                name='a.txt', parent=UploadFileAttributesParentField(id='0')
+            ),
+            BytesIO(b'file content'),
+        )
+    )
+
+    assert isinstance(files, Files)
+    assert files.entries[0].id == '1'
+    assert b'file content' in bodies[0]
+    assert sd_to_json({'name': 'a.txt'})[1:-1].encode() in bodies[0]
+
+
+def test_token_and_upload_body_are_read_off_the_event_loop(
+    client, mock_auth, mock_handler, tmp_path
+):
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def retrieve_authorization_header(network_session=None) -> str:
+        threads.append(('token', threading.get_ident()))
+        return 'Bearer token'
+
+    class FileStream(FileIO):
+        def read(self, size=-1) -> bytes:
+            threads.append(('body', threading.get_ident()))
+            return super().read(size)
+
+    file_path = tmp_path / 'a.txt'
+    file_path.write_bytes(b'file content')
+    mock_auth.retrieve_authorization_header.side_effect = retrieve_authorization_header
+    mock_handler.side_effect = lambda request: httpx.Response(
+        200, json={'id': '1', 'type': 'file'}
+    )
+
+    asyncio.run(client.files.get_file_by_id('1'))
+    with FileStream(file_path) as file:
+        asyncio.run(
+            client.uploads.upload_file(
+                UploadFileAttributes(
+                    name='a.txt', parent=UploadFileAttributesParentField(id='0')
+                ),
+                file,
+            )
+        )
+
+    assert {kind for kind, _ in threads} == {'token', 'body'}
+    assert all(thread != loop_thread for _, thread in threads)
+
+
+def test_composite_methods_are_not_available(client):
+    with pytest.raises(AttributeError):
+        client.chunked_uploads.upload_big_file
+    assert 'upload_big_file' not in dir(client.chunked_uploads)
+    assert 'create_file_upload_session' in dir(client.chunked_uploads)
+
+
+def test_concurrent_requests_on_one_thread(client, mock_handler):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={'id': request.url.path.split('/')[-1], 'type': 'file'}
+        )
+
+    mock_handler.side_effect = handler
+
+    async def get_files():
+        return await asyncio.gather(
+            *(client.files.get_file_by_id(str(file_id)) for file_id in range(1000))
+        )
+
+    files = asyncio.run(get_files())
+
+    assert [file.id for file in files] == [str(file_id) for file_id in range(1000)]
+
+
+def test_raw_responses_return_parsed_json(client, mock_handler):
+    mock_handler.return_value = httpx.Response(
+        200, json={'total_count': 1, 'entries': [{'id': '1', 'type': 'file'}]}
+    )
+
+    items = asyncio.run(client.with_raw_responses().folders.get_folder_items('0'))
+
+    assert items == {'total_count': 1, 'entries': [{'id': '1', 'type': 'file'}]}
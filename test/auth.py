@@ -1,3 +1,15 @@
+import multiprocessing
+
+import os
+
+import threading
+
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from unittest.mock import patch
+
 import pytest
 
 from box_sdk_gen.schemas.user_full import UserFull
@@ -48,10 +60,24 @@ from box_sdk_gen.box.oauth import OAuthConfig
 
 from box_sdk_gen.box.token_storage import InMemoryTokenStorage
 
+from box_sdk_gen.box.token_storage import SQLiteTokenStorage
+
+from box_sdk_gen.box.errors import BoxSDKError
+
 from box_sdk_gen.box.jwt_auth import BoxJWTAuth
 
 from box_sdk_gen.box.jwt_auth import JWTConfig
 
+from box_sdk_gen.box.token_refresher import TokenRefresher
+
+from box_sdk_gen.box.token_pool import TokenPool
+
+from box_sdk_gen.box.downscoped_token_cache import DownscopedTokenCache
+
+from box_sdk_gen.internal.utils import get_epoch_time_in_seconds
+
+from box_sdk_gen.managers.authorization import AuthorizationManager
+
 
 def test_jwt_auth():
     user_id: str = get_env_var('USER_ID')
@@ -301,3 +327,376 @@ def test_oauth_auth_downscope():
     with pytest.raises(Exception):
         downscoped_client.files.delete_file_by_id(file.id)
     parent_client.files.delete_file_by_id(file.id)
+
+
+def call_concurrently(function, workers: int = 100) -> list:
+    barrier = threading.Barrier(workers)
+
+    def call(_):
+        barrier.wait()
+        return function()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(call, range(workers)))
+
+
+def mock_token_endpoint(token_requests: list):
+    def request_access_token(*args, **kwargs):
+        token_requests.append(kwargs)
+        threading.Event().wait(0.1)
+        return AccessToken(
+            access_token=f'token_{len(token_requests)}',
+            refresh_token=f'refresh_token_{len(token_requests)}',
+        )
+
+    return patch.object(
+        AuthorizationManager, 'request_access_token', side_effect=request_access_token
+    )
+
+
+def test_ccg_auth_concurrent_token_retrieval_requests_one_token():
+    auth: BoxCCGAuth = BoxCCGAuth(
+        config=CCGConfig(
+            client_id='client_id',
+            client_secret='client_secret',
+            enterprise_id='enterprise_id',
+        )
+    )
+    token_requests: list = []
+    with mock_token_endpoint(token_requests):
+        tokens = call_concurrently(auth.retrieve_token)
+    assert len(token_requests) == 1
+    assert {token.access_token for token in tokens} == {'token_1'}
+
+
+def test_jwt_auth_concurrent_token_refresh_requests_one_token():
+    auth: BoxJWTAuth = BoxJWTAuth(
+        config=JWTConfig(
+            client_id='client_id',
+            client_secret='client_secret',
+            jwt_key_id='jwt_key_id',
+            private_key='private_key',
+            private_key_passphrase='passphrase',
+            enterprise_id='enterprise_id',
+            token_storage=InMemoryTokenStorage(AccessToken(access_token='expired')),
+        )
+    )
+    token_requests: list = []
+    with mock_token_endpoint(token_requests), patch(
+        'box_sdk_gen.box.jwt_auth.create_jwt_assertion', return_value='assertion'
+    ):
+        tokens = call_concurrently(auth.refresh_token)
+    assert len(token_requests) == 1
+    assert {token.access_token for token in tokens} == {'token_1'}
+
+
+def test_oauth_concurrent_token_refresh_uses_refresh_token_once():
+    auth: BoxOAuth = BoxOAuth(
+        config=OAuthConfig(
+            client_id='client_id',
+            client_secret='client_secret',
+            token_storage=InMemoryTokenStorage(
+                AccessToken(access_token='expired', refresh_token='refresh_token_0')
+            ),
+        )
+    )
+    token_requests: list = []
+    with mock_token_endpoint(token_requests):
+        tokens = call_concurrently(auth.refresh_token)
+        assert [request['refresh_token'] for request in token_requests] == [
+            'refresh_token_0'
+        ]
+        assert {token.access_token for token in tokens} == {'token_1'}
+        assert auth.refresh_token().access_token == 'token_2'
+
+
+def create_ccg_auth(token: AccessToken = None) -> BoxCCGAuth:
+    return BoxCCGAuth(
+        config=CCGConfig(
+            client_id='client_id',
+            client_secret='client_secret',
+            enterprise_id='enterprise_id',
+            token_storage=InMemoryTokenStorage(token),
+        )
+    )
+
+
+def test_ccg_auth_records_token_issue_time():
+    auth: BoxCCGAuth = create_ccg_auth()
+    with mock_token_endpoint([]):
+        token: AccessToken = auth.retrieve_token()
+    assert abs(token.issued_at - get_epoch_time_in_seconds()) <= 1
+
+
+def test_ccg_auth_refreshes_token_before_expiry():
+    token: AccessToken = AccessToken(access_token='expiring', expires_in=3600)
+    token.issued_at = get_epoch_time_in_seconds() - 3590
+    auth: BoxCCGAuth = create_ccg_auth(token)
+    token_requests: list = []
+    with mock_token_endpoint(token_requests):
+        assert auth.retrieve_token().access_token == 'token_1'
+        assert auth.retrieve_token().access_token == 'token_1'
+    assert len(token_requests) == 1
+
+
+def test_ccg_auth_keeps_token_without_issue_time():
+    auth: BoxCCGAuth = create_ccg_auth(
+        AccessToken(access_token='token', expires_in=3600)
+    )
+    assert auth.retrieve_token().access_token == 'token'
+
+
+def test_token_refresher_refreshes_token_in_background():
+    token: AccessToken = AccessToken(access_token='expiring', expires_in=3600)
+    token.issued_at = get_epoch_time_in_seconds() - 3500
+    auth: BoxCCGAuth = create_ccg_auth(token)
+    token_requests: list = []
+    with mock_token_endpoint(token_requests):
+        with TokenRefresher(auth, refresh_margin=300):
+            for _ in range(50):
+                if token_requests:
+                    break
+                threading.Event().wait(0.1)
+    assert len(token_requests) == 1
+    assert auth.token_storage.get().access_token == 'token_1'
+
+
+def test_token_pool_reuses_auth_of_subject():
+    pool: TokenPool = TokenPool(create_ccg_auth(), max_size=10)
+    user_auth: BoxCCGAuth = pool.get_user_auth('1')
+    assert pool.get_user_auth('1') is user_auth
+    assert user_auth.subject_id == '1'
+    assert not pool.get_user_auth('2') is user_auth
+    assert pool.get_enterprise_auth('1').subject_type == 'enterprise'
+    assert pool.get_user_client('1') is pool.get_user_client('1')
+    assert pool.get_user_client('1').auth is user_auth
+    assert pool.get_user_client('2').network_session is pool.network_session
+
+
+def test_token_pool_evicts_least_recently_used_subject():
+    pool: TokenPool = TokenPool(create_ccg_auth(), max_size=2)
+    first_auth: BoxCCGAuth = pool.get_user_auth('1')
+    second_auth: BoxCCGAuth = pool.get_user_auth('2')
+    pool.get_user_auth('1')
+    pool.get_user_auth('3')
+    assert len(pool) == 2
+    assert pool.get_user_auth('1') is first_auth
+    assert not pool.get_user_auth('2') is second_auth
+
+
+def test_token_pool_replaces_subject_with_expired_token_on_access():
+    pool: TokenPool = TokenPool(create_ccg_auth(), max_size=10)
+    expired_token: AccessToken = AccessToken(access_token='expired', expires_in=60)
+    expired_token.issued_at = get_epoch_time_in_seconds() - 120
+    expired_auth: BoxCCGAuth = pool.get_user_auth('1')
+    expired_client: BoxClient = pool.get_user_client('1')
+    expired_auth.token_storage.store(expired_token)
+    user_auth: BoxCCGAuth = pool.get_user_auth('1')
+    assert not user_auth is expired_auth
+    assert user_auth.token_storage.get() is None
+    assert not pool.get_user_client('1') is expired_client
+    assert len(pool) == 1
+
+
+def test_token_pool_keeps_subject_with_valid_token():
+    pool: TokenPool = TokenPool(create_ccg_auth(), max_size=2)
+    valid_token: AccessToken = AccessToken(access_token='valid', expires_in=3600)
+    valid_token.issued_at = get_epoch_time_in_seconds()
+    user_auth: BoxCCGAuth = pool.get_user_auth('1')
+    user_auth.token_storage.store(valid_token)
+    pool.get_user_auth('2')
+    assert pool.get_user_auth('1') is user_auth
+    assert pool.get_user_auth('1').token_storage.get() is valid_token
+
+
+def test_token_pool_requires_jwt_or_ccg_auth():
+    with pytest.raises(BoxSDKError):
+        TokenPool(BoxDeveloperTokenAuth(token='token'))
+
+
+def test_client_with_token_pool_shares_network_session():
+    client: BoxClient = BoxClient(auth=create_ccg_auth()).with_extra_headers(
+        extra_headers={'X-Header': 'value'}
+    )
+    pool: TokenPool = client.with_token_pool(max_size=10)
+    assert pool.max_size == 10
+    assert pool.auth is client.auth
+    user_client: BoxClient = pool.get_user_client('1')
+    assert user_client.network_session is client.network_session
+    assert user_client.auth.subject_id == '1'
+
+
+def test_token_pool_requests_one_token_per_subject_for_concurrent_calls():
+    pool: TokenPool = TokenPool(create_ccg_auth(), max_size=10)
+    token_requests: list = []
+    with mock_token_endpoint(token_requests):
+        tokens = call_concurrently(
+            lambda: pool.get_user_auth('1').retrieve_token(), workers=50
+        )
+    assert len(token_requests) == 1
+    assert len({token.access_token for token in tokens}) == 1
+
+
+def test_sqlite_token_storage_shares_token_between_instances(tmp_path):
+    filename: str = str(tmp_path / 'tokens.db')
+    first_storage: SQLiteTokenStorage = SQLiteTokenStorage(filename)
+    second_storage: SQLiteTokenStorage = SQLiteTokenStorage(filename)
+    other_key_storage: SQLiteTokenStorage = SQLiteTokenStorage(filename, key='other')
+    assert first_storage.get() == None
+    token: AccessToken = AccessToken(access_token='token', expires_in=3600)
+    token.issued_at = 1000
+    first_storage.store(token)
+    stored_token: AccessToken = second_storage.get()
+    assert stored_token.access_token == 'token'
+    assert stored_token.expires_in == 3600
+    assert stored_token.issued_at == 1000
+    assert second_storage.get() is stored_token
+    assert other_key_storage.get() == None
+    with first_storage.lock(), first_storage.lock():
+        first_storage.store(AccessToken(access_token='new_token'))
+    assert second_storage.get().access_token == 'new_token'
+    first_storage.clear()
+    assert second_storage.get() == None
+
+
+def test_sqlite_token_storage_lock_does_not_block_database(tmp_path):
+    filename: str = str(tmp_path / 'tokens.db')
+    first_storage: SQLiteTokenStorage = SQLiteTokenStorage(filename)
+    second_storage: SQLiteTokenStorage = SQLiteTokenStorage(filename, timeout=0.2)
+    other_key_storage: SQLiteTokenStorage = SQLiteTokenStorage(
+        filename, key='other', timeout=0.2
+    )
+    with first_storage.lock():
+        # Writes of other processes are not blocked while the token is requested
+        other_key_storage.store(AccessToken(access_token='other_token'))
+        with other_key_storage.lock():
+            pass
+        with pytest.raises(BoxSDKError, match='Timed out'):
+            with second_storage.lock():
+                pass
+    with second_storage.lock():
+        pass
+    assert other_key_storage.get().access_token == 'other_token'
+
+
+def test_sqlite_token_storage_takes_over_expired_lock(tmp_path):
+    filename: str = str(tmp_path / 'tokens.db')
+    crashed_storage: SQLiteTokenStorage = SQLiteTokenStorage(filename, timeout=0.1)
+    storage: SQLiteTokenStorage = SQLiteTokenStorage(filename, timeout=1)
+    crashed_storage._ensure_connections()
+    crashed_storage._acquire_lock()
+    started_at: float = time.monotonic()
+    with storage.lock():
+        assert time.monotonic() - started_at < 1
+
+
+def retrieve_token_in_process(filename: str, counter_filename: str, barrier):
+    def request_access_token(*args, **kwargs):
+        with open(counter_filename, 'a') as counter_file:
+            counter_file.write('token request\n')
+        time.sleep(0.5)
+        return AccessToken(access_token=f'token_{os.getpid()}', expires_in=3600)
+
+    auth: BoxCCGAuth = BoxCCGAuth(
+        config=CCGConfig(
+            client_id='client_id',
+            client_secret='client_secret',
+            enterprise_id='enterprise_id',
+            token_storage=SQLiteTokenStorage(filename),
+        )
+    )
+    with patch.object(
+        AuthorizationManager, 'request_access_token', side_effect=request_access_token
+    ):
+        barrier.wait()
+        return auth.retrieve_token().access_token
+
+
+def test_sqlite_token_storage_requests_one_token_for_all_processes(tmp_path):
+    filename: str = str(tmp_path / 'tokens.db')
+    counter_filename: str = str(tmp_path / 'token_requests.txt')
+    processes: int = 4
+    context = multiprocessing.get_context('spawn')
+    with context.Manager() as manager, context.Pool(processes) as pool:
+        barrier = manager.Barrier(processes)
+        tokens = pool.starmap(
+            retrieve_token_in_process,
+            [(filename, counter_filename, barrier)] * processes,
+        )
+    with open(counter_filename) as counter_file:
+        assert len(counter_file.readlines()) == 1
+    assert len(set(tokens)) == 1
+
+
+def test_downscoped_token_cache_reuses_token_until_expiry():
+    auth: BoxDeveloperTokenAuth = BoxDeveloperTokenAuth(token='developer_token')
+    issued_tokens: list = []
+
+    def downscope_token(scopes, **kwargs):
+        issued_tokens.append((scopes, kwargs['resource']))
+        return AccessToken(
+            access_token=f'downscoped_{len(issued_tokens)}', expires_in=3600
+        )
+
+    cache: DownscopedTokenCache = DownscopedTokenCache(auth, max_size=2)
+    with patch.object(auth, 'downscope_token', side_effect=downscope_token):
+        token: AccessToken = cache.downscope_token(
+            ['item_preview', 'item_download'],
+            resource='https://api.box.com/2.0/files/1',
+        )
+        assert (
+            cache.downscope_token(
+                ['item_download', 'item_preview'],
+                resource='https://api.box.com/2.0/files/1',
+            )
+            is token
+        )
+        assert (
+            not cache.downscope_token(
+                ['item_preview'], resource='https://api.box.com/2.0/files/1'
+            )
+            is token
+        )
+        token.issued_at = get_epoch_time_in_seconds() - 3590
+        assert (
+            cache.downscope_token(
+                ['item_preview', 'item_download'],
+                resource='https://api.box.com/2.0/files/1',
+            ).access_token
+            == 'downscoped_3'
+        )
+    assert len(issued_tokens) == 3
+
+
+def test_downscoped_token_cache_evicts_least_recently_used_token():
+    auth: BoxDeveloperTokenAuth = BoxDeveloperTokenAuth(token='developer_token')
+    cache: DownscopedTokenCache = DownscopedTokenCache(auth, max_size=2)
+    with patch.object(
+        auth,
+        'downscope_token',
+        side_effect=lambda scopes, **kwargs: AccessToken(
+            access_token=kwargs['resource'], expires_in=3600
+        ),
+    ) as downscope_token:
+        for resource in ['1', '2', '1', '3', '1', '2']:
+            cache.downscope_token(['item_preview'], resource=resource)
+    assert len(cache) == 2
+    assert downscope_token.call_count == 4
+
+
+def test_downscoped_token_cache_exchanges_token_once_for_concurrent_calls():
+    auth: BoxDeveloperTokenAuth = BoxDeveloperTokenAuth(token='developer_token')
+    cache: DownscopedTokenCache = DownscopedTokenCache(auth)
+
+    def downscope_token(scopes, **kwargs):
+        threading.Event().wait(0.1)
+        return AccessToken(access_token='downscoped', expires_in=3600)
+
+    with patch.object(
+        auth, 'downscope_token', side_effect=downscope_token
+    ) as downscope_token_mock:
+        tokens = call_concurrently(
+            lambda: cache.downscope_token(['item_preview'], resource='1'), workers=20
+        )
+    assert downscope_token_mock.call_count == 1
+    assert len({id(token) for token in tokens}) == 1
@@ -10,6 +10,8 @@ from test.commons import get_default_client
 
 from box_sdk_gen.schemas.file import File
 
+from box_sdk_gen.box.upload_session_journal import InMemoryUploadSessionJournal
+
 client: BoxClient = get_default_client()
 
 
@@ -25,3 +27,32 @@ def testChunkedUpload():
     assert uploaded_file.size == file_size
     assert uploaded_file.parent.id == parent_folder_id
     client.files.delete_file_by_id(uploaded_file.id)
+
+
+def testChunkedUploadWithConcurrentParts():
+    file_size: int = (20 * 1024) * 1024
+    file_byte_stream: ByteStream = generate_byte_stream(file_size)
+    file_name: str = get_uuid()
+    parent_folder_id: str = '0'
+    uploaded_file: File = client.chunked_uploads.upload_big_file(
+        file_byte_stream, file_name, file_size, parent_folder_id, max_workers=4
+    )
+    assert uploaded_file.name == file_name
+    assert uploaded_file.size == file_size
+    assert uploaded_file.parent.id == parent_folder_id
+    client.files.delete_file_by_id(uploaded_file.id)
+
+
+def testChunkedUploadWithJournal():
+    file_size: int = (20 * 1024) * 1024
+    file_byte_stream: ByteStream = generate_byte_stream(file_size)
+    file_name: str = get_uuid()
+    parent_folder_id: str = '0'
+    journal: InMemoryUploadSessionJournal = InMemoryUploadSessionJournal()
+    uploaded_file: File = client.chunked_uploads.upload_big_file(
+        file_byte_stream, file_name, file_size, parent_folder_id, journal=journal
+    )
+    assert uploaded_file.name == file_name
+    assert uploaded_file.size == file_size
+    assert journal.get() == None
+    client.files.delete_file_by_id(uploaded_file.id)
@@ -64,6 +64,26 @@ from box_sdk_gen.box.jwt_auth import BoxJWTAuth
 
 from box_sdk_gen.box.jwt_auth import JWTConfig
 
+import hashlib
+
+import json
+
+from typing import Callable
+
+from typing import Dict
+
+from unittest.mock import Mock
+
+from urllib.parse import urlsplit
+
+from box_sdk_gen.networking.auth import Authentication
+
+from box_sdk_gen.networking.network import NetworkSession
+
+from box_sdk_gen.networking.transport import InMemoryTransport
+
+from box_sdk_gen.networking.transport import TransportResponse
+
 
 def get_jwt_auth() -> BoxJWTAuth:
     jwt_config: JWTConfig = JWTConfig.from_config_json_string(
@@ -174,3 +194,117 @@ def get_or_create_shield_information_barrier(
             EnterpriseBase(id=enterprise_id)
         )
     return barriers.entries[number_of_barriers - 1]
+
+
+def create_client(
+    handler: Callable[..., TransportResponse], **session_kwargs
+) -> BoxClient:
+    """
+    Create a client sending its requests to the given handler instead of the API, for offline tests.
+    :param handler: Function receiving a request and its body and returning the response, as used by InMemoryTransport
+    :param session_kwargs: Other arguments of the network session of the client
+    """
+    auth = Mock(Authentication)
+    auth.retrieve_authorization_header.return_value = 'Bearer token'
+    return BoxClient(
+        auth=auth,
+        network_session=NetworkSession(
+            transport=InMemoryTransport(handler), **session_kwargs
+        ),
+    )
+
+
+PART_SIZE = 1024
+
+
+class FakeUploadSessionApi:
+    """
+    Upload session endpoints of the API, keeping the uploaded parts in memory.
+    """
+
+    def __init__(self):
+        self.sessions: Dict[str, Dict[int, bytes]] = {}
+        self.file_sizes: Dict[str, int] = {}
+        self.uploaded_offsets: List[int] = []
+        self.committed: Dict[str, bytes] = {}
+
+    def add_session(self, session_id: str, file_size: int) -> None:
+        self.sessions[session_id] = {}
+        self.file_sizes[session_id] = file_size
+
+    def add_part(self, session_id: str, offset: int, content: bytes) -> None:
+        self.sessions[session_id][offset] = content
+
+    def handle(self, request, body: bytes) -> TransportResponse:
+        path = urlsplit(request.url).path.split('/files/upload_sessions')[1]
+        segments = [segment for segment in path.split('/') if segment]
+        if not segments:
+            attributes = json.loads(body)
+            session_id = f'session-{len(self.sessions) + 1}'
+            self.add_session(session_id, attributes['file_size'])
+            return self.json(201, self.session_json(session_id))
+        session_id = segments[0]
+        if session_id not in self.sessions:
+            return self.json(404, {'type': 'error', 'status': 404, 'code': 'not_found'})
+        if len(segments) == 2 and segments[1] == 'parts':
+            parts = self.parts_json(session_id)
+            offset = int(request.params.get('offset') or 0)
+            limit = int(request.params.get('limit') or len(parts))
+            return self.json(
+                200,
+                {'total_count': len(parts), 'entries': parts[offset : offset + limit]},
+            )
+        if len(segments) == 2 and segments[1] == 'commit':
+            parts = self.sessions[session_id]
+            self.committed[session_id] = b''.join(
+                parts[offset] for offset in sorted(parts)
+            )
+            return self.json(
+                201,
+                {
+                    'total_count': 1,
+                    'entries': [
+                        {
+                            'id': '12345',
+                            'type': 'file',
+                            'size': len(self.committed[session_id]),
+                        }
+                    ],
+                },
+            )
+        if request.method == 'PUT':
+            offset = int(request.headers['content-range'].split(' ')[1].split('-')[0])
+            self.uploaded_offsets.append(offset)
+            self.add_part(session_id, offset, body)
+            return self.json(200, {'part': self.part_json(offset, body)})
+        return self.json(200, self.session_json(session_id))
+
+    def session_json(self, session_id: str) -> dict:
+        return {
+            'id': session_id,
+            'type': 'upload_session',
+            'part_size': PART_SIZE,
+            'total_parts': -(-self.file_sizes[session_id] // PART_SIZE),
+            'num_parts_processed': len(self.sessions[session_id]),
+        }
+
+    def parts_json(self, session_id: str) -> List[dict]:
+        parts = self.sessions[session_id]
+        return [self.part_json(offset, parts[offset]) for offset in sorted(parts)]
+
+    @staticmethod
+    def part_json(offset: int, content: bytes) -> dict:
+        return {
+            'part_id': f'part-{offset}',
+            'offset': offset,
+            'size': len(content),
+            'sha1': hashlib.sha1(content).hexdigest(),
+        }
+
+    @staticmethod
+    def json(status_code: int, body: dict) -> TransportResponse:
+        return TransportResponse(
+            status_code,
+            {'Content-Type': 'application/json'},
+            json.dumps(body).encode(),
+        )
@@ -20,6 +20,8 @@ from box_sdk_gen.internal.utils import generate_byte_stream_from_buffer
 
 from box_sdk_gen.internal.utils import buffer_equals
 
+from box_sdk_gen.internal.utils import buffer_length
+
 from box_sdk_gen.internal.utils import read_byte_stream
 
 from test.commons import get_default_client
@@ -47,3 +49,58 @@ def test_download_file():
     )
     assert buffer_equals(read_byte_stream(downloaded_file_content), file_buffer)
     client.files.delete_file_by_id(uploaded_file.id)
+
+
+def test_download_file_to(tmp_path):
+    new_file_name: str = get_uuid()
+    file_buffer: Buffer = generate_byte_buffer(1024 * 1024)
+    file_content_stream: ByteStream = generate_byte_stream_from_buffer(file_buffer)
+    uploaded_files: Files = client.uploads.upload_file(
+        UploadFileAttributes(
+            name=new_file_name, parent=UploadFileAttributesParentField(id='0')
+        ),
+        file_content_stream,
+    )
+    uploaded_file: FileFull = uploaded_files.entries[0]
+    destination = tmp_path / new_file_name
+    written: int = client.downloads.download_file_to(uploaded_file.id, destination)
+    assert written == buffer_length(file_buffer)
+    assert buffer_equals(destination.read_bytes(), file_buffer)
+    client.files.delete_file_by_id(uploaded_file.id)
+
+
+def test_download_file_in_parallel(tmp_path):
+    new_file_name: str = get_uuid()
+    file_buffer: Buffer = generate_byte_buffer(1024 * 1024)
+    file_content_stream: ByteStream = generate_byte_stream_from_buffer(file_buffer)
+    uploaded_files: Files = client.uploads.upload_file(
+        UploadFileAttributes(
+            name=new_file_name, parent=UploadFileAttributesParentField(id='0')
+        ),
+        file_content_stream,
+    )
+    uploaded_file: FileFull = uploaded_files.entries[0]
+    destination = tmp_path / new_file_name
+    client.downloads.download_file_in_parallel(
+        uploaded_file.id, str(destination), range_size=256 * 1024
+    )
+    assert buffer_equals(destination.read_bytes(), file_buffer)
+    client.files.delete_file_by_id(uploaded_file.id)
+
+
+def test_download_file_resumable():
+    new_file_name: str = get_uuid()
+    file_buffer: Buffer = generate_byte_buffer(1024 * 1024)
+    file_content_stream: ByteStream = generate_byte_stream_from_buffer(file_buffer)
+    uploaded_files: Files = client.uploads.upload_file(
+        UploadFileAttributes(
+            name=new_file_name, parent=UploadFileAttributesParentField(id='0')
+        ),
+        file_content_stream,
+    )
+    uploaded_file: FileFull = uploaded_files.entries[0]
+    downloaded_file_content: ByteStream = client.downloads.download_file_resumable(
+        uploaded_file.id
+    )
+    assert buffer_equals(read_byte_stream(downloaded_file_content), file_buffer)
+    client.files.delete_file_by_id(uploaded_file.id)
@@ -1,12 +1,29 @@
+import asyncio
 import pytest
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from collections import OrderedDict
 from io import BytesIO
 from unittest import mock
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 from requests import Session, Response, RequestException
 
-from box_sdk_gen import NetworkSession, BoxAPIError, Authentication, BoxSDKError
+from box_sdk_gen import (
+    NetworkSession,
+    BoxAPIError,
+    Authentication,
+    BoxSDKError,
+    BaseUrls,
+    RetryJitter,
+    RetryPolicy,
+    StatusRetryRule,
+)
+from box_sdk_gen.box.ccg_auth import BoxCCGAuth, CCGConfig
+from box_sdk_gen.box.token_storage import InMemoryTokenStorage
+from box_sdk_gen.managers.authorization import AuthorizationManager
+from box_sdk_gen.schemas.access_token import AccessToken
+from box_sdk_gen.internal.utils import StreamingResponseByteStream
 from box_sdk_gen.networking.fetch import (
     fetch,
     FetchOptions,
@@ -15,13 +32,27 @@ from box_sdk_gen.networking.fetch import (
     __prepare_request,
     __make_request,
     __raise_on_unsuccessful_request,
-    __get_retry_after_time,
     USER_AGENT_HEADER,
     X_BOX_UA_HEADER,
     APIRequest,
     APIResponse,
     MultipartItem,
+    DEFAULT_MAX_ATTEMPTS,
+    _get_default_requests_session,
+)
+from box_sdk_gen.serialization.json.json_data import (
+    JsonBackend,
+    get_json_backend,
+    json_to_serialized_data,
+    sd_to_json,
+    sd_to_json_bytes,
+    set_json_backend,
 )
+from box_sdk_gen.networking.connection_pool import (
+    ConnectionPoolConfig,
+    PooledHTTPAdapter,
+)
+from box_sdk_gen.networking.transport import RequestsTransport
 
 
 @pytest.fixture
@@ -131,7 +162,10 @@ def test_use_default_session_and_max_attempts_when_network_session_not_provided(
     mock_requests_session, response_500
 ):
     mock_requests_session.request.return_value = response_500
-    with patch('requests.Session', return_value=mock_requests_session):
+    with patch(
+        'box_sdk_gen.networking.fetch._get_default_requests_session',
+        return_value=mock_requests_session,
+    ):
         options = FetchOptions(method="GET")
 
         with pytest.raises(BoxAPIError):
@@ -140,6 +174,99 @@ def test_use_default_session_and_max_attempts_when_network_session_not_provided(
         assert mock_requests_session.request.call_count == 5
 
 
+def test_default_max_attempts_is_still_importable_from_fetch():
+    assert DEFAULT_MAX_ATTEMPTS == RetryPolicy().get_max_attempts() == 5
+
+
+def test_default_session_is_shared_when_network_session_not_provided():
+    assert _get_default_requests_session() is _get_default_requests_session()
+
+
+def test_network_session_mounts_configured_connection_pool():
+    pool_config = ConnectionPoolConfig(pool_maxsize=64, pool_block=True)
+    network_session = NetworkSession(connection_pool_config=pool_config)
+
+    for prefix in ('https://', 'http://'):
+        adapter = network_session.requests_session.get_adapter(f'{prefix}api.box.com')
+        assert isinstance(adapter, PooledHTTPAdapter)
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 64
+        assert adapter.poolmanager.connection_pool_kw['block'] is True
+        assert (
+            adapter.poolmanager.connection_pool_kw['socket_options']
+            == pool_config.socket_options()
+        )
+    assert (
+        network_session.with_additional_headers(
+            {'As-User': '123'}
+        ).connection_pool_config
+        is pool_config
+    )
+
+
+def test_derived_network_sessions_share_connection_pools():
+    network_session = NetworkSession(additional_headers={'header': 'value'})
+    network_session.MAX_ATTEMPTS = 2
+
+    derived_session = network_session.with_additional_headers(
+        {'As-User': '123'}
+    ).with_custom_base_urls(BaseUrls(base_url='https://example.com'))
+
+    assert derived_session.requests_session is network_session.requests_session
+
+    async def get_async_http_clients():
+        return derived_session.async_http_client, network_session.async_http_client
+
+    derived_async_http_client, async_http_client = asyncio.run(get_async_http_clients())
+    assert derived_async_http_client is async_http_client
+    assert derived_session.additional_headers == {'header': 'value', 'As-User': '123'}
+    assert derived_session.base_urls.base_url == 'https://example.com'
+    assert derived_session.MAX_ATTEMPTS == 2
+    assert network_session.additional_headers == {'header': 'value'}
+    assert network_session.base_urls.base_url != 'https://example.com'
+
+
+def test_network_session_with_stream_downloads():
+    network_session = NetworkSession(download_chunk_size=1000)
+
+    streaming_session = network_session.with_stream_downloads()
+
+    assert streaming_session.stream_downloads
+    assert streaming_session.download_chunk_size == 1000
+    assert streaming_session.requests_session is network_session.requests_session
+    assert not network_session.stream_downloads
+    assert not streaming_session.with_stream_downloads(False).stream_downloads
+
+
+def test_each_event_loop_gets_its_own_async_http_client():
+    network_session = NetworkSession()
+
+    async def get_async_http_client():
+        return network_session.async_http_client, network_session.async_http_client
+
+    first_client, same_client = asyncio.run(get_async_http_client())
+    second_client, _ = asyncio.run(get_async_http_client())
+
+    assert first_client is same_client
+    assert second_client is not first_client
+    # Clients of closed loops are not kept
+    assert len(network_session._async_http_clients) <= 1
+
+
+def test_pooled_adapter_drops_connections_idle_longer_than_idle_timeout():
+    adapter = PooledHTTPAdapter(ConnectionPoolConfig(idle_timeout=30))
+    adapter.poolmanager = Mock()
+
+    with patch('time.monotonic', return_value=adapter._last_request_time + 10):
+        with patch('requests.adapters.HTTPAdapter.send'):
+            adapter.send(Mock())
+    adapter.poolmanager.clear.assert_not_called()
+
+    with patch('time.monotonic', return_value=adapter._last_request_time + 31):
+        with patch('requests.adapters.HTTPAdapter.send'):
+            adapter.send(Mock())
+    adapter.poolmanager.clear.assert_called_once()
+
+
 def test_prepare_headers(authentication_mock, token_mock):
     network_session = NetworkSession(additional_headers={"additional_header": "test"})
     options = FetchOptions(
@@ -183,8 +310,12 @@ def test_prepare_headers_reauthenticate(authentication_mock, token2_mock):
 @pytest.mark.parametrize(
     'content_type, data, expected_body',
     [
-        ('application/json', {'key': 'value'}, '{"key": "value"}'),
-        ('application/json-patch+json', {'key': 'value'}, '{"key": "value"}'),
+        ('application/json', {'key': 'value'}, sd_to_json_bytes({'key': 'value'})),
+        (
+            'application/json-patch+json',
+            {'key': 'value'},
+            sd_to_json_bytes({'key': 'value'}),
+        ),
         ('application/x-www-form-urlencoded', {'key': 'value'}, 'key=value'),
         ('multipart/form-data', mock_byte_stream, mock_byte_stream),
         ('application/octet-stream', mock_byte_stream, mock_byte_stream),
@@ -223,7 +354,7 @@ def test_prepare_json_request():
             'Content-Type': 'application/json',
         },
         params={'param': 'value'},
-        data='{"key": "value"}',
+        data=sd_to_json_bytes({'key': 'value'}),
     )
 
 
@@ -252,7 +383,7 @@ def test_prepare_multipart_request(mock_byte_stream):
     assert api_request.params == {}
     assert api_request.data.fields == OrderedDict(
         [
-            ('attributes', '{"name": "file.pdf"}'),
+            ('attributes', sd_to_json({'name': 'file.pdf'})),
             ('file', ('file.pdf', mock_byte_stream, None)),
         ]
     )
@@ -274,7 +405,7 @@ def test_make_request(mock_requests_session, response_200):
     mock_requests_session.request.return_value = response_200
     api_request = APIRequest(**request_params)
 
-    api_response = __make_request(api_request, mock_requests_session)
+    api_response = __make_request(api_request, RequestsTransport(mock_requests_session))
 
     assert api_response == APIResponse(
         network_response=response_200,
@@ -282,7 +413,9 @@ def test_make_request(mock_requests_session, response_200):
         raised_exception=None,
     )
     assert mock_requests_session.request.call_count == 1
-    mock_requests_session.request.assert_called_once_with(**request_params, stream=True)
+    mock_requests_session.request.assert_called_once_with(
+        **request_params, stream=True, timeout=None
+    )
 
 
 def test_make_request_unauthorised(mock_requests_session, response_401):
@@ -290,7 +423,7 @@ def test_make_request_unauthorised(mock_requests_session, response_401):
     api_request = APIRequest(
         "GET", "https://example.com", headers={}, params={}, data=""
     )
-    api_response = __make_request(api_request, mock_requests_session)
+    api_response = __make_request(api_request, RequestsTransport(mock_requests_session))
 
     assert api_response == APIResponse(
         network_response=response_401,
@@ -322,7 +455,7 @@ def test_make_request_network_exception(
     api_request = APIRequest(
         "GET", "https://example.com", headers={}, params={}, data=""
     )
-    api_response = __make_request(api_request, mock_requests_session)
+    api_response = __make_request(api_request, RequestsTransport(mock_requests_session))
 
     assert api_response == APIResponse(
         network_response=None,
@@ -364,6 +497,7 @@ def test_fetch_get_json_format_response_success(
     mock_requests_session, network_session_mock, response_200
 ):
     response_200.text = '{"id": "123456"}'
+    response_200.content = b'{"id": "123456"}'
     mock_requests_session.request.return_value = response_200
 
     fetch_response = fetch(
@@ -376,6 +510,43 @@ def test_fetch_get_json_format_response_success(
     assert fetch_response.headers == {}
 
 
+def test_fetch_reads_json_body_once_without_keeping_raw_content(
+    mock_requests_session, network_session_mock, response_200
+):
+    body = PropertyMock(return_value=b'{"id": "123456"}')
+    text = PropertyMock(side_effect=AssertionError('text must not be decoded'))
+    type(response_200).content = body
+    type(response_200).text = text
+    mock_requests_session.request.return_value = response_200
+
+    fetch_response = fetch(
+        "https://example.com",
+        FetchOptions(network_session=network_session_mock, response_format='json'),
+    )
+
+    assert fetch_response.data == {'id': '123456'}
+    assert fetch_response.content is None
+    body.assert_called_once_with()
+
+
+def test_fetch_get_streamed_binary_format_response(
+    mock_requests_session, network_session_mock, response_200
+):
+    network_session_mock.stream_downloads = True
+    network_session_mock.download_chunk_size = 4
+    response_200.iter_content.return_value = iter([b'bina', b'ry d', b'ata'])
+    mock_requests_session.request.return_value = response_200
+
+    fetch_response = fetch(
+        "https://example.com",
+        FetchOptions(network_session=network_session_mock, response_format='binary'),
+    )
+
+    response_200.iter_content.assert_called_once_with(chunk_size=4)
+    assert isinstance(fetch_response.content, StreamingResponseByteStream)
+    assert fetch_response.content.read() == b'binary data'
+
+
 def test_fetch_get_binary_format_response_success(
     mock_requests_session, network_session_mock, response_200
 ):
@@ -403,6 +574,7 @@ def test_retryable_status_codes(
 ):
     response_failure_no_status.status_code = retryable_status_code
     response_200.text = '{"id": "123456"}'
+    response_200.content = b'{"id": "123456"}'
     mock_requests_session.request.side_effect = [
         response_failure_no_status,
         response_failure_no_status,
@@ -448,6 +620,7 @@ def test_retrying_401_response_with_new_token_and_auth_provided(
     token2_mock,
 ):
     response_200.text = '{"id": "123456"}'
+    response_200.content = b'{"id": "123456"}'
     mock_requests_session.request.side_effect = [response_401, response_200]
 
     with patch('time.sleep'):
@@ -475,6 +648,7 @@ def test_retrying_401_response_with_new_token_and_auth_provided(
                 params={},
                 data=None,
                 stream=True,
+                timeout=None,
             ),
             mock.call(
                 method="GET",
@@ -488,6 +662,7 @@ def test_retrying_401_response_with_new_token_and_auth_provided(
                 params={},
                 data=None,
                 stream=True,
+                timeout=None,
             ),
         ],
     )
@@ -522,6 +697,7 @@ def test_not_retrying_401_when_auth_not_provided(
         params={},
         data=None,
         stream=True,
+        timeout=None,
     )
 
 
@@ -536,15 +712,15 @@ def test_reaching_retry_limit(
     assert mock_requests_session.request.call_count == 5
 
 
-def test_get_retry_after_time_use_retry_after_header_value():
+def test_get_retry_delay_use_retry_after_header_value():
     for attempt_number in range(1, 5):
-        sleep_time = __get_retry_after_time(attempt_number, "213")
+        sleep_time = RetryPolicy().get_retry_delay(attempt_number, 429, "213")
         assert sleep_time == 213
 
 
-def test_get_retry_after_time_use_exponential_backoff():
+def test_get_retry_delay_use_exponential_backoff():
     for attempt_number in range(1, 5):
-        sleep_time = __get_retry_after_time(attempt_number)
+        sleep_time = RetryPolicy().get_retry_delay(attempt_number)
         assert sleep_time > 0
 
 
@@ -707,3 +883,348 @@ def test_raising_exception_raised_by_network_layer():
         assert e.message == "Something went wrong"
         assert e.error == requests_exception
         assert e.name == 'BoxSDKError'
+
+
+def test_refreshing_token_once_when_concurrent_requests_get_401(mock_requests_session):
+    workers = 100
+    token_requests = []
+
+    def request_access_token(*args, **kwargs):
+        token_requests.append(kwargs)
+        threading.Event().wait(0.05)
+        return AccessToken(access_token='new_token')
+
+    def request(**kwargs):
+        response = Mock(Response)
+        response.headers = {}
+        response.text = ''
+        response.content = b''
+        if kwargs['headers']['Authorization'] == 'Bearer old_token':
+            response.status_code, response.ok = 401, False
+        else:
+            response.status_code, response.ok = 200, True
+        return response
+
+    mock_requests_session.request.side_effect = request
+    network_session = NetworkSession()
+    network_session.requests_session = mock_requests_session
+    auth = BoxCCGAuth(
+        config=CCGConfig(
+            client_id='client_id',
+            client_secret='client_secret',
+            enterprise_id='enterprise_id',
+            token_storage=InMemoryTokenStorage(AccessToken(access_token='old_token')),
+        )
+    )
+    barrier = threading.Barrier(workers)
+
+    def make_call():
+        barrier.wait()
+        return fetch(
+            "https://example.com",
+            FetchOptions(method='GET', auth=auth, network_session=network_session),
+        )
+
+    with patch.object(
+        AuthorizationManager,
+        'request_access_token',
+        side_effect=request_access_token,
+    ), patch('time.sleep'):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = list(executor.map(lambda _: make_call(), range(workers)))
+
+    assert all(response.status == 200 for response in responses)
+    assert len(token_requests) == 1
+
+
+@pytest.fixture
+def json_backend():
+    backend = get_json_backend()
+    yield
+    set_json_backend(backend)
+
+
+@pytest.mark.parametrize('backend', ['json', 'orjson'])
+def test_json_backends_parse_bytes_and_serialize_utf8(json_backend, backend):
+    pytest.importorskip(backend)
+    set_json_backend(backend)
+    data = {'name': 'zażółć.txt', 'size': 1, 'tags': [None, True]}
+
+    assert get_json_backend().name == backend
+    assert json_to_serialized_data(sd_to_json_bytes(data)) == data
+    assert json_to_serialized_data(sd_to_json(data)) == data
+    assert json.loads(sd_to_json_bytes(data).decode('utf-8')) == data
+
+
+def test_custom_json_backend_is_used_by_fetch(
+    json_backend, mock_requests_session, network_session_mock, response_200
+):
+    class RecordingBackend(JsonBackend):
+        parsed = []
+
+        def loads(self, data):
+            self.parsed.append(data)
+            return super().loads(data)
+
+    set_json_backend(RecordingBackend())
+    response_200.content = b'{"id": "123456"}'
+    mock_requests_session.request.return_value = response_200
+
+    fetch_response = fetch(
+        "https://example.com",
+        FetchOptions(network_session=network_session_mock, response_format='json'),
+    )
+
+    assert fetch_response.data == {'id': '123456'}
+    assert RecordingBackend.parsed == [b'{"id": "123456"}']
+
+
+def test_setting_unknown_json_backend_raises_error(json_backend):
+    with pytest.raises(ValueError):
+        set_json_backend('unknown')
+
+
+def test_retry_policy_backoff_is_capped_and_randomized():
+    policy = RetryPolicy(base_backoff=2, max_backoff=10, jitter=RetryJitter.NONE)
+    assert [policy.get_backoff(attempt_number) for attempt_number in range(1, 6)] == [
+        2,
+        4,
+        8,
+        10,
+        10,
+    ]
+
+    with patch('random.uniform', side_effect=lambda low, high: high):
+        assert RetryPolicy(jitter=RetryJitter.FULL).get_backoff(2) == 4
+        assert RetryPolicy(jitter=RetryJitter.EQUAL).get_backoff(2) == 4
+        assert RetryPolicy(jitter=RetryJitter.PROPORTIONAL).get_backoff(2) == 6
+        assert (
+            RetryPolicy(jitter=RetryJitter.PROPORTIONAL, max_backoff=5).get_backoff(2)
+            == 5
+        )
+    with patch('random.uniform', side_effect=lambda low, high: low):
+        assert RetryPolicy(jitter=RetryJitter.FULL).get_backoff(2) == 0
+        assert RetryPolicy(jitter=RetryJitter.EQUAL).get_backoff(2) == 2
+        assert RetryPolicy(jitter=RetryJitter.PROPORTIONAL).get_backoff(2) == 2
+
+
+@pytest.mark.parametrize(
+    'method, status_code, expected_call_count',
+    [('GET', 500, 3), ('POST', 500, 1), ('POST', 429, 3), ('PUT', 503, 3)],
+)
+def test_retry_policy_does_not_retry_non_idempotent_methods_on_server_errors(
+    mock_requests_session,
+    network_session_mock,
+    response_500,
+    method,
+    status_code,
+    expected_call_count,
+):
+    response_500.status_code = status_code
+    mock_requests_session.request.return_value = response_500
+    network_session = network_session_mock.with_retry_policy(
+        RetryPolicy(max_attempts=3, retry_non_idempotent_methods=False)
+    )
+
+    with pytest.raises(BoxAPIError):
+        fetch(
+            "https://example.com",
+            FetchOptions(method=method, network_session=network_session),
+        )
+
+    assert mock_requests_session.request.call_count == expected_call_count
+
+
+def test_retry_policy_applies_rules_of_status_codes_before_rules_of_classes(
+    mock_requests_session, network_session_mock, response_500
+):
+    network_session_mock.retry_policy = RetryPolicy(
+        status_rules={
+            503: StatusRetryRule(max_attempts=2, respect_retry_after=False),
+            '5XX': StatusRetryRule(retry=False),
+        },
+        jitter=RetryJitter.NONE,
+    )
+    mock_requests_session.request.return_value = response_500
+
+    with pytest.raises(BoxAPIError):
+        fetch("https://example.com", FetchOptions(network_session=network_session_mock))
+    assert mock_requests_session.request.call_count == 1
+
+    response_500.status_code = 503
+    with patch('time.sleep') as sleep_mock:
+        with pytest.raises(BoxAPIError):
+            fetch(
+                "https://example.com",
+                FetchOptions(network_session=network_session_mock),
+            )
+    assert mock_requests_session.request.call_count == 3
+    # The Retry-After header of the response is ignored
+    sleep_mock.assert_called_once_with(2)
+
+
+def test_retry_policy_limits_retries_of_network_errors(
+    mock_requests_session, network_session_mock, response_200
+):
+    network_session_mock.retry_policy = RetryPolicy(network_error_retries=3)
+    mock_requests_session.request.side_effect = [
+        RequestException('Connection reset'),
+        RequestException('Connection reset'),
+        RequestException('Connection reset'),
+        response_200,
+    ]
+
+    with patch('time.sleep'):
+        fetch("https://example.com", FetchOptions(network_session=network_session_mock))
+    assert mock_requests_session.request.call_count == 4
+
+    mock_requests_session.request.side_effect = RequestException('Connection reset')
+    with patch('time.sleep'):
+        with pytest.raises(BoxSDKError, match='Connection reset'):
+            fetch(
+                "https://example.com",
+                FetchOptions(network_session=network_session_mock),
+            )
+    assert mock_requests_session.request.call_count == 8
+
+
+def test_retry_policy_deadline_limits_time_spent_on_request(
+    mock_requests_session, network_session_mock, response_429, response_500
+):
+    network_session_mock.retry_policy = RetryPolicy(deadline=5, jitter=RetryJitter.NONE)
+    response_429.headers = {'Retry-After': '10'}
+    mock_requests_session.request.return_value = response_429
+
+    with patch('time.sleep') as sleep_mock:
+        with pytest.raises(BoxAPIError):
+            fetch(
+                "https://example.com",
+                FetchOptions(network_session=network_session_mock),
+            )
+
+    # Waiting for the delay requested by the response would exceed the deadline
+    assert mock_requests_session.request.call_count == 1
+    sleep_mock.assert_not_called()
+    timeout = mock_requests_session.request.call_args.kwargs['timeout']
+    assert 4 < timeout <= 5
+
+    mock_requests_session.request.reset_mock()
+    response_500.headers = {}
+    mock_requests_session.request.return_value = response_500
+    clock = [0.0]
+
+    def sleep(seconds: float) -> None:
+        clock[0] += seconds
+
+    with patch('time.monotonic', side_effect=lambda: clock[0]):
+        with patch('time.sleep', side_effect=sleep) as sleep_mock:
+            with pytest.raises(BoxAPIError):
+                fetch(
+                    "https://example.com",
+                    FetchOptions(network_session=network_session_mock),
+                )
+
+    # A backoff of 2 s fits into the deadline, a further backoff of 4 s does not
+    sleep_mock.assert_called_once_with(2)
+    assert [
+        call.kwargs['timeout'] for call in mock_requests_session.request.call_args_list
+    ] == [5, 3]
+
+
+def test_max_attempts_of_session_applies_unless_set_by_retry_policy(
+    mock_requests_session, response_500
+):
+    network_session = NetworkSession()
+    network_session.requests_session = mock_requests_session
+    mock_requests_session.request.return_value = response_500
+    derived_session = network_session.with_additional_headers({'As-User': '123'})
+    derived_session.MAX_ATTEMPTS = 2
+
+    with patch('time.sleep'):
+        for session, attempts in [
+            (network_session, 5),
+            (derived_session, 2),
+            (derived_session.with_retry_policy(RetryPolicy(max_attempts=3)), 3),
+        ]:
+            mock_requests_session.request.reset_mock()
+            with pytest.raises(BoxAPIError):
+                fetch("https://example.com", FetchOptions(network_session=session))
+            assert mock_requests_session.request.call_count == attempts
+
+    assert NetworkSession.MAX_ATTEMPTS == 5
+    assert network_session.MAX_ATTEMPTS == 5
+
+
+def test_max_attempts_can_be_changed_on_class(monkeypatch):
+    monkeypatch.setattr(NetworkSession, 'MAX_ATTEMPTS', 3)
+
+    assert NetworkSession().MAX_ATTEMPTS == 3
+    assert NetworkSession().with_additional_headers({}).MAX_ATTEMPTS == 3
+
+
+def test_deadline_exceeded_while_retrieving_token(
+    mock_requests_session, network_session_mock
+):
+    network_session_mock.retry_policy = RetryPolicy(deadline=5)
+    clock = [0.0]
+    auth = Mock(Authentication)
+
+    def retrieve_authorization_header(network_session=None) -> str:
+        clock[0] += 6
+        return 'Bearer token'
+
+    auth.retrieve_authorization_header.side_effect = retrieve_authorization_header
+
+    with patch('time.monotonic', side_effect=lambda: clock[0]):
+        with pytest.raises(BoxSDKError, match='Deadline'):
+            fetch(
+                "https://example.com",
+                FetchOptions(network_session=network_session_mock, auth=auth),
+            )
+
+    mock_requests_session.request.assert_not_called()
+
+
+def test_time_spent_retrieving_token_is_deducted_from_timeout(
+    mock_requests_session, network_session_mock, response_200
+):
+    network_session_mock.retry_policy = RetryPolicy(deadline=5)
+    mock_requests_session.request.return_value = response_200
+    clock = [0.0]
+    auth = Mock(Authentication)
+
+    def retrieve_authorization_header(network_session=None) -> str:
+        clock[0] += 2
+        return 'Bearer token'
+
+    auth.retrieve_authorization_header.side_effect = retrieve_authorization_header
+
+    with patch('time.monotonic', side_effect=lambda: clock[0]):
+        fetch(
+            "https://example.com",
+            FetchOptions(network_session=network_session_mock, auth=auth),
+        )
+
+    assert mock_requests_session.request.call_args.kwargs['timeout'] == 3
+
+
+def test_request_is_not_retried_without_minimum_time_left(
+    mock_requests_session, network_session_mock, response_500
+):
+    network_session_mock.retry_policy = RetryPolicy(
+        deadline=5, jitter=RetryJitter.NONE, base_backoff=4.5, min_attempt_time=1
+    )
+    response_500.headers = {}
+    mock_requests_session.request.return_value = response_500
+
+    with patch('time.monotonic', return_value=0.0):
+        with patch('time.sleep') as sleep_mock:
+            with pytest.raises(BoxAPIError):
+                fetch(
+                    "https://example.com",
+                    FetchOptions(network_session=network_session_mock),
+                )
+
+    # After the backoff only 0.5 s would be left for the next attempt
+    sleep_mock.assert_not_called()
+    assert mock_requests_session.request.call_count == 1
@@ -0,0 +1,106 @@
+import subprocess
+import sys
+
+import pytest
+
+import box_sdk_gen
+from box_sdk_gen import managers, schemas
+from box_sdk_gen.internal.generate_lazy_exports import collect_exports
+
+
+def run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+@pytest.mark.parametrize('package', [schemas, managers])
+def test_lazy_exports_are_generated_from_submodules(package):
+    # Run `python -m box_sdk_gen.internal.generate_lazy_exports` to update the registries
+    assert package._exports == collect_exports(package.__name__)
+    assert list(package._exports) == list(collect_exports(package.__name__))
+
+
+def test_importing_package_does_not_import_schemas_and_managers():
+    imported_modules = run_python(
+        'import sys, box_sdk_gen; '
+        'print(*(name for name in sys.modules if name.startswith("box_sdk_gen.")))'
+    ).split()
+
+    assert 'box_sdk_gen.schemas' in imported_modules
+    assert 'box_sdk_gen.async_client' not in imported_modules
+    assert 'box_sdk_gen.networking.async_fetch' not in imported_modules
+    # Auth modules import the schemas of tokens and the authorization manager
+    assert [
+        name for name in imported_modules if name.startswith('box_sdk_gen.managers.')
+    ] == ['box_sdk_gen.managers.authorization']
+    assert (
+        len(
+            [
+                name
+                for name in imported_modules
+                if name.startswith('box_sdk_gen.schemas.')
+            ]
+        )
+        < 20
+    )
+
+
+def test_accessing_name_imports_only_its_module():
+    imported_modules = run_python(
+        'import sys, box_sdk_gen; box_sdk_gen.WebLink; '
+        'print(*(name for name in sys.modules if name.startswith("box_sdk_gen.schemas.")))'
+    ).split()
+
+    assert 'box_sdk_gen.schemas.web_link' in imported_modules
+    assert 'box_sdk_gen.schemas.file_full' not in imported_modules
+
+
+def test_lazy_names_are_the_objects_defined_by_submodules():
+    from box_sdk_gen.schemas.file_full import FileFull
+    from box_sdk_gen.managers.files import FilesManager
+    from box_sdk_gen.networking.async_fetch import fetch_async
+
+    assert box_sdk_gen.FileFull is schemas.FileFull is FileFull
+    assert box_sdk_gen.FilesManager is FilesManager
+    assert box_sdk_gen.fetch_async is fetch_async
+    assert 'FileFull' in dir(box_sdk_gen)
+    assert box_sdk_gen.schemas.file_full.FileFull is FileFull
+
+
+def test_star_import_and_names_outside_registry():
+    namespace = {}
+    exec('from box_sdk_gen import *', namespace)
+
+    assert namespace['BoxClient'] is box_sdk_gen.BoxClient
+    assert namespace['FileFull'] is box_sdk_gen.FileFull
+    # Names which used to be re-exported by the star imports of submodules are still available
+    assert box_sdk_gen.schemas.BaseObject is box_sdk_gen.BaseObject
+    with pytest.raises(AttributeError):
+        box_sdk_gen.NoSuchName
+
+
+def test_importing_package_does_not_import_schemas_and_managers():
+    lazy_modules = run_python('import sys, box_sdk_gen; print(len(sys.modules))')
+    eager_modules = run_python(
+        'import sys, box_sdk_gen; from box_sdk_gen import *; import box_sdk_gen.async_client; '
+        'print(len(sys.modules))'
+    )
+    assert int(lazy_modules) < int(eager_modules) - len(schemas._exports)
+
+
+def test_client_creates_managers_on_first_access():
+    imported_modules = run_python(
+        'import sys; from unittest.mock import Mock; '
+        'from box_sdk_gen import BoxClient, Authentication; '
+        'client = BoxClient(auth=Mock(Authentication)).with_as_user_header("1"); '
+        'assert "files" not in vars(client); '
+        'assert client.files is client.files; '
+        'assert client.files.network_session is client.network_session; '
+        'print(*(name for name in sys.modules if name.startswith("box_sdk_gen.managers.")))'
+    ).split()
+
+    assert sorted(imported_modules) == [
+        'box_sdk_gen.managers.authorization',
+        'box_sdk_gen.managers.files',
+    ]
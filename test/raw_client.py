@@ -0,0 +1,116 @@
+import inspect
+import json
+from unittest.mock import Mock
+
+import pytest
+from requests import Response, Session
+
+from box_sdk_gen import (
+    Authentication,
+    BoxClient,
+    FileFull,
+    NetworkSession,
+    RawBoxClient,
+)
+from box_sdk_gen.internal.endpoints import is_manager, list_endpoints
+
+
+@pytest.fixture
+def mock_auth():
+    auth = Mock(Authentication)
+    auth.retrieve_authorization_header.return_value = 'Bearer token'
+    return auth
+
+
+@pytest.fixture
+def network_session():
+    network_session = NetworkSession()
+    network_session.requests_session = Mock(Session)
+    return network_session
+
+
+@pytest.fixture
+def client(mock_auth, network_session):
+    return BoxClient(auth=mock_auth, network_session=network_session)
+
+
+def json_response(status_code: int, body: dict) -> Response:
+    response = Mock(Response)
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.headers = {'Content-Type': 'application/json'}
+    response.text = json.dumps(body)
+    response.content = response.text.encode()
+    return response
+
+
+def test_raw_responses_return_parsed_json(client, network_session):
+    body = {
+        'id': '12345',
+        'type': 'file',
+        'created_at': '2024-01-02T03:04:05Z',
+        'path_collection': {'total_count': 0, 'entries': []},
+    }
+    network_session.requests_session.request.return_value = json_response(200, body)
+
+    raw_file = client.with_raw_responses().files.get_file_by_id(
+        '12345', fields=['created_at']
+    )
+
+    assert raw_file == body
+    assert network_session.requests_session.request.call_args.kwargs['params'] == {
+        'fields': 'created_at'
+    }
+    assert isinstance(client.files.get_file_by_id('12345'), FileFull)
+
+
+def test_raw_client_is_reused_and_shares_network_session(client, mock_auth):
+    raw_client = client.with_raw_responses()
+
+    assert isinstance(raw_client, RawBoxClient)
+    assert client.with_raw_responses() is raw_client
+    assert raw_client.network_session is client.network_session
+    assert raw_client.auth is mock_auth
+    assert raw_client.files is raw_client.files
+
+
+def test_raw_endpoint_without_response_body_returns_none(client, network_session):
+    response = json_response(204, {})
+    response.text = ''
+    response.content = b''
+    network_session.requests_session.request.return_value = response
+
+    assert client.with_raw_responses().files.delete_file_by_id('12345') is None
+
+
+def test_composite_methods_are_not_available_in_raw_client(client):
+    with pytest.raises(AttributeError):
+        client.with_raw_responses().chunked_uploads.upload_big_file
+    assert 'create_file_upload_session' in dir(
+        client.with_raw_responses().chunked_uploads
+    )
+
+
+def test_request_builders_take_the_arguments_of_their_endpoint_methods(client):
+    for manager_name, manager in vars(client).items():
+        if not is_manager(manager):
+            continue
+        for name in list_endpoints(manager):
+            method = inspect.signature(getattr(manager, name))
+            builder = inspect.signature(getattr(manager, f'_{name}_request'))
+            assert list(builder.parameters.values()) == list(
+                method.parameters.values()
+            ), f'{manager_name}.{name}'
+
+
+def test_raw_and_typed_endpoints_send_the_same_request(client, network_session):
+    body = {'id': '12345', 'type': 'folder'}
+    network_session.requests_session.request.return_value = json_response(200, body)
+
+    client.folders.update_folder_by_id('12345', name='new name', fields=['name'])
+    client.with_raw_responses().folders.update_folder_by_id(
+        '12345', name='new name', fields=['name']
+    )
+
+    typed_call, raw_call = network_session.requests_session.request.call_args_list
+    assert typed_call == raw_call
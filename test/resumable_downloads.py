@@ -0,0 +1,260 @@
+import hashlib
+import json
+import os
+import re
+import tracemalloc
+from io import BytesIO
+from typing import Iterator, List, Optional
+from unittest.mock import Mock
+from urllib.parse import urlsplit
+
+import pytest
+
+from box_sdk_gen import BoxAPIError, BoxClient, BoxSDKError
+from box_sdk_gen.internal.utils import Buffer, ResumableByteStream
+from box_sdk_gen.networking.retries import RetryPolicy
+from box_sdk_gen.networking.transport import TransportError, TransportResponse
+from test.commons import create_client
+
+FILE_ID = '12345'
+
+
+class FakeContentApi:
+    """
+    File endpoints of the API, serving the content of a single file version.
+    """
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.ranges: List[Optional[str]] = []
+        self.ignore_range = False
+        self.extra_bytes = b''
+        self.chunk_size = 100
+        # Number of content requests failing before a response is sent
+        self.failing_requests = 0
+        # Number of bytes sent by each content response before the connection drops
+        self.drop_after: List[int] = []
+        # Status of the error responses to content requests, e.g. after the file was deleted
+        self.error_status: Optional[int] = None
+        # Authorization headers of the requests for file information
+        self.file_authorizations: List[Optional[str]] = []
+
+    def handle(self, request, body: bytes) -> TransportResponse:
+        path = urlsplit(request.url).path
+        if not path.endswith('/content'):
+            self.file_authorizations.append(request.headers.get('Authorization'))
+            return TransportResponse(
+                200,
+                {'Content-Type': 'application/json'},
+                json.dumps(
+                    {
+                        'id': FILE_ID,
+                        'type': 'file',
+                        'size': len(self.content),
+                        'sha1': hashlib.sha1(self.content).hexdigest(),
+                        'file_version': {'id': '1', 'type': 'file_version'},
+                    }
+                ).encode(),
+            )
+        range_header = request.headers.get('range')
+        self.ranges.append(range_header)
+        if self.failing_requests:
+            self.failing_requests -= 1
+            raise TransportError('Connection refused')
+        if self.error_status is not None:
+            return TransportResponse(
+                self.error_status,
+                {'Content-Type': 'application/json'},
+                json.dumps({'type': 'error', 'status': self.error_status}).encode(),
+            )
+        if range_header is None or self.ignore_range:
+            return self.content_response(200, {}, self.content)
+        first_byte, last_byte = re.match(r'bytes=(\d+)-(\d*)', range_header).groups()
+        first_byte = int(first_byte)
+        last_byte = int(last_byte) if last_byte else len(self.content) - 1
+        # The content is not copied, so that the memory used by the client can be measured
+        body = memoryview(self.content)[first_byte : last_byte + 1]
+        if self.extra_bytes:
+            body = bytes(body) + self.extra_bytes
+        return self.content_response(
+            206,
+            {'Content-Range': f'bytes {first_byte}-{last_byte}/{len(self.content)}'},
+            body,
+        )
+
+    def content_response(
+        self, status_code: int, headers: dict, content: Buffer
+    ) -> TransportResponse:
+        drop_after = self.drop_after.pop(0) if self.drop_after else None
+        return TransportResponse(
+            status_code, headers, chunks=self.chunks(content, drop_after)
+        )
+
+    def chunks(self, content: Buffer, drop_after: Optional[int]) -> Iterator[bytes]:
+        for start in range(0, len(content), self.chunk_size):
+            if drop_after is not None and start >= drop_after:
+                raise TransportError('Connection dropped')
+            yield bytes(content[start : start + self.chunk_size])
+
+
+@pytest.fixture
+def content() -> bytes:
+    return os.urandom(1000)
+
+
+@pytest.fixture
+def api(content):
+    return FakeContentApi(content)
+
+
+def create_content_client(api: FakeContentApi) -> BoxClient:
+    return create_client(
+        api.handle,
+        download_chunk_size=api.chunk_size,
+        retry_policy=RetryPolicy(network_error_retries=0),
+    )
+
+
+@pytest.fixture
+def client(api):
+    return create_content_client(api)
+
+
+def test_download_file_in_parallel_resumes_dropped_range(
+    client, api, content, tmp_path
+):
+    api.drop_after = [200]
+
+    client.downloads.download_file_in_parallel(
+        FILE_ID, str(tmp_path / 'file'), range_size=400, max_workers=1
+    )
+
+    assert (tmp_path / 'file').read_bytes() == content
+    assert api.ranges == [
+        'bytes=0-399',
+        'bytes=200-399',
+        'bytes=400-799',
+        'bytes=800-999',
+    ]
+
+
+def test_download_file_in_parallel_fails_when_range_is_ignored(client, api, tmp_path):
+    api.ignore_range = True
+
+    with pytest.raises(BoxSDKError, match='does not contain the requested byte range'):
+        client.downloads.download_file_in_parallel(
+            FILE_ID, str(tmp_path / 'file'), range_size=400, max_workers=1
+        )
+
+    assert api.ranges == ['bytes=0-399']
+
+
+def test_download_file_in_parallel_does_not_retry_oversized_range(
+    client, api, tmp_path
+):
+    api.extra_bytes = b'0'
+
+    with pytest.raises(BoxSDKError, match='more data than the requested byte range'):
+        client.downloads.download_file_in_parallel(
+            FILE_ID, str(tmp_path / 'file'), range_size=400, max_workers=1
+        )
+
+    assert api.ranges == ['bytes=0-399']
+
+
+def test_download_file_resumable_continues_after_dropped_connection(
+    client, api, content
+):
+    api.drop_after = [300, 200]
+
+    stream = client.downloads.download_file_resumable(FILE_ID, version='1')
+
+    assert stream.read() == content
+    assert api.ranges == [None, 'bytes=300-', 'bytes=500-']
+
+
+def test_download_file_resumable_counts_failed_reopen_as_attempt(client, api, content):
+    api.drop_after = [300]
+
+    stream = client.downloads.download_file_resumable(
+        FILE_ID, version='1', max_attempts=3
+    )
+    assert stream.read(300) == content[:300]
+    api.failing_requests = 1
+
+    assert stream.read() == content[300:]
+    assert api.ranges == [None, 'bytes=300-', 'bytes=300-']
+
+
+def test_download_file_resumable_gives_up_when_reopen_keeps_failing(
+    client, api, content
+):
+    api.drop_after = [300]
+
+    stream = client.downloads.download_file_resumable(
+        FILE_ID, version='1', max_attempts=3
+    )
+    assert stream.read(300) == content[:300]
+    api.failing_requests = 2
+
+    with pytest.raises(BoxSDKError):
+        stream.read()
+    assert api.ranges == [None, 'bytes=300-', 'bytes=300-']
+
+
+def test_download_file_resumable_looks_up_version_with_access_token(
+    client, api, content
+):
+    stream = client.downloads.download_file_resumable(
+        FILE_ID, access_token='download-token'
+    )
+
+    assert stream.read() == content
+    assert api.file_authorizations == ['Bearer download-token']
+
+
+def test_download_file_resumable_does_not_retry_api_error(client, api, content):
+    api.drop_after = [300]
+
+    stream = client.downloads.download_file_resumable(
+        FILE_ID, version='1', max_attempts=3
+    )
+    assert stream.read(300) == content[:300]
+    api.error_status = 404
+
+    with pytest.raises(BoxAPIError):
+        stream.read()
+    assert api.ranges == [None, 'bytes=300-']
+
+
+def test_resumable_stream_does_not_retry_programming_error():
+    open_stream = Mock(side_effect=[BytesIO(b'content'), ValueError('bug')])
+    stream = ResumableByteStream(open_stream, max_attempts=3)
+    stream._stream.read = Mock(side_effect=TransportError('Connection dropped'))
+
+    with pytest.raises(ValueError):
+        stream.read(5)
+    assert open_stream.call_count == 2
+
+
+def test_download_file_resumable_does_not_keep_read_content(api):
+    api.content = os.urandom(8 * 1024 * 1024)
+    api.chunk_size = 64 * 1024
+    api.drop_after = [4 * 1024 * 1024]
+    client = create_content_client(api)
+
+    stream = client.downloads.download_file_resumable(FILE_ID, version='1')
+    tracemalloc.start()
+    try:
+        read_size = 0
+        chunk = stream.read(api.chunk_size)
+        while chunk:
+            read_size += len(chunk)
+            chunk = stream.read(api.chunk_size)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert read_size == len(api.content)
+    assert api.ranges == [None, f'bytes={4 * 1024 * 1024}-']
+    assert peak_memory < 1024 * 1024
@@ -0,0 +1,225 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+import pytest
+
+from box_sdk_gen import (
+    Event,
+    Events,
+    FileFull,
+    FolderMini,
+    Items,
+    WebLink,
+)
+from box_sdk_gen.internal.base_object import (
+    BaseObject,
+    _deserialization_plans,
+)
+from box_sdk_gen.networking.transport import TransportResponse
+from box_sdk_gen.serialization.json.serializer import deserialize, serialize
+from test.commons import create_client
+
+
+def legacy_from_dict(cls, data: dict):
+    return cls(
+        **{
+            cls._json_to_fields_mapping.get(key, key): cls._deserialize(
+                key,
+                value,
+                cls.__init__.__annotations__.get(
+                    cls._json_to_fields_mapping.get(key, key), None
+                ),
+            )
+            for key, value in data.items()
+        }
+    )
+
+
+ITEMS = {
+    'total_count': 4,
+    'entries': [
+        {
+            'id': '1',
+            'type': 'file',
+            'name': 'a.txt',
+            'created_at': '2024-01-02T03:04:05Z',
+            'content_created_at': 'not a date',
+            'item_status': 'active',
+            'permissions': {'can_download': True, 'can_preview': False},
+            'shared_link': None,
+            'unknown_field': {'kept': 'as is'},
+        },
+        {'id': '2', 'type': 'folder', 'name': 'b', 'etag': '0'},
+        {'id': '3', 'type': 'web_link', 'url': 'https://example.com'},
+        {'id': '4', 'type': 'unknown'},
+    ],
+    'order': [{'by': 'type', 'direction': 'ASC'}],
+}
+
+
+def test_from_dict_matches_deserialization_of_each_field():
+    items = Items.from_dict(ITEMS)
+    legacy_items = legacy_from_dict(Items, ITEMS)
+
+    assert items.to_dict() == legacy_items.to_dict()
+    assert [type(entry) for entry in items.entries] == [
+        type(entry) for entry in legacy_items.entries
+    ]
+    assert [type(entry) for entry in items.entries] == [
+        FileFull,
+        FolderMini,
+        WebLink,
+        FileFull,
+    ]
+    file = items.entries[0]
+    assert file.created_at == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert file.content_created_at == 'not a date'
+    assert file.item_status.value == 'active'
+    # Required fields of the permissions are missing, so they are kept as they are
+    assert file.permissions == {'can_download': True, 'can_preview': False}
+    assert file.unknown_field == {'kept': 'as is'}
+
+
+def test_deserializing_union_returns_discriminated_variant():
+    value = {'id': '2', 'type': 'folder'}
+
+    folder = deserialize(value, Union[FileFull, FolderMini, WebLink])
+
+    assert isinstance(folder, FolderMini)
+    assert folder.id == '2'
+
+
+def test_deserialization_plans_are_cached_per_class():
+    class Parent(BaseObject):
+        _json_to_fields_mapping = {'type': 'type_'}
+
+        def __init__(self, type_: Optional[str] = None, **kwargs):
+            super().__init__(**kwargs)
+            self.type_ = type_
+
+    class Child(Parent):
+        def __init__(self, count: Optional[int] = None, **kwargs):
+            super().__init__(**kwargs)
+            self.count = count
+
+    Parent.from_dict({'type': 'parent'})
+    child = Child.from_dict({'type': 'child', 'count': 1})
+
+    assert child.type_ == 'child'
+    assert set(_deserialization_plans[Parent]) == {'type'}
+    assert set(_deserialization_plans[Child]) == {'type', 'count'}
+
+
+def test_event_source_union_with_dict_variant():
+    events = deserialize(
+        {
+            'entries': [
+                {'type': 'event', 'source': {'type': 'user', 'id': '1'}},
+                {'type': 'event', 'source': {'custom': 'source'}},
+            ],
+            'next_stream_position': 10,
+        },
+        Events,
+    )
+
+    assert all(isinstance(event, Event) for event in events.entries)
+    assert events.entries[0].source.id == '1'
+    assert serialize(events) == serialize(
+        legacy_from_dict(
+            Events,
+            {
+                'entries': [
+                    {'type': 'event', 'source': {'type': 'user', 'id': '1'}},
+                    {'type': 'event', 'source': {'custom': 'source'}},
+                ],
+                'next_stream_position': 10,
+            },
+        )
+    )
+
+
+def test_lazy_deserialization_builds_nested_fields_on_access():
+    items = Items.from_dict(ITEMS, lazy=True)
+
+    assert 'entries' not in vars(items)
+    assert '_lazy_fields' not in vars(items)
+    assert items.total_count == 4
+    assert serialize(items) == serialize(legacy_from_dict(Items, ITEMS))
+
+    entries = items.entries
+
+    assert [type(entry) for entry in entries] == [
+        FileFull,
+        FolderMini,
+        WebLink,
+        FileFull,
+    ]
+    assert items.entries is entries
+    file = entries[0]
+    assert file.created_at == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert file.item_status.value == 'active'
+    assert file.permissions == {'can_download': True, 'can_preview': False}
+    assert file.shared_link is None
+    assert items.to_dict() == legacy_from_dict(Items, ITEMS).to_dict()
+
+
+def test_deserialization_is_eager_by_default():
+    items = deserialize(ITEMS, Items)
+
+    assert 'entries' in vars(items)
+    assert 'permissions' in vars(items.entries[0])
+    lazy_items = deserialize(ITEMS, Items, lazy=True)
+    assert 'entries' not in vars(lazy_items)
+    # Nested objects are deserialized lazily as well
+    assert 'permissions' not in vars(lazy_items.entries[0])
+
+
+def test_lazy_deserialization_of_network_session():
+    def handle(request, body: bytes) -> TransportResponse:
+        return TransportResponse(
+            200, {'Content-Type': 'application/json'}, json.dumps(ITEMS).encode()
+        )
+
+    client = create_client(handle, lazy_deserialization=True)
+
+    items = client.with_extra_headers(extra_headers={}).folders.get_folder_items('0')
+
+    assert 'entries' not in vars(items)
+    assert items.to_dict() == Items.from_dict(ITEMS).to_dict()
+    eager_client = create_client(handle)
+    assert 'entries' in vars(eager_client.folders.get_folder_items('0'))
+
+
+def test_lazy_fields_are_built_once_by_concurrent_threads():
+    for _ in range(20):
+        items = Items.from_dict(ITEMS, lazy=True)
+        barrier = threading.Barrier(8)
+
+        def read_entries(_):
+            barrier.wait()
+            return items.entries
+
+        with ThreadPoolExecutor(8) as executor:
+            entries = list(executor.map(read_entries, range(8)))
+
+        assert all(entry is items.entries for entry in entries)
+
+
+def test_lazy_fields_can_be_replaced():
+    items = Items.from_dict(ITEMS, lazy=True)
+
+    items.entries = []
+
+    assert items.entries == []
+    assert items.to_dict()['entries'] == []
+
+
+def test_missing_attributes_raise_attribute_error():
+    items = Items.from_dict(ITEMS, lazy=True)
+
+    with pytest.raises(AttributeError):
+        items.missing_field
+    assert getattr(items, 'missing_field', None) is None
@@ -0,0 +1,784 @@
+import asyncio
+import datetime
+import gc
+import ipaddress
+import ssl
+import threading
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import Mock
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+import httpx
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+except ImportError:
+    h2 = None
+
+from box_sdk_gen import (
+    Authentication,
+    BoxAPIError,
+    BoxSDKError,
+    ConnectionPoolConfig,
+    HttpxTransport,
+    NetworkSession,
+)
+from box_sdk_gen.internal.utils import read_byte_stream
+from box_sdk_gen.networking.fetch import FetchOptions, MultipartItem, fetch
+from box_sdk_gen.networking.httpx_transport import httpx_transport_options
+from box_sdk_gen.networking.transport import (
+    HTTPTransport,
+    InMemoryTransport,
+    TransportError,
+    TransportResponse,
+)
+from box_sdk_gen.serialization.json.json_data import (
+    json_to_serialized_data,
+    sd_to_json,
+    sd_to_json_bytes,
+)
+
+# Conformance tests, which every transport has to pass. The same routes are served by a local HTTP server,
+# used by transports sending requests over the network, and called directly by the in-memory transport.
+
+_attempts = Counter()
+_attempts_lock = threading.Lock()
+
+
+def count_attempt(key: str) -> int:
+    with _attempts_lock:
+        _attempts[key] += 1
+        return _attempts[key]
+
+
+def handle(
+    method: str, path: str, query: Dict[str, str], headers: Dict[str, str], body: bytes
+) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Respond to a request. Raises TransportError, when the connection should be dropped without a response.
+    """
+    json_headers = {'Content-Type': 'application/json'}
+    route, _, key = path.strip('/').partition('/')
+    if route == 'echo':
+        return (
+            200,
+            {**json_headers, 'X-Echo': 'echo'},
+            sd_to_json_bytes(
+                {
+                    'method': method,
+                    'query': query,
+                    'headers': {name.lower(): value for name, value in headers.items()},
+                    'body': body.decode('latin-1'),
+                }
+            ),
+        )
+    if route == 'binary':
+        size = int(query['size'])
+        return (
+            200,
+            {'Content-Type': 'application/octet-stream'},
+            bytes(index % 251 for index in range(size)),
+        )
+    if route == 'status':
+        status = int(key)
+        if status < 400:
+            return status, {}, b''
+        return (
+            status,
+            json_headers,
+            sd_to_json_bytes(
+                {'type': 'error', 'code': 'not_found', 'request_id': 'request-id'}
+            ),
+        )
+    if route == 'flaky':
+        if count_attempt(key) <= int(query['failures']):
+            return int(query['status']), {'Retry-After': '0'}, b''
+        return 200, json_headers, sd_to_json_bytes({'attempts': _attempts[key]})
+    if route == 'disconnect':
+        if count_attempt(key) <= int(query['failures']):
+            raise TransportError('Connection dropped')
+        return 200, json_headers, sd_to_json_bytes({'attempts': _attempts[key]})
+    if route == 'authorized':
+        count_attempt(key)
+        if {name.lower(): value for name, value in headers.items()}.get(
+            'authorization'
+        ) != 'Bearer new':
+            return 401, {}, b''
+        return 200, json_headers, sd_to_json_bytes({'attempts': _attempts[key]})
+    return 404, {}, b''
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _handle(self) -> None:
+        url = urlsplit(self.path)
+        query = dict(parse_qsl(url.query))
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        # Responses can be delayed to simulate the processing time of the API
+        threading.Event().wait(float(query.get('delay', 0)))
+        try:
+            status, headers, response_body = handle(
+                self.command, url.path, query, dict(self.headers), body
+            )
+        except TransportError:
+            self.close_connection = True
+            return
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(response_body)))
+        self.end_headers()
+        self.wfile.write(response_body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None):
+        super().__init__(('127.0.0.1', 0), _RequestHandler)
+        self.connections = 0
+        if ssl_context is not None:
+            # The TLS handshake is made by the thread handling the connection
+            self.socket = ssl_context.wrap_socket(
+                self.socket, server_side=True, do_handshake_on_connect=False
+            )
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def process_request(self, request, client_address) -> None:
+        self.connections += 1
+        super().process_request(request, client_address)
+
+    def close(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class _HTTP2Protocol(asyncio.Protocol):
+    def __init__(self, server: '_HTTP2Server'):
+        self.server = server
+        self.connection = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding='utf-8')
+        )
+        self.requests: Dict[int, Tuple[dict, bytearray]] = {}
+        self.unsent_bodies: Dict[int, bytes] = {}
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.server.connections += 1
+        self.connection.initiate_connection()
+        self.transport.write(self.connection.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        try:
+            events = self.connection.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self.transport.write(self.connection.data_to_send())
+            self.transport.close()
+            return
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                self.requests[event.stream_id] = (dict(event.headers), bytearray())
+            elif isinstance(event, h2.events.DataReceived):
+                self.requests[event.stream_id][1].extend(event.data)
+                self.connection.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, h2.events.StreamEnded):
+                headers, body = self.requests.pop(event.stream_id)
+                url = urlsplit(headers[':path'])
+                query = dict(parse_qsl(url.query))
+                # Delayed responses do not block the other streams of the connection
+                asyncio.get_running_loop().call_later(
+                    float(query.get('delay', 0)),
+                    self.respond,
+                    event.stream_id,
+                    headers[':method'],
+                    url.path,
+                    query,
+                    headers,
+                    bytes(body),
+                )
+            elif isinstance(event, h2.events.StreamReset):
+                self.unsent_bodies.pop(event.stream_id, None)
+            elif isinstance(event, h2.events.WindowUpdated):
+                self.send_bodies()
+        self.transport.write(self.connection.data_to_send())
+
+    def respond(self, stream_id: int, method, path, query, headers, body) -> None:
+        try:
+            status, response_headers, response_body = handle(
+                method, path, query, headers, body
+            )
+        except TransportError:
+            self.connection.reset_stream(stream_id)
+        else:
+            self.connection.send_headers(
+                stream_id,
+                [(':status', str(status))]
+                + [(name.lower(), value) for name, value in response_headers.items()]
+                + [('content-length', str(len(response_body)))],
+            )
+            self.unsent_bodies[stream_id] = response_body
+            self.send_bodies()
+        self.transport.write(self.connection.data_to_send())
+
+    def send_bodies(self) -> None:
+        # Bodies are sent as far as the flow control windows of the client allow
+        for stream_id, body in list(self.unsent_bodies.items()):
+            size = min(
+                self.connection.local_flow_control_window(stream_id),
+                self.connection.max_outbound_frame_size,
+            )
+            while body and size > 0:
+                self.connection.send_data(stream_id, body[:size])
+                body = body[size:]
+                size = min(
+                    self.connection.local_flow_control_window(stream_id),
+                    self.connection.max_outbound_frame_size,
+                )
+            if body:
+                self.unsent_bodies[stream_id] = body
+            else:
+                self.connection.end_stream(stream_id)
+                del self.unsent_bodies[stream_id]
+
+
+class _HTTP2Server:
+    def __init__(self, ssl_context: ssl.SSLContext):
+        self.connections = 0
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(
+            self.loop.create_server(
+                lambda: _HTTP2Protocol(self), '127.0.0.1', 0, ssl=ssl_context
+            )
+        )
+        self.server_port = self.server.sockets[0].getsockname()[1]
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
+    def close(self) -> None:
+        async def close_server():
+            self.server.close()
+            await self.server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(close_server(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+@dataclass
+class _Certificate:
+    cert_file: str
+    key_file: str
+
+    def server_context(self, alpn_protocol: str) -> ssl.SSLContext:
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(self.cert_file, self.key_file)
+        context.set_alpn_protocols([alpn_protocol])
+        return context
+
+    def client_context(self) -> ssl.SSLContext:
+        return ssl.create_default_context(cafile=self.cert_file)
+
+
+@pytest.fixture(scope='module')
+def certificate(tmp_path_factory) -> _Certificate:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, '127.0.0.1')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address('127.0.0.1'))]
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .add_extension(
+            x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False
+        )
+        .add_extension(
+            x509.AuthorityKeyIdentifier.from_issuer_public_key(key.public_key()),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+    directory = tmp_path_factory.mktemp('certificate')
+    cert_file, key_file = directory / 'cert.pem', directory / 'key.pem'
+    cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return _Certificate(str(cert_file), str(key_file))
+
+
+@pytest.fixture(scope='module')
+def server_url():
+    server = _HTTPServer()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.close()
+
+
+@pytest.fixture(scope='module')
+def http2_server(certificate):
+    if h2 is None:
+        pytest.skip('HTTP/2 requires the h2 package')
+    server = _HTTP2Server(certificate.server_context('h2'))
+    yield server
+    server.close()
+
+
+def handle_in_memory(request, body: bytes) -> TransportResponse:
+    url = urlsplit(request.url)
+    status, headers, response_body = handle(
+        request.method,
+        url.path,
+        {**dict(parse_qsl(url.query)), **request.params},
+        request.headers,
+        body,
+    )
+    return TransportResponse(status, headers, response_body)
+
+
+def http2_network_session(certificate: _Certificate, **pool_options) -> NetworkSession:
+    return NetworkSession(
+        transport=HttpxTransport(
+            ConnectionPoolConfig(http2=True, **pool_options),
+            verify=certificate.client_context(),
+        )
+    )
+
+
+@pytest.fixture(params=['requests', 'in_memory', 'httpx', 'httpx_http2'])
+def session_and_url(request, server_url):
+    if request.param == 'requests':
+        return NetworkSession(), server_url
+    if request.param == 'in_memory':
+        return (
+            NetworkSession(transport=InMemoryTransport(handle_in_memory)),
+            'http://fake',
+        )
+    if request.param == 'httpx':
+        return NetworkSession(transport=HttpxTransport()), server_url
+    http2_server = request.getfixturevalue('http2_server')
+    return (
+        http2_network_session(request.getfixturevalue('certificate')),
+        f'https://127.0.0.1:{http2_server.server_port}',
+    )
+
+
+@pytest.fixture
+def network_session(session_and_url):
+    yield session_and_url[0]
+    if session_and_url[0].transport is not None:
+        session_and_url[0].transport.close()
+
+
+@pytest.fixture
+def url(session_and_url):
+    return session_and_url[1]
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr('time.sleep', lambda seconds: None)
+
+
+def unique_key() -> str:
+    return uuid.uuid4().hex
+
+
+def test_json_response_with_params_and_headers(network_session, url):
+    response = fetch(
+        f'{url}/echo',
+        FetchOptions(
+            method='GET',
+            params={'fields': 'name,size'},
+            headers={'X-Custom': 'value'},
+            network_session=network_session,
+        ),
+    )
+
+    assert response.status == 200
+    assert response.data['method'] == 'GET'
+    assert response.data['query'] == {'fields': 'name,size'}
+    assert response.data['headers']['x-custom'] == 'value'
+    assert response.data['headers']['user-agent'].startswith('box-python')
+    assert {name.lower(): value for name, value in response.headers.items()}[
+        'x-echo'
+    ] == 'echo'
+
+
+def test_json_request_body(network_session, url):
+    response = fetch(
+        f'{url}/echo',
+        FetchOptions(
+            method='POST', data={'name': 'ä.txt'}, network_session=network_session
+        ),
+    )
+
+    assert response.data['headers']['content-type'] == 'application/json'
+    assert json_to_serialized_data(response.data['body'].encode('latin-1')) == {
+        'name': 'ä.txt'
+    }
+
+
+def test_multipart_request_body(network_session, url):
+    response = fetch(
+        f'{url}/echo',
+        FetchOptions(
+            method='POST',
+            content_type='multipart/form-data',
+            multipart_data=[
+                MultipartItem(part_name='attributes', data={'name': 'file.txt'}),
+                MultipartItem(
+                    part_name='file',
+                    file_stream=BytesIO(b'file content'),
+                    file_name='file.txt',
+                ),
+            ],
+            network_session=network_session,
+        ),
+    )
+
+    body = response.data['body']
+    assert response.data['headers']['content-type'].startswith(
+        'multipart/form-data; boundary='
+    )
+    assert 'name="attributes"' in body and sd_to_json({'name': 'file.txt'}) in body
+    assert 'filename="file.txt"' in body and 'file content' in body
+
+
+def test_binary_request_body(network_session, url):
+    response = fetch(
+        f'{url}/echo',
+        FetchOptions(
+            method='PUT',
+            content_type='application/octet-stream',
+            file_stream=BytesIO(b'\x00\x01binary'),
+            network_session=network_session,
+        ),
+    )
+
+    assert response.data['body'].encode('latin-1') == b'\x00\x01binary'
+
+
+@pytest.mark.parametrize('stream_downloads', [False, True])
+def test_binary_response(network_session, url, stream_downloads):
+    network_session.stream_downloads = stream_downloads
+    network_session.download_chunk_size = 1000
+
+    response = fetch(
+        f'{url}/binary',
+        FetchOptions(
+            params={'size': '100000'},
+            response_format='binary',
+            network_session=network_session,
+        ),
+    )
+
+    assert read_byte_stream(response.content) == bytes(
+        index % 251 for index in range(100000)
+    )
+
+
+def test_response_without_body(network_session, url):
+    response = fetch(
+        f'{url}/status/204',
+        FetchOptions(method='DELETE', network_session=network_session),
+    )
+
+    assert response.status == 204
+    assert response.data is None
+
+
+def test_error_response(network_session, url):
+    with pytest.raises(BoxAPIError) as error:
+        fetch(f'{url}/status/404', FetchOptions(network_session=network_session))
+
+    assert error.value.response_info.status_code == 404
+    assert error.value.response_info.code == 'not_found'
+    assert error.value.response_info.request_id == 'request-id'
+    assert error.value.request_info.url == f'{url}/status/404'
+
+
+@pytest.mark.parametrize('status', ['429', '500', '503'])
+def test_retries_rate_limited_and_server_errors(network_session, url, status):
+    response = fetch(
+        f'{url}/flaky/{unique_key()}',
+        FetchOptions(
+            params={'status': status, 'failures': '2'},
+            network_session=network_session,
+        ),
+    )
+
+    assert response.data == {'attempts': 3}
+
+
+def test_raises_after_max_attempts(network_session, url):
+    network_session.MAX_ATTEMPTS = 2
+
+    with pytest.raises(BoxAPIError) as error:
+        fetch(
+            f'{url}/flaky/{unique_key()}',
+            FetchOptions(
+                params={'status': '500', 'failures': '2'},
+                network_session=network_session,
+            ),
+        )
+
+    assert error.value.response_info.status_code == 500
+
+
+def test_retries_network_error_once(network_session, url):
+    response = fetch(
+        f'{url}/disconnect/{unique_key()}',
+        FetchOptions(params={'failures': '1'}, network_session=network_session),
+    )
+
+    assert response.data == {'attempts': 2}
+
+    with pytest.raises(BoxSDKError) as error:
+        fetch(
+            f'{url}/disconnect/{unique_key()}',
+            FetchOptions(params={'failures': '2'}, network_session=network_session),
+        )
+    assert not isinstance(error.value, BoxAPIError)
+    assert error.value.error is not None
+
+
+def test_reauthenticates_on_unauthorized_response(network_session, url):
+    auth = Mock(Authentication)
+    auth.retrieve_authorization_header.return_value = 'Bearer old'
+    auth.refresh_token.side_effect = lambda network_session=None: setattr(
+        auth.retrieve_authorization_header, 'return_value', 'Bearer new'
+    )
+
+    response = fetch(
+        f'{url}/authorized/{unique_key()}',
+        FetchOptions(auth=auth, network_session=network_session),
+    )
+
+    assert response.data == {'attempts': 2}
+    auth.refresh_token.assert_called_once()
+
+
+def test_http2_multiplexes_concurrent_requests(certificate, http2_server):
+    network_session = http2_network_session(certificate)
+    url = f'https://127.0.0.1:{http2_server.server_port}/echo'
+    connections = http2_server.connections
+    fetch(url, FetchOptions(network_session=network_session))
+
+    with ThreadPoolExecutor(16) as executor:
+        responses = list(
+            executor.map(
+                lambda _: fetch(
+                    url,
+                    FetchOptions(
+                        params={'delay': '0.05'}, network_session=network_session
+                    ),
+                ),
+                range(64),
+            )
+        )
+
+    assert all(response.status == 200 for response in responses)
+    assert http2_server.connections - connections == 1
+    network_session.transport.close()
+
+
+def test_http2_async_client(certificate, http2_server):
+    from box_sdk_gen.networking.async_fetch import fetch_async
+
+    url = f'https://127.0.0.1:{http2_server.server_port}/echo'
+    network_session = NetworkSession(
+        connection_pool_config=ConnectionPoolConfig(http2=True)
+    )
+
+    async def fetch_concurrently() -> List[int]:
+        network_session._async_http_clients[asyncio.get_running_loop()] = (
+            httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    **httpx_transport_options(network_session.connection_pool_config),
+                    verify=certificate.client_context(),
+                ),
+                timeout=None,
+            )
+        )
+        await fetch_async(url, FetchOptions(network_session=network_session))
+        responses = await asyncio.gather(
+            *(
+                fetch_async(
+                    url,
+                    FetchOptions(
+                        params={'delay': '0.05'}, network_session=network_session
+                    ),
+                )
+                for _ in range(64)
+            )
+        )
+        await network_session.aclose()
+        return [response.status for response in responses]
+
+    connections = http2_server.connections
+    assert asyncio.run(fetch_concurrently()) == [200] * 64
+    assert http2_server.connections - connections == 1
+    assert isinstance(network_session.transport, HttpxTransport)
+    network_session.transport.close()
+
+
+def test_httpx_transport_reads_request_body_off_its_event_loop(server_url):
+    read_threads = []
+
+    class RecordingStream(BytesIO):
+        def read(self, size=-1) -> bytes:
+            read_threads.append(threading.current_thread().name)
+            return super().read(size)
+
+    network_session = NetworkSession(transport=HttpxTransport())
+    response = fetch(
+        f'{server_url}/echo',
+        FetchOptions(
+            method='PUT',
+            content_type='application/octet-stream',
+            file_stream=RecordingStream(b'\x00\x01binary'),
+            network_session=network_session,
+        ),
+    )
+    network_session.close()
+
+    assert response.data['body'].encode('latin-1') == b'\x00\x01binary'
+    assert read_threads
+    assert 'box-sdk-httpx' not in read_threads
+
+
+def test_network_session_close_stops_http2_transport():
+    network_session = NetworkSession(
+        connection_pool_config=ConnectionPoolConfig(http2=True)
+    )
+    transport = network_session.transport
+
+    network_session.with_retry_policy(network_session.retry_policy).close()
+    assert transport._thread.is_alive()
+    network_session.close()
+
+    assert not transport._thread.is_alive()
+    assert transport._loop.is_closed()
+    assert transport.client.is_closed
+
+
+def test_garbage_collected_httpx_transport_closes_its_loop():
+    transport = HttpxTransport()
+    loop, thread, client = transport._loop, transport._thread, transport.client
+
+    del transport
+    gc.collect()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert loop.is_closed()
+    assert client.is_closed
+
+
+def test_http2_uses_fewer_connections_than_http1(certificate, http2_server):
+    # Concurrent requests to local TLS servers, responding after 50 ms. With HTTP/1.1 each concurrent request
+    # needs its own connection, while HTTP/2 multiplexes them over one.
+    requests_count, concurrency = 200, 32
+
+    def run(network_session: NetworkSession, url: str) -> None:
+        with ThreadPoolExecutor(concurrency) as executor:
+            list(
+                executor.map(
+                    lambda _: fetch(
+                        f'{url}/echo',
+                        FetchOptions(
+                            params={'delay': '0.05'}, network_session=network_session
+                        ),
+                    ),
+                    range(requests_count),
+                )
+            )
+
+    http1_server = _HTTPServer(certificate.server_context('http/1.1'))
+    http1_session = NetworkSession(
+        connection_pool_config=ConnectionPoolConfig(pool_maxsize=concurrency)
+    )
+    # CA bundles set in the environment would take precedence over the certificate
+    http1_session.requests_session.trust_env = False
+    http1_session.requests_session.verify = certificate.cert_file
+    http2_session = http2_network_session(certificate, pool_maxsize=concurrency)
+    http2_connections = http2_server.connections
+    try:
+        run(http1_session, f'https://127.0.0.1:{http1_server.server_port}')
+        run(http2_session, f'https://127.0.0.1:{http2_server.server_port}')
+    finally:
+        http1_server.close()
+        http2_session.close()
+
+    assert http2_server.connections - http2_connections < http1_server.connections
+
+
+@pytest.mark.parametrize(
+    'chunk_sizes',
+    [[], [10], [3, 3, 3, 1], [1] * 25, [7, 0, 12, 4], [25], [40]],
+    ids=str,
+)
+def test_transport_response_regroups_chunks(chunk_sizes):
+    body = bytes(range(sum(chunk_sizes)))
+    chunks, start = [], 0
+    for size in chunk_sizes:
+        chunks.append(body[start : start + size])
+        start += size
+    response = TransportResponse(200, chunks=iter(chunks))
+
+    content = list(response.iter_content(10))
+
+    assert b''.join(content) == body
+    assert all(len(chunk) == 10 for chunk in content[:-1])
+    assert all(0 < len(chunk) <= 10 for chunk in content)
+
+
+def test_transport_response_splits_large_chunk_in_linear_time():
+    # Copying the rest of the buffer for every chunk yielded would copy about 32 GB here
+    body = bytes(8 * 1024 * 1024)
+    response = TransportResponse(200, chunks=iter([body]))
+
+    assert sum(len(chunk) for chunk in response.iter_content(1024)) == len(body)
+
+
+def test_transport_has_to_implement_send():
+    class IncompleteTransport(HTTPTransport):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteTransport()
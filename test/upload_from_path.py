@@ -0,0 +1,107 @@
+import os
+from typing import List, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+
+from box_sdk_gen import (
+    UploadFileAttributes,
+    UploadFileAttributesParentField,
+    UploadFileVersionAttributes,
+)
+from box_sdk_gen.networking.transport import TransportResponse
+from test.commons import PART_SIZE, FakeUploadSessionApi, create_client
+
+
+class FakeUploadApi(FakeUploadSessionApi):
+    """
+    Upload endpoints of the API, recording the multipart bodies of direct uploads.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.uploads: List[Tuple[str, bytes]] = []
+
+    def handle(self, request, body: bytes) -> TransportResponse:
+        path = urlsplit(request.url).path
+        if '/files/upload_sessions' in path:
+            return super().handle(request, body)
+        self.uploads.append((path, body))
+        return self.json(
+            201, {'total_count': 1, 'entries': [{'id': '12345', 'type': 'file'}]}
+        )
+
+
+@pytest.fixture
+def api():
+    return FakeUploadApi()
+
+
+@pytest.fixture
+def client(api):
+    return create_client(api.handle)
+
+
+def multipart_file(body: bytes) -> Tuple[bytes, bytes]:
+    """
+    Headers and content of the file part of a multipart body.
+    """
+    boundary = body.split(b'\r\n', 1)[0]
+    for part in body.split(boundary):
+        headers, _, content = part.partition(b'\r\n\r\n')
+        if b'name="file"' in headers:
+            return headers, content[: -len(b'\r\n')]
+    raise AssertionError('The body has no file part.')
+
+
+@pytest.mark.parametrize('size', [0, 1, 5000])
+def test_upload_file_from_path(client, api, tmp_path, size):
+    content = os.urandom(size)
+    file_path = tmp_path / 'local.bin'
+    file_path.write_bytes(content)
+
+    files = client.uploads.upload_file_from_path(
+        UploadFileAttributes(
+            name='file.bin', parent=UploadFileAttributesParentField(id='0')
+        ),
+        str(file_path),
+    )
+
+    assert files.entries[0].id == '12345'
+    [(path, body)] = api.uploads
+    assert path.endswith('/files/content')
+    headers, uploaded_content = multipart_file(body)
+    assert b'filename="local.bin"' in headers
+    assert uploaded_content == content
+
+
+@pytest.mark.parametrize('size', [0, 5000])
+def test_upload_file_version_from_path(client, api, tmp_path, size):
+    content = os.urandom(size)
+    file_path = tmp_path / 'local.bin'
+    file_path.write_bytes(content)
+
+    client.uploads.upload_file_version_from_path(
+        '12345', UploadFileVersionAttributes(name='file.bin'), str(file_path)
+    )
+
+    [(path, body)] = api.uploads
+    assert path.endswith('/files/12345/content')
+    assert multipart_file(body)[1] == content
+
+
+@pytest.mark.parametrize(
+    'size', [0, PART_SIZE - 1, PART_SIZE, 3 * PART_SIZE + 100], ids=str
+)
+@pytest.mark.parametrize('max_workers', [1, 3])
+def test_upload_big_file_from_path(client, api, tmp_path, size, max_workers):
+    content = os.urandom(size)
+    file_path = tmp_path / 'local.bin'
+    file_path.write_bytes(content)
+
+    uploaded_file = client.chunked_uploads.upload_big_file_from_path(
+        str(file_path), 'file.bin', '0', max_workers=max_workers
+    )
+
+    assert uploaded_file.id == '12345'
+    assert api.committed == {'session-1': content}
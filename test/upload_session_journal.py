@@ -0,0 +1,128 @@
+import hashlib
+import os
+from typing import List, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from box_sdk_gen import (
+    BoxClient,
+    BoxSDKError,
+    InMemoryUploadSessionJournal,
+    UploadPart,
+    UploadSessionProgress,
+)
+from box_sdk_gen.internal.utils import MemoryViewByteStream
+from test.commons import PART_SIZE, FakeUploadSessionApi, create_client
+
+
+@pytest.fixture
+def api():
+    return FakeUploadSessionApi()
+
+
+@pytest.fixture
+def client(api):
+    return create_client(api.handle)
+
+
+@pytest.fixture
+def content() -> bytes:
+    return os.urandom(PART_SIZE * 4 + 100)
+
+
+def upload_part(offset: int, content: bytes) -> UploadPart:
+    return UploadPart(
+        part_id=f'part-{offset}',
+        offset=offset,
+        size=len(content),
+        sha_1=hashlib.sha1(content).hexdigest(),
+    )
+
+
+def progress(
+    session_id: str, content: bytes, parts: Optional[List[UploadPart]] = None
+) -> UploadSessionProgress:
+    return UploadSessionProgress(
+        session_id, 'file.bin', len(content), '0', PART_SIZE, parts=parts
+    )
+
+
+def upload(client: BoxClient, content: bytes, journal) -> None:
+    uploaded_file = client.chunked_uploads.upload_big_file(
+        MemoryViewByteStream(content), 'file.bin', len(content), '0', journal=journal
+    )
+    assert uploaded_file.id == '12345'
+
+
+def test_resumes_upload_session_from_journal(client, api, content):
+    api.add_session('session-1', len(content))
+    first_part = content[:PART_SIZE]
+    api.add_part('session-1', 0, first_part)
+    journal = InMemoryUploadSessionJournal(
+        progress('session-1', content, [upload_part(0, first_part)])
+    )
+
+    upload(client, content, journal)
+
+    assert api.uploaded_offsets == [
+        PART_SIZE,
+        2 * PART_SIZE,
+        3 * PART_SIZE,
+        4 * PART_SIZE,
+    ]
+    assert api.committed == {'session-1': content}
+    assert journal.get() is None
+
+
+def test_reconciles_journal_with_parts_acknowledged_by_api(client, api, content):
+    # The process was interrupted after the API acknowledged the second part,
+    # but before the journal recorded it.
+    api.add_session('session-1', len(content))
+    for offset in (0, PART_SIZE):
+        api.add_part('session-1', offset, content[offset : offset + PART_SIZE])
+    stored_progress = []
+    journal = InMemoryUploadSessionJournal(
+        progress('session-1', content, [upload_part(0, content[:PART_SIZE])])
+    )
+    journal.store = Mock(
+        side_effect=lambda progress: stored_progress.append(list(progress.parts))
+    )
+
+    upload(client, content, journal)
+
+    assert api.uploaded_offsets == [2 * PART_SIZE, 3 * PART_SIZE, 4 * PART_SIZE]
+    assert api.committed == {'session-1': content}
+    assert [part.offset for part in stored_progress[0]] == [0, PART_SIZE]
+    assert len(stored_progress[-1]) == 5
+
+
+def test_rejects_acknowledged_part_of_changed_file(client, api, content):
+    api.add_session('session-1', len(content))
+    api.add_part('session-1', 0, os.urandom(PART_SIZE))
+    journal = InMemoryUploadSessionJournal(progress('session-1', content))
+
+    with pytest.raises(BoxSDKError, match='The file has changed'):
+        upload(client, content, journal)
+
+    assert api.uploaded_offsets == []
+    assert journal.get().upload_session_id == 'session-1'
+
+
+def test_starts_new_upload_session_when_journaled_one_expired(client, api, content):
+    journal = InMemoryUploadSessionJournal(progress('expired-session', content))
+
+    upload(client, content, journal)
+
+    assert api.uploaded_offsets == [offset * PART_SIZE for offset in range(5)]
+    assert api.committed == {'session-1': content}
+    assert journal.get() is None
+
+
+def test_ignores_journal_of_other_file(client, api, content):
+    api.add_session('session-1', len(content) + 1)
+    journal = InMemoryUploadSessionJournal(progress('session-1', content + b'0'))
+
+    upload(client, content, journal)
+
+    assert api.committed == {'session-2': content}
@@ -0,0 +1,180 @@
+import os
+import pytest
+from io import BytesIO, SEEK_CUR, UnsupportedOperation
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from box_sdk_gen.internal.utils import (
+    iterate_chunks,
+    read_byte_stream_view,
+    MemoryViewByteStream,
+    MemoryMappedFileStream,
+    ResponseByteStream,
+    StreamingResponseByteStream,
+    ResumableByteStream,
+    get_rsa_private_key,
+)
+
+
+@pytest.mark.parametrize('size', [0, 1, 99, 100, 101, 1000])
+@pytest.mark.parametrize('chunk_size', [1, 7, 100])
+def test_iterate_chunks(size, chunk_size):
+    data = bytes(range(256)) * 4
+    data = data[:size]
+
+    chunks = [
+        bytes(read_byte_stream_view(chunk))
+        for chunk in iterate_chunks(BytesIO(data), chunk_size)
+    ]
+
+    assert b''.join(chunks) == data
+    assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+    assert all(chunks)
+
+
+def test_iterate_chunks_from_stream_returning_partial_reads():
+    class PartialReadStream:
+        def __init__(self, data):
+            self._stream = BytesIO(data)
+
+        def read(self, size):
+            return self._stream.read(min(size, 3))
+
+    data = b'0123456789' * 10
+    chunks = [chunk.read() for chunk in iterate_chunks(PartialReadStream(data), 32)]
+
+    assert chunks == [data[0:32], data[32:64], data[64:96], data[96:100]]
+
+
+def test_memory_view_byte_stream_does_not_copy_buffer():
+    buffer = bytearray(b'0123456789')
+    stream = MemoryViewByteStream(buffer)
+
+    assert stream.read(3) == b'012'
+    view = stream.read_view(4)
+    buffer[3] = ord('x')
+
+    assert bytes(view) == b'x456'
+    assert stream.tell() == 7
+    assert stream.read() == b'789'
+    assert stream.seek(0) == 0
+    assert len(stream) == 10
+
+
+def test_memory_mapped_file_stream(tmp_path):
+    data = os.urandom(1000)
+    file_path = tmp_path / 'file.bin'
+    file_path.write_bytes(data)
+
+    with MemoryMappedFileStream(str(file_path)) as stream:
+        chunks = [
+            bytes(read_byte_stream_view(chunk)) for chunk in iterate_chunks(stream, 300)
+        ]
+
+    assert chunks == [data[0:300], data[300:600], data[600:900], data[900:1000]]
+
+
+def test_memory_mapped_empty_file_stream(tmp_path):
+    file_path = tmp_path / 'empty.bin'
+    file_path.write_bytes(b'')
+
+    with MemoryMappedFileStream(str(file_path)) as stream:
+        assert len(stream) == 0
+        assert stream.read() == b''
+
+
+def test_streaming_response_byte_stream_read():
+    stream = StreamingResponseByteStream(iter([b'0123', b'', b'45', b'6789']))
+
+    assert stream.read(3) == b'012'
+    assert stream.read(4) == b'3456'
+    assert stream.tell() == 7
+    assert stream.read() == b'789'
+    assert stream.read(1) == b''
+
+
+def test_streaming_response_byte_stream_readinto_and_seek_forward():
+    stream = StreamingResponseByteStream(iter([b'0123', b'4567', b'89']))
+    buffer = bytearray(5)
+
+    assert stream.readinto(buffer) == 5
+    assert buffer == b'01234'
+    assert stream.seek(2, SEEK_CUR) == 7
+    assert stream.read() == b'789'
+    with pytest.raises(UnsupportedOperation):
+        stream.seek(0)
+
+
+@pytest.mark.parametrize(
+    'stream_class', [ResponseByteStream, StreamingResponseByteStream]
+)
+def test_download_to(stream_class, tmp_path):
+    stream = stream_class(iter([b'0123', b'4567', b'89']))
+    stream.read(2)
+
+    file_object = BytesIO()
+    assert stream.download_to(file_object) == 8
+    assert file_object.getvalue() == b'23456789'
+
+    stream = stream_class(iter([b'0123', b'4567', b'89']))
+    assert stream.download_to(tmp_path / 'file.bin') == 10
+    assert (tmp_path / 'file.bin').read_bytes() == b'0123456789'
+
+
+class FailingStream:
+    def __init__(self, data, fail_after):
+        self._stream = BytesIO(data)
+        self._fail_after = fail_after
+
+    def read(self, size=-1):
+        if self._stream.tell() >= self._fail_after:
+            raise ConnectionError('Connection broken')
+        return self._stream.read(min(size, self._fail_after - self._stream.tell()))
+
+
+def test_resumable_byte_stream_reopens_at_current_position():
+    data = b'0123456789' * 10
+    offsets = []
+
+    def open_stream(offset):
+        offsets.append(offset)
+        return FailingStream(data[offset:], fail_after=30)
+
+    stream = ResumableByteStream(open_stream, chunk_size=7)
+
+    assert stream.read() == data
+    assert offsets == [0, 30, 60, 90]
+
+
+def test_resumable_byte_stream_gives_up_after_max_attempts():
+    def open_stream(offset):
+        return FailingStream(b'0123456789', fail_after=0)
+
+    stream = ResumableByteStream(open_stream, max_attempts=3)
+
+    with pytest.raises(ConnectionError):
+        stream.read(5)
+
+
+def test_get_rsa_private_key_loads_key_once():
+    private_key = (
+        rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        .private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.BestAvailableEncryption(b'passphrase'),
+        )
+        .decode()
+    )
+
+    with patch(
+        'cryptography.hazmat.primitives.serialization.load_pem_private_key',
+        wraps=serialization.load_pem_private_key,
+    ) as load_pem_private_key:
+        keys = [get_rsa_private_key(private_key, 'passphrase') for _ in range(3)]
+
+    assert load_pem_private_key.call_count == 1
+    assert keys[0] is keys[1] is keys[2]
+    assert isinstance(keys[0], rsa.RSAPrivateKey)